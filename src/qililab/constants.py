@@ -181,6 +181,7 @@ class INSTRUMENTCONTROLLER:
     RESET = "reset"
     REFERENCE_CLOCK = "reference_clock"
     EXT_TRIGGER = "ext_trigger"
+    EMULATOR = "emulator"
 
 
 class CONNECTION:
@@ -41,6 +41,7 @@ from qililab.qprogram.operations import (
     Wait,
 )
 from qililab.qprogram.qprogram import QProgram
+from qililab.qprogram.transforms import BusMappingTransform, CalibrationTransform, QProgramTransform
 from qililab.waveforms import IQWaveform, Square, Waveform
 
 from .integration_weights_tools import convert_integration_weights
@@ -196,11 +197,12 @@ class QuantumMachinesCompiler:
                     handler(element)
             self._qprogram_block_stack.pop()
 
-        self._qprogram = qprogram
+        transforms: list[QProgramTransform] = []
         if bus_mapping is not None:
-            self._qprogram = self._qprogram.with_bus_mapping(bus_mapping=bus_mapping)
+            transforms.append(BusMappingTransform(bus_mapping))
         if calibration is not None:
-            self._qprogram = self._qprogram.with_calibration(calibration=calibration)
+            transforms.append(CalibrationTransform(calibration))
+        self._qprogram = qprogram.with_transforms(*transforms) if transforms else qprogram
         if self._qprogram.has_calibrated_waveforms_or_weights():
             raise RuntimeError(
                 "Cannot compile to hardware-native instructions because QProgram contains named operations that are not mapped. Provide a calibration instance containing all necessary mappings."
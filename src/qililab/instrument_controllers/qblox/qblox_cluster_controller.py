@@ -15,12 +15,16 @@
 """Qblox Cluster Controller class"""
 
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Any, Sequence
 
+from qililab.constants import INSTRUMENTCONTROLLER
 from qililab.instrument_controllers.instrument_controller import InstrumentController, InstrumentControllerSettings
 from qililab.instrument_controllers.utils.instrument_controller_factory import InstrumentControllerFactory
+from qililab.instruments.qblox.qblox_emulator import EmulatedCluster, QbloxEmulatorModel
 from qililab.instruments.qblox.qblox_qcm import QbloxQCM
+from qililab.instruments.qblox.qblox_qcm_rf import QbloxQCMRF
 from qililab.instruments.qblox.qblox_qrm import QbloxQRM
+from qililab.instruments.qblox.qblox_qrm_rf import QbloxQRMRF
 from qililab.typings.enums import (
     ConnectionName,
     InstrumentControllerName,
@@ -43,12 +47,20 @@ class QbloxClusterController(InstrumentController):
 
     name = InstrumentControllerName.QBLOX_CLUSTER
     number_available_modules = 20
-    device: Cluster
+    device: Cluster | EmulatedCluster
     modules: Sequence[QbloxQCM | QbloxQRM]
 
     @dataclass
     class QbloxClusterControllerSettings(InstrumentControllerSettings):
-        """Contains the settings of a specific Qblox Cluster Controller."""
+        """Contains the settings of a specific Qblox Cluster Controller.
+
+        Args:
+            emulator (dict | None, optional): Settings of the :class:`.QbloxEmulatorModel` of an
+                :class:`.EmulatedCluster` that runs the sequences offline, instead of connecting to the cluster at the
+                address of the connection. Defaults to None, which connects to the hardware.
+        """
+
+        emulator: dict[str, Any] | None = None
 
         def __post_init__(self):
             super().__post_init__()
@@ -98,12 +110,44 @@ class QbloxClusterController(InstrumentController):
                     f"The only supported instruments are {InstrumentTypeName.QBLOX_QCM} and {InstrumentTypeName.QBLOX_QRM}."
                 )
 
+    @property
+    def emulated(self) -> bool:
+        """Whether the cluster is emulated instead of connected to the hardware."""
+        return self.settings.emulator is not None
+
     def _initialize_device(self):
-        """Initialize the cluster device."""
+        """Initialize the cluster device, or the emulated cluster if the ``emulator`` setting is given."""
+        if self.settings.emulator is not None:
+            self.device = EmulatedCluster(
+                name=f"{self.name.value}_{self.alias}",
+                modules={
+                    slot_id: self._emulated_module_type(module)
+                    for module, slot_id in zip(self.modules, self.connected_modules_slot_ids)
+                },
+                model=QbloxEmulatorModel(**self.settings.emulator),
+            )
+            return
         self.device = Cluster(name=f"{self.name.value}_{self.alias}", identifier=self.address)
 
+    @staticmethod
+    def _emulated_module_type(module: QbloxQCM | QbloxQRM) -> str:
+        """Type of the emulated module of an instrument."""
+        if isinstance(module, QbloxQRMRF):
+            return "QRM_RF"
+        if isinstance(module, QbloxQRM):
+            return "QRM"
+        if isinstance(module, QbloxQCMRF):
+            return "QCM_RF"
+        return "QCM"
+
     def _set_device_to_all_modules(self):
         """Set the initialized device to all attached modules."""
         for module, slot_id in zip(self.modules, self.connected_modules_slot_ids):
             # slot_id represents the number displayed in the cluster
             module.device = self.device.modules[slot_id - 1]
+
+    def to_dict(self):
+        """Return a dict representation of the Qblox Cluster Controller class."""
+        if self.settings.emulator is None:
+            return super().to_dict()
+        return super().to_dict() | {INSTRUMENTCONTROLLER.EMULATOR: self.settings.emulator}
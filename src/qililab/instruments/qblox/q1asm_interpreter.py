@@ -0,0 +1,429 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parser and interpreter of the Q1ASM programs run by the sequencers of the Qblox modules."""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from qililab.config import logger
+
+NUM_REGISTERS = 64
+# Value of the gain and offset operands of ``set_awg_gain`` and ``set_awg_offs`` equivalent to full scale.
+FULL_SCALE = 32767
+# Steps of the ``set_freq`` operand per Hz.
+FREQUENCY_STEPS_PER_HZ = 4
+# Steps of the ``set_ph`` and ``set_ph_delta`` operands per turn.
+PHASE_STEPS_PER_TURN = 1_000_000_000
+# Time in ns between the end of an integration and the arrival of its trigger at the latches of the other sequencers.
+TRIGGER_NETWORK_LATENCY = 252
+
+_WORD = 0xFFFFFFFF
+
+# Number of operands of each instruction. The last operand of the real-time instructions is their duration.
+_OPERANDS: dict[str, int] = {
+    "illegal": 0,
+    "stop": 0,
+    "nop": 0,
+    "jmp": 1,
+    "jge": 3,
+    "jlt": 3,
+    "loop": 2,
+    "move": 2,
+    "not": 2,
+    "add": 3,
+    "sub": 3,
+    "and": 3,
+    "or": 3,
+    "xor": 3,
+    "asl": 3,
+    "asr": 3,
+    "set_mrk": 1,
+    "set_freq": 1,
+    "reset_ph": 0,
+    "set_ph": 1,
+    "set_ph_delta": 1,
+    "set_awg_gain": 2,
+    "set_awg_offs": 2,
+    "set_cond": 4,
+    "upd_param": 1,
+    "play": 3,
+    "acquire": 3,
+    "acquire_weighed": 5,
+    "acquire_ttl": 4,
+    "set_latch_en": 2,
+    "latch_rst": 1,
+    "wait": 1,
+    "wait_trigger": 2,
+    "wait_sync": 1,
+}
+
+# Index of the operand of each instruction that is the register it writes to.
+_DESTINATIONS: dict[str, int] = {
+    "loop": 0,
+    "move": 1,
+    "not": 1,
+    "add": 2,
+    "sub": 2,
+    "and": 2,
+    "or": 2,
+    "xor": 2,
+    "asl": 2,
+    "asr": 2,
+}
+
+_LABEL = re.compile(r"^\s*([A-Za-z_][\w]*)\s*:")
+
+
+@dataclass(frozen=True)
+class Q1ASMProgram:
+    """A parsed Q1ASM program.
+
+    Operands are stored as integers: immediates as their value, labels as the index of the instruction they point to,
+    and registers ``Rn`` as ``~n``, so that a negative operand always denotes a register.
+
+    Args:
+        instructions (tuple[tuple[str, tuple[int, ...]], ...]): Opcode and operands of each instruction.
+        labels (dict[str, int]): Index of the instruction following each label.
+    """
+
+    instructions: tuple[tuple[str, tuple[int, ...]], ...]
+    labels: dict[str, int]
+
+    @property
+    def has_conditionals(self) -> bool:
+        """Whether the program executes real-time instructions conditionally on the trigger network."""
+        return any(opcode == "set_cond" for opcode, _ in self.instructions)
+
+    @classmethod
+    def parse(cls, source: str) -> Q1ASMProgram:
+        """Parses the source of a Q1ASM program.
+
+        Parsed programs are cached by their source, so uploading the same program again does not parse it again.
+
+        Args:
+            source (str): Source of the program.
+
+        Raises:
+            ValueError: If an instruction is unknown, has a wrong number of operands or jumps to an unknown label.
+
+        Returns:
+            Q1ASMProgram: The parsed program.
+        """
+        return _parse(source)
+
+
+@lru_cache(maxsize=128)
+def _parse(source: str) -> Q1ASMProgram:
+    labels: dict[str, int] = {}
+    lines: list[tuple[int, str, list[str]]] = []
+    for number, line in enumerate(source.splitlines(), start=1):
+        line = line.split("#", 1)[0]
+        while match := _LABEL.match(line):
+            labels[match.group(1)] = len(lines)
+            line = line[match.end() :]
+        line = line.strip()
+        if not line:
+            continue
+        opcode, _, arguments = line.partition(" ")
+        operands = [operand.strip() for operand in arguments.split(",")] if arguments.strip() else []
+        if opcode not in _OPERANDS:
+            raise ValueError(f"Line {number}: unknown Q1ASM instruction {opcode!r}.")
+        if len(operands) != _OPERANDS[opcode]:
+            raise ValueError(
+                f"Line {number}: {opcode!r} takes {_OPERANDS[opcode]} operands, but {len(operands)} were given."
+            )
+        if opcode in _DESTINATIONS and not operands[_DESTINATIONS[opcode]].upper().startswith("R"):
+            raise ValueError(f"Line {number}: operand {_DESTINATIONS[opcode] + 1} of {opcode!r} must be a register.")
+        lines.append((number, opcode, operands))
+
+    def resolve(number: int, operand: str) -> int:
+        if operand.startswith("@"):
+            if operand[1:] not in labels:
+                raise ValueError(f"Line {number}: unknown label {operand!r}.")
+            return labels[operand[1:]]
+        if operand[0] in "Rr":
+            register = int(operand[1:])
+            if not 0 <= register < NUM_REGISTERS:
+                raise ValueError(f"Line {number}: register {operand!r} does not exist.")
+            return ~register
+        return int(operand, 0) & _WORD
+
+    instructions = tuple(
+        (opcode, tuple(resolve(number, operand) for operand in operands)) for number, opcode, operands in lines
+    )
+    return Q1ASMProgram(instructions=instructions, labels=labels)
+
+
+def _signed(value: int, bits: int) -> int:
+    """Interprets the lowest ``bits`` bits of ``value`` as a two's complement integer."""
+    value &= (1 << bits) - 1
+    return value - (1 << bits) if value >> (bits - 1) else value
+
+
+@dataclass
+class Q1ASMTrace:
+    """Timeline of the real-time instructions executed by a sequencer, with times in ns from its start.
+
+    Args:
+        duration (int): Time at which the program stopped.
+        play_times (list[int]): Start time of each ``play``.
+        plays (list[tuple[int, int, float, float]]): Indices of the waveforms of paths 0 and 1 and their gains, for
+            each ``play``. A waveform plays until it ends or until the next ``play`` starts.
+        offset_times (list[int]): Time at which each change of the AWG offsets takes effect.
+        offsets (list[tuple[float, float]]): AWG offsets of paths 0 and 1 after each change.
+        nco (list[tuple[int, float, float, bool]]): Time, frequency in Hz, phase offset in radians and whether the
+            phase was reset, of each update of the NCO.
+        markers (list[tuple[int, int]]): Time and value of each update of the markers.
+        acquisitions (list[tuple[int, int, int, int, tuple[int, int] | None]]): Time, acquisition index, bin, duration
+            and indices of the weights of paths 0 and 1 (None for ``acquire``) of each acquisition.
+        completed (bool): Whether the program reached a ``stop`` instruction, instead of being interrupted.
+    """
+
+    duration: int = 0
+    play_times: list[int] = field(default_factory=list)
+    plays: list[tuple[int, int, float, float]] = field(default_factory=list)
+    offset_times: list[int] = field(default_factory=list)
+    offsets: list[tuple[float, float]] = field(default_factory=list)
+    nco: list[tuple[int, float, float, bool]] = field(default_factory=list)
+    markers: list[tuple[int, int]] = field(default_factory=list)
+    acquisitions: list[tuple[int, int, int, int, tuple[int, int] | None]] = field(default_factory=list)
+    completed: bool = False
+
+
+class Q1ASMInterpreter:
+    """Executes a :class:`Q1ASMProgram`, recording the timeline of its real-time instructions in a :class:`Q1ASMTrace`.
+
+    Classical instructions take no time, and real-time instructions take the time given by their duration operand.
+    The parameters set by ``set_awg_gain``, ``set_awg_offs``, ``set_freq``, ``set_ph``, ``set_ph_delta``, ``reset_ph``
+    and ``set_mrk`` are queued and take effect at the next ``upd_param``, ``play`` or acquisition, as in the hardware.
+
+    Conditional execution (``set_cond``) is evaluated against ``triggers``, the arrival times of the triggers sent to
+    each address of the trigger network, which are counted by the latches of the sequencer while they are enabled.
+    A trigger address is considered set once its latch has counted at least one trigger.
+
+    Args:
+        program (Q1ASMProgram): The program to execute.
+        triggers (dict[int, list[int]], optional): Sorted arrival times of the triggers, by address. Defaults to None.
+        nco_frequency (float, optional): Frequency in Hz of the NCO before the first ``set_freq``. Defaults to 0.0.
+        max_instructions (int, optional): Maximum number of instructions to execute. A program that exceeds it, like
+            an infinite loop, is stopped as if ``stop_sequencer`` had been called. Defaults to 10**8.
+    """
+
+    def __init__(
+        self,
+        program: Q1ASMProgram,
+        triggers: dict[int, list[int]] | None = None,
+        nco_frequency: float = 0.0,
+        max_instructions: int = 10**8,
+    ):
+        self.program = program
+        self.triggers = triggers if triggers is not None else {}
+        self.nco_frequency = nco_frequency
+        self.max_instructions = max_instructions
+        self.registers = [0] * NUM_REGISTERS
+
+    def _condition(self, time: int, mask: int, operator: int, latch: tuple[int, int | None] | None) -> bool:
+        """Evaluates the condition of ``set_cond`` at ``time`` on the latched trigger addresses selected by ``mask``."""
+        states = []
+        for address in range(1, 16):
+            if not mask >> (address - 1) & 1:
+                continue
+            arrivals = self.triggers.get(address, ())
+            latched = False
+            if latch is not None:
+                start, stop = latch
+                end = time if stop is None else min(time, stop)
+                latched = bisect_right(arrivals, end) > bisect_right(arrivals, start - 1)  # type: ignore[arg-type]
+            states.append(latched)
+        if operator in {0, 1}:  # OR, NOR
+            result = any(states)
+        elif operator in {2, 3}:  # AND, NAND
+            result = all(states)
+        elif operator in {4, 5}:  # XOR, XNOR
+            result = sum(states) % 2 == 1
+        else:
+            raise ValueError(f"Unknown set_cond operator {operator}.")
+        return result != (operator % 2 == 1)
+
+    def run(self) -> Q1ASMTrace:
+        """Executes the program from its first instruction until ``stop``.
+
+        Raises:
+            ValueError: If the program executes an ``illegal`` instruction or runs past its last instruction.
+
+        Returns:
+            Q1ASMTrace: The timeline of the executed real-time instructions.
+        """
+        instructions = self.program.instructions
+        registers = self.registers
+        trace = Q1ASMTrace()
+        play_times, plays, acquisitions = trace.play_times, trace.plays, trace.acquisitions
+
+        time = 0
+        gains = (1.0, 1.0)
+        frequency = self.nco_frequency
+        phase = 0.0
+        pending: dict[str, tuple] = {}
+        condition: tuple[int, int, int] | None = None
+        latch: tuple[int, int | None] | None = None
+
+        pc = 0
+        executed = 0
+        while instructions:
+            if pc >= len(instructions):
+                raise ValueError("The Q1ASM program ran past its last instruction without reaching a stop.")
+            executed += 1
+            if executed > self.max_instructions:
+                logger.warning(
+                    "Q1ASM program stopped after executing %d instructions without reaching a stop.",
+                    self.max_instructions,
+                )
+                break
+            opcode, operands = instructions[pc]
+            values = [operand if operand >= 0 else registers[~operand] for operand in operands]
+            pc += 1
+
+            # Classical instructions
+            if opcode == "loop":
+                register = ~operands[0]
+                registers[register] = (registers[register] - 1) & _WORD
+                if registers[register]:
+                    pc = values[1]
+                continue
+            if opcode == "add":
+                registers[~operands[2]] = (values[0] + values[1]) & _WORD
+                continue
+            if opcode == "sub":
+                registers[~operands[2]] = (values[0] - values[1]) & _WORD
+                continue
+            if opcode == "move":
+                registers[~operands[1]] = values[0]
+                continue
+            if opcode == "jmp":
+                pc = values[0]
+                continue
+            if opcode == "jge":
+                if values[0] >= values[1]:
+                    pc = values[2]
+                continue
+            if opcode == "jlt":
+                if values[0] < values[1]:
+                    pc = values[2]
+                continue
+            if opcode == "not":
+                registers[~operands[1]] = ~values[0] & _WORD
+                continue
+            if opcode == "and":
+                registers[~operands[2]] = values[0] & values[1]
+                continue
+            if opcode == "or":
+                registers[~operands[2]] = values[0] | values[1]
+                continue
+            if opcode == "xor":
+                registers[~operands[2]] = values[0] ^ values[1]
+                continue
+            if opcode == "asl":
+                registers[~operands[2]] = (values[0] << values[1]) & _WORD
+                continue
+            if opcode == "asr":
+                registers[~operands[2]] = (_signed(values[0], 32) >> values[1]) & _WORD
+                continue
+            if opcode == "nop":
+                continue
+            if opcode == "stop":
+                trace.completed = True
+                break
+            if opcode == "illegal":
+                raise ValueError(f"The Q1ASM program executed an illegal instruction at index {pc - 1}.")
+
+            # Parameter updates, queued until the next real-time instruction updating the parameters
+            if opcode == "set_awg_gain":
+                pending["gain"] = (_signed(values[0], 16) / FULL_SCALE, _signed(values[1], 16) / FULL_SCALE)
+                continue
+            if opcode == "set_awg_offs":
+                pending["offset"] = (_signed(values[0], 16) / FULL_SCALE, _signed(values[1], 16) / FULL_SCALE)
+                continue
+            if opcode == "set_freq":
+                pending["frequency"] = (_signed(values[0], 32) / FREQUENCY_STEPS_PER_HZ,)
+                continue
+            if opcode == "set_ph":
+                pending["phase"] = (2 * math.pi * values[0] / PHASE_STEPS_PER_TURN,)
+                continue
+            if opcode == "set_ph_delta":
+                delta = 2 * math.pi * values[0] / PHASE_STEPS_PER_TURN
+                pending["phase"] = (pending.get("phase", (phase,))[0] + delta,)
+                continue
+            if opcode == "reset_ph":
+                pending["reset"] = ()
+                continue
+            if opcode == "set_mrk":
+                pending["marker"] = (values[0],)
+                continue
+            if opcode == "set_cond":
+                condition = (values[1], values[2], values[3]) if values[0] else None
+                continue
+
+            # Real-time instructions
+            duration = values[-1]
+            if condition is not None and not self._condition(time, condition[0], condition[1], latch):
+                time += condition[2]
+                continue
+
+            if opcode in {"play", "acquire", "acquire_weighed", "acquire_ttl", "upd_param"} and pending:
+                if "gain" in pending:
+                    gains = pending["gain"]
+                if "offset" in pending:
+                    trace.offset_times.append(time)
+                    trace.offsets.append(pending["offset"])
+                if "frequency" in pending or "phase" in pending or "reset" in pending:
+                    frequency = pending.get("frequency", (frequency,))[0]
+                    phase = pending.get("phase", (phase,))[0]
+                    trace.nco.append((time, frequency, phase, "reset" in pending))
+                if "marker" in pending:
+                    trace.markers.append((time, pending["marker"][0]))
+                pending.clear()
+
+            if opcode == "play":
+                play_times.append(time)
+                plays.append((values[0], values[1], gains[0], gains[1]))
+            elif opcode == "acquire":
+                acquisitions.append((time, values[0], values[1], duration, None))
+            elif opcode == "acquire_weighed":
+                acquisitions.append((time, values[0], values[1], duration, (values[2], values[3])))
+            elif opcode == "set_latch_en":
+                if values[0] and (latch is None or latch[1] is not None):
+                    latch = (time, None)
+                elif not values[0] and latch is not None and latch[1] is None:
+                    latch = (latch[0], time)
+            elif opcode == "latch_rst":
+                if latch is not None:
+                    latch = (time, latch[1])
+            elif opcode == "wait_trigger":
+                arrivals = self.triggers.get(values[0], ())
+                index = bisect_right(arrivals, time)  # type: ignore[arg-type]
+                if index < len(arrivals):
+                    time = arrivals[index]  # type: ignore[index]
+            time += duration
+
+        else:
+            # An empty program, as the one left by clearing a sequencer, stops immediately
+            trace.completed = True
+        trace.duration = time
+        return trace
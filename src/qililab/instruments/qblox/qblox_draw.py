@@ -19,32 +19,127 @@ import plotly.colors as pc
 import plotly.graph_objects as go
 
 from qililab.core.variables import Domain
+from qililab.instruments.qblox.q1asm_interpreter import Q1ASMProgram
+
+# Index of the operand of each jump instruction that is the label it jumps to.
+_JUMP_TARGETS = {"jmp": 0, "jge": 2, "jlt": 2, "loop": 1}
+
+
+class _DrawTimeline:
+    """Timeline of a sequencer being drawn, recorded as events with absolute timestamps.
+
+    The plays, waits and parameter updates of the program only record where they happen, in samples of 1 ns, and the
+    samples themselves are only computed by :meth:`render`, into arrays allocated once with the final duration.
+    """
+
+    KEYS = ("intermediate_frequency", "phase", "q1asm_offset_i", "q1asm_offset_q")
+
+    def __init__(self, initial_values: dict[str, float]):
+        self.length = 0
+        # [start, stop, I, Q] of each play
+        self.plays: list[list] = []
+        # [start, stop] of each acquisition
+        self.acquisitions: list[list[int]] = []
+        # times and values of the updates of each parameter, which take effect at the end of the timeline
+        self.parameters: dict[str, tuple[list[int], list[float]]] = {
+            key: ([0], [initial_values[key]]) for key in self.KEYS
+        }
+
+    def value(self, key: str) -> float:
+        """Last value set of a parameter."""
+        return self.parameters[key][1][-1]
+
+    def set(self, key: str, value: float):
+        """Sets a parameter from the end of the timeline on. Setting it again before anything is played replaces the
+        previous value."""
+        times, values = self.parameters[key]
+        if times[-1] == self.length:
+            values[-1] = value
+        else:
+            times.append(self.length)
+            values.append(value)
+
+    def play(self, waveform_i: np.ndarray, waveform_q: np.ndarray):
+        """Appends the samples of a waveform to the timeline."""
+        self.plays.append([self.length, self.length + len(waveform_i), waveform_i, waveform_q])
+        self.length += len(waveform_i)
+
+    def wait(self, duration: int):
+        """Appends ``duration`` samples without any waveform to the timeline."""
+        self.length += int(duration)
+
+    def acquire(self, start: int, duration: int):
+        """Records an acquisition, interrupting the previous one if it is still running."""
+        for acquisition in reversed(self.acquisitions):
+            if acquisition[1] <= start:
+                break
+            acquisition[1] = max(acquisition[0], start)
+        self.acquisitions.append([start, start + duration])
+
+    def truncate(self, length: int):
+        """Interrupts everything played after ``length``, including the parameters set after it."""
+        if self.length <= length:
+            return
+        self.length = length
+        for play in reversed(self.plays):
+            if play[1] <= length:
+                break
+            play[1] = max(play[0], length)
+        for times, values in self.parameters.values():
+            while len(times) > 1 and times[-1] >= length:
+                times.pop()
+                values.pop()
+
+    def render(self) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray], np.ndarray]:
+        """Computes the samples of the timeline.
+
+        Returns:
+            tuple: The I and Q waveforms, the value of each parameter at every sample, and the index of the acquisition
+                running at every sample, 0 meaning none. The acquisitions can last longer than the waveforms.
+        """
+        waveform_i, waveform_q = np.zeros(self.length), np.zeros(self.length)
+        for start, stop, play_i, play_q in self.plays:
+            waveform_i[start:stop] = play_i[: stop - start]
+            waveform_q[start:stop] = play_q[: stop - start]
+
+        parameters = {}
+        for key, (times, values) in self.parameters.items():
+            times_array = np.asarray(times)
+            in_range = times_array < self.length
+            durations = np.diff(np.append(times_array[in_range], self.length))
+            parameters[key] = np.repeat(np.asarray(values, dtype=float)[in_range], durations)
+
+        acquiring_status = np.zeros(max([self.length] + [stop for _, stop in self.acquisitions]), dtype=int)
+        for index, (start, stop) in enumerate(self.acquisitions, start=1):
+            acquiring_status[start:stop] = index
+
+        return waveform_i, waveform_q, parameters, acquiring_status
 
 
 class QbloxDraw:
-    def _call_handlers(self, program_line, param, register, data_draw, waveform_seq):
+    def _call_handlers(self, program_line, param, register, timeline, waveform_seq):
         """Calls the handlers.
 
         Args:
             program_line (tuple): line of the Q1ASM program parsed.
-            param (dictionary): parameters of the bus (IF, phase, offset, hardware modulation).
+            param (dictionary): parameters of the bus (gains, hardware modulation, time counters).
             register (dictionary): registers of the Q1ASM.
-            data_draw (list): nested list for each waveform, data points until current time.
-            waveform_seq (Dict items): waveform data as provided by the sequencer
+            timeline (_DrawTimeline): events of the bus until the current time.
+            waveform_seq (dictionary): waveform data of the sequencer, by index.
         """
 
         action_type = program_line[0]
         if action_type == "set_freq":
-            param = self._handle_freq_phase_draw(program_line, param, register, "intermediate_frequency")
+            param = self._handle_freq_phase_draw(program_line, param, register, timeline, "intermediate_frequency")
 
         elif action_type == "set_ph":
-            param = self._handle_freq_phase_draw(program_line, param, register, "phase")
+            param = self._handle_freq_phase_draw(program_line, param, register, timeline, "phase")
 
         elif action_type == "reset_ph":
-            param = self._handle_reset_phase_draw(param)
+            param = self._handle_reset_phase_draw(param, timeline)
 
         elif action_type == "set_awg_offs":
-            param = self._handle_offset(program_line, param, register)
+            param = self._handle_offset(program_line, param, register, timeline)
 
         elif action_type == "set_awg_gain":
             param = self._handle_gain_draw(program_line, param, register)
@@ -57,29 +152,15 @@ class QbloxDraw:
                 # update the real time counter
                 param["real_time_counter"] = param["real_time_counter"] - wait_duration
             else:
-                data_draw = self._handle_wait_draw(data_draw, param, real_wait)
+                timeline.wait(real_wait)
                 param["real_time_counter"] = max(0, param["real_time_counter"] - wait_duration)
 
-            # extend the acquiring status array - cannot be inside the wait handler in the case where real wait is less than 0
-            if len(param["acquiring_status"]) < len(param["intermediate_frequency"]):
-                extension_length = len(param["intermediate_frequency"]) - len(param["acquiring_status"])
-                param["acquiring_status"] = np.concatenate(
-                    [param["acquiring_status"], np.zeros(extension_length, dtype=int)]
-                )
-
         elif action_type == "play":
             param["play_idx"] += 1
             #  Essentially interrupting the previous play that is still running and extend the play status to the current play
-            if len(data_draw[0]) != param["classical_time_counter"]:
-                for i in [0, 1]:
-                    data_draw[i] = data_draw[i][: param["classical_time_counter"]]
-                for key in ["intermediate_frequency", "phase", "q1asm_offset_i", "q1asm_offset_q"]:
-                    param[key] = param[key][: param["classical_time_counter"]]
-                    param[f"{key}_new"] = False
-
-            data_draw, wf_length, classical_duration_play = self._handle_play_draw(
-                data_draw, program_line, waveform_seq, param
-            )
+            timeline.truncate(param["classical_time_counter"])
+
+            wf_length, classical_duration_play = self._handle_play_draw(timeline, program_line, waveform_seq, param)
             param["classical_time_counter"] += int(classical_duration_play)
             if wf_length > classical_duration_play:
                 real_time_counter = wf_length - classical_duration_play
@@ -87,7 +168,7 @@ class QbloxDraw:
                 param["real_time_counter"] = real_time_counter
             elif wf_length < classical_duration_play:
                 real_play_wait = classical_duration_play - wf_length
-                data_draw = self._handle_wait_draw(data_draw, param, real_play_wait)
+                timeline.wait(real_play_wait)
                 param["real_time_counter"] = 0
 
         elif action_type == "acquire_weighed":
@@ -99,21 +180,16 @@ class QbloxDraw:
             # the difference
             integration_length = classical_duration_acquire
 
-            #  Essentially interrupting the previous acquire that is still running and extend the acquiring status to the current acquire
-            if len(param["acquiring_status"]) != param["classical_time_counter"]:
-                param["acquiring_status"] = param["acquiring_status"][: param["classical_time_counter"]]
-
+            #  Essentially interrupting the previous acquire that is still running
+            timeline.acquire(param["classical_time_counter"], int(integration_length))
             param["classical_time_counter"] += int(classical_duration_acquire)
 
-            extend_acquire = np.full(int(integration_length), param["acquire_idx"], dtype=int)
-            param["acquiring_status"] = np.concatenate([param["acquiring_status"], extend_acquire])
-
             #  Add wait if needed and reset the real time counter
             if classical_duration_acquire - param["real_time_counter"] >= 0:
                 #  add a wait if needed and reset the real time counter to 0
                 real_acquire_wait = classical_duration_acquire - param["real_time_counter"]
                 if real_acquire_wait > 0:
-                    data_draw = self._handle_wait_draw(data_draw, param, real_acquire_wait)
+                    timeline.wait(real_acquire_wait)
                 param["real_time_counter"] = 0
             elif classical_duration_acquire - param["real_time_counter"] < 0:
                 param["real_time_counter"] = param["real_time_counter"] - classical_duration_acquire
@@ -138,17 +214,17 @@ class QbloxDraw:
                 f'The Q1ASM operation "{action_type}" is not implemented in the plotter yet. Please contact someone from QHC.'
             )
 
-        return param, register, data_draw
+        return param, register, timeline
 
-    def _calculate_scaling_and_offsets(self, param, i_or_q):
+    def _calculate_scaling_and_offsets(self, param, i_or_q, timeline):
         if i_or_q == "I":
             scaling_factor, max_voltage = self._get_scaling_factors(
-                param, param.get("q1asm_offset_i", 0), param.get("sequencer_runcard_offset_i", 0)
+                param, timeline.value("q1asm_offset_i"), param.get("sequencer_runcard_offset_i", 0)
             )
             gain = param.get("gain_i", 1)
         elif i_or_q == "Q":
             scaling_factor, max_voltage = self._get_scaling_factors(
-                param, param.get("q1asm_offset_q", 0), param.get("sequencer_runcard_offset_q", 0)
+                param, timeline.value("q1asm_offset_q"), param.get("sequencer_runcard_offset_q", 0)
             )
             gain = param.get("gain_q", 1)
         return scaling_factor, max_voltage, gain
@@ -163,88 +239,34 @@ class QbloxDraw:
         # (scaling factor, max voltage)
         return (param["max_voltage"], param["max_voltage"])
 
-    def _handle_play_draw(self, data_draw, program_line, waveform_seq, param):
-        """Play a waveform by appending the stored data list.
+    def _handle_play_draw(self, timeline, program_line, waveform_seq, param):
+        """Play a waveform by appending it to the timeline.
 
         Args:
-            data_draw (list): nested list for each waveform, data points until current time.
+            timeline (_DrawTimeline): events of the bus until the current time.
             program_line (tuple): line of the Q1ASM program parsed with a play instruction.
-            waveform_seq (Dict items): waveform data as provided by the sequencer
-            param (dictionary): parameters of the bus (IF, phase, offset, hardware modulation).
+            waveform_seq (dictionary): waveform data of the sequencer, by index.
+            param (dictionary): parameters of the bus (gains, hardware modulation, time counters).
 
         Returns:
-            Appended data_draw considering the play, the gain and the offset.
-            And appended the IF and phase keys of the param dictionary. Each of these is a np array where 1 data point represents 1 ns (same as the waveforms).
+            The length of the waveform played, considering the gain, and the duration of the play instruction.
         """
         output_path1, output_path2, classical_duration_play = map(int, program_line[1].split(","))
-        # modify and store the wf data
-        # tracker to avoid looping for the entirety of the waveform dictionary but rather stop when both I and Q have been found
-        wf_found = 0
-        for idx, output_path in enumerate([output_path1, output_path2]):
-            for _, waveform_value in waveform_seq:
-                index = waveform_value["index"]
-                if index == output_path:
-                    iq = "I" if idx == 0 else "Q"
-                    scaling_factor, max_voltage, gain = self._calculate_scaling_and_offsets(param, iq)
-                    scaled_array = np.array(waveform_value["data"]) * scaling_factor
-                    modified_waveform = np.clip(scaled_array * gain, -max_voltage, max_voltage)
-                    data_draw[idx] = np.append(data_draw[idx], modified_waveform)
-                    wf_found += 1
-                if wf_found == 2:
-                    break
-        wf_length = len(modified_waveform)
-
-        # extend the IF and phase by the length of the wf
-        for key in ["intermediate_frequency", "phase", "q1asm_offset_i", "q1asm_offset_q"]:
-            if param.get(f"{key}_new", False) is True:
-                param[key].extend([param[key][-1]] * (len(scaled_array) - 1))
-                param[f"{key}_new"] = False
-            else:
-                param[key].extend([param[key][-1]] * len(scaled_array))
+        modified_waveforms = []
+        for iq, output_path in zip(["I", "Q"], [output_path1, output_path2]):
+            scaling_factor, max_voltage, gain = self._calculate_scaling_and_offsets(param, iq, timeline)
+            scaled_array = waveform_seq[output_path] * scaling_factor
+            modified_waveforms.append(np.clip(scaled_array * gain, -max_voltage, max_voltage))
+        timeline.play(*modified_waveforms)
 
-        if len(param["acquiring_status"]) < len(param["intermediate_frequency"]):
-            extension_length = len(param["intermediate_frequency"]) - len(param["acquiring_status"])
-            param["acquiring_status"] = np.concatenate(
-                [param["acquiring_status"], np.zeros(extension_length, dtype=int)]
-            )
-
-        return data_draw, wf_length, classical_duration_play
-
-    def _handle_wait_draw(self, data_draw, param, time):
-        """Play a wait by appending the stored data list.
-
-        Args:
-            data_draw (list): nested list for each waveform, data points until current time.
-            program_line (tuple): line of the Q1ASM program parsed with a wait instruction.
-            param (dictionary): parameters of the bus (IF, phase, offset, hardware modulation).
-            time (int): reañ duration of the wait
-
-        Returns:
-            Appended data_draw considering the wait and the offset.
-            And appended the IF and phase keys of the param dictionary. Each of these is a np array where 1 data point represents 1 ns (same as the waveforms).
-        """
-        # add a clock cycle - used for acquisitions
-        y_wait = np.linspace(0, 0, int(time))
-        data_draw[0] = np.append(data_draw[0], (y_wait))
-        data_draw[1] = np.append(data_draw[1], (y_wait))
-
-        # Extend the IF and phase by the length of the wf
-        for key in ["intermediate_frequency", "phase", "q1asm_offset_i", "q1asm_offset_q"]:
-            if param.get(f"{key}_new", False) is True:
-                param[key].extend([param[key][-1]] * (len(y_wait) - 1))
-                param[f"{key}_new"] = False
-            else:
-                param[key].extend([param[key][-1]] * len(y_wait))
-
-        return data_draw
+        return len(modified_waveforms[0]), classical_duration_play
 
     def _handle_gain_draw(self, program_line, param, register):
         """Updates the param dictionary when a gain is set in the program
 
         Args:
-            data_draw (list): nested list for each waveform, data points until current time.
             program_line (tuple): line of the Q1ASM program parsed with a gain or offset instruction.
-            param (dictionary): parameters of the bus (IF, phase, offset, hardware modulation).
+            param (dictionary): parameters of the bus (gains, hardware modulation, time counters).
             register (dictionary): registers of the Q1ASM.
 
         Returns:
@@ -256,17 +278,17 @@ class QbloxDraw:
         param["gain_i"], param["gain_q"] = i_val, q_val
         return param
 
-    def _handle_offset(self, program_line, param, register):
-        """Updates the param dictionary when an offset is set in the program
+    def _handle_offset(self, program_line, param, register, timeline):
+        """Updates the timeline when an offset is set in the program
 
         Args:
-            data_draw (list): nested list for each waveform, data points until current time.
             program_line (tuple): line of the Q1ASM program parsed with an offset instruction.
-            param (dictionary): parameters of the bus (IF, phase, offset, hardware modulation).
+            param (dictionary): parameters of the bus (gains, hardware modulation, time counters).
             register (dictionary): registers of the Q1ASM.
+            timeline (_DrawTimeline): events of the bus until the current time.
 
         Returns:
-            Appends the param dictionary
+            The param dictionary
         """
         offi, offq = program_line[1].split(", ")
         offi = float(self._get_value(offi, register))
@@ -278,48 +300,36 @@ class QbloxDraw:
             scaling_offset = param["max_voltage"]
 
         for x, off in zip(["q1asm_offset_i", "q1asm_offset_q"], [offi, offq]):
-            new_key = f"{x}_new"
-            if param[new_key]:
-                param[x][-1] = off * scaling_offset / 32767
-            else:
-                param[x].append(off * scaling_offset / 32767)
-            param[new_key] = True
+            timeline.set(x, off * scaling_offset / 32767)
         return param
 
-    def _handle_freq_phase_draw(self, program_line, param, register, key):
-        """Updates the param dictionary when a freq or phase is set in the program
+    def _handle_freq_phase_draw(self, program_line, param, register, timeline, key):
+        """Updates the timeline when a freq or phase is set in the program
 
         Args:
-            data_draw (list): nested list for each waveform, data points until current time.
             program_line (tuple): line of the Q1ASM program parsed with a freq or phase instruction.
-            param (dictionary): parameters of the bus (IF, phase, offset, hardware modulation).
+            param (dictionary): parameters of the bus (gains, hardware modulation, time counters).
+            register (dictionary): registers of the Q1ASM.
+            timeline (_DrawTimeline): events of the bus until the current time.
             key (string): the key is freq or phase.
 
         Returns:
-            Appends the param dictionary.
+            The param dictionary.
         """
-        new_key = f"{key}_new"
-        if param[new_key]:
-            param[key][-1] = self._get_value(program_line[1], register)
-        else:
-            param[key].append(self._get_value(program_line[1], register))
-        param[new_key] = True
+        timeline.set(key, self._get_value(program_line[1], register))
         return param
 
-    def _handle_reset_phase_draw(self, param):
+    def _handle_reset_phase_draw(self, param, timeline):
         """Handles a reset phase
 
         Args:
-            param (dictionary): parameters of the bus (IF, phase, offset, hardware modulation).
+            param (dictionary): parameters of the bus (gains, hardware modulation, time counters).
+            timeline (_DrawTimeline): events of the bus until the current time.
 
         Returns:
-            Sets the phase as 0 in the param dictionary.
+            The param dictionary, with the phase set to 0 in the timeline.
         """
-        if param["phase_new"]:
-            param["phase"][-1] = 0
-        else:
-            param["phase"].append(0)
-        param["phase_new"] = True
+        timeline.set("phase", 0)
         return param
 
     def _handle_add_draw(self, register, program_line):
@@ -406,81 +416,85 @@ class QbloxDraw:
                 where 1 is the index and () is a tuple of the loop labels
                 ie: (avg_0, loop_0) meaning the current isntruction is part of 2 loops, avg_0 as top and loop_0 as nested.
 
+        Note:
+            The programs are parsed with :meth:`.Q1ASMProgram.parse`, which caches them, so drawing the same compiled
+            program again does not parse it again.
         """
 
         seq_parsed_program = {}
         # Iterate through the bus of the sequences
         for bus in sequences:
             sequence = sequences[bus].to_dict()
-            program_line = sequence["program"].split("\n")
-            processed_lines = []
-
-            # parse all lines of qprogram and deal with special case of reset phase
-            for line in program_line:
-                stripped_line = line.strip()
-                if stripped_line.startswith("reset_ph"):
-                    processed_lines.append("reset_ph             2")
-                elif stripped_line.startswith("nop"):
-                    processed_lines.append("nop             2")
-                else:
-                    processed_lines.append(stripped_line)
-            line_data = "\n".join(processed_lines)
-            pattern = r"(\w+):|(\w+)(?:\s+([^\n]*))?"
-            # (section/loop, instruction, numerical value)
-            matches = re.findall(pattern, line_data)
-
-            program_parsed = {
-                "setup": [],
-                "main": [],
-                # each section is a list of tuples (instruction, numerical value, (tuple of loop label), index)
-            }
-            # Track execution order
-            index = 0
-            # Create a list of the program section made of tuples (command, args, index)
-            loop_label = ()
-            for section, instruction, numerical_value in matches:
-                if section:
-                    if section == "setup":
-                        current_section = section
-                        index = 0
-                    if section == "main":
-                        current_section = section
-                        index = 0
-                    elif section not in ["setup", "main"]:
-                        # add the label of the loop
-                        loop_label += (section,)
-                elif instruction:
-                    numerical_value = numerical_value if numerical_value else ""
-                    program_parsed[current_section].append(
-                        (instruction, numerical_value, loop_label, index)
-                        # Store index
-                    )
-                    # Increment order index
-                    index += 1
-                    # remove the @, eg: Q1ASM has @loop_0 and we want loop_0
-                    for la in loop_label:
-                        if ("@" + la) in numerical_value:
-                            loop_label = tuple(l for l in loop_label if l != la)
-                sequence["program"] = program_parsed
-            del sequence["program"]["main"][
-                -3:
-                # delete the last 3 lines of the Q1ASM that are always hardcoded - tempers with the _new flag later on if not removed here
-            ]
+            sequence["program"] = self._program_sections(Q1ASMProgram.parse(sequence["program"]))
             seq_parsed_program[bus] = sequence
         return seq_parsed_program
 
+    def _program_sections(self, program: Q1ASMProgram):
+        """Splits a parsed Q1ASM program into its setup and main sections, in the format of :meth:`_parse_program`.
+
+        Args:
+            program (Q1ASMProgram): the parsed program.
+
+        Returns:
+            dictionary with the list of lines of each section.
+        """
+        labels_at: dict[int, list[str]] = {}
+        for label, position in program.labels.items():
+            if label not in {"setup", "main"}:
+                labels_at.setdefault(position, []).append(label)
+
+        sections: dict[str, list] = {"setup": [], "main": []}
+        # labels of the loops containing the current instruction, from the outermost to the innermost
+        loop_label: tuple[str, ...] = ()
+        for position, (instruction, operands) in enumerate(program.instructions):
+            section = "main" if position >= program.labels["main"] else "setup"
+            loop_label += tuple(labels_at.get(position, ()))
+            values = []
+            closed = None
+            for operand_idx, operand in enumerate(operands):
+                if _JUMP_TARGETS.get(instruction) == operand_idx:
+                    # the jump closes the innermost loop starting at its target
+                    targets = [label for label in loop_label if program.labels[label] == operand]
+                    closed = targets[-1] if targets else None
+                    values.append(f"@{closed or labels_at[operand][0]}")
+                elif operand < 0:
+                    values.append(f"R{~operand}")
+                else:
+                    # immediates are stored as 32 bits words
+                    values.append(str(operand - (1 << 32) if operand >> 31 else operand))
+            sections[section].append((instruction, ", ".join(values), loop_label, len(sections[section])))
+            if closed is not None:
+                loop_label = tuple(label for label in loop_label if label != closed)
+
+        # delete the last 3 lines of the Q1ASM that are always hardcoded - tempers with the _new flag later on if not removed here
+        del sections["main"][-3:]
+        return sections
+
     def draw(
-        self, sequencer, runcard_data=None, time_window=None, averages_displayed=False, acquisition_showing=True
+        self,
+        sequencer,
+        runcard_data=None,
+        time_window=None,
+        averages_displayed=False,
+        acquisition_showing=True,
+        max_points=None,
     ) -> dict:
         """Parses the program dictionary of the sequence, plots the waveforms and generates waveform data.
+
+        The program of each bus is run once to record its plays, waits, acquisitions and parameter updates with their
+        absolute time, and the waveforms are then computed at once into arrays allocated with the final duration, so
+        that long waits and many loop iterations only cost the samples actually drawn.
+
         Args:
-            sequencer: The compiled qprogram, either at the platform or qprogram level.
+            sequencer (QbloxCompilationOutput): The compiled qprogram, either at the platform or qprogram level.
             runcard_data (dictionary): parameters of the bus (IF, phase, offset, hardware modulation) retrieved from the runcard if using the platform
                 This gets renamed as param to overwrite/add values from the sequencer.
             averages_displayed (bool): Determines how looping variables are handled. If False (default), all loops
                 on the sequencer starting with `avg_` will only iterate once. If True, all iterations are displayed.
-            loops_displayed (bool): Determines how looping variables are handled. If False (default), all loops
-                on the sequencer starting with `loop_` will only iterate once. If True, all iterations are displayed.
+            max_points (int, optional): Maximum number of points of each trace of the figure. Longer traces are
+                downsampled keeping the minimum and the maximum of each interval, so that the envelope of fast
+                oscillations is preserved. The returned data is never downsampled. Defaults to None, which plots every
+                sample.
 
 
         Returns:
@@ -496,8 +510,9 @@ class QbloxDraw:
             raise NotImplementedError("QbloxDraw does not support hardware time-domain loops at the moment.")
 
         self.acquisition_showing = acquisition_showing
+        self.max_points = max_points
         Q1ASM_ordered = self._parse_program(
-            sequencer.sequences.copy()
+            sequencer.sequences
             # (instruction, value, label of the loops, index)
         )
         data_draw = {}
@@ -511,7 +526,6 @@ class QbloxDraw:
                     # retrieve runcard data if the qblox draw is called when a platform has been built
                 }
                 IF = parameters[bus]["intermediate_frequency"] * 4
-                parameters[bus]["intermediate_frequency"] = [IF]
                 parameters[bus]["sequencer_runcard_offset_i"] = parameters[bus]["offset_i"]
                 parameters[bus]["sequencer_runcard_offset_q"] = parameters[bus]["offset_q"]
                 if parameters[bus]["instrument_name"] in {"QCM", "QCM-RF"}:
@@ -521,41 +535,36 @@ class QbloxDraw:
             # no runcard uploaded- running qp directly
             else:
                 parameters[bus] = {}
-                parameters[bus]["intermediate_frequency"] = [0]
-                parameters[bus]["sequencer_runcard_offset_i"] = [0]
-                parameters[bus]["sequencer_runcard_offset_q"] = [0]
-                parameters[bus]["dac_offset_i"] = [0]
-                parameters[bus]["dac_offset_q"] = [0]
+                IF = 0
+                parameters[bus]["sequencer_runcard_offset_i"] = 0
+                parameters[bus]["sequencer_runcard_offset_q"] = 0
+                parameters[bus]["dac_offset_i"] = 0
+                parameters[bus]["dac_offset_q"] = 0
                 # if plotting directly from qp, plot i and q
                 parameters[bus]["hardware_modulation"] = True
                 parameters[bus]["max_voltage"] = 1
                 parameters[bus]["instrument_name"] = "QProgram"
-            parameters[bus]["q1asm_offset_i"] = [0]
-            parameters[bus]["q1asm_offset_q"] = [0]
-            parameters[bus]["phase"] = [0]
             parameters[bus]["real_time_counter"] = 0
             parameters[bus]["classical_time_counter"] = 0
-            parameters[bus]["acquiring_status"] = [0]
-            parameters[bus]["play_status"] = [0]
-
-            # flags to determine if the phase or freq has been updated and the time_window
-            parameters[bus]["phase_new"] = True
-            parameters[bus]["intermediate_frequency_new"] = True
-            parameters[bus]["q1asm_offset_i_new"] = True
-            parameters[bus]["q1asm_offset_q_new"] = True
+
+            # flag to determine if the time_window has been reached
             parameters[bus]["time_reached"] = False
             parameters[bus]["acquire_idx"] = 0
             parameters[bus]["play_idx"] = 0
 
-            wf1: list[float] = []
-            wf2: list[float] = []
             param = parameters[bus]
+            timeline = _DrawTimeline(
+                {"intermediate_frequency": IF, "phase": 0, "q1asm_offset_i": 0, "q1asm_offset_q": 0}
+            )
             # keep track of the instructions that have been done
-            instructions_ran = []
-            data_draw[bus] = [wf1, wf2]
+            instructions_ran = set()
             # list to keep track of the label once they have been looped over
             label_done = []
-            wf = Q1ASM_ordered[bus]["waveforms"].items()
+            wf = {
+                waveform["index"]: np.asarray(waveform["data"], dtype=float)
+                for waveform in Q1ASM_ordered[bus]["waveforms"].values()
+            }
+            main = Q1ASM_ordered[bus]["program"]["main"]
 
             # Loop through the program to store the register and have the information on the loops
             register = {}
@@ -579,77 +588,59 @@ class QbloxDraw:
                             loop_info[l][2] = value.split(",")[0]
                             if l.startswith("avg") and not averages_displayed:
                                 loop_info[l][2] = "avg_no_loop"
-                    sorted_labels = sorted(loop_info.items(), key=lambda x: x[1][0])
+            sorted_labels = sorted(loop_info.items(), key=lambda x: x[1][0])
 
             def process_loop(recursive_input, i):
-                if not parameters[bus]["time_reached"]:
+                if not param["time_reached"]:
                     (label, [start, end, value]) = recursive_input
                     if label not in label_done:
                         label_done.append(label)
                     for x in range(register[value], 0, -1):
                         current_idx = start
                         while current_idx <= end:
-                            item = Q1ASM_ordered[bus]["program"]["main"][current_idx]
-                            wf = Q1ASM_ordered[bus]["waveforms"].items()
+                            item = main[current_idx]
                             _, value, label, _ = item
                             for la in label:
                                 # nested loop
                                 if la not in label_done:
-                                    new_label = la
-                                    result = next(
-                                        (element for element in sorted_labels if element[0] == new_label),
-                                        None,
-                                        # retrieve the start/end/variable of the new label
-                                    )
-                                    current_idx = process_loop(result, current_idx)
-                                    if parameters[bus]["time_reached"] is True:
+                                    # retrieve the start/end/variable of the new label
+                                    current_idx = process_loop((la, loop_info[la]), current_idx)
+                                    if param["time_reached"] is True:
                                         return current_idx
-                                    label_index = {}
                                     # check if there is a nested loop, if yes need to remove it from label_dne, otherwise it wont loop over in the next iteration of the parent
-                                    for a in label_done:
-                                        element = next((e for e in sorted_labels if e[0] == a), None)[1][0]
-                                        label_index[a] = int(element)
-                                    max_value = max(label_index.values())
-                                    max_keys = [key for key, value in label_index.items() if value == max_value]
-                                    label_done.remove(max_keys[0])
-
-                            item = Q1ASM_ordered[bus]["program"]["main"][current_idx]
-                            wf = Q1ASM_ordered[bus]["waveforms"].items()
-                            instructions_ran.append(item[-1])
-                            self._call_handlers(item, param, register, data_draw[bus], wf)
-                            if time_window is not None and len(data_draw[bus][0]) >= time_window:
-                                parameters[bus]["time_reached"] = True
+                                    label_done.remove(max(label_done, key=lambda a: loop_info[a][0]))
+
+                            item = main[current_idx]
+                            instructions_ran.add(item[-1])
+                            self._call_handlers(item, param, register, timeline, wf)
+                            if time_window is not None and timeline.length >= time_window:
+                                param["time_reached"] = True
                                 return current_idx
                             current_idx += 1
                 return current_idx
 
-            for q1asm_line in Q1ASM_ordered[bus]["program"]["main"]:
-                if parameters[bus]["time_reached"]:
+            for q1asm_line in main:
+                if param["time_reached"]:
                     break
 
                 if (
                     q1asm_line[2] and q1asm_line[-1] not in instructions_ran
                     # if there is a loop label and if the index has not been ran before
                 ):
-                    index = 0
-                    for x in sorted_labels:
-                        if x[0] == q1asm_line[2][0]:
-                            input_recursive = x
-                            # Stop as soon as the first match is found
-                            break
-                    process_loop(input_recursive, index)
+                    input_recursive = next(x for x in sorted_labels if x[0] == q1asm_line[2][0])
+                    process_loop(input_recursive, 0)
 
                 # run if no loop label
                 elif q1asm_line[-1] not in instructions_ran:
-                    self._call_handlers(q1asm_line, param, register, data_draw[bus], wf)
-                    if time_window is not None and len(data_draw[bus][0]) >= time_window:
-                        parameters[bus]["time_reached"] = True
+                    self._call_handlers(q1asm_line, param, register, timeline, wf)
+                    if time_window is not None and timeline.length >= time_window:
+                        param["time_reached"] = True
                         break
 
-            # remove the latest freq, phase and offset data points if nothing played after
-            for key in ["intermediate_frequency", "phase", "q1asm_offset_i", "q1asm_offset_q"]:
-                if param[f"{key}_new"]:
-                    param[key].pop()
+            # compute the samples of the waveforms, freq, phase and offsets
+            waveform_i, waveform_q, rendered_parameters, param["acquiring_status"] = timeline.render()
+            param |= rendered_parameters
+            data_draw[bus] = [waveform_i, waveform_q]
 
             self._interrupt_acquire(param)
             parameters[bus] = param
@@ -657,6 +648,28 @@ class QbloxDraw:
         data_draw = self._oscilloscope_plotting(data_draw, parameters)
         return data_draw
 
+    def _trace_points(self, samples):
+        """Points of the trace of ``samples`` in the figure, downsampled to at most ``max_points`` if given.
+
+        Each interval of samples is represented by its minimum and its maximum, in the order they happen, so that the
+        envelope of oscillations faster than the resolution of the plot is preserved.
+
+        Args:
+            samples (np.ndarray): samples of the waveform, one per ns.
+
+        Returns:
+            dict: the ``y`` values of the trace, and their ``x`` positions in ns if it has been downsampled.
+        """
+        if self.max_points is None or len(samples) <= self.max_points:
+            return {"y": samples}
+        num_intervals = max(1, self.max_points // 2)
+        interval = -(-len(samples) // num_intervals)
+        padded = np.pad(samples, (0, num_intervals * interval - len(samples)), mode="edge").reshape(-1, interval)
+        offsets = np.arange(num_intervals)[:, None] * interval
+        extremes = np.stack([padded.argmin(axis=1), padded.argmax(axis=1)], axis=1) + offsets
+        x = np.minimum(np.sort(extremes, axis=1).ravel(), len(samples) - 1)
+        return {"x": x, "y": samples[x]}
+
     def _interrupt_acquire(self, param):
         """Interrupts the last acquire that is still running. This function is not actually used in qililab but if the duration of the acquire
         and the intergration were to be different, this will allow interrupting acquires similarly to play"""
@@ -680,21 +693,14 @@ class QbloxDraw:
         """
 
         def range_acquire(nparray):
-            ranges = []
-            start = None
-            idx_acquire = 1
-            for idx, value in enumerate(nparray):
-                if value == idx_acquire and start is None:
-                    start = idx
-                elif value != idx_acquire and start is not None:
-                    ranges.append([start, idx - 1])
-                    idx_acquire += 1
-                    start = None
-                    if value != 0:
-                        start = idx
-                elif value == idx_acquire and idx == len(nparray) - 1:
-                    ranges.append([start, idx + 1])
-            return ranges
+            status = np.asarray(nparray)
+            acquiring = status != 0
+            # first and last sample of each run of samples of the same acquisition
+            starts = np.flatnonzero(acquiring & (status != np.concatenate([[0], status[:-1]])))
+            stops = np.flatnonzero(acquiring & (status != np.concatenate([status[1:], [0]])))
+            return [
+                [int(start), int(stop) if stop < len(status) - 1 else len(status)] for start, stop in zip(starts, stops)
+            ]
 
         def adjust_color_rgb(color_rgb, factor):
             r, g, b = map(int, re.findall(r"\d+", color_rgb))
@@ -732,7 +738,14 @@ class QbloxDraw:
                 )
                 data_draw[key][0] = waveform_flux
                 data_draw[key][1] = None
-                fig.add_trace(go.Scatter(y=waveform_flux, mode="lines", name=f"{key} Flux", line={"color": base_color}))
+                fig.add_trace(
+                    go.Scatter(
+                        **self._trace_points(waveform_flux),
+                        mode="lines",
+                        name=f"{key} Flux",
+                        line={"color": base_color},
+                    )
+                )
 
             else:
                 sequencer_runcard_offset_i, sequencer_runcard_offset_q = (
@@ -766,10 +779,14 @@ class QbloxDraw:
                 path1_clipped = np.clip(path1, -volt_bounds, volt_bounds)
 
                 data_draw[key][0], data_draw[key][1] = path0_clipped, path1_clipped
-                fig.add_trace(go.Scatter(y=path0_clipped, mode="lines", name=f"{key} I", line={"color": base_color}))
                 fig.add_trace(
                     go.Scatter(
-                        y=path1_clipped,
+                        **self._trace_points(path0_clipped), mode="lines", name=f"{key} I", line={"color": base_color}
+                    )
+                )
+                fig.add_trace(
+                    go.Scatter(
+                        **self._trace_points(path1_clipped),
                         mode="lines",
                         name=f"{key} Q",
                         line={"color": adjust_color_rgb(base_color, 1.5)},
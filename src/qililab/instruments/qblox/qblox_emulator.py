@@ -0,0 +1,623 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Emulated Qblox cluster, which runs the uploaded Q1ASM programs offline instead of on the hardware."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import partial
+from threading import RLock
+from typing import Any, ClassVar
+
+import numpy as np
+
+from qililab.instruments.qblox.q1asm_interpreter import (
+    TRIGGER_NETWORK_LATENCY,
+    Q1ASMInterpreter,
+    Q1ASMProgram,
+    Q1ASMTrace,
+)
+from qililab.typings.instruments.device import Device
+
+NUM_SLOTS = 20
+NUM_SEQUENCERS = 6
+SCOPE_SAMPLES = 16384
+MAX_OUTPUT_ATTENUATION = 60
+
+
+@dataclass
+class QbloxEmulatorModel:
+    """Model of the signals received by the inputs of the modules of an :class:`EmulatedCluster`.
+
+    The inputs of each sequencer receive its own outputs, delayed by ``time_of_flight``, scaled by ``loopback`` and
+    with white gaussian noise added. Each acquisition finds the qubit in the excited state with probability
+    ``excited_state_probability``, in which case ``excited_state_response`` is added to the inputs during the
+    acquisition, so that thresholding the integrated values recovers the excited state population.
+
+    Args:
+        noise (float, optional): Standard deviation of the noise of each input sample, relative to full scale.
+            Defaults to 0.0.
+        loopback (float, optional): Gain from the outputs of a sequencer to its inputs. Defaults to 1.0.
+        time_of_flight (int, optional): Delay in ns from the outputs of a sequencer to its inputs. Defaults to 0.
+        excited_state_probability (float, optional): Probability of finding the qubit excited. Defaults to 0.0.
+        excited_state_response (list[float], optional): I and Q amplitude added to the inputs while reading out the
+            excited state. Defaults to [0.0, 0.0].
+        seed (int | None, optional): Seed of the random number generator of the noise and the qubit states.
+            Defaults to None.
+        max_instructions (int, optional): Maximum number of instructions executed by a sequencer in a single run,
+            after which it is stopped. Defaults to 10**8.
+    """
+
+    noise: float = 0.0
+    loopback: float = 1.0
+    time_of_flight: int = 0
+    excited_state_probability: float = 0.0
+    excited_state_response: list[float] = field(default_factory=lambda: [0.0, 0.0])
+    seed: int | None = None
+    max_instructions: int = 10**8
+
+
+class _EmulatedParameters:
+    """Stores the parameters of an emulated instrument, which are called like QCoDeS parameters: ``instrument.name()``
+    gets the value of ``name`` and ``instrument.name(value)`` sets it. Parameters without a default are None until set.
+    """
+
+    _DEFAULTS: ClassVar[dict[str, Any]] = {}
+
+    def __init__(self):
+        self._parameters: dict[str, Any] = dict(self._DEFAULTS)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return partial(self._parameter, name)
+
+    def _parameter(self, name: str, *value: Any) -> Any:
+        if value:
+            self._parameters[name] = value[0]
+            return None
+        return self._parameters.get(name)
+
+    def set(self, name: str, value: Any):
+        """Sets the value of a parameter."""
+        self._parameters[name] = value
+
+    def get(self, name: str) -> Any:
+        """Returns the value of a parameter."""
+        return self._parameters.get(name)
+
+    def _reset_parameters(self):
+        self._parameters = dict(self._DEFAULTS)
+
+
+@dataclass
+class _AcquisitionBins:
+    """Accumulated values of the bins of an acquisition, and its scope."""
+
+    integration: np.ndarray
+    threshold: np.ndarray
+    avg_cnt: np.ndarray
+    scope: np.ndarray | None = None
+    scope_avg_cnt: int = 0
+
+    @classmethod
+    def empty(cls, num_bins: int) -> _AcquisitionBins:
+        return cls(
+            integration=np.zeros((2, num_bins)), threshold=np.zeros(num_bins), avg_cnt=np.zeros(num_bins, dtype=int)
+        )
+
+    def to_dict(self) -> dict:
+        """Returns the acquisition in the format of ``Cluster.get_acquisitions``, with the bins averaged."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            integration = np.where(self.avg_cnt > 0, self.integration / self.avg_cnt, np.nan)
+            threshold = np.where(self.avg_cnt > 0, self.threshold / self.avg_cnt, np.nan)
+        scope = self.scope if self.scope is not None else np.zeros((2, 0))
+        return {
+            "scope": {
+                f"path{path}": {"data": scope[path], "out-of-range": False, "avg_cnt": self.scope_avg_cnt}
+                for path in range(2)
+            },
+            "bins": {
+                "integration": {"path0": integration[0], "path1": integration[1]},
+                "threshold": threshold,
+                "avg_cnt": self.avg_cnt.copy(),
+            },
+        }
+
+
+class EmulatedSequencer(_EmulatedParameters):
+    """Sequencer of an :class:`EmulatedModule`.
+
+    Uploading a sequence parses its program and loads its waveforms, weights and acquisitions. When the sequencer is
+    started, the cluster runs its program with a :class:`.Q1ASMInterpreter` and integrates the acquisitions over the
+    signals modelled by its :class:`QbloxEmulatorModel`.
+    """
+
+    _DEFAULTS: ClassVar[dict[str, Any]] = {
+        "sync_en": False,
+        "marker_ovr_en": False,
+        "marker_ovr_value": 0,
+        "mod_en_awg": False,
+        "demod_en_acq": False,
+        "nco_freq": 0.0,
+        "gain_awg_path0": 1.0,
+        "gain_awg_path1": 1.0,
+        "offset_awg_path0": 0.0,
+        "offset_awg_path1": 0.0,
+        "mixer_corr_gain_ratio": 1.0,
+        "mixer_corr_phase_offset_degree": 0.0,
+        "integration_length_acq": 1024,
+        "thresholded_acq_threshold": 0.0,
+        "thresholded_acq_rotation": 0.0,
+        "thresholded_acq_trigger_en": False,
+        "thresholded_acq_trigger_address": 1,
+        "thresholded_acq_trigger_invert": False,
+    }
+
+    def __init__(self, module: EmulatedModule, index: int):
+        super().__init__()
+        self.module = module
+        self.index = index
+        self._clear()
+
+    def _clear(self):
+        self._sequence: dict = {}
+        self.program = Q1ASMProgram.parse("")
+        self.waveforms: dict[int, np.ndarray] = {}
+        self.weights: dict[int, np.ndarray] = {}
+        self.acquisitions: dict[str, dict[str, int]] = {}
+        self._bins: dict[int, _AcquisitionBins] = {}
+        self._trace: Q1ASMTrace | None = None
+        self._states: np.ndarray = np.zeros(0, dtype=bool)
+        self._nco_table: tuple[np.ndarray, ...] | None = None
+        self.armed = False
+
+    def reset(self):
+        """Resets the parameters of the sequencer and clears its sequence and acquisitions."""
+        self._reset_parameters()
+        self._clear()
+
+    def sequence(self, sequence: dict | None = None) -> dict | None:
+        """Uploads a sequence, with its ``program``, ``waveforms``, ``weights`` and ``acquisitions``, or returns the
+        sequence uploaded last when called without arguments."""
+        if sequence is None:
+            return self._sequence
+        self._sequence = sequence
+        self.program = Q1ASMProgram.parse(sequence.get("program", ""))
+        self.waveforms = {
+            int(waveform["index"]): np.asarray(waveform["data"], dtype=float)
+            for waveform in sequence.get("waveforms", {}).values()
+        }
+        self.weights = {
+            int(weight["index"]): np.asarray(weight["data"], dtype=float)
+            for weight in sequence.get("weights", {}).values()
+        }
+        self.acquisitions = {
+            name: {"num_bins": int(acquisition["num_bins"]), "index": int(acquisition["index"])}
+            for name, acquisition in sequence.get("acquisitions", {}).items()
+        }
+        self.delete_acquisition_data(all=True)
+        self._trace = None
+        self._nco_table = None
+        return None
+
+    @property
+    def trace(self) -> Q1ASMTrace | None:
+        """Timeline of the last run of the program, or None if it has not been run. Runs it first if it was started."""
+        self.module.cluster.run_started_sequencers()
+        return self._trace
+
+    def delete_acquisition_data(self, name: str = "", all: bool = False):  # pylint: disable=redefined-builtin
+        """Deletes the data of the acquisition ``name``, or of all the acquisitions."""
+        for acquisition_name, acquisition in self.acquisitions.items():
+            if all or acquisition_name == name:
+                self._bins[acquisition["index"]] = _AcquisitionBins.empty(acquisition["num_bins"])
+
+    def get_acquisitions(self) -> dict:
+        """Returns the acquisitions, by name, in the format of ``Cluster.get_acquisitions``."""
+        return {
+            name: {"index": acquisition["index"], "acquisition": self._bins[acquisition["index"]].to_dict()}
+            for name, acquisition in self.acquisitions.items()
+        }
+
+    def run(self, model: QbloxEmulatorModel, rng: np.random.Generator, triggers: dict[int, list[int]]):
+        """Runs the program and accumulates its acquisitions, sending the triggers of its thresholded acquisitions.
+
+        Args:
+            model (QbloxEmulatorModel): Model of the signals received by the inputs.
+            rng (np.random.Generator): Generator of the noise and the qubit states.
+            triggers (dict[int, list[int]]): Arrival times of the triggers, by address, read by the conditional
+                instructions and appended to by the thresholded acquisitions.
+        """
+        interpreter = Q1ASMInterpreter(
+            self.program,
+            triggers=triggers,
+            nco_frequency=float(self.get("nco_freq") or 0.0),
+            max_instructions=model.max_instructions,
+        )
+        self._trace = interpreter.run()
+        self._nco_table = None
+        acquisitions = self._trace.acquisitions
+        self._states = rng.random(len(acquisitions)) < model.excited_state_probability
+        noise = rng.standard_normal((len(acquisitions), 2)) * model.noise if model.noise else None
+
+        rotation = np.deg2rad(float(self.get("thresholded_acq_rotation") or 0.0))
+        threshold = float(self.get("thresholded_acq_threshold") or 0.0)
+        send_triggers = bool(self.get("thresholded_acq_trigger_en"))
+        invert = bool(self.get("thresholded_acq_trigger_invert"))
+        address = int(self.get("thresholded_acq_trigger_address") or 1)
+        response = np.asarray(model.excited_state_response, dtype=float)
+
+        for number, (time, index, bin_index, _, weights) in enumerate(acquisitions):
+            if weights is None:
+                length = int(self.get("integration_length_acq") or 0)
+                weight = (np.ones(length), np.ones(length))
+            else:
+                weight = (self.weights[weights[0]], self.weights[weights[1]])
+                length = max(len(weight[0]), len(weight[1]))
+            signal = self._input(time, length, model)
+            integration = np.array([signal[0, : len(weight[0])] @ weight[0], signal[1, : len(weight[1])] @ weight[1]])
+            if self._states[number]:
+                integration += response * (weight[0].sum(), weight[1].sum())
+            if noise is not None:
+                integration += noise[number] * (np.linalg.norm(weight[0]), np.linalg.norm(weight[1]))
+            state = integration[0] * np.cos(rotation) - integration[1] * np.sin(rotation) >= threshold
+
+            bins = self._bins.get(index)
+            if bins is None or bin_index >= len(bins.avg_cnt):
+                raise ValueError(
+                    f"Sequencer {self.index} of slot {self.module.slot} acquired into bin {bin_index} of acquisition "
+                    f"{index}, which does not exist."
+                )
+            bins.integration[:, bin_index] += integration
+            bins.threshold[bin_index] += state
+            bins.avg_cnt[bin_index] += 1
+            if send_triggers and state != invert:
+                triggers.setdefault(address, []).append(time + length + TRIGGER_NETWORK_LATENCY)
+
+    def store_scope(self, index: int, model: QbloxEmulatorModel, rng: np.random.Generator, average: bool):
+        """Stores the signal received by the inputs during the acquisitions into the scope of acquisition ``index``.
+
+        Args:
+            index (int): Index of the acquisition.
+            model (QbloxEmulatorModel): Model of the signals received by the inputs.
+            rng (np.random.Generator): Generator of the noise.
+            average (bool): Whether to average the signal of all the acquisitions, instead of keeping the last one.
+        """
+        if self._trace is None or not self._trace.acquisitions or index not in self._bins:
+            return
+        acquisitions = self._trace.acquisitions if average else self._trace.acquisitions[-1:]
+        states = self._states if average else self._states[-1:]
+        scope = np.zeros((2, SCOPE_SAMPLES))
+        for time, *_ in acquisitions:
+            scope += self._input(time, SCOPE_SAMPLES, model, demodulate=False)
+        scope /= len(acquisitions)
+        scope += np.mean(states) * np.asarray(model.excited_state_response, dtype=float)[:, None]
+        if model.noise:
+            scope += rng.standard_normal(scope.shape) * model.noise / np.sqrt(len(acquisitions))
+        bins = self._bins[index]
+        bins.scope = scope
+        bins.scope_avg_cnt = len(acquisitions)
+
+    def _input(self, time: int, length: int, model: QbloxEmulatorModel, demodulate: bool = True) -> np.ndarray:
+        """Returns the noiseless signal received by the inputs of the sequencer from ``time`` onwards.
+
+        The inputs receive the outputs, delayed by the time of flight. When the acquisition demodulates the signal, the
+        NCO rotation applied by the outputs is undone, so with both modulation and demodulation enabled the acquisition
+        sees the envelopes.
+        """
+        start = time - model.time_of_flight
+        modulate = bool(self.get("mod_en_awg"))
+        demodulate = demodulate and bool(self.get("demod_en_acq"))
+        signal = self._envelope(start, start + length)
+        if modulate != demodulate:
+            signal = self._rotate(signal, self._nco_phase(start, start + length) * (1 if modulate else -1))
+        return model.loopback * signal
+
+    def render(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Renders the signal output by the paths 0 and 1 of the sequencer during its last run, one sample per ns.
+
+        The waveforms played are scaled by the gains of ``set_awg_gain`` and of the sequencer, shifted by the offsets
+        of ``set_awg_offs`` and of the sequencer and, if modulation is enabled, mixed with the NCO.
+
+        Args:
+            start (int, optional): Time in ns of the first sample. Defaults to 0.
+            stop (int | None, optional): Time in ns after the last sample. Defaults to the duration of the run.
+
+        Returns:
+            np.ndarray: The samples of the paths 0 and 1, with shape ``(2, stop - start)``.
+        """
+        trace = self.trace
+        if trace is None:
+            raise ValueError(f"Sequencer {self.index} of slot {self.module.slot} has not been run.")
+        stop = trace.duration if stop is None else stop
+        signal = self._envelope(start, stop)
+        if self.get("mod_en_awg"):
+            signal = self._rotate(signal, self._nco_phase(start, stop))
+        return signal
+
+    def _envelope(self, start: int, stop: int) -> np.ndarray:
+        """Renders the output of the sequencer between ``start`` and ``stop``, without modulation."""
+        trace = self._trace
+        signal = np.zeros((2, max(stop - start, 0)))
+        if trace is None or stop <= start:
+            return signal
+
+        # Waveforms play until they end or the next play starts, so walk back from the last play starting before stop
+        position = np.searchsorted(trace.play_times, stop, side="left") - 1
+        following = stop
+        while position >= 0:
+            time = trace.play_times[position]
+            index_0, index_1, gain_0, gain_1 = trace.plays[position]
+            for path, (index, gain) in enumerate(((index_0, gain_0), (index_1, gain_1))):
+                waveform = self.waveforms.get(index)
+                if waveform is None:
+                    continue
+                end = min(time + len(waveform), following)
+                low, high = max(time, start), min(end, stop)
+                if high > low:
+                    signal[path, low - start : high - start] += gain * waveform[low - time : high - time]
+            if time <= start:
+                break
+            following = time
+            position -= 1
+
+        # Offsets hold from each change until the next one
+        position = np.searchsorted(trace.offset_times, stop, side="left") - 1
+        following = stop
+        while position >= 0:
+            time = trace.offset_times[position]
+            low = max(time, start)
+            if following > low:
+                signal[:, low - start : following - start] += np.asarray(trace.offsets[position])[:, None]
+            if time <= start:
+                break
+            following = time
+            position -= 1
+
+        gains = np.array([self.get("gain_awg_path0"), self.get("gain_awg_path1")], dtype=float)
+        offsets = np.array([self.get("offset_awg_path0"), self.get("offset_awg_path1")], dtype=float)
+        return signal * gains[:, None] + offsets[:, None]
+
+    def _nco_phase(self, start: int, stop: int) -> np.ndarray:
+        """Returns the phase in radians of the NCO at each ns between ``start`` and ``stop``."""
+        if self._nco_table is None:
+            # Time, frequency, phase offset and accumulated phase after each NCO update
+            trace = self._trace
+            events = trace.nco if trace is not None else []
+            times = np.zeros(len(events) + 1, dtype=np.int64)
+            frequencies = np.full(len(events) + 1, float(self.get("nco_freq") or 0.0))
+            offsets = np.zeros(len(events) + 1)
+            accumulated = np.zeros(len(events) + 1)
+            for number, (time, frequency, offset, reset) in enumerate(events, start=1):
+                elapsed = (
+                    accumulated[number - 1] + 2 * np.pi * frequencies[number - 1] * (time - times[number - 1]) * 1e-9
+                )
+                times[number], frequencies[number], offsets[number] = time, frequency, offset
+                accumulated[number] = 0.0 if reset else elapsed
+            self._nco_table = (times, frequencies, offsets, accumulated)
+        times, frequencies, offsets, accumulated = self._nco_table
+        samples = np.arange(start, stop)
+        segment = np.clip(np.searchsorted(times, samples, side="right") - 1, 0, None)
+        return (
+            accumulated[segment]
+            + 2 * np.pi * frequencies[segment] * (samples - times[segment]) * 1e-9
+            + offsets[segment]
+        )
+
+    @staticmethod
+    def _rotate(signal: np.ndarray, phase: np.ndarray) -> np.ndarray:
+        """Rotates the I/Q ``signal`` by ``phase``."""
+        cos, sin = np.cos(phase), np.sin(phase)
+        return np.array([signal[0] * cos - signal[1] * sin, signal[0] * sin + signal[1] * cos])
+
+
+class EmulatedModule(_EmulatedParameters):
+    """Module in a slot of an :class:`EmulatedCluster`, with the interface of a Qblox ``Module`` used by qililab.
+
+    Args:
+        cluster (EmulatedCluster): The cluster of the module.
+        slot (int): Slot of the module, starting at 1.
+        module_type (str | None): ``"QCM"``, ``"QRM"``, ``"QCM_RF"`` or ``"QRM_RF"``, or None if the slot is empty.
+    """
+
+    _DEFAULTS: ClassVar[dict[str, Any]] = {
+        "scope_acq_sequencer_select": 0,
+        "scope_acq_trigger_mode_path0": "sequencer",
+        "scope_acq_trigger_mode_path1": "sequencer",
+        "scope_acq_avg_mode_en_path0": False,
+        "scope_acq_avg_mode_en_path1": False,
+    }
+
+    def __init__(self, cluster: EmulatedCluster, slot: int, module_type: str | None):
+        super().__init__()
+        self.cluster = cluster
+        self.slot = slot
+        self._module_type = module_type
+        self.sequencers = [EmulatedSequencer(module=self, index=index) for index in range(NUM_SEQUENCERS)]
+
+    @property
+    def present(self) -> bool:
+        """Whether there is a module in the slot."""
+        return self._module_type is not None
+
+    @property
+    def is_qcm_type(self) -> bool:
+        """Whether the module is a QCM or a QCM-RF."""
+        return self._module_type is not None and self._module_type.startswith("QCM")
+
+    @property
+    def is_qrm_type(self) -> bool:
+        """Whether the module is a QRM or a QRM-RF."""
+        return self._module_type is not None and self._module_type.startswith("QRM")
+
+    @property
+    def is_rf_type(self) -> bool:
+        """Whether the module is an RF module."""
+        return self._module_type is not None and self._module_type.endswith("_RF")
+
+    def module_type(self) -> str | None:
+        """Returns the type of the module."""
+        return self._module_type
+
+    def reset(self):
+        """Resets the parameters of the module and of its sequencers."""
+        self._reset_parameters()
+        for sequencer in self.sequencers:
+            sequencer.reset()
+
+    def _selected(self, sequencer: int | None) -> list[EmulatedSequencer]:
+        return self.sequencers if sequencer is None else [self.sequencers[sequencer]]
+
+    def arm_sequencer(self, sequencer: int | None = None):
+        """Arms a sequencer, or all of them."""
+        for selected in self._selected(sequencer):
+            selected.armed = True
+
+    def start_sequencer(self, sequencer: int | None = None):
+        """Starts a sequencer, or all the armed ones. The cluster runs them when their results are needed."""
+        for selected in self._selected(sequencer):
+            if selected.armed:
+                selected.armed = False
+                self.cluster.start(selected)
+
+    def stop_sequencer(self, sequencer: int | None = None):
+        """Stops a sequencer, or all of them, once they have finished running."""
+        self.cluster.run_started_sequencers()
+        for selected in self._selected(sequencer):
+            selected.armed = False
+
+    def get_acquisition_status(self, sequencer: int, timeout: int = 0) -> bool:  # pylint: disable=unused-argument
+        """Runs the started sequencers and returns True, as their acquisitions are then finished."""
+        self.cluster.run_started_sequencers()
+        return True
+
+    def store_scope_acquisition(self, sequencer: int, name: str):
+        """Stores the scope of the sequencer selected by ``scope_acq_sequencer_select`` into the acquisition ``name``."""
+        self.cluster.run_started_sequencers()
+        if sequencer != self.get("scope_acq_sequencer_select"):
+            return
+        emulated_sequencer = self.sequencers[sequencer]
+        emulated_sequencer.store_scope(
+            index=emulated_sequencer.acquisitions[name]["index"],
+            model=self.cluster.model,
+            rng=self.cluster.rng,
+            average=bool(self.get("scope_acq_avg_mode_en_path0")),
+        )
+
+    def get_acquisitions(self, sequencer: int) -> dict:
+        """Returns the acquisitions of a sequencer, by name, in the format of ``Cluster.get_acquisitions``."""
+        self.cluster.run_started_sequencers()
+        return self.sequencers[sequencer].get_acquisitions()
+
+    def delete_acquisition_data(self, sequencer: int, name: str = "", all: bool = False):  # pylint: disable=redefined-builtin
+        """Deletes the data of the acquisition ``name`` of a sequencer, or of all of them."""
+        self.sequencers[sequencer].delete_acquisition_data(name=name, all=all)
+
+    def disconnect_outputs(self):
+        """Disconnects the outputs of all the sequencers."""
+        for sequencer in self.sequencers:
+            for output in range(4):
+                sequencer.set(f"connect_out{output}", "off")
+
+    def disconnect_inputs(self):
+        """Disconnects the inputs of all the sequencers."""
+        for sequencer in self.sequencers:
+            sequencer.set("connect_acq_I", "off")
+            sequencer.set("connect_acq_Q", "off")
+
+    def _get_max_out_att_0(self) -> int:
+        return MAX_OUTPUT_ATTENUATION
+
+    def _get_max_out_att_1(self) -> int:
+        return MAX_OUTPUT_ATTENUATION
+
+    def _run_mixer_lo_calib(self, channel: int):
+        """Mixer calibration has no effect on the emulated outputs."""
+
+
+class EmulatedCluster(_EmulatedParameters, Device):
+    """Emulated Qblox cluster, with the interface of the Qblox ``Cluster`` used by qililab, that runs the Q1ASM programs
+    uploaded to its sequencers with a :class:`.Q1ASMInterpreter` instead of on the hardware.
+
+    Started sequencers are run together the first time their results, or the result of any other sequencer, are needed.
+    All of them start at time 0. The sequencers whose programs execute conditional instructions are run last, so that
+    the triggers sent by the thresholded acquisitions of the others have arrived. Acquisitions are integrated over the
+    signals given by ``model``.
+
+    It is selected with the ``emulator`` setting of the ``qblox_cluster`` instrument controllers of the runcard.
+
+    Args:
+        name (str): Name of the cluster.
+        modules (dict[int, str]): Type of the module in each occupied slot, by slot number, as in
+            :class:`EmulatedModule`.
+        model (QbloxEmulatorModel | None, optional): Model of the signals received by the inputs. Defaults to the
+            noiseless loopback of :class:`QbloxEmulatorModel`.
+    """
+
+    _DEFAULTS: ClassVar[dict[str, Any]] = {"reference_source": "internal"}
+
+    def __init__(self, name: str, modules: dict[int, str], model: QbloxEmulatorModel | None = None):
+        super().__init__()
+        self.name = name
+        self.model = model if model is not None else QbloxEmulatorModel()
+        self.rng = np.random.default_rng(self.model.seed)
+        self.modules = [
+            EmulatedModule(cluster=self, slot=slot, module_type=modules.get(slot)) for slot in range(1, NUM_SLOTS + 1)
+        ]
+        self._started: list[EmulatedSequencer] = []
+        self._trigger_counts: dict[int, int] = {}
+        self._lock = RLock()
+
+    def reset(self):
+        """Resets the parameters of the cluster and of all its modules."""
+        with self._lock:
+            self._reset_parameters()
+            self._started.clear()
+            self._trigger_counts.clear()
+            for module in self.modules:
+                module.reset()
+
+    def start(self, sequencer: EmulatedSequencer):
+        """Marks a sequencer as started, to be run by :meth:`run_started_sequencers`."""
+        with self._lock:
+            self._started.append(sequencer)
+
+    def run_started_sequencers(self):
+        """Runs the programs of all the started sequencers together, from time 0."""
+        with self._lock:
+            started, self._started = self._started, []
+            triggers: dict[int, list[int]] = {}
+            for sequencer in sorted(started, key=lambda started_sequencer: started_sequencer.program.has_conditionals):
+                sequencer.run(model=self.model, rng=self.rng, triggers=triggers)
+                for arrivals in triggers.values():
+                    arrivals.sort()
+            for address, arrivals in triggers.items():
+                self._trigger_counts[address] = self._trigger_counts.get(address, 0) + len(arrivals)
+
+    def trigger_monitor_count(self, address: int) -> int:
+        """Returns the number of triggers sent to ``address`` since its count was last reset."""
+        self.run_started_sequencers()
+        return self._trigger_counts.get(address, 0)
+
+    def reset_trigger_monitor_count(self, address: int):
+        """Resets the count of triggers sent to ``address``."""
+        with self._lock:
+            self._trigger_counts.pop(address, None)
+
+    def close(self):
+        """Releases the started sequencers."""
+        with self._lock:
+            self._started.clear()
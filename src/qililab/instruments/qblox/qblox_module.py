@@ -14,6 +14,8 @@
 
 """Qblox module class"""
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from typing import Iterable, Sequence, cast
 
@@ -26,6 +28,7 @@ from qililab.instruments.qblox.qblox_filters import QbloxFilter
 from qililab.instruments.qblox.qblox_sequencer import QbloxSequencer
 from qililab.typings import ChannelID, DistortionState, OutputID, Parameter, ParameterValue
 from qililab.typings.instruments import QcmQrm
+from qililab.utils.execution_profiler import profile_phase
 
 
 class QbloxModule(Instrument):
@@ -83,6 +86,9 @@ class QbloxModule(Instrument):
         # The sequences dictionary contains all the compiled sequences for each sequencer. Sequences are saved and handled at the compiler
         # {sequencer_idx: (program), ...}
         self.sequences: dict[int, QpySequence] = {}
+        # Digest of the sequence currently resident in each sequencer of the device, used to skip redundant uploads.
+        # {sequencer_idx: digest, ...}
+        self._uploaded_digests: dict[int, str] = {}
         self.num_bins: int = 1
         super().__init__(settings=settings)
 
@@ -207,8 +213,10 @@ class QbloxModule(Instrument):
         """Run the uploaded program"""
         sequencer = next((sequencer for sequencer in self.awg_sequencers if sequencer.identifier == channel_id), None)
         if sequencer is not None and sequencer.identifier in self.sequences:
-            self.device.arm_sequencer(sequencer=sequencer.identifier)
-            self.device.start_sequencer(sequencer=sequencer.identifier)
+            with profile_phase("qblox.arm"):
+                self.device.arm_sequencer(sequencer=sequencer.identifier)
+            with profile_phase("qblox.start"):
+                self.device.start_sequencer(sequencer=sequencer.identifier)
 
     @log_set_parameter
     def set_parameter(
@@ -644,6 +652,7 @@ class QbloxModule(Instrument):
         """Empty cache."""
         self.cache = {}
         self.sequences = {}
+        self._uploaded_digests = {}
 
     @check_device_initialized
     def reset(self):
@@ -651,18 +660,38 @@ class QbloxModule(Instrument):
         self.clear_cache()
         self.device.reset()
 
-    def upload_qpysequence(self, qpysequence: QpySequence, channel_id: ChannelID):
+    def upload_qpysequence(self, qpysequence: QpySequence, channel_id: ChannelID) -> bool:
         """Upload the qpysequence to its corresponding sequencer.
 
+        If the sequencer already holds an identical sequence (same program, waveforms, weights and acquisitions), the
+        upload is skipped and the sequencer only needs to be rearmed and restarted by :meth:`run`.
+
         Args:
             qpysequence (QpySequence): The qpysequence to upload.
-            port (str): The port of the sequencer to upload to.
+            channel_id (ChannelID): The id of the sequencer to upload to.
+
+        Returns:
+            bool: True if the sequence was sent to the device, False if the upload was skipped.
         """
         sequencer = next((sequencer for sequencer in self.awg_sequencers if sequencer.identifier == channel_id), None)
-        if sequencer is not None:
-            logger.info("Sequence program: \n %s", repr(qpysequence._program))
-            self.device.sequencers[sequencer.identifier].sequence(qpysequence.to_dict())
-            self.sequences[sequencer.identifier] = qpysequence
+        if sequencer is None:
+            return False
+        sequencer_id = sequencer.identifier
+        if self.sequences.get(sequencer_id) is qpysequence and sequencer_id in self._uploaded_digests:
+            logger.debug("Sequence of sequencer %d is already uploaded, skipping upload.", sequencer_id)
+            return False
+        with profile_phase("qblox.sequence_compile"):
+            sequence_dict = qpysequence.to_dict()
+        digest = self._sequence_digest(sequence_dict)
+        self.sequences[sequencer_id] = qpysequence
+        if self._uploaded_digests.get(sequencer_id) == digest:
+            logger.debug("Sequence of sequencer %d is unchanged, skipping upload.", sequencer_id)
+            return False
+        logger.info("Sequence program: \n %s", repr(qpysequence._program))
+        with profile_phase("qblox.sequence_upload"):
+            self.device.sequencers[sequencer_id].sequence(sequence_dict)
+        self._uploaded_digests[sequencer_id] = digest
+        return True
 
     def upload(self, channel_id: ChannelID):
         """Upload all the previously compiled programs to its corresponding sequencers.
@@ -674,10 +703,55 @@ class QbloxModule(Instrument):
         sequencer = next((sequencer for sequencer in self.awg_sequencers if sequencer.identifier == channel_id), None)
         if sequencer is not None and sequencer.identifier in self.sequences:
             sequence = self.sequences[sequencer.identifier]
+            sequence_dict = sequence.to_dict()
             logger.info("Uploaded sequence program: \n %s", repr(sequence._program))  # pylint: disable=protected-access
-            self.device.sequencers[sequencer.identifier].sequence(sequence.to_dict())
+            self.device.sequencers[sequencer.identifier].sequence(sequence_dict)
+            self._uploaded_digests[sequencer.identifier] = self._sequence_digest(sequence_dict)
             self.device.sequencers[sequencer.identifier].sync_en(True)
 
+    def is_sequence_resident(self, sequencer_id: int) -> bool:
+        """Whether the last uploaded sequence is still loaded in the sequencer, so it can be run again without uploading.
+
+        Args:
+            sequencer_id (int): sequencer identifier
+
+        Returns:
+            bool: True if the sequence uploaded last is still resident in the sequencer.
+        """
+        return sequencer_id in self._uploaded_digests
+
+    def _clear_sequencer(self, sequencer_id: int):
+        """Overwrite the sequencer with an empty sequence.
+
+        Args:
+            sequencer_id (int): sequencer identifier
+        """
+        empty_sequence = {
+            "waveforms": {},
+            "weights": {},
+            "acquisitions": {},
+            "program": "",
+        }
+        self.device.sequencers[sequencer_id].sequence(empty_sequence)
+        self._uploaded_digests.pop(sequencer_id, None)
+
+    @staticmethod
+    def _sequence_digest(sequence_dict: dict) -> str:
+        """Digest of a sequence dictionary, as sent to the device.
+
+        Args:
+            sequence_dict (dict): Sequence dictionary, as returned by ``QpySequence.to_dict()``.
+
+        Returns:
+            str: Hexadecimal digest of the sequence.
+        """
+        serialized = json.dumps(
+            sequence_dict,
+            sort_keys=True,
+            default=lambda value: value.tolist() if hasattr(value, "tolist") else str(value),
+        )
+        return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
     def _set_nco(self, sequencer_id: int):
         """Enable modulation of pulses and setup NCO frequency."""
         if self.get_sequencer(sequencer_id=sequencer_id).hardware_modulation:
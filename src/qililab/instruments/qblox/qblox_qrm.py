@@ -23,6 +23,7 @@ from qililab.instruments.decorators import check_device_initialized
 from qililab.instruments.qblox.qblox_adc_sequencer import QbloxADCSequencer
 from qililab.instruments.qblox.qblox_module import QbloxModule
 from qililab.instruments.utils import InstrumentFactory
+from qililab.qililab_settings import get_settings
 from qililab.qprogram.qblox_compiler import AcquisitionData
 from qililab.result.qprogram.qblox_measurement_result import QbloxMeasurementResult
 from qililab.typings import (
@@ -34,6 +35,7 @@ from qililab.typings import (
     Parameter,
     ParameterValue,
 )
+from qililab.utils.execution_profiler import profile_phase
 
 
 @InstrumentFactory.register
@@ -88,13 +90,7 @@ class QbloxQRM(QbloxModule):
             sequencer_id = sequencer.identifier
             # Remove all acquisition data
             self.device.delete_acquisition_data(sequencer=sequencer_id, all=True)
-            empty_sequence = {
-                "waveforms": {},
-                "weights": {},
-                "acquisitions": {},
-                "program": "",
-            }
-            self.device.sequencers[sequencer_id].sequence(empty_sequence)
+            self._clear_sequencer(sequencer_id=sequencer_id)
             self._set_acquisition_mode(
                 value=cast("QbloxADCSequencer", sequencer).scope_acquire_trigger_mode, sequencer_id=sequencer_id
             )
@@ -143,42 +139,44 @@ class QbloxQRM(QbloxModule):
     ) -> list[QbloxMeasurementResult]:
         """Read the result from the AWG instrument
 
+        The sequencer is waited for once, all its acquisitions are fetched from the device in a single call and then
+        deleted in a single call, so the amount of data transferred does not grow quadratically with the number of
+        acquisitions. The scope is only stored on the device in the acquisitions with ``save_adc=True``, and the device
+        only sends the scope data stored in each acquisition, so the acquisitions with ``save_adc=False`` transfer just
+        their integration bins.
+
         Args:
-            acquisitions (list[str]): A list of acquisitions names.
+            acquisitions (dict[str, AcquisitionData]): The acquisitions to read, by name.
+            channel_id (ChannelID): The id of the sequencer to read from.
 
         Returns:
             list[QbloxQProgramMeasurementResult]: Acquired Qblox results in chronological order.
         """
         results = []
         sequencer = next((sequencer for sequencer in self.awg_sequencers if sequencer.identifier == channel_id), None)
-        for acquisition, acquisition_data in acquisitions.items():
-            if sequencer is not None and sequencer.identifier in self.sequences:
+        if acquisitions and sequencer is not None and sequencer.identifier in self.sequences:
+            with profile_phase("qblox.wait_acquisition"):
                 self.device.get_acquisition_status(
                     sequencer=sequencer.identifier,
                     timeout=cast("QbloxADCSequencer", sequencer).acquisition_timeout,
                 )
-                if acquisition_data.save_adc:
-                    self.device.store_scope_acquisition(sequencer=sequencer.identifier, name=acquisition)
-                raw_measurement_data = self.device.get_acquisitions(sequencer=sequencer.identifier)[acquisition][
-                    "acquisition"
-                ]
+            with profile_phase("qblox.fetch_acquisitions"):
+                for acquisition, acquisition_data in acquisitions.items():
+                    if acquisition_data.save_adc:
+                        self.device.store_scope_acquisition(sequencer=sequencer.identifier, name=acquisition)
+                raw_acquisitions = self.device.get_acquisitions(sequencer=sequencer.identifier)
+            for acquisition, acquisition_data in acquisitions.items():
                 measurement_result = QbloxMeasurementResult(
-                    bus=acquisitions[acquisition].bus,
-                    raw_measurement_data=raw_measurement_data,
+                    bus=acquisition_data.bus,
+                    raw_measurement_data=raw_acquisitions[acquisition]["acquisition"],
                     shape=acquisition_data.shape,
                 )
                 results.append(measurement_result)
 
-                # always deleting acquisitions without checking save_adc flag
-                self.device.delete_acquisition_data(sequencer=sequencer.identifier, name=acquisition)
-        empty_sequence = {
-            "waveforms": {},
-            "weights": {},
-            "acquisitions": {},
-            "program": "",
-        }
-        if sequencer is not None:
-            self.device.sequencers[sequencer.identifier].sequence(empty_sequence)
+            # always deleting acquisitions without checking save_adc flag
+            self.device.delete_acquisition_data(sequencer=sequencer.identifier, all=True)
+        if sequencer is not None and not get_settings().qblox_keep_sequences_resident:
+            self._clear_sequencer(sequencer_id=sequencer.identifier)
         return results
 
     def _set_device_hardware_demodulation(self, value: bool, sequencer_id: int):
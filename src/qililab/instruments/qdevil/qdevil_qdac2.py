@@ -14,9 +14,10 @@
 
 """QDevil QDAC-II Instrument"""
 
+import hashlib
 from dataclasses import dataclass
 from itertools import product
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 from qcodes_contrib_drivers.drivers.QDevil.QDAC2 import QDac2Trigger_Context
@@ -50,6 +51,8 @@ class QDevilQDac2(VoltageSource):
     _GENERATOR_LIST: tuple[str, str, str, str, str] = ("DC", "SINe", "SQUare", "TRIangle", "AWG")
     _MARKER_LOCATION: tuple[str, str, str, str] = ("STARt", "END", "PSTart", "PEND")
     _DC_MARKER_LOCATION: tuple[str, str] = ("SSTart", "SEND")
+    # Number of points sent to the instrument per write when uploading traces and voltage lists
+    _TRANSFER_CHUNK_SIZE: int = 16384
 
     @dataclass
     class QDevilQDac2Settings(VoltageSource.VoltageSourceSettings):
@@ -75,6 +78,9 @@ class QDevilQDac2(VoltageSource):
         self._marker_registers: dict[str, tuple[ChannelID, str, str]] = {}
         # cache keys of DC lists armed to start on a trigger; start() must leave these alone
         self._armed_on_trigger: set[str] = set()
+        # DC lists loaded on the instrument, with the digest of the list they were uploaded with. Unlike _cache_dc, they
+        # survive start(), so that uploading the same list again only needs to arm it.
+        self._resident_dc: dict[str, tuple[str, List_Context]] = {}
 
     @property
     def low_pass_filter(self):
@@ -137,6 +143,8 @@ class QDevilQDac2(VoltageSource):
             self.settings.voltage[index] = voltage
             if self.is_device_active():
                 channel.dc_constant_V(voltage)  # type: ignore[union-attr]
+                # the channel is back to a fixed voltage, its DC list must be uploaded again
+                self._resident_dc.pop(f"{self.device.name}_{channel_id}", None)
             return
         if parameter == Parameter.SPAN:
             span = str(value)
@@ -187,13 +195,29 @@ class QDevilQDac2(VoltageSource):
         """
         return self.device.channel(channel_id)
 
-    def upload_awg_waveform(self, waveform: Waveform, channel_id: ChannelID):
+    def upload_awg_waveform(
+        self,
+        waveform: Waveform,
+        channel_id: ChannelID,
+        binary: bool = True,
+        chunk_size: int | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ):
         """Uploads a waveform to the instrument and saves it to _cache_awg.
         IMPORTANT: note that the waveform resolution is not to the ns, it is actually around 1_micro_second.
 
+        By default the trace is sent as an IEEE-488.2 definite length binary block of 32-bit floats, streamed in chunks,
+        instead of as a comma separated list of numbers.
+
         Args:
             waveform (Waveform): Waveform to upload
             channel_id (ChannelID): channel id of the qdac
+            binary (bool, optional): Whether to send the trace as a binary block. If False, it is sent as ASCII through
+                                        the driver. Defaults to True.
+            chunk_size (int, optional): Number of points sent per write. Defaults to None, which uses
+                                        ``_TRANSFER_CHUNK_SIZE``.
+            progress (Callable[[int, int], None], optional): Called after each chunk with the number of points sent
+                                        so far and the total number of points. Defaults to None.
 
         Raises:
             ValueError: if a waveform is already allocated
@@ -201,7 +225,6 @@ class QDevilQDac2(VoltageSource):
         self._validate_channel(channel_id=channel_id)
 
         envelope = waveform.envelope()
-        values = list(envelope)
         if channel_id in self._cache_awg:
             raise ValueError(
                 f"Device {self.name} already has a waveform allocated to channel {channel_id}. Clear the cache before allocating a new waveform"
@@ -211,8 +234,13 @@ class QDevilQDac2(VoltageSource):
             raise ValueError("Waveform entries must be even.")
         if np.max(np.abs(envelope)) >= 1:
             raise ValueError("Waveform amplitudes must be within [-1,1] range.")
-        trace = self.device.allocate_trace(channel_id, len(values))
-        trace.waveform(values)
+        trace = self.device.allocate_trace(channel_id, len(envelope))
+        if binary:
+            self._write_binary_block(f'TRAC:DATA "{trace.name}",', envelope, chunk_size, progress)
+        else:
+            trace.waveform(envelope.tolist())
+            if progress is not None:
+                progress(len(envelope), len(envelope))
         self._cache_awg[channel_id] = self.get_dac(channel_id).arbitrary_wave(trace.name)
 
     def upload_voltage_list(
@@ -223,9 +251,15 @@ class QDevilQDac2(VoltageSource):
         sync_delay_s: float = 0,
         repetitions: int = 1,
         stepped: bool = False,
+        digest: str | None = None,
+        chunk_size: int | None = None,
+        progress: Callable[[int, int], None] | None = None,
     ):
         """Uploads an arbitrary voltage list to the instrument and saves it to _cache_dc.
 
+        If the channel still has the same list loaded from a previous upload, the list is not transmitted again. Long
+        lists are streamed in chunks, appending each chunk to the list of the channel.
+
         Args:
             waveform (Waveform): Waveform to upload
             channel_id (ChannelID): Channel id of the qdac.
@@ -235,23 +269,101 @@ class QDevilQDac2(VoltageSource):
             repetitions (int, optional): Number of pulse repetitions. Defaults to 1.
             stepped (bool, optional): Trigger defining pulse shape,
                                         if True, instead of a ramp the qdac will show a staircase. Defaults to False.
+            digest (str, optional): Digest of the list, as returned by :meth:`voltage_list_digest`. Defaults to None,
+                                        which computes it.
+            chunk_size (int, optional): Number of voltages sent per write. Defaults to None, which uses
+                                        ``_TRANSFER_CHUNK_SIZE``.
+            progress (Callable[[int, int], None], optional): Called after each chunk with the number of voltages sent
+                                        so far and the total number of voltages. Defaults to None.
         """
         self._validate_channel(channel_id=channel_id)
 
+        key = f"{self.device.name}_{channel_id}"
+        if digest is None:
+            digest = self.voltage_list_digest(waveform, dwell_us, sync_delay_s, repetitions, stepped)
+        resident = self._resident_dc.get(key)
+        if resident is not None and resident[0] == digest:
+            self._cache_dc[key] = resident[1]
+            return
+
         envelope = waveform.envelope()
         channel = self.device.channel(channel_id)
-        if f"{self.device.name}_{channel_id}" in self._cache_dc:
+        if key in self._cache_dc:
             channel.dc_abort()
-            self.device.remove_traces()
 
+        chunk_size = chunk_size or self._TRANSFER_CHUNK_SIZE
         dc_list = channel.dc_list(
-            voltages=list(envelope),
+            voltages=envelope[:chunk_size].tolist(),
             dwell_s=dwell_us * 1e-6,
             delay_s=sync_delay_s,
             repetitions=repetitions,
             stepped=stepped,
         )
-        self._cache_dc[f"{self.device.name}_{channel_id}"] = dc_list
+        for start in range(0, len(envelope), chunk_size):
+            if start > 0:
+                dc_list.append(envelope[start : start + chunk_size].tolist())
+            if progress is not None:
+                progress(min(start + chunk_size, len(envelope)), len(envelope))
+        self._cache_dc[key] = dc_list
+        self._resident_dc[key] = (digest, dc_list)
+
+    def _write_binary_block(
+        self,
+        command: str,
+        values: np.ndarray,
+        chunk_size: int | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ):
+        """Writes a command followed by an IEEE-488.2 definite length binary block of little-endian 32-bit floats.
+
+        The message is written in chunks of ``chunk_size`` values, straight to the VISA resource of the driver.
+
+        Args:
+            command (str): Command preceding the binary block, including the separator before it.
+            values (np.ndarray): Values of the block.
+            chunk_size (int, optional): Number of values written per chunk. Defaults to None, which uses
+                ``_TRANSFER_CHUNK_SIZE``.
+            progress (Callable[[int, int], None], optional): Called after each chunk with the number of values written
+                so far and the total number of values. Defaults to None.
+        """
+        chunk_size = chunk_size or self._TRANSFER_CHUNK_SIZE
+        data = np.ascontiguousarray(values, dtype="<f4")
+        length = str(data.nbytes)
+        header = f"{command}#{len(length)}{length}".encode("ascii")
+        visa_handle = self.device.visa_handle
+        for start in range(0, max(len(data), 1), chunk_size):
+            stop = min(start + chunk_size, len(data))
+            message = data[start:stop].tobytes()
+            if start == 0:
+                message = header + message
+            if stop == len(data):
+                message += b"\n"
+            visa_handle.write_raw(message)
+            if progress is not None:
+                progress(stop, len(data))
+
+    @staticmethod
+    def voltage_list_digest(
+        waveform: Waveform,
+        dwell_us: float = 2,
+        sync_delay_s: float = 0,
+        repetitions: int = 1,
+        stepped: bool = False,
+    ) -> str:
+        """Returns a digest identifying a voltage list, used to recognize the lists already loaded on a channel.
+
+        Args:
+            waveform (Waveform): Waveform of the list.
+            dwell_us (float, optional): Dwell of each voltage in us. Defaults to 2.
+            sync_delay_s (float, optional): Delay of each repetition. Defaults to 0.
+            repetitions (int, optional): Number of repetitions. Defaults to 1.
+            stepped (bool, optional): Whether the list is a staircase instead of a ramp. Defaults to False.
+
+        Returns:
+            str: Hexadecimal digest of the waveform and the parameters of the list.
+        """
+        parameters = (waveform.digest(), float(dwell_us), float(sync_delay_s), int(repetitions), bool(stepped))
+        return hashlib.blake2b(repr(parameters).encode(), digest_size=16).hexdigest()
 
     def set_in_external_trigger(self, channel_id: ChannelID, in_port: int):
         """Method to read an external trigger and start a dc list when the Qdac reads this trigger.
@@ -563,6 +675,7 @@ class QDevilQDac2(VoltageSource):
             else:
                 channel.dc_slew_rate_V_per_s(2e7)
             channel.dc_constant_V(0.0)
+        self._resident_dc = {}
 
     @check_device_initialized
     def turn_on(self):
@@ -571,6 +684,7 @@ class QDevilQDac2(VoltageSource):
             index = self.dacs.index(channel_id)
             channel = self.device.channel(channel_id)
             channel.dc_constant_V(self.voltage[index])
+        self._resident_dc = {}
         self.clear_cache()
 
     @check_device_initialized
@@ -579,6 +693,7 @@ class QDevilQDac2(VoltageSource):
         for channel_id in self.dacs:
             channel = self.device.channel(channel_id)
             channel.dc_constant_V(0.0)
+        self._resident_dc = {}
         self.clear_cache()
 
     def stop(self):
@@ -591,6 +706,7 @@ class QDevilQDac2(VoltageSource):
     def reset(self):
         """Reset instrument. This will affect all channels."""
         self.clear_cache()
+        self._resident_dc = {}
         self.device.remove_traces()
         self.device.reset()
 
@@ -0,0 +1,94 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""CompilationCache class."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+
+class CompilationCache:
+    """Least-recently-used cache of compilation outputs, keyed by the fingerprint of the compilation inputs.
+
+    The cache is safe to use from several threads, so QPrograms can be compiled ahead of time in the background.
+
+    Args:
+        max_size (int): Maximum number of entries kept. When exceeded, the least recently used entry is evicted. A
+            ``max_size`` of 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int = 64) -> None:
+        if max_size < 0:
+            raise ValueError(f"max_size must be non-negative, got {max_size}.")
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = Lock()
+        self.hits: int = 0
+        """Number of lookups that found a cached output."""
+        self.misses: int = 0
+        """Number of lookups that did not find a cached output."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Any | None:
+        """Returns the output stored under ``key``, or None if there is none, updating the hit/miss counters.
+
+        Args:
+            key (str): Fingerprint of the compilation inputs.
+
+        Returns:
+            Any | None: The cached output, or None on a miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Stores ``value`` under ``key``, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (str): Fingerprint of the compilation inputs.
+            value (Any): Compilation output.
+        """
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the cache statistics.
+
+        Returns:
+            dict[str, int]: Dictionary with the ``hits``, ``misses``, ``size`` and ``max_size`` of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "max_size": self.max_size}
@@ -234,14 +234,17 @@ class Bus:
                 return instrument.get_parameter(parameter, instrument_channel)
         raise Exception(f"No parameter with name {parameter.value} was found in the bus with alias {self.alias}")
 
-    def upload_qpysequence(self, qpysequence: QpySequence):
-        """Uploads the qpysequence into the instrument."""
+    def upload_qpysequence(self, qpysequence: QpySequence) -> bool:
+        """Uploads the qpysequence into the instrument.
+
+        Returns:
+            bool: True if the qpysequence was sent to the instrument, False if an identical one was already loaded.
+        """
         from qililab.instruments.qblox.qblox_module import QbloxModule  # pylint: disable=import-outside-toplevel
 
         for instrument, instrument_channel in zip(self.instruments, self.channels):
             if isinstance(instrument, QbloxModule):
-                instrument.upload_qpysequence(qpysequence=qpysequence, channel_id=int(instrument_channel))  # type: ignore[arg-type]
-                return
+                return instrument.upload_qpysequence(qpysequence=qpysequence, channel_id=int(instrument_channel))  # type: ignore[arg-type]
 
         raise AttributeError(f"Bus {self.alias} doesn't have any QbloxModule to upload a qpysequence.")
 
@@ -0,0 +1,95 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ParallelTaskRunner class."""
+
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class ParallelTaskRunner:
+    """Runs blocking instrument calls concurrently, one thread per instrument connection.
+
+    Each task is tagged with the connection it talks through. Tasks sharing a connection run serially in the order
+    they were given, because the instrument drivers are not safe to use concurrently over the same connection, while
+    tasks on different connections run in parallel. :meth:`run` only returns once every task has finished, so it can be
+    used as a barrier between execution phases (e.g. all uploads before any start).
+
+    Args:
+        max_workers (int): Maximum number of threads. With 1, or when all tasks share a connection, the tasks run in
+            the calling thread.
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def run(self, tasks: Mapping[K, tuple[Hashable, Callable[[], Any]]]) -> dict[K, Any]:
+        """Runs the given tasks and waits for all of them to finish.
+
+        Args:
+            tasks (Mapping[K, tuple[Hashable, Callable[[], Any]]]): Tasks to run, as ``{key: (connection, function)}``.
+
+        Raises:
+            Exception: The exception raised by the first failing task, following the order of ``tasks``. The rest of
+                the tasks of its connection are not run.
+
+        Returns:
+            dict[K, Any]: The value returned by each task, in the same order as ``tasks``.
+        """
+        groups: dict[Hashable, list[K]] = {}
+        for key, (connection, _) in tasks.items():
+            groups.setdefault(connection, []).append(key)
+
+        if self.max_workers == 1 or len(groups) <= 1:
+            return {key: function() for key, (_, function) in tasks.items()}
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="qililab-qblox")
+
+        def run_group(keys: list[K]) -> tuple[dict[K, Any], dict[K, BaseException]]:
+            results: dict[K, Any] = {}
+            for key in keys:
+                try:
+                    results[key] = tasks[key][1]()
+                except Exception as exception:  # noqa: BLE001
+                    return results, {key: exception}
+            return results, {}
+
+        # Each group runs in a copy of the caller's context, so context variables (e.g. the active profiler) are seen.
+        futures = [self._executor.submit(copy_context().run, run_group, keys) for keys in groups.values()]
+        wait(futures)
+
+        results: dict[K, Any] = {}
+        errors: dict[K, BaseException] = {}
+        for future in futures:
+            group_results, group_errors = future.result()
+            results |= group_results
+            errors |= group_errors
+        for key in tasks:
+            if key in errors:
+                raise errors[key]
+        return {key: results[key] for key in tasks}
+
+    def shutdown(self) -> None:
+        """Stops the worker threads. They are started again by the next :meth:`run` that needs them."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
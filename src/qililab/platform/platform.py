@@ -19,11 +19,13 @@ from __future__ import annotations
 
 import ast
 import io
+import json
 import re
 from builtins import BaseExceptionGroup
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import asdict, dataclass, field
+from functools import partial
 from time import perf_counter
 from typing import TYPE_CHECKING, Any, cast
 
@@ -49,8 +51,10 @@ from qililab.instruments.qblox.qblox_draw import QbloxDraw
 from qililab.instruments.qblox.qblox_qrm import QbloxQRM
 from qililab.instruments.qdevil.qdevil_qdac2 import QDevilQDac2
 from qililab.instruments.utils import InstrumentFactory
+from qililab.platform.compilation_cache import CompilationCache
 from qililab.platform.components.bus import Bus
 from qililab.platform.components.buses import Buses
+from qililab.platform.parallel_task_runner import ParallelTaskRunner
 from qililab.qililab_settings import get_settings
 from qililab.qprogram import (
     Calibration,
@@ -64,20 +68,25 @@ from qililab.qprogram.experiment_executor import ExperimentExecutor
 from qililab.qprogram.flux_vector import FluxVector
 from qililab.qprogram.qdac_compiler import QdacCompiler
 from qililab.result.database import get_db_manager
-from qililab.result.qprogram.qblox_measurement_result import QbloxMeasurementResult
 from qililab.result.qprogram.qprogram_results import QProgramResults
 from qililab.result.stream_results import StreamArray
 from qililab.typings import ChannelID, DistortionState, InstrumentName, OutputID, Parameter, ParameterValue
+from qililab.utils.execution_profiler import ExecutionProfiler, get_active_profiler, profile_phase
+from qililab.utils.fingerprint import fingerprint
 from qililab.utils.serialization import deserialize_from
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import numpy as np
 
     from qililab.instrument_controllers.instrument_controller import InstrumentController
     from qililab.instruments.instrument import Instrument
     from qililab.instruments.qblox.qblox_adc_sequencer import QbloxADCSequencer
     from qililab.qprogram.crosstalk_matrix import CrosstalkMatrix
+    from qililab.qprogram.qblox_compiler import AcquisitionData
     from qililab.result.database import DatabaseManager
+    from qililab.result.qprogram.qblox_measurement_result import QbloxMeasurementResult
     from qililab.settings import Runcard
 
 
@@ -295,8 +304,8 @@ class Platform:
         self._connected_to_instruments: bool = False
         """Boolean indicating the connection status to the instruments. Defaults to False (not connected)."""
 
-        self._qpy_sequence_cache: dict[str, str] = {}
-        """Dictionary for caching qpysequences."""
+        self._qpy_sequence_cache = CompilationCache(max_size=get_settings().compilation_cache_size)
+        """LRU cache of Qblox compilation outputs, keyed by the fingerprint of the compilation inputs."""
 
         self.calibration: Calibration | None = None
         """Calibration class introduced to platform, defaults to None"""
@@ -321,6 +330,9 @@ class Platform:
 
         self.trigger_runs: int = 0
 
+        self._qblox_task_runner = ParallelTaskRunner(max_workers=get_settings().qblox_execution_threads)
+        """Runs the upload, start and acquisition of the Qblox sequencers concurrently across instrument connections."""
+
         self.qblox_alias_module: list = self._get_qblox_alias_module()
         """List of dict with key the alias of qblox module and value the module_id. Used for the qblox distortions"""
 
@@ -393,7 +405,8 @@ class Platform:
             return
         self.instrument_controllers.disconnect()
         self._connected_to_instruments = False
-        self._qpy_sequence_cache = {}
+        self._qpy_sequence_cache.clear()
+        self._qblox_task_runner.shutdown()
         logger.info("Disconnected from instruments")
 
     def get_element(self, alias: str):
@@ -819,7 +832,8 @@ class Platform:
         """Sets the Calibration class from a given Calibration or the file's path.
 
         Args:
-            calibration (Calibration | str): Calibration class or file path.
+            calibration (Calibration | str): Calibration class or path of a YAML or binary file, see
+                :func:`.serialize_to`.
         """
         if isinstance(calibration, str):
             self.calibration = deserialize_from(file=calibration, cls=Calibration)
@@ -1071,6 +1085,47 @@ class Platform:
         )
         return executor.execute()
 
+    @property
+    def compilation_cache(self) -> CompilationCache:
+        """LRU cache of the Qblox compilation outputs produced by :meth:`compile_qprogram`.
+
+        Entries are keyed by a structural fingerprint of the QProgram and of everything the compiler reads (bus
+        mapping, calibration, times of flight, delays, markers, distortions and crosstalk), so compiling the same
+        program twice with the same settings reuses the first output. Its size is controlled by the
+        ``QILILAB_COMPILATION_CACHE_SIZE`` setting, and ``compilation_cache.stats()`` returns its hit/miss counters.
+        """
+        return self._qpy_sequence_cache
+
+    def clear_compilation_cache(self) -> None:
+        """Removes all the entries of the compilation cache and resets its hit/miss counters."""
+        self._qpy_sequence_cache.clear()
+
+    @contextmanager
+    def profile(self):
+        """Context manager recording where the time of compiling and executing QPrograms goes while it is open.
+
+        It yields an :class:`.ExecutionProfiler` that records the wall time of each phase (QProgram transformations,
+        Q1ASM generation, sequence serialization, upload, arm, start, waiting for and fetching acquisitions, reshaping
+        the results...), compilation cache hits and misses, and, for every Qblox bus, the bytes uploaded and
+        downloaded, the waveform memory used and the number of Q1ASM instructions of its sequence. The recorded data
+        is returned as a structured record by ``profiler.profile()``.
+
+        Recording the size of the uploaded sequences serializes them a second time, which is recorded as the
+        ``profiling`` phase so that it can be told apart from the rest.
+
+        Yields:
+            ExecutionProfiler: The profiler recording the executions.
+
+        Examples:
+
+            >>> with platform.profile() as profiler:
+            ...     platform.execute_qprogram(qprogram)
+            >>> print(profiler.profile())
+            >>> profiler.profile().to_dict()
+        """
+        with ExecutionProfiler().activate() as profiler:
+            yield profiler
+
     def compile_qprogram(
         self,
         qprogram: QProgram,
@@ -1078,14 +1133,7 @@ class Platform:
         calibration: Calibration | None = None,
         crosstalk: bool = True,
     ) -> QProgramCompilationOutput:
-        if (
-            not crosstalk
-            and calibration is not None
-            and (calibration.crosstalk_matrix is not None or calibration.crosstalk_matrix_ac is not None)
-        ):
-            calibration = deepcopy(calibration)
-            calibration.crosstalk_matrix = None
-            calibration.crosstalk_matrix_ac = None
+        calibration = self._compilation_calibration(calibration=calibration, crosstalk=crosstalk)
 
         bus_aliases = {bus_mapping[bus] if bus_mapping and bus in bus_mapping else bus for bus in qprogram.buses}
         buses = [self.buses.get(alias=bus_alias) for bus_alias in bus_aliases]
@@ -1127,77 +1175,24 @@ class Platform:
                     raise ValueError("Multiple QDAC-II instruments used but no Output trigger instrument given.")
 
             qdac_compiler = QdacCompiler()
-            compiled_qdac = qdac_compiler.compile(
-                qprogram=qprogram,
-                qdacs=self.qdac_instruments,
-                qdac_buses=self.qdac_buses,
-                qdac_offsets=qdac_offsets,
-                bus_mapping=bus_mapping,
-                calibration=calibration,
-                crosstalk=self.crosstalk if crosstalk else None,
-                out_instrument=out_trigger_qdac,
-                target_fluxes=target_fluxes,
-            )
-
-        if all(isinstance(instrument, QbloxModule) for instrument in instruments):
-            # Retrieve the time of flight parameter from settings
-            instrument_controllers = [
-                controller
-                for controller in self.instrument_controllers.elements
-                if isinstance(controller, QbloxClusterController)
-            ]
-            ext_trigger = any(controller.ext_trigger for controller in instrument_controllers)
-            times_of_flight = {
-                bus.alias: int(bus.get_parameter(Parameter.TIME_OF_FLIGHT)) for bus in buses if bus.has_adc()
-            }
-            delays = {bus.alias: int(bus.get_parameter(Parameter.DELAY)) for bus in buses}
-            # Determine what should be the initial value of the markers for each bus.
-            # This depends on the model of the associated Qblox module and the `output` setting of the associated sequencer.
-            markers = {}
-            # In this bus loop the distortions are also stored.
-            bus_distortions = {}
-            single_channel = []
-            for bus in buses:
-                for instrument, channel in zip(bus.instruments, bus.channels):
-                    if isinstance(instrument, QbloxModule):
-                        sequencer = instrument.get_sequencer(sequencer_id=channel)
-                        if instrument.name == InstrumentName.QCMRF:
-                            markers[bus.alias] = "".join(
-                                ["1" if i in [0, 1] and i in sequencer.outputs else "0" for i in range(4)]
-                            )[::-1]
-                        elif instrument.name == InstrumentName.QRMRF:
-                            markers[bus.alias] = "".join(
-                                ["1" if i in [1] and i - 1 in sequencer.outputs else "0" for i in range(4)]
-                            )[::-1]
-                        else:
-                            markers[bus.alias] = "0000"
-                            if len(sequencer.outputs) == 1:
-                                single_channel.append(bus.alias)
-                if bus.distortions:
-                    bus_distortions[bus.alias] = bus.distortions
-
-            qprogram = qprogram.with_resolved_weight_duration(calibration, bus_mapping)
-            qblox_compiler = QbloxCompiler()
-            qblox_buses = [
-                bus.alias for bus in buses if any(isinstance(instrument, QbloxModule) for instrument in bus.instruments)
-            ]
-            output = QProgramCompilationOutput(
-                qblox=qblox_compiler.compile(
+            with profile_phase("compile.qdac"):
+                compiled_qdac = qdac_compiler.compile(
                     qprogram=qprogram,
+                    qdacs=self.qdac_instruments,
+                    qdac_buses=self.qdac_buses,
+                    qdac_offsets=qdac_offsets,
                     bus_mapping=bus_mapping,
                     calibration=calibration,
-                    times_of_flight=times_of_flight,
-                    delays=delays,
-                    markers=markers,
-                    ext_trigger=ext_trigger,
-                    qblox_buses=qblox_buses,
-                    single_channel=single_channel,
-                    bus_distortions=bus_distortions,
                     crosstalk=self.crosstalk if crosstalk else None,
-                ),
-                qdac=compiled_qdac,
+                    out_instrument=out_trigger_qdac,
+                    target_fluxes=target_fluxes,
+                )
+
+        if all(isinstance(instrument, QbloxModule) for instrument in instruments):
+            compilation_inputs = self._qblox_compilation_inputs(
+                qprogram=qprogram, buses=buses, bus_mapping=bus_mapping, calibration=calibration, crosstalk=crosstalk
             )
-            return output
+            return QProgramCompilationOutput(qblox=self._compile_qblox(compilation_inputs), qdac=compiled_qdac)
 
         if all(isinstance(instrument, QuantumMachinesCluster) for instrument in instruments):
             if len(instruments) != 1:
@@ -1221,24 +1216,236 @@ class Platform:
                 for bus in buses
                 if any(isinstance(instrument, QuantumMachinesCluster) for instrument in bus.instruments)
             ]
-            return QProgramCompilationOutput(
-                quantum_machines=compiler.compile(
+            with profile_phase("compile.quantum_machines"):
+                compiled_quantum_machines = compiler.compile(
                     qprogram=qprogram,
                     bus_mapping=bus_mapping,
                     thresholds=thresholds,
                     threshold_rotations=threshold_rotations,
                     calibration=calibration,
                     qm_buses=qm_buses,
-                ),
-                qdac=compiled_qdac,
-            )
+                )
+            return QProgramCompilationOutput(quantum_machines=compiled_quantum_machines, qdac=compiled_qdac)
         raise NotImplementedError("Compiling QProgram for a mixture of AWG instruments is not supported.")
 
+    @staticmethod
+    def _compilation_calibration(calibration: Calibration | None, crosstalk: bool) -> Calibration | None:
+        """Returns the calibration to compile with, without its crosstalk matrices if the crosstalk is not applied."""
+        if (
+            not crosstalk
+            and calibration is not None
+            and (calibration.crosstalk_matrix is not None or calibration.crosstalk_matrix_ac is not None)
+        ):
+            calibration = deepcopy(calibration)
+            calibration.crosstalk_matrix = None
+            calibration.crosstalk_matrix_ac = None
+        return calibration
+
+    def _qblox_compilation_inputs(
+        self,
+        qprogram: QProgram,
+        buses: list[Bus],
+        bus_mapping: dict[str, str] | None,
+        calibration: Calibration | None,
+        crosstalk: bool,
+    ) -> dict[str, Any]:
+        """Collects the arguments of :meth:`QbloxCompiler.compile` from the current settings of the platform.
+
+        Args:
+            qprogram (QProgram): The :class:`.QProgram` to compile.
+            buses (list[Bus]): The buses of the platform used by the QProgram.
+            bus_mapping (dict[str, str] | None): Mapping of the buses in the QProgram to the buses in the platform.
+            calibration (Calibration | None): :class:`.Calibration` instance to use.
+            crosstalk (bool): Whether the crosstalk compensation is applied.
+
+        Returns:
+            dict[str, Any]: The keyword arguments of :meth:`QbloxCompiler.compile`.
+        """
+        # Retrieve the time of flight parameter from settings
+        instrument_controllers = [
+            controller
+            for controller in self.instrument_controllers.elements
+            if isinstance(controller, QbloxClusterController)
+        ]
+        ext_trigger = any(controller.ext_trigger for controller in instrument_controllers)
+        times_of_flight = {
+            bus.alias: int(bus.get_parameter(Parameter.TIME_OF_FLIGHT)) for bus in buses if bus.has_adc()
+        }
+        delays = {bus.alias: int(bus.get_parameter(Parameter.DELAY)) for bus in buses}
+        # Determine what should be the initial value of the markers for each bus.
+        # This depends on the model of the associated Qblox module and the `output` setting of the associated sequencer.
+        markers = {}
+        # In this bus loop the distortions are also stored.
+        bus_distortions = {}
+        single_channel = []
+        for bus in buses:
+            for instrument, channel in zip(bus.instruments, bus.channels):
+                if isinstance(instrument, QbloxModule):
+                    sequencer = instrument.get_sequencer(sequencer_id=cast("int", channel))
+                    if instrument.name == InstrumentName.QCMRF:
+                        markers[bus.alias] = "".join(
+                            ["1" if i in [0, 1] and i in sequencer.outputs else "0" for i in range(4)]
+                        )[::-1]
+                    elif instrument.name == InstrumentName.QRMRF:
+                        markers[bus.alias] = "".join(
+                            ["1" if i in [1] and i - 1 in sequencer.outputs else "0" for i in range(4)]
+                        )[::-1]
+                    else:
+                        markers[bus.alias] = "0000"
+                        if len(sequencer.outputs) == 1:
+                            single_channel.append(bus.alias)
+            if bus.distortions:
+                bus_distortions[bus.alias] = bus.distortions
+
+        qblox_buses = [
+            bus.alias for bus in buses if any(isinstance(instrument, QbloxModule) for instrument in bus.instruments)
+        ]
+        return {
+            "qprogram": qprogram,
+            "bus_mapping": bus_mapping,
+            "calibration": calibration,
+            "times_of_flight": times_of_flight,
+            "delays": delays,
+            "markers": markers,
+            "ext_trigger": ext_trigger,
+            "qblox_buses": qblox_buses,
+            "single_channel": single_channel,
+            "bus_distortions": bus_distortions,
+            "crosstalk": self.crosstalk if crosstalk else None,
+        }
+
+    def _compile_qblox(self, compilation_inputs: dict[str, Any]) -> QbloxCompilationOutput:
+        """Compiles a QProgram for the Qblox modules, reusing the output cached for identical inputs.
+
+        Args:
+            compilation_inputs (dict[str, Any]): The keyword arguments of :meth:`QbloxCompiler.compile`, as returned by
+                :meth:`_qblox_compilation_inputs`.
+
+        Returns:
+            QbloxCompilationOutput: The compilation output.
+        """
+        # Identical inputs always compile to the same sequences, so a previous output can be reused as is.
+        cache_key = fingerprint(compilation_inputs) if self._qpy_sequence_cache.max_size > 0 else None
+        compiled_qblox = self._qpy_sequence_cache.get(cache_key) if cache_key is not None else None
+        profiler = get_active_profiler()
+        if compiled_qblox is None:
+            if profiler is not None and cache_key is not None:
+                profiler.count("compilation_cache.misses")
+            with profile_phase("compile.qblox"):
+                qprogram = compilation_inputs["qprogram"].with_resolved_weight_duration(
+                    compilation_inputs["calibration"], compilation_inputs["bus_mapping"]
+                )
+                compiled_qblox = QbloxCompiler().compile(**{**compilation_inputs, "qprogram": qprogram})
+            if cache_key is not None:
+                self._qpy_sequence_cache.put(cache_key, compiled_qblox)
+        else:
+            if profiler is not None:
+                profiler.count("compilation_cache.hits")
+            logger.debug("Reusing cached Qblox compilation output.")
+        return compiled_qblox
+
+    def precompile_qprogram(
+        self,
+        qprogram: QProgram,
+        bus_mapping: dict[str, str] | None = None,
+        calibration: Calibration | None = None,
+        crosstalk: bool = True,
+    ) -> bool:
+        """Compiles a :class:`.QProgram` into the compilation cache, without executing it.
+
+        A later :meth:`execute_qprogram` of the same QProgram reuses the cached output, as long as the parameters of
+        the platform that the compilation depends on (delays, times of flight, crosstalk...) have not changed in
+        between; otherwise it simply compiles again. To compile in a background thread, use
+        :meth:`prepare_qprogram_precompilation` instead.
+
+        Only QPrograms that run exclusively on Qblox modules are precompiled: QDAC-II and Quantum Machines outputs are
+        not cached.
+
+        Args:
+            qprogram (QProgram): The :class:`.QProgram` to compile.
+            bus_mapping (dict[str, str], optional): A dictionary mapping the buses in the :class:`.QProgram` (keys) to
+                the buses in the platform (values). Defaults to None.
+            calibration (Calibration, optional): :class:`.Calibration` instance to use. Defaults to the calibration of
+                the platform, as in :meth:`execute_qprogram`.
+            crosstalk (bool, optional): Whether the crosstalk compensation is applied. Defaults to True.
+
+        Returns:
+            bool: Whether the QProgram was compiled into the cache.
+        """
+        compilation = self.prepare_qprogram_precompilation(
+            qprogram=qprogram, bus_mapping=bus_mapping, calibration=calibration, crosstalk=crosstalk
+        )
+        if compilation is None:
+            return False
+        compilation()
+        return True
+
+    def prepare_qprogram_precompilation(
+        self,
+        qprogram: QProgram,
+        bus_mapping: dict[str, str] | None = None,
+        calibration: Calibration | None = None,
+        crosstalk: bool = True,
+    ) -> Callable[[], QbloxCompilationOutput] | None:
+        """Takes a snapshot of the inputs of the compilation of a :class:`.QProgram`, to compile it into the
+        compilation cache later.
+
+        The settings of the platform that the compiler reads (delays, times of flight, markers, distortions...) are
+        copied in the calling thread. The returned callable fingerprints and compiles that snapshot, without reading the platform or communicating with the
+        instruments, so it can run in a background thread while the calling thread keeps changing the settings, e.g.
+        executing the rest of an experiment. If the settings change before the QProgram is executed,
+        :meth:`execute_qprogram` simply misses the cache and compiles again.
+
+        The QProgram, the calibration and the crosstalk matrix are not copied, since copying them can cost as much as
+        compiling: they must not be modified in place until the callable has run. Replacing them, e.g. with
+        :meth:`set_crosstalk` or :meth:`set_calibration`, is safe.
+
+        Args:
+            qprogram (QProgram): The :class:`.QProgram` to compile.
+            bus_mapping (dict[str, str], optional): A dictionary mapping the buses in the :class:`.QProgram` (keys) to
+                the buses in the platform (values). Defaults to None.
+            calibration (Calibration, optional): :class:`.Calibration` instance to use. Defaults to the calibration of
+                the platform, as in :meth:`execute_qprogram`.
+            crosstalk (bool, optional): Whether the crosstalk compensation is applied. Defaults to True.
+
+        Returns:
+            Callable[[], QbloxCompilationOutput] | None: Callable that compiles the QProgram into the cache, or None if
+            the QProgram cannot be precompiled, see :meth:`precompile_qprogram`.
+        """
+        if self._qpy_sequence_cache.max_size == 0:
+            return None
+        bus_aliases = {bus_mapping[bus] if bus_mapping and bus in bus_mapping else bus for bus in qprogram.buses}
+        buses = [self.buses.get(alias=bus_alias) for bus_alias in bus_aliases]
+        instruments = [instrument for bus in buses for instrument in bus.instruments]
+        if not any(isinstance(instrument, QbloxModule) for instrument in instruments) or any(
+            isinstance(instrument, (QDevilQDac2, QuantumMachinesCluster)) for instrument in instruments
+        ):
+            return None
+        if calibration is None:
+            calibration = self.calibration
+        compilation_inputs = self._qblox_compilation_inputs(
+            qprogram=qprogram,
+            buses=buses,
+            bus_mapping=bus_mapping,
+            calibration=self._compilation_calibration(calibration=calibration, crosstalk=crosstalk),
+            crosstalk=crosstalk,
+        )
+        # The other settings are fresh dictionaries of numbers and strings, already independent of the platform.
+        compilation_inputs["bus_distortions"] = deepcopy(compilation_inputs["bus_distortions"])
+        if bus_mapping is not None:
+            compilation_inputs["bus_mapping"] = dict(bus_mapping)
+        return partial(self._compile_qblox, compilation_inputs)
+
     def execute_compilation_output(
         self,
         output: QProgramCompilationOutput,
         debug: bool = False,
     ):
+        if output.qdac:
+            # Compiling only plans the QDAC-II uploads and triggers, they are sent to the instruments now
+            with profile_phase("execute.qdac"):
+                output.qdac.apply()
+
         if isinstance(output.qblox, QbloxCompilationOutput):
             self.trigger_runs = 0
             return self._execute_qblox_compilation_output(output=output, debug=debug)
@@ -1286,48 +1493,41 @@ class Platform:
                         print(str(sequence._program), file=sourceFile)
                         print(file=sourceFile)
 
-            # Upload sequences
-            for bus_alias in sequences:
-                buses[bus_alias].upload_qpysequence(qpysequence=sequences[bus_alias])
-                # sync all relevant sequences
-                for instrument, channel in zip(buses[bus_alias].instruments, buses[bus_alias].channels):
-                    if isinstance(instrument, QbloxModule):
-                        instrument.sync_sequencer(sequencer_id=int(channel))
+            # Upload sequences. Every phase finishes on all buses before the next one starts.
+            with profile_phase("execute.upload"):
+                uploaded = self._run_qblox_bus_tasks(
+                    buses, lambda bus_alias, bus: self._upload_and_sync_qblox_bus(bus, sequences[bus_alias])
+                )
+            self._profile_qblox_uploads(sequences=sequences, uploaded=uploaded)
 
             # Execute sequences
-            if output.qdac:
-                if output.qdac.trigger_position == "back":
-                    for qdac in output.qdac.qdacs:
-                        qdac.start()
-                for bus_alias in sequences:
-                    buses[bus_alias].run()
-                if output.qdac.trigger_position == "front":
-                    for qdac in output.qdac.qdacs:
-                        qdac.start()
-            else:
-                for bus_alias in sequences:
-                    buses[bus_alias].run()
+            with profile_phase("execute.run"):
+                if output.qdac:
+                    if output.qdac.trigger_position == "back":
+                        for qdac in output.qdac.qdacs:
+                            qdac.start()
+                    self._run_qblox_bus_tasks(buses, lambda _, bus: bus.run())
+                    if output.qdac.trigger_position == "front":
+                        for qdac in output.qdac.qdacs:
+                            qdac.start()
+                else:
+                    self._run_qblox_bus_tasks(buses, lambda _, bus: bus.run())
 
             # Acquire results
             results = QProgramResults()
-            for bus_alias, bus in buses.items():
-                if bus.has_adc():
-                    for instrument, channel in zip(buses[bus_alias].instruments, buses[bus_alias].channels):
-                        if isinstance(instrument, QbloxModule):
-                            bus_results = bus.acquire_qprogram_results(
-                                acquisitions=acquisitions[bus_alias], channel_id=int(channel)
-                            )
-                            for bus_result, (_, acquisition_data) in zip(bus_results, acquisitions[bus_alias].items()):
-                                intertwined = acquisition_data.intertwined
-                                unintertwined_results = self._unintertwined_qblox_results(bus_result, intertwined)
-                                for unintertwined_result in unintertwined_results:
-                                    results.append_result(bus=bus_alias, result=unintertwined_result)
+            with profile_phase("execute.acquire"):
+                acquired = self._run_qblox_bus_tasks(
+                    {bus_alias: bus for bus_alias, bus in buses.items() if bus.has_adc()},
+                    lambda bus_alias, bus: self._acquire_qblox_bus_results(bus, acquisitions[bus_alias]),
+                )
+            self._profile_qblox_acquisitions(acquired=acquired)
+            for bus_alias, bus_results in acquired.items():
+                for unintertwined_result in bus_results:
+                    results.append_result(bus=bus_alias, result=unintertwined_result)
 
             # Reset instrument settings
-            for bus_alias in sequences:
-                for instrument, channel in zip(buses[bus_alias].instruments, buses[bus_alias].channels):
-                    if isinstance(instrument, QbloxModule):
-                        instrument.desync_sequencer(sequencer_id=int(channel))
+            with profile_phase("execute.reset"):
+                self._run_qblox_bus_tasks(buses, lambda _, bus: self._desync_qblox_bus(bus))
 
             return results
         except TimeoutError as timeout:
@@ -1354,6 +1554,109 @@ class Platform:
 
             raise timeout
 
+    def _run_qblox_bus_tasks(self, buses: dict[Any, Bus], task: Callable[[Any, Bus], Any]) -> dict[Any, Any]:
+        """Runs ``task(key, bus)`` for every bus, concurrently across the Qblox instrument connections.
+
+        Calls to buses sharing a connection are made serially, in the order of ``buses``.
+
+        Returns:
+            dict[Any, Any]: The value returned by ``task`` for each bus, in the order of ``buses``.
+        """
+        return self._qblox_task_runner.run(
+            {key: (self._qblox_connection(bus), partial(task, key, bus)) for key, bus in buses.items()}
+        )
+
+    @staticmethod
+    def _qblox_connection(bus: Bus) -> Any:
+        """Returns an object identifying the connection used to talk to the Qblox modules of ``bus``.
+
+        All the modules of a Qblox cluster are driven through the cluster's connection, so buses in the same cluster
+        share it.
+        """
+        for instrument in bus.instruments:
+            if isinstance(instrument, QbloxModule):
+                device = getattr(instrument, "device", None)
+                return getattr(device, "root_instrument", None) or device or instrument
+        return bus
+
+    @staticmethod
+    def _upload_and_sync_qblox_bus(bus: Bus, sequence: Any) -> bool:
+        uploaded = bus.upload_qpysequence(qpysequence=sequence)
+        for instrument, channel in zip(bus.instruments, bus.channels):
+            if isinstance(instrument, QbloxModule):
+                instrument.sync_sequencer(sequencer_id=int(channel))  # type: ignore[arg-type]
+        return uploaded
+
+    @staticmethod
+    def _profile_qblox_uploads(sequences: dict[Any, Any], uploaded: dict[Any, bool]) -> None:
+        """Records the size of the sequences uploaded to each bus in the active profiler, if any.
+
+        ``sequences`` and ``uploaded`` are keyed by bus alias, or by ``(qprogram index, bus alias)`` in parallel
+        executions. The sequences are serialized again to measure them, which is recorded as the ``profiling`` phase.
+        """
+        profiler = get_active_profiler()
+        if profiler is None:
+            return
+        with profiler.phase("profiling"):
+            for key, was_uploaded in uploaded.items():
+                bus_alias = key[1] if isinstance(key, tuple) else key
+                if not was_uploaded:
+                    profiler.record_bus(bus_alias, skipped_uploads=1)
+                    continue
+                sequence_dict = sequences[key].to_dict()
+                program = sequence_dict.get("program", "")
+                # Labels end with a colon and may share their line with an instruction, comments start with "#"
+                instructions = sum(1 for line in program.splitlines() if line.split("#")[0].rsplit(":", 1)[-1].strip())
+                waveform_samples = sum(
+                    len(waveform["data"])
+                    for memory in ("waveforms", "weights")
+                    for waveform in sequence_dict.get(memory, {}).values()
+                )
+                payload = json.dumps(sequence_dict, default=lambda value: value.tolist())
+                profiler.record_bus(
+                    bus_alias,
+                    uploads=1,
+                    bytes_uploaded=len(payload.encode()),
+                    waveform_samples=waveform_samples,
+                    instructions=instructions,
+                )
+
+    @staticmethod
+    def _profile_qblox_acquisitions(acquired: dict[Any, list[QbloxMeasurementResult]]) -> None:
+        """Records the size of the acquisition data fetched from each bus in the active profiler, if any.
+
+        ``acquired`` is keyed by bus alias, or by ``(qprogram index, bus alias)`` in parallel executions.
+        """
+        profiler = get_active_profiler()
+        if profiler is None:
+            return
+        for key, bus_results in acquired.items():
+            values = sum(
+                result.scope.size + result.integration.size + result.thresholded.size + result.avg_cnt.size
+                for result in bus_results
+            )
+            profiler.record_bus(key[1] if isinstance(key, tuple) else key, bytes_downloaded=8 * values)
+
+    @staticmethod
+    def _desync_qblox_bus(bus: Bus) -> None:
+        for instrument, channel in zip(bus.instruments, bus.channels):
+            if isinstance(instrument, QbloxModule):
+                instrument.desync_sequencer(sequencer_id=int(channel))  # type: ignore[arg-type]
+
+    def _acquire_qblox_bus_results(
+        self, bus: Bus, acquisitions: dict[str, AcquisitionData]
+    ) -> list[QbloxMeasurementResult]:
+        results = []
+        for instrument, channel in zip(bus.instruments, bus.channels):
+            if isinstance(instrument, QbloxModule):
+                bus_results = bus.acquire_qprogram_results(acquisitions=acquisitions, channel_id=int(channel))  # type: ignore[arg-type]
+                with profile_phase("execute.reshape_results"):
+                    for bus_result, acquisition_data in zip(bus_results, acquisitions.values()):
+                        # Qblox modules always return QbloxMeasurementResult instances
+                        qblox_result = cast("QbloxMeasurementResult", bus_result)
+                        results.extend(self._unintertwined_qblox_results(qblox_result, acquisition_data.intertwined))
+        return results
+
     def _unintertwined_qblox_results(
         self, bus_result: QbloxMeasurementResult, intertwined: int
     ) -> list[QbloxMeasurementResult]:
@@ -1363,45 +1666,12 @@ class Platform:
         while the acquisition index remains constant.
         If `intertwined` is greater than 1, this function separates each acquisition into its own QbloxMeasurementResult object.
         QbloxMeasurementResult object. If `intertwined` is 1 the result is returned inside a single-element list.
+        The separated results are strided views of the buffers of `bus_result`, so no data is copied.
 
         Returns:
             list[QbloxMeasurementResult]: unintertwined results where each element corresponds to one acquisition.
         """
-        results_unintertwined_list = []
-        if intertwined > 1:
-            for result in range(intertwined):
-                bus = bus_result.bus
-                new_raw_measurement_data = {
-                    "scope": {
-                        "path0": {
-                            "data": bus_result.raw_measurement_data["scope"]["path0"]["data"][result::intertwined]
-                        },
-                        "path1": {
-                            "data": bus_result.raw_measurement_data["scope"]["path1"]["data"][result::intertwined]
-                        },
-                    },
-                    "bins": {
-                        "integration": {
-                            "path0": bus_result.raw_measurement_data["bins"]["integration"]["path0"][
-                                result::intertwined
-                            ],
-                            "path1": bus_result.raw_measurement_data["bins"]["integration"]["path1"][
-                                result::intertwined
-                            ],
-                        },
-                        "threshold": bus_result.raw_measurement_data["bins"]["threshold"][result::intertwined],
-                        "avg_cnt": bus_result.raw_measurement_data["bins"]["avg_cnt"][result::intertwined],
-                    },
-                }
-                results_unintertwined = QbloxMeasurementResult(
-                    bus=bus, raw_measurement_data=new_raw_measurement_data, shape=bus_result.shape
-                )
-                results_unintertwined_list.append(results_unintertwined)
-
-        else:
-            results_unintertwined_list = [bus_result]
-
-        return results_unintertwined_list
+        return bus_result.deinterleave(intertwined)
 
     def _execute_quantum_machines_compilation_output(
         self,
@@ -1483,10 +1753,12 @@ class Platform:
         if calibration is None:
             calibration = self.calibration
 
-        output = self.compile_qprogram(
-            qprogram=qprogram, bus_mapping=bus_mapping, calibration=calibration, crosstalk=crosstalk
-        )
-        return self.execute_compilation_output(output=output, debug=debug)
+        with profile_phase("compile"):
+            output = self.compile_qprogram(
+                qprogram=qprogram, bus_mapping=bus_mapping, calibration=calibration, crosstalk=crosstalk
+            )
+        with profile_phase("execute"):
+            return self.execute_compilation_output(output=output, debug=debug)
 
     def _normalize_bus_mappings(
         self,
@@ -1601,19 +1873,21 @@ class Platform:
                     )
                 all_physical |= phys
 
-            outputs = [
-                self.compile_qprogram(
-                    qprogram=qp, bus_mapping=bus_mapping, calibration=calibration, crosstalk=crosstalk
-                )
-                for qp, bus_mapping, calibration in zip(qprograms, bus_mapping_list, calibrations_list)
-            ]
+            with profile_phase("compile"):
+                outputs = [
+                    self.compile_qprogram(
+                        qprogram=qp, bus_mapping=bus_mapping, calibration=calibration, crosstalk=crosstalk
+                    )
+                    for qp, bus_mapping, calibration in zip(qprograms, bus_mapping_list, calibrations_list)
+                ]
 
         if any(isinstance(output.quantum_machines, QuantumMachinesCompilationOutput) for output in outputs):
             raise ValueError("Parallel execution is not supported in Quantum Machines.")
 
-        return self.execute_compilation_outputs_parallel(
-            outputs=cast("list[QbloxCompilationOutput]", [output.qblox for output in outputs]), debug=debug
-        )
+        with profile_phase("execute"):
+            return self.execute_compilation_outputs_parallel(
+                outputs=cast("list[QbloxCompilationOutput]", [output.qblox for output in outputs]), debug=debug
+            )
 
     def execute_compilation_outputs_parallel(self, outputs: list[QbloxCompilationOutput], debug: bool = False):
         """Execute compiled qprograms in parallel.
@@ -1641,7 +1915,15 @@ class Platform:
             Each element of the list corresponds to a sequencer.
             The keys correspond to the buses a measurement were performed upon, and the values are the list of measurement results in chronological order.
         """
-        sequences_per_qprogram = [output.sequences for output in outputs]
+        # Distortions are applied in place to the waveforms, so they are applied to copies to keep the (possibly
+        # cached) compilation outputs untouched.
+        sequences_per_qprogram = [
+            {
+                bus_alias: deepcopy(sequence) if self.buses.get(alias=bus_alias).distortions else sequence
+                for bus_alias, sequence in output.sequences.items()
+            }
+            for output in outputs
+        ]
         aquisitions_per_qprogram = [output.acquisitions for output in outputs]
         buses_per_qprogram = self._resolve_qblox_parallel_buses(sequences_per_qprogram=sequences_per_qprogram)
         self._apply_qblox_distortions_parallel(
@@ -1653,26 +1935,30 @@ class Platform:
             self._write_qblox_parallel_debug(sequences_per_qprogram=sequences_per_qprogram)
 
         # Upload sequences
-        self._upload_qblox_parallel_sequences(
-            sequences_per_qprogram=sequences_per_qprogram, buses_per_qprogram=buses_per_qprogram
-        )
+        with profile_phase("execute.upload"):
+            self._upload_qblox_parallel_sequences(
+                sequences_per_qprogram=sequences_per_qprogram, buses_per_qprogram=buses_per_qprogram
+            )
 
         # Execute sequences
-        self._run_qblox_parallel_sequences(
-            sequences_per_qprogram=sequences_per_qprogram, buses_per_qprogram=buses_per_qprogram
-        )
+        with profile_phase("execute.run"):
+            self._run_qblox_parallel_sequences(
+                sequences_per_qprogram=sequences_per_qprogram, buses_per_qprogram=buses_per_qprogram
+            )
 
         # Acquire results
-        results = self._acquire_qblox_parallel_results(
-            outputs=outputs,
-            buses_per_qprogram=buses_per_qprogram,
-            aquisitions_per_qprogram=aquisitions_per_qprogram,
-        )
+        with profile_phase("execute.acquire"):
+            results = self._acquire_qblox_parallel_results(
+                outputs=outputs,
+                buses_per_qprogram=buses_per_qprogram,
+                aquisitions_per_qprogram=aquisitions_per_qprogram,
+            )
 
         # Reset instrument settings
-        self._reset_qblox_parallel_sequencers(
-            sequences_per_qprogram=sequences_per_qprogram, buses_per_qprogram=buses_per_qprogram
-        )
+        with profile_phase("execute.reset"):
+            self._reset_qblox_parallel_sequencers(
+                sequences_per_qprogram=sequences_per_qprogram, buses_per_qprogram=buses_per_qprogram
+            )
 
         return results
 
@@ -1734,25 +2020,20 @@ class Platform:
         sequences_per_qprogram: list[dict[str, Any]],
         buses_per_qprogram: list[dict[str, Bus]],
     ) -> None:
-        for qprogram_idx, sequences in enumerate(sequences_per_qprogram):
-            for bus_alias in sequences:
-                buses_per_qprogram[qprogram_idx][bus_alias].upload_qpysequence(qpysequence=sequences[bus_alias])
-                # sync all relevant sequences
-                for instrument, channel in zip(
-                    buses_per_qprogram[qprogram_idx][bus_alias].instruments,
-                    buses_per_qprogram[qprogram_idx][bus_alias].channels,
-                ):
-                    if isinstance(instrument, QbloxModule):
-                        instrument.sync_sequencer(sequencer_id=int(channel))  # type: ignore[arg-type]
+        uploaded = self._run_qblox_bus_tasks(
+            self._flatten_qblox_parallel_buses(buses_per_qprogram),
+            lambda key, bus: self._upload_and_sync_qblox_bus(bus, sequences_per_qprogram[key[0]][key[1]]),
+        )
+        self._profile_qblox_uploads(
+            sequences={key: sequences_per_qprogram[key[0]][key[1]] for key in uploaded}, uploaded=uploaded
+        )
 
     def _run_qblox_parallel_sequences(
         self,
         sequences_per_qprogram: list[dict[str, Any]],
         buses_per_qprogram: list[dict[str, Bus]],
     ) -> None:
-        for qprogram_idx, sequences in enumerate(sequences_per_qprogram):
-            for bus_alias in sequences:
-                buses_per_qprogram[qprogram_idx][bus_alias].run()
+        self._run_qblox_bus_tasks(self._flatten_qblox_parallel_buses(buses_per_qprogram), lambda _, bus: bus.run())
 
     def _acquire_qblox_parallel_results(
         self,
@@ -1761,22 +2042,14 @@ class Platform:
         aquisitions_per_qprogram: list[dict[str, Any]],
     ) -> list[QProgramResults]:
         results = [QProgramResults() for _ in outputs]
-        for qprogram_idx, buses in enumerate(buses_per_qprogram):
-            for bus_alias, bus in buses.items():
-                if bus.has_adc():
-                    for instrument, channel in zip(buses[bus_alias].instruments, buses[bus_alias].channels):
-                        if isinstance(instrument, QbloxModule):
-                            bus_results = bus.acquire_qprogram_results(
-                                acquisitions=aquisitions_per_qprogram[qprogram_idx][bus_alias],
-                                channel_id=int(channel),  # type: ignore[arg-type]
-                            )
-                            for bus_result, (_, acquisition_data) in zip(
-                                bus_results, aquisitions_per_qprogram[qprogram_idx][bus_alias].items()
-                            ):
-                                intertwined = acquisition_data.intertwined
-                                unintertwined_results = self._unintertwined_qblox_results(bus_result, intertwined)  # type: ignore[arg-type]
-                                for unintertwined_result in unintertwined_results:
-                                    results[qprogram_idx].append_result(bus=bus_alias, result=unintertwined_result)
+        acquired = self._run_qblox_bus_tasks(
+            {key: bus for key, bus in self._flatten_qblox_parallel_buses(buses_per_qprogram).items() if bus.has_adc()},
+            lambda key, bus: self._acquire_qblox_bus_results(bus, aquisitions_per_qprogram[key[0]][key[1]]),
+        )
+        self._profile_qblox_acquisitions(acquired=acquired)
+        for (qprogram_idx, bus_alias), bus_results in acquired.items():
+            for unintertwined_result in bus_results:
+                results[qprogram_idx].append_result(bus=bus_alias, result=unintertwined_result)
         return results
 
     def _reset_qblox_parallel_sequencers(
@@ -1784,14 +2057,17 @@ class Platform:
         sequences_per_qprogram: list[dict[str, Any]],
         buses_per_qprogram: list[dict[str, Bus]],
     ) -> None:
-        for qprogram_idx, sequences in enumerate(sequences_per_qprogram):
-            for bus_alias in sequences:
-                for instrument, channel in zip(
-                    buses_per_qprogram[qprogram_idx][bus_alias].instruments,
-                    buses_per_qprogram[qprogram_idx][bus_alias].channels,
-                ):
-                    if isinstance(instrument, QbloxModule):
-                        instrument.desync_sequencer(sequencer_id=int(channel))  # type: ignore[arg-type]
+        self._run_qblox_bus_tasks(
+            self._flatten_qblox_parallel_buses(buses_per_qprogram), lambda _, bus: self._desync_qblox_bus(bus)
+        )
+
+    @staticmethod
+    def _flatten_qblox_parallel_buses(buses_per_qprogram: list[dict[str, Bus]]) -> dict[tuple[int, str], Bus]:
+        return {
+            (qprogram_idx, bus_alias): bus
+            for qprogram_idx, buses in enumerate(buses_per_qprogram)
+            for bus_alias, bus in buses.items()
+        }
 
     def calibrate_mixers(self, alias: str, cal_type: str, channel_id: ChannelID | None = None):
         bus = self.get_element(alias=alias)
@@ -1813,6 +2089,7 @@ class Platform:
         acquisition_showing: bool = True,
         bus_mapping: dict[str, str] | None = None,
         calibration: Calibration | None = None,
+        max_points: int | None = None,
     ):
         """Draw the QProgram using QBlox Compiler whilst adding the knowledge of the platform
 
@@ -1823,6 +2100,8 @@ class Platform:
             acquisition_showing (bool): Allows visualizing the acquisition period on the plot. Defaults to True.
             bus_mapping (dict[str, str], optional): A dictionary mapping the buses in the :class:`.QProgram` (keys )to the buses in the platform (values).
                 It is useful for mapping a generic :class:`.QProgram` to a specific experiment. Defaults to None.
+            max_points (int, optional): Maximum number of points of each trace of the plot. Longer traces are downsampled keeping the minimum
+                and maximum of each interval, which keeps long programs responsive to display. Defaults to None, which plots every ns.
 
         Returns:
             plotly object: plotly.graph_objs._figure.Figure
@@ -1831,7 +2110,7 @@ class Platform:
         qblox_draw = QbloxDraw()
         sequencer = self.compile_qprogram(qprogram, bus_mapping, calibration).qblox
         plotly_figure, _ = qblox_draw.draw(
-            sequencer, runcard_data, time_window, averages_displayed, acquisition_showing
+            sequencer, runcard_data, time_window, averages_displayed, acquisition_showing, max_points
         )
 
         return plotly_figure
@@ -1859,6 +2138,8 @@ class Platform:
         experiment_name: str,
         qprogram: QProgram | None = None,
         description: str | None = None,
+        buffered: bool = False,
+        keep_results: bool = True,
     ):
         """Allows for real time saving of results from an experiment.
 
@@ -1898,6 +2179,8 @@ class Platform:
             experiment_name (str): Name of the experiment.
             qprogram (QProgram | None, optional): Qprogram of the experiment, if there is no Qprogram related to the results it is not mandatory. Defaults to None.
             description (str | None, optional): String containing a description or any relevant information about the experiment. Defaults to None.
+            buffered (bool, optional): Whether to coalesce the results in memory and flush them to the file periodically, instead of writing and flushing every assignment. Recommended for large sweeps. Defaults to False.
+            keep_results (bool, optional): Whether to keep a copy of all the results in memory. Defaults to True.
 
         Returns:
             StreamArray: StreamArray class to process and save the data
@@ -1914,6 +2197,8 @@ class Platform:
             experiment_name=experiment_name,
             db_manager=self.db_manager,
             optional_identifier=description,
+            buffered=buffered,
+            keep_results=keep_results,
         )
 
     def db_save_results(
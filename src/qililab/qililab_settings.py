@@ -13,6 +13,7 @@
 # limitations under the License.
 import tempfile
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -40,6 +41,26 @@ class QililabSettings(BaseSettings):
         default=False,
         description="If the experiment should be saved in the database or not. [env: QILILAB_EXPERIMENT_RESULTS_SAVE_IN_DATABASE]",
     )
+    experiment_results_chunk_bytes: int = Field(
+        default=1024 * 1024,
+        ge=0,
+        description="Target size in bytes of the chunks of the results datasets, which span the innermost loops of the experiment. Writes are buffered in memory and written one chunk at a time. 0 stores the results contiguously and writes every point directly. [env: QILILAB_EXPERIMENT_RESULTS_CHUNK_BYTES]",
+    )
+    experiment_results_compression: Literal["gzip", "lzf"] | None = Field(
+        default=None,
+        description="Lossless compression filter of the results datasets, applied with the byte shuffle filter. Requires chunking. [env: QILILAB_EXPERIMENT_RESULTS_COMPRESSION]",
+    )
+    experiment_results_compression_level: int = Field(
+        default=4,
+        ge=0,
+        le=9,
+        description="Compression level of the gzip filter of the results datasets. [env: QILILAB_EXPERIMENT_RESULTS_COMPRESSION_LEVEL]",
+    )
+    experiment_results_flush_interval: float = Field(
+        default=5.0,
+        ge=0,
+        description="Maximum time in seconds that buffered results stay in memory before being written to the results file. 0 only writes them when their chunk is complete and when the experiment ends. [env: QILILAB_EXPERIMENT_RESULTS_FLUSH_INTERVAL]",
+    )
     experiment_live_plot_enabled: bool = Field(
         default=False,
         description="If the experiment should be live plotted. [env: QILILAB_EXPERIMENT_LIVE_PLOT_ENABLED]",
@@ -52,6 +73,85 @@ class QililabSettings(BaseSettings):
         default=None,
         description="The port number of the Dash server for when experiment_live_plot_on_slurm is True. Defaults to None. [env: QILILAB_EXPERIMENT_LIVE_PLOT_PORT]",
     )
+    experiment_live_plot_refresh_interval: float = Field(
+        default=1.0,
+        ge=0,
+        description="Minimum time in seconds between two refreshes of the live plot figure and its PNG export, which run in a background thread. 0 refreshes it after every write, in the thread acquiring the results. [env: QILILAB_EXPERIMENT_LIVE_PLOT_REFRESH_INTERVAL]",
+    )
+    experiment_pipelined_execution: bool = Field(
+        default=False,
+        description="If experiments should compile the next QProgram and write the previous results to file in background threads while the current QProgram runs on the instruments. [env: QILILAB_EXPERIMENT_PIPELINED_EXECUTION]",
+    )
+    experiment_profiling_enabled: bool = Field(
+        default=False,
+        description="If experiments should record the time spent in each phase of compiling and executing their QPrograms, and the data uploaded and downloaded per bus, and store it in the results file. [env: QILILAB_EXPERIMENT_PROFILING_ENABLED]",
+    )
+    database_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Number of connections kept open in the connection pool of each database. [env: QILILAB_DATABASE_POOL_SIZE]",
+    )
+    database_pool_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Number of connections that can be opened beyond database_pool_size when all of them are in use. [env: QILILAB_DATABASE_POOL_MAX_OVERFLOW]",
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        description="Time in seconds after which pooled database connections are replaced, before the server closes them. -1 never replaces them. [env: QILILAB_DATABASE_POOL_RECYCLE]",
+    )
+    database_summary_cache_ttl: float = Field(
+        default=2.0,
+        ge=0,
+        description="Time in seconds that the results of DatabaseManager.tail_summary and head_summary are reused for identical queries, for dashboards polling the database. 0 disables the cache. [env: QILILAB_DATABASE_SUMMARY_CACHE_TTL]",
+    )
+    database_asynchronous_writes: bool = Field(
+        default=False,
+        description="If the DatabaseManager should commit new measurements from a background thread, in batches, instead of blocking until each one is committed. DatabaseManager.flush() waits for them. [env: QILILAB_DATABASE_ASYNCHRONOUS_WRITES]",
+    )
+    database_write_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of measurements committed in a single transaction by the background thread of the DatabaseManager. [env: QILILAB_DATABASE_WRITE_BATCH_SIZE]",
+    )
+    database_deduplicate_blobs: bool = Field(
+        default=False,
+        description="If the DatabaseManager should store the platforms and calibrations of the measurements once per distinct content in the blobs table, with each measurement only referencing them. [env: QILILAB_DATABASE_DEDUPLICATE_BLOBS]",
+    )
+    serialization_cache_dir: str | None = Field(
+        default=None,
+        description="Directory where the YAML files loaded with deserialize_from, like calibrations, are cached in binary format, named after the hash of their content, so that unchanged files are loaded from the binary copy instead of being parsed again. Defaults to None, which disables the cache. [env: QILILAB_SERIALIZATION_CACHE_DIR]",
+    )
+    yaml_ndarray_binary_min_size: int = Field(
+        default=64,
+        ge=0,
+        description="Minimum number of elements of the numpy arrays serialized to YAML as base64 encoded binary data. Smaller arrays are serialized as lists of their elements. [env: QILILAB_YAML_NDARRAY_BINARY_MIN_SIZE]",
+    )
+    yaml_ndarray_compression_level: int = Field(
+        default=1,
+        ge=0,
+        le=9,
+        description="zlib compression level of the numpy arrays serialized to YAML as binary data. 0 disables compression. [env: QILILAB_YAML_NDARRAY_COMPRESSION_LEVEL]",
+    )
+    compilation_cache_size: int = Field(
+        default=64,
+        ge=0,
+        description="Maximum number of compiled QPrograms kept in the platform's compilation cache. 0 disables the cache. [env: QILILAB_COMPILATION_CACHE_SIZE]",
+    )
+    qblox_execution_threads: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of threads used to upload, start and acquire the Qblox sequencers of different instrument connections concurrently. 1 runs everything serially. [env: QILILAB_QBLOX_EXECUTION_THREADS]",
+    )
+    qblox_keep_sequences_resident: bool = Field(
+        default=False,
+        description="If the Qblox readout sequencers should keep their last sequence loaded after acquiring the results, instead of being overwritten with an empty sequence, so that executing the same sequence again only rearms and restarts them. [env: QILILAB_QBLOX_KEEP_SEQUENCES_RESIDENT]",
+    )
+    waveform_envelope_cache_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Maximum total size in bytes of the waveform envelopes kept in memory, shared by all the waveforms, so that equal waveforms compute their envelope only once. 0 disables the cache. [env: QILILAB_WAVEFORM_ENVELOPE_CACHE_BYTES]",
+    )
 
 
 @lru_cache(maxsize=1)
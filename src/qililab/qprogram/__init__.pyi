@@ -21,21 +21,34 @@ if TYPE_CHECKING:
     from .qblox_compiler import QbloxCompilationOutput, QbloxCompiler
     from .qdac_compiler import QdacCompilationOutput, QdacCompiler
     from .qprogram import QProgram, QProgramCompilationOutput
-    from .utils_crosstalk import CrosstalkElements, NonLinearFlagState
+    from .transforms import (
+        BusMappingTransform,
+        CalibrationTransform,
+        DistortionsTransform,
+        QProgramTransform,
+        WeightDurationTransform,
+    )
+    from .utils_crosstalk import CrosstalkElements, NonLinearFlagState, NonLinearLoopFolder
 
 __all__ = [
+    "BusMappingTransform",
     "Calibration",
+    "CalibrationTransform",
     "CrosstalkElements",
     "CrosstalkMatrix",
+    "DistortionsTransform",
     "Experiment",
     "FluxVector",
     "NonLinearCrosstalkMatrix",
     "NonLinearFlagState",
     "NonLinearFluxVector",
+    "NonLinearLoopFolder",
     "QProgram",
     "QProgramCompilationOutput",
+    "QProgramTransform",
     "QbloxCompilationOutput",
     "QbloxCompiler",
     "QdacCompilationOutput",
     "QdacCompiler",
+    "WeightDurationTransform",
 ]
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Final, Mapping
+from typing import Any, Final, Mapping, NamedTuple
 
 import numpy as np
 from scipy.special import jv
@@ -23,9 +23,23 @@ from qililab.yaml import yaml
 _UNSET: Final = Sentinel.UNSET
 
 
+class _DenseCrosstalk(NamedTuple):
+    """Dense representation of a crosstalk matrix, cached until the matrix changes."""
+
+    signature: tuple
+    buses: list[str]
+    rows: list[int]
+    array: np.ndarray
+    inverse: np.ndarray
+
+
 @yaml.register_class
 class CrosstalkMatrix:
-    """A class to represent a crosstalk matrix where each index corresponds to a bus."""
+    """A class to represent a crosstalk matrix where each index corresponds to a bus.
+
+    The dense array of the matrix and its inverse are computed once and cached until the values of ``matrix`` change,
+    so that converting flux to bias, e.g. on every flux step of a sweep, is a single matrix product.
+    """
 
     def __init__(self) -> None:
         """Initializes an empty crosstalk matrix."""
@@ -33,6 +47,42 @@ class CrosstalkMatrix:
         self.flux_offsets: dict[str, float] = {}
         self.resistances: dict[str, float | None] = {}
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the attributes of the matrix, without its cached dense representation."""
+        state = self.__dict__.copy()
+        state.pop("_dense_cache", None)
+        return state
+
+    def __fingerprint__(self) -> dict[str, Any]:
+        return self.__getstate__()
+
+    def _dense(self) -> _DenseCrosstalk:
+        """Returns the dense representation of the matrix, computing it again only if ``matrix`` changed.
+
+        The values of ``matrix`` are compared with those the cached representation was computed from, so that changes
+        made through ``__setitem__``, to the dictionaries returned by ``__getitem__`` or by reassigning ``matrix`` are
+        all detected.
+        """
+        signature = tuple((bus, tuple(row.items())) for bus, row in self.matrix.items())
+        dense: _DenseCrosstalk | None = self.__dict__.get("_dense_cache")
+        if dense is None or dense.signature != signature:
+            buses = self._sorted_buses()
+            index = {bus: i for i, bus in enumerate(buses)}
+            array = np.eye(len(buses))
+            for bus1, row in self.matrix.items():
+                for bus2, value in row.items():
+                    array[index[bus1], index[bus2]] = value
+            rows = [index[bus] for bus in sort_buses(self.matrix.keys())]
+            dense = _DenseCrosstalk(signature, buses, rows, array, np.linalg.inv(array))
+            self._dense_cache = dense
+        return dense
+
+    @property
+    def buses(self) -> list[str]:
+        """The buses of the matrix, in the order of the rows and columns of :meth:`to_array` and of the flux and bias
+        arrays of :meth:`flux_to_bias_array`."""
+        return list(self._dense().buses)
+
     def _sorted_buses(self) -> list[str]:
         """Canonical bus ordering shared by to_array/inverse/from_array.
 
@@ -55,14 +105,7 @@ class CrosstalkMatrix:
         Returns:
             np.ndarray: crosstalk matrix as a numpy array.
         """
-        sorted_buses = self._sorted_buses()
-
-        xtalk_matrix = np.eye(len(self.matrix))
-        for i, bus1 in enumerate(sorted_buses):
-            for j, bus2 in enumerate(sorted_buses):
-                if bus1 in self.matrix and bus2 in self.matrix[bus1]:
-                    xtalk_matrix[i, j] = self.matrix[bus1][bus2]
-        return xtalk_matrix
+        return self._dense().array.copy()
 
     def inverse(self) -> "CrosstalkMatrix":
         """Returns the inverse version of the crosstalk matrix (as a bus dictionary).
@@ -70,8 +113,8 @@ class CrosstalkMatrix:
         Returns:
             CrosstalkMatrix: inverse crosstalk matrix
         """
-        inverse_xtalk_array = np.linalg.inv(self.to_array())
-        return self.from_array(self._sorted_buses(), inverse_xtalk_array)
+        dense = self._dense()
+        return self.from_array(dense.buses, dense.inverse)
 
     def __getitem__(self, bus: str) -> dict[str, float]:
         """Returns the dictionary of crosstalk values for the given bus.
@@ -163,20 +206,48 @@ class CrosstalkMatrix:
             flux (dict[str, float | np.ndarray]): Target flux values keyed by bus name.
                 Values can be scalars or numpy arrays of the same length.
 
+        Raises:
+            ValueError: If the array values do not all have the same shape.
+
         Returns:
             dict[str, float | np.ndarray]: Hardware bias values keyed by bus name.
         """
-        sorted_buses = sort_buses(self.matrix.keys())
-        inverse = self.inverse()
-        inverse.flux_offsets = self.flux_offsets
-
-        bias = {}
-        for bus_1 in sorted_buses:
-            bias[bus_1] = sum(
-                (flux[bus_2] - inverse.flux_offsets[bus_2]) * inverse.matrix[bus_1][bus_2]
-                for bus_2 in inverse.matrix[bus_1].keys()
-            )
-        return bias
+        dense = self._dense()
+        values = {bus: np.asarray(flux[bus], dtype=float) for bus in dense.buses}
+        self._check_flux_shapes(values)
+        flux_array = np.array(np.broadcast_arrays(*values.values()))
+        bias_array = self._apply_inverse(dense, flux_array)
+        return {dense.buses[row]: bias_array[row] for row in dense.rows}
+
+    def flux_to_bias_array(self, flux: np.ndarray) -> np.ndarray:
+        """Converts a batch of target flux points to hardware bias values with a single matrix product.
+
+        Equivalent to :meth:`flux_to_bias` for each point, for whole sweep grids at once.
+
+        Args:
+            flux (np.ndarray): Target flux values with shape ``(N_points, N_buses)``, or ``(N_buses,)`` for a single
+                point, with the buses in the order of :attr:`buses`.
+
+        Returns:
+            np.ndarray: Hardware bias values with the same shape and bus order as ``flux``.
+        """
+        dense = self._dense()
+        flux = np.asarray(flux, dtype=float)
+        if flux.shape[-1] != len(dense.buses):
+            raise ValueError(f"Expected flux values for {len(dense.buses)} buses {dense.buses}, got {flux.shape[-1]}.")
+        return self._apply_inverse(dense, flux.T).T
+
+    @staticmethod
+    def _check_flux_shapes(flux: Mapping[str, np.ndarray]) -> None:
+        """Raises a ValueError unless the non-scalar values of ``flux`` all have the same shape."""
+        shapes = {bus: value.shape for bus, value in flux.items() if value.ndim > 0}
+        if len(set(shapes.values())) > 1:
+            raise ValueError(f"Flux values must be scalars or arrays of the same shape, got shapes {shapes}.")
+
+    def _apply_inverse(self, dense: _DenseCrosstalk, flux: np.ndarray) -> np.ndarray:
+        """Applies the inverse matrix to ``flux`` minus the flux offsets, with the buses in the first dimension."""
+        offsets = np.array([self.flux_offsets.get(bus, 0.0) for bus in dense.buses])
+        return dense.inverse @ (flux - offsets.reshape((-1,) + (1,) * (flux.ndim - 1)))
 
     @classmethod
     def from_array(cls, buses: list[str], matrix_array: np.ndarray) -> "CrosstalkMatrix":
@@ -473,7 +544,7 @@ class NonLinearCrosstalkMatrix(CrosstalkMatrix):
             )
         offsets = np.array([self.flux_offsets.get(bus, 0.0) for bus in sorted_buses])
 
-        inverse_matrix = self.inverse().to_array()
+        inverse_matrix = self._dense().inverse
         corr_m_off = corrected_flux.T - offsets
         bias_array = inverse_matrix @ corr_m_off.T
 
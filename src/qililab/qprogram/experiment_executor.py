@@ -16,17 +16,21 @@
 import inspect
 import math
 import os
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from contextvars import copy_context
 from dataclasses import dataclass
 from datetime import datetime
 from time import perf_counter
 from types import LambdaType
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, cast
 from uuid import UUID
 
 import numpy as np
 from rich.progress import BarColumn, Progress, TaskID, TextColumn, TimeElapsedColumn
 
+from qililab.config import logger
 from qililab.core.variables import Variable
 from qililab.qililab_settings import get_settings
 from qililab.qprogram.blocks import Average, Block, ForLoop, Loop, Parallel
@@ -41,6 +45,7 @@ from qililab.qprogram.operations import (
     SetParameter,
 )
 from qililab.qprogram.operations.set_crosstalk import SetCrosstalk
+from qililab.qprogram.qprogram import QProgram
 from qililab.result.experiment_results_writer import (
     ExperimentDataBaseMetadata,
     ExperimentMetadata,
@@ -50,6 +55,7 @@ from qililab.result.experiment_results_writer import (
     VariableMetadata,
 )
 from qililab.result.qprogram.qprogram_results import QProgramResults
+from qililab.utils.execution_profiler import ExecutionProfile, ExecutionProfiler
 from qililab.utils.serialization import serialize
 
 if TYPE_CHECKING:
@@ -65,6 +71,84 @@ class VariableInfo:
     values: np.ndarray
 
 
+class _QProgramExecution:
+    """Callable that executes an ``ExecuteQProgram`` operation of the experiment and stores its results.
+
+    Besides being called like the rest of the prepared operations, it exposes the steps of the execution separately,
+    so that the pipelined mode of :class:`ExperimentExecutor` can precompile the QProgram ahead of time and store the
+    results in a background thread.
+    """
+
+    def __init__(
+        self,
+        executor: "ExperimentExecutor",
+        operation: ExecuteQProgram,
+        qprogram_index: int,
+        call_parameters: dict[str, int | float],
+        deferred_parameters: dict[str, UUID],
+        current_value_of_variable: dict[UUID, int | float],
+    ):
+        self.executor = executor
+        self.operation = operation
+        self.qprogram_index = qprogram_index
+        self.call_parameters = call_parameters
+        self.deferred_parameters = deferred_parameters
+        self.current_value_of_variable = current_value_of_variable
+        self._qprogram: QProgram | None = None
+
+    @property
+    def is_bound(self) -> bool:
+        """Whether the QProgram can be built before the preceding operations have run."""
+        return not self.deferred_parameters
+
+    def build_qprogram(self) -> QProgram:
+        """Returns the QProgram to execute, calling the lambda of the operation with the current variable values."""
+        if isinstance(self.operation.qprogram, QProgram):
+            return self.operation.qprogram
+        qprogram_of = cast("Callable[..., QProgram]", self.operation.qprogram)
+        return qprogram_of(
+            **{
+                # Bind the values that are known
+                **self.call_parameters,
+                # Retrieve the deferred values
+                **{
+                    param_name: self.current_value_of_variable[uuid]
+                    for param_name, uuid in self.deferred_parameters.items()
+                },
+            }
+        )
+
+    def prepare_precompilation(self) -> Callable[[], Any] | None:
+        """Builds the QProgram and takes a snapshot of the inputs of its compilation, in the calling thread.
+
+        Returns:
+            Callable[[], Any] | None: Callable that compiles the QProgram into the platform's compilation cache, to be
+            run in a background thread, or None if the QProgram cannot be precompiled.
+        """
+        self._qprogram = self.build_qprogram()
+        return self.executor.platform.prepare_qprogram_precompilation(
+            qprogram=self._qprogram, bus_mapping=self.operation.bus_mapping, calibration=self.operation.calibration
+        )
+
+    def run(self) -> QProgramResults:
+        """Executes the QProgram on the platform.
+
+        Returns:
+            QProgramResults: The results of the execution.
+        """
+        qprogram = self._qprogram if self._qprogram is not None else self.build_qprogram()
+        self._qprogram = None
+        return self.executor.platform.execute_qprogram(
+            qprogram=qprogram,
+            bus_mapping=self.operation.bus_mapping,
+            calibration=self.operation.calibration,
+            debug=self.operation.debug,
+        )
+
+    def __call__(self) -> None:
+        self.executor._store_results(self.run(), self.qprogram_index, tuple(self.executor.loop_indices.values()))
+
+
 class ExperimentExecutor:
     """Manages the execution of a quantum experiment.
 
@@ -82,6 +166,11 @@ class ExperimentExecutor:
     Args:
         platform (Platform): The platform on which the experiment is to be executed.
         experiment (Experiment): The experiment object defining the sequence of operations and loops.
+        resume_from (int, optional): Flat index of the operation to start the execution from, as given by
+            :attr:`operation_index` after an interrupted execution. The previous QProgram executions are skipped, while
+            the ``SetParameter``, ``SetCrosstalk`` and ``GetParameter`` operations of the blocks and loop iterations
+            being resumed are replayed, so that the instruments are set as in the resumed iteration. The results are
+            written to a new file. Defaults to 0.
 
     Example:
         .. code-block::
@@ -123,6 +212,7 @@ class ExperimentExecutor:
         job_id: int | None = None,
         sample: str | None = None,
         cooldown: str | None = None,
+        resume_from: int = 0,
     ):
         self.platform = platform
         self.experiment = experiment
@@ -169,6 +259,18 @@ class ExperimentExecutor:
         # ExperimentResultsWriter object responsible for saving experiment results to file in real-time.
         self._results_writer: ExperimentResultsWriter
 
+        # Number of operations generated for each Block, computed without generating them.
+        self._operations_per_block: dict[Block, int] = {}
+
+        # Flat index of the next operation to execute. After an interruption, it can be passed as `resume_from`.
+        self.operation_index = resume_from
+
+        # Statistics of the last pipelined execution (see `experiment_pipelined_execution` setting).
+        self.pipeline_statistics: dict[str, int | float] = {}
+
+        # Profile of the last execution (see `experiment_profiling_enabled` setting).
+        self.profile: ExecutionProfile | None = None
+
     def _prepare_metadata(self, executed_at: datetime):
         """Prepares the loop values and result shape before execution."""
 
@@ -280,43 +382,73 @@ class ExperimentExecutor:
         traverse_experiment(self.experiment.body)
         self._all_variables = dict(self._all_variables)
 
-    def _prepare_operations(self, block: Block, progress: Progress):
-        """Traverse blocks, store generated Python functions, and return the stored operations."""
+    def _count_operations(self, element: Block | Operation) -> int:
+        """Number of operations generated by :meth:`_prepare_operations` for an element, without generating them."""
+        if isinstance(element, (GetParameter, SetCrosstalk, SetParameter, ExecuteQProgram)):
+            return 1
+        if not isinstance(element, Block):
+            return 0
+        if element not in self._operations_per_block:
+            count = sum(self._count_operations(child) for child in element.elements)
+            if isinstance(element, (Loop, ForLoop, Parallel)):
+                # Create and remove the progress bar, plus advancing the progress bar and loop index every iteration
+                iterations = self._variables_per_block[element][0].values.shape[-1]
+                count = 2 + iterations * (count + 2)
+            self._operations_per_block[element] = count
+        return self._operations_per_block[element]
+
+    def _prepare_operations(self, block: Block, progress: Progress, start: int = 0) -> Iterator[Callable]:
+        """Lazily generate the Python functions that execute the operations of a block, in execution order.
+
+        Loops are walked on the fly while the operations are consumed, so only the state of the loops being walked is
+        kept in memory, instead of the operations of every iteration.
+
+        Args:
+            block (Block): Block to generate the operations of.
+            progress (Progress): Progress in which the progress bars of the loops are shown.
+            start (int, optional): Flat index of the first operation to generate. The previous operations are skipped
+                without being generated, except for the ``GetParameter``, ``SetParameter`` and ``SetCrosstalk``
+                operations of the blocks being entered, which are executed immediately, with the values of the iteration
+                being entered. The progress bars and loop indices of the loops that are entered midway start at the
+                corresponding iteration. Defaults to 0.
+
+        Yields:
+            Callable: The operations to execute.
+        """
 
         # A mapping from block UUID to the associated Progress TaskID
         task_ids: dict[UUID, TaskID] = {}
 
-        # A list of operations to execute
-        operations: list[Callable] = []
-
         # A mapping from block UUID to the index of the current value of its variable
         self.loop_indices: dict[UUID, int] = {}
 
-        # A mapping from variable UUID to current value of the variable
+        # A mapping from variable UUID to the value of the variable in the loop iteration being generated
         current_value_of_variable: dict[UUID, int | float] = {}
 
-        def handle_loop(block: ForLoop | Loop | Parallel) -> list[Callable]:
-            """Common logic for handling ForLoop and Loop blocks."""
-            loop_operations: list[Callable] = []
+        # Variables whose value is retrieved by a `GetParameter` when the operations are executed
+        deferred_variables: set[UUID] = set()
+
+        # A mapping from variable UUID to the value retrieved by a `GetParameter` operation
+        retrieved_value_of_variable: dict[UUID, int | float] = {}
 
+        def handle_loop(block: ForLoop | Loop | Parallel, skip: int) -> Iterator[Callable]:
+            """Common logic for handling ForLoop and Loop blocks."""
             # Determine loop parameters based on the type of block
             label = ",".join([variable.label for variable in self._variables_per_block[block]])
             shape = self._variables_per_block[block][0].values.shape[-1]
 
             # Create the progress bar for the loop
-            def create_progress_bar():
+            def create_progress_bar(iteration: int = 0):
                 total_iterations = shape
-                loop_task_id = progress.add_task(f"Looping over {label}", total=total_iterations)
+                loop_task_id = progress.add_task(f"Looping over {label}", total=total_iterations, completed=iteration)
                 # Store the task ID associated with this loop block
                 task_ids[block.uuid] = loop_task_id
 
                 # Track the index for this loop
-                self.loop_indices[block.uuid] = 0
+                self.loop_indices[block.uuid] = iteration
 
                 return loop_task_id
 
-            loop_operations.append(create_progress_bar)
-
             def advance_progress_bar(variable_value: tuple[int | float, ...]) -> None:
                 loop_task_id = task_ids[block.uuid]
                 progress.update(
@@ -329,185 +461,305 @@ class ExperimentExecutor:
                 # Update the loop index
                 self.loop_indices[block.uuid] += 1
 
-            uuids = [variable.uuid for variable in self._variables_per_block[block]]
-            values = [variable.values for variable in self._variables_per_block[block]]
-
-            for current_values in zip(*values):
-                for uuid, value in zip(uuids, current_values):
-                    current_value_of_variable[uuid] = value
-
-                loop_operations.append(lambda value=current_values: advance_progress_bar(value))  # type: ignore
-
-                # Process elements within the loop
-                loop_operations.extend(process_elements(block.elements))
-
-                loop_operations.append(advance_loop_index)
-
             def remove_progress_bar():
                 progress.remove_task(task_ids[block.uuid])
                 del self.loop_indices[block.uuid]
 
-            loop_operations.append(remove_progress_bar)
+            uuids = [variable.uuid for variable in self._variables_per_block[block]]
+            values = [variable.values for variable in self._variables_per_block[block]]
+            iteration_size = sum(self._count_operations(element) for element in block.elements)
+
+            first_iteration = 0
+            if skip == 0:
+                yield create_progress_bar
+            else:
+                # Enter the loop at the iteration containing the first operation to generate
+                first_iteration, skip = divmod(skip - 1, iteration_size + 2)
+                create_progress_bar(first_iteration + (1 if skip > 0 else 0))
+                self.loop_indices[block.uuid] = first_iteration
+
+            for iteration in range(first_iteration, shape):
+                current_values = tuple(variable_values[iteration] for variable_values in values)
+                current_value_of_variable.update(zip(uuids, current_values))
+                deferred_variables.difference_update(uuids)
+
+                if skip == 0:
+                    yield lambda value=current_values: advance_progress_bar(value)  # type: ignore
+                else:
+                    skip -= 1
 
-            return loop_operations
+                # Process elements within the loop
+                yield from process_elements(block.elements, skip)
+                skip = 0
+
+                yield advance_loop_index
 
-        def process_elements(elements: list[Block | Operation]) -> list[Callable]:
-            """Process the elements in a block and store the corresponding operations."""
-            elements_operations: list[Callable] = []
+            yield remove_progress_bar
 
+        def process_elements(elements: list[Block | Operation], skip: int = 0) -> Iterator[Callable]:
+            """Process the elements in a block and generate the corresponding operations."""
             for element in elements:
                 if isinstance(element, GetParameter):
-                    # Set current value of the variable to None
-                    current_value_of_variable[element.variable.uuid] = None  # type: ignore[assignment]
-                    # Append a lambda that will call the `platform.get_parameter` method and assign the returned value to the variable
-                    elements_operations.append(
-                        lambda operation=element: current_value_of_variable.update(
-                            {
-                                operation.variable.uuid: self.platform.get_parameter(
-                                    alias=operation.alias,
-                                    parameter=operation.parameter,
-                                    channel_id=operation.channel_id,
-                                    output_id=operation.output_id,
-                                )
-                            }
-                        )
-                    )
-                if isinstance(element, SetCrosstalk):
-                    elements_operations.append(
-                        lambda operation=element: self.platform.set_crosstalk(crosstalk=operation.crosstalk)
-                    )
-                if isinstance(element, SetParameter):
-                    # Append a lambda that will call the `platform.set_parameter` method
-                    if isinstance(element.value, Variable):
-                        if current_value_of_variable[element.value.uuid] is None:
-                            # Variable has no value and it will get it from a `GetOperation` in the future. Thus, don't bind `value` in lambda.
-                            elements_operations.append(
-                                lambda operation=element: self.platform.set_parameter(
-                                    alias=operation.alias,
-                                    parameter=operation.parameter,
-                                    value=current_value_of_variable[operation.value.uuid],
-                                    channel_id=operation.channel_id,
-                                    output_id=operation.output_id,
-                                )
-                            )
-                        else:
-                            # Variable has a value that was set from a loop. Thus, bind `value` in lambda with the current value of the variable.
-                            elements_operations.append(
-                                lambda operation=element, value=current_value_of_variable[element.value.uuid]: (
-                                    self.platform.set_parameter(
-                                        alias=operation.alias,
-                                        parameter=operation.parameter,
-                                        value=value,
-                                        channel_id=operation.channel_id,
-                                        output_id=operation.output_id,
-                                    )
-                                )
-                            )
-                    else:
-                        # Value is not a variable. Treat it as a normal Python type.
-                        elements_operations.append(
-                            lambda operation=element: self.platform.set_parameter(
-                                alias=operation.alias,
-                                parameter=operation.parameter,
-                                value=operation.value,
-                                channel_id=operation.channel_id,
-                                output_id=operation.output_id,
-                            )
-                        )
+                    # The value of the variable is only known once the operation is executed
+                    deferred_variables.add(element.variable.uuid)
+                    current_value_of_variable.pop(element.variable.uuid, None)
+
+                count = self._count_operations(element)
+                if skip >= count:
+                    if isinstance(element, (GetParameter, SetCrosstalk, SetParameter)):
+                        # Replay the skipped operations of the blocks being entered, so that the instruments are set as
+                        # in the resumed iteration, and the following operations get the values they retrieve
+                        operation_of(element)()
+                    skip -= count
+                    continue
 
-                if isinstance(element, ExecuteQProgram):
-                    qprogram_index = self._qprogram_execution_indices[element]
-                    if isinstance(element.qprogram, LambdaType):
-                        signature = inspect.signature(element.qprogram)
-                        call_parameters: dict[str, int | float] = {}
-                        deferred_parameters: dict[str, UUID] = {}
-
-                        # Iterate through parameters and separate the ones that have values and the ones that don't
-                        for param in signature.parameters.values():
-                            if isinstance(param.default, Variable):
-                                variable_value = current_value_of_variable.get(param.default.uuid, None)
-                                if variable_value is None:
-                                    # The variable doesn't have a value yet; defer binding
-                                    deferred_parameters[param.name] = param.default.uuid
-                                    # Make sure key exists
-                                    current_value_of_variable[param.default.uuid] = None  # type: ignore[assignment]
-                                else:
-                                    # The variable has a current value; bind it immediately
-                                    call_parameters[param.name] = variable_value
-
-                        # Bind the values for known variables, and retrieve deferred ones when the lambda is executed
-                        elements_operations.append(
-                            lambda operation=element, call_parameters=call_parameters, qprogram_index=qprogram_index: (
-                                store_results(
-                                    self.platform.execute_qprogram(
-                                        qprogram=operation.qprogram(
-                                            **{
-                                                # Bind the values that are known
-                                                **call_parameters,
-                                                **{
-                                                    param_name: current_value_of_variable[uuid]
-                                                    for param_name, uuid in deferred_parameters.items()
-                                                    # Defer retrieving missing values
-                                                },
-                                            }
-                                        ),  # type: ignore
-                                        bus_mapping=operation.bus_mapping,
-                                        calibration=operation.calibration,
-                                        debug=operation.debug,
-                                    ),
-                                    qprogram_index,
-                                )
-                            )
+                if isinstance(element, Block):
+                    # Recursively handle elements of the block
+                    yield from process_block(element, skip)
+                else:
+                    yield operation_of(element)
+                skip = 0
+
+        def operation_of(element: Operation) -> Callable:
+            """Return the Python function that executes an operation."""
+            if isinstance(element, GetParameter):
+                # Return a lambda that will call the `platform.get_parameter` method and assign the returned value to the variable
+                return lambda operation=element: retrieved_value_of_variable.update(
+                    {
+                        operation.variable.uuid: self.platform.get_parameter(
+                            alias=operation.alias,
+                            parameter=operation.parameter,
+                            channel_id=operation.channel_id,
+                            output_id=operation.output_id,
                         )
-                    else:
-                        # Append a lambda that will call the `platform.execute_qprogram` method
-                        elements_operations.append(
-                            lambda operation=element, qprogram_index=qprogram_index: store_results(
-                                self.platform.execute_qprogram(
-                                    qprogram=operation.qprogram,
-                                    bus_mapping=operation.bus_mapping,
-                                    calibration=operation.calibration,
-                                    debug=operation.debug,
-                                ),
-                                qprogram_index,
-                            )
+                    }
+                )
+            if isinstance(element, SetCrosstalk):
+                return lambda operation=element: self.platform.set_crosstalk(crosstalk=operation.crosstalk)
+            if isinstance(element, SetParameter):
+                # Return a lambda that will call the `platform.set_parameter` method
+                if isinstance(element.value, Variable):
+                    if element.value.uuid in deferred_variables:
+                        # Variable gets its value from a `GetOperation` when executed. Thus, don't bind `value` in lambda.
+                        return lambda operation=element: self.platform.set_parameter(
+                            alias=operation.alias,
+                            parameter=operation.parameter,
+                            value=retrieved_value_of_variable[operation.value.uuid],
+                            channel_id=operation.channel_id,
+                            output_id=operation.output_id,
                         )
-                elif isinstance(element, Block):
-                    # Recursively handle elements of the block
-                    nested_operations = self._prepare_operations(element, progress)
-                    elements_operations.extend(nested_operations)
-
-            return elements_operations
+                    # Variable has a value that was set from a loop. Thus, bind `value` in lambda with the current value of the variable.
+                    return lambda operation=element, value=current_value_of_variable[element.value.uuid]: (
+                        self.platform.set_parameter(
+                            alias=operation.alias,
+                            parameter=operation.parameter,
+                            value=value,
+                            channel_id=operation.channel_id,
+                            output_id=operation.output_id,
+                        )
+                    )
+                # Value is not a variable. Treat it as a normal Python type.
+                return lambda operation=element: self.platform.set_parameter(
+                    alias=operation.alias,
+                    parameter=operation.parameter,
+                    value=operation.value,
+                    channel_id=operation.channel_id,
+                    output_id=operation.output_id,
+                )
 
-        def store_results(qprogram_results: QProgramResults, qprogram_index: int):
-            """Store the result in the correct location within the ExperimentResultsWriter."""
-            # Determine the index based on current loop indices and store the results in the ExperimentResultsWriter
-            for measurement_index, measurement_result in enumerate(qprogram_results.timeline):
-                indices = (qprogram_index, measurement_index, *tuple(index for _, index in self.loop_indices.items()))
-                self._results_writer[indices] = np.moveaxis(measurement_result.array, 0, -1)
+            # ExecuteQProgram
+            element = cast("ExecuteQProgram", element)
+            call_parameters: dict[str, int | float] = {}
+            deferred_parameters: dict[str, UUID] = {}
+            if isinstance(element.qprogram, LambdaType):
+                signature = inspect.signature(element.qprogram)
+
+                # Iterate through parameters and separate the ones that have values and the ones that don't
+                for param in signature.parameters.values():
+                    if isinstance(param.default, Variable):
+                        variable_value = current_value_of_variable.get(param.default.uuid, None)
+                        if variable_value is None:
+                            # The variable doesn't have a value yet; defer binding
+                            deferred_parameters[param.name] = param.default.uuid
+                        else:
+                            # The variable has a current value; bind it immediately
+                            call_parameters[param.name] = variable_value
+
+            # Bind the values for known variables, and retrieve deferred ones when the operation is executed
+            return _QProgramExecution(
+                executor=self,
+                operation=element,
+                qprogram_index=self._qprogram_execution_indices[element],
+                call_parameters=call_parameters,
+                deferred_parameters=deferred_parameters,
+                current_value_of_variable=retrieved_value_of_variable,
+            )
 
-        if isinstance(block, (Loop, ForLoop, Parallel)):
-            # Handle loops
-            operations.extend(handle_loop(block))
-        else:
+        def process_block(block: Block, skip: int) -> Iterator[Callable]:
+            if isinstance(block, (Loop, ForLoop, Parallel)):
+                # Handle loops
+                return handle_loop(block, skip)
             # Handle generic blocks
-            operations.extend(process_elements(block.elements))
+            return process_elements(block.elements, skip)
+
+        yield from process_block(block, start)
 
-        return operations
+    def _store_results(self, qprogram_results: QProgramResults, qprogram_index: int, loop_indices: tuple[int, ...]):
+        """Store the result in the correct location within the ExperimentResultsWriter."""
+        # Determine the index based on the loop indices at execution time and store the results in the ExperimentResultsWriter
+        for measurement_index, measurement_result in enumerate(qprogram_results.timeline):
+            indices = (qprogram_index, measurement_index, *loop_indices)
+            self._results_writer[indices] = np.moveaxis(measurement_result.array, 0, -1)
 
-    def _execute_operations(self, operations: list[Callable], progress: Progress):
-        """Run the stored operations in sequence, updating the progress bar."""
-        main_task_id = progress.add_task("Executing experiment", total=len(operations))
+    def _execute_operations(self, operations: Iterable[Callable], progress: Progress, total: int | None = None):
+        """Run the operations in sequence as they are generated, updating the progress bar."""
+        main_task_id = progress.add_task(
+            "Executing experiment", total=total, completed=self.operation_index if total is not None else 0
+        )
 
-        for operation in operations:
-            # Execute the stored operation and update the main progress bar
-            operation()
-            progress.advance(main_task_id)
+        if get_settings().experiment_pipelined_execution:
+            self._execute_operations_pipelined(operations, progress, main_task_id)
+        else:
+            for operation in operations:
+                # Execute the stored operation and update the main progress bar
+                operation()
+                self.operation_index += 1
+                progress.advance(main_task_id)
 
         progress.update(main_task_id, description="Executing experiment (done)")
         # Ensure the final state of the progress bar is rendered
         progress.refresh()
 
+    def _execute_operations_pipelined(self, operations: Iterable[Callable], progress: Progress, main_task_id: TaskID):
+        """Run the operations in sequence, overlapping each QProgram execution with background work.
+
+        All the operations, and therefore all the calls to the platform (set/get parameter, set crosstalk and QProgram
+        executions), still run in this thread and in the same order as in the sequential mode. While a QProgram runs on
+        the instruments, a compiler thread precompiles the next one into the platform's compilation cache, and a writer
+        thread stores the results of the previous ones to file, in execution order. A QProgram that depends on a
+        ``GetParameter`` is not precompiled, since its value is only known once the preceding operations have run.
+
+        The time spent by the background threads, and how much of it was hidden behind the execution, is stored in
+        :attr:`pipeline_statistics` and logged at the end.
+        """
+        pending_operations = iter(operations)
+        # Operations generated ahead of time to find the next QProgram execution, up to and including it.
+        lookahead: deque[Callable] = deque()
+        statistics: dict[str, int | float] = {
+            "executed": 0,
+            "precompiled": 0,
+            "compile_time": 0.0,
+            "write_time": 0.0,
+            "wait_time": 0.0,
+            "overlap": 0.0,
+        }
+        compilations: dict[_QProgramExecution, Future] = {}
+        writes: deque[Future] = deque()
+
+        def next_execution() -> _QProgramExecution | None:
+            """Return the next QProgram execution, generating the operations up to it if needed."""
+            if lookahead and isinstance(lookahead[-1], _QProgramExecution):
+                return lookahead[-1]
+            for operation in pending_operations:
+                lookahead.append(operation)
+                if isinstance(operation, _QProgramExecution):
+                    return operation
+            return None
+
+        def precompile(execution: _QProgramExecution, compilation: Callable[[], Any]) -> None:
+            start = perf_counter()
+            try:
+                compilation()
+                statistics["precompiled"] += 1
+            except Exception as exception:  # noqa: BLE001
+                # The execution compiles the QProgram again, and raises the error in order if it persists.
+                logger.debug("Precompiling QProgram %d failed: %s", execution.qprogram_index, exception)
+            statistics["compile_time"] += perf_counter() - start
+
+        def schedule_precompilation() -> None:
+            upcoming = next_execution()
+            if upcoming is None or not upcoming.is_bound or upcoming in compilations:
+                return
+            # The platform settings are read here, in the thread that changes them; the compiler thread only compiles.
+            try:
+                compilation = upcoming.prepare_precompilation()
+            except Exception as exception:  # noqa: BLE001
+                logger.debug("Precompiling QProgram %d failed: %s", upcoming.qprogram_index, exception)
+                return
+            if compilation is not None:
+                compilations[upcoming] = compiler.submit(copy_context().run, precompile, upcoming, compilation)
+
+        def write(results: QProgramResults, qprogram_index: int, loop_indices: tuple[int, ...]) -> None:
+            start = perf_counter()
+            try:
+                self._store_results(results, qprogram_index, loop_indices)
+            finally:
+                statistics["write_time"] += perf_counter() - start
+
+        def wait_for(future: Future) -> None:
+            start = perf_counter()
+            wait([future])
+            statistics["wait_time"] += perf_counter() - start
+
+        with (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="qililab-compiler") as compiler,
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="qililab-writer") as writer,
+        ):
+            try:
+                schedule_precompilation()
+                while True:
+                    if lookahead:
+                        operation = lookahead.popleft()
+                    else:
+                        next_operation = next(pending_operations, None)
+                        if next_operation is None:
+                            break
+                        operation = next_operation
+                    if isinstance(operation, _QProgramExecution):
+                        if operation in compilations:
+                            wait_for(compilations.pop(operation))
+                        schedule_precompilation()
+                        results = operation.run()
+                        statistics["executed"] += 1
+                        writes.append(
+                            writer.submit(
+                                copy_context().run,
+                                write,
+                                results,
+                                operation.qprogram_index,
+                                tuple(self.loop_indices.values()),
+                            )
+                        )
+                        # Surface writing errors as soon as they happen, instead of at the end of the experiment.
+                        while writes and writes[0].done():
+                            writes.popleft().result()
+                    else:
+                        operation()
+                    self.operation_index += 1
+                    progress.advance(main_task_id)
+            finally:
+                for future in compilations.values():
+                    future.cancel()
+                # Wait for every pending write, so that all the results acquired so far end up in the file.
+                for future in writes:
+                    wait_for(future)
+            for future in writes:
+                future.result()
+
+        statistics["overlap"] = max(
+            statistics["compile_time"] + statistics["write_time"] - statistics["wait_time"], 0.0
+        )
+        self.pipeline_statistics = statistics
+        logger.info(
+            "Pipelined execution: precompiled %d of %d QPrograms in %.3f s and wrote results in %.3f s, "
+            "%.3f s of which overlapped with the execution.",
+            statistics["precompiled"],
+            statistics["executed"],
+            statistics["compile_time"],
+            statistics["write_time"],
+            statistics["overlap"],
+        )
+
     def _inclusive_range(self, start: int | float, stop: int | float, step: int | float) -> np.ndarray:
         # Define the number of decimal places based on the precision of the step
         decimal_places = -int(np.floor(np.log10(step))) if step < 1 else 0
@@ -593,8 +845,8 @@ class ExperimentExecutor:
         Executes the experiment and streams the results in real-time.
 
         This method prepares the experiment by calculating the shape and values of the loops,
-        creates callable operations, initializes an ExperimentResultsWriter for real-time result storage,
-        and then runs the operations while updating a progress bar.
+        initializes an ExperimentResultsWriter for real-time result storage, and then generates and runs
+        the operations one by one while updating a progress bar.
 
         Returns:
             str: The path to the file where the results are stored.
@@ -615,7 +867,9 @@ class ExperimentExecutor:
             db_manager=self.platform.db_manager,
         )
 
-        with self._results_writer:
+        # The experiment records its own profile, taking over from any profiler activated with `Platform.profile()`.
+        profiling = ExecutionProfiler().activate() if get_settings().experiment_profiling_enabled else nullcontext()
+        with self._results_writer, profiling as profiler:
             start_time = perf_counter()
             try:
                 with Progress(
@@ -625,11 +879,14 @@ class ExperimentExecutor:
                     TimeElapsedColumn(),
                 ) as progress:
                     # every self._prepare_operations updates the h5 though ExperimentResultsWriter
-                    operations = self._prepare_operations(self.experiment.body, progress)
-                    self._execute_operations(operations, progress)
+                    operations = self._prepare_operations(self.experiment.body, progress, start=self.operation_index)
+                    self._execute_operations(operations, progress, total=self._count_operations(self.experiment.body))
             finally:
                 # Write the execution time to the results writer
                 self._results_writer.execution_time = perf_counter() - start_time
+                if profiler is not None:
+                    self.profile = profiler.profile()
+                    self._results_writer.profile = self.profile.to_dict()
 
         del self.loop_indices
 
@@ -15,6 +15,7 @@
 from .acquire import Acquire, AcquireWithCalibratedWeights
 from .execute_qprogram import ExecuteQProgram
 from .get_parameter import GetParameter
+from .lookup_table import LookupTable
 from .measure import (
     Measure,
     MeasureWithCalibratedWaveform,
@@ -42,6 +43,7 @@ __all__ = [
     "AcquireWithCalibratedWeights",
     "ExecuteQProgram",
     "GetParameter",
+    "LookupTable",
     "Measure",
     "MeasureReset",
     "MeasureResetCalibrated",
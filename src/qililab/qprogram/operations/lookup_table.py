@@ -0,0 +1,54 @@
+# Copyright 2026 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from qililab.core.variables import Variable
+from qililab.qprogram.operations.operation import Operation
+from qililab.qprogram.operations.play import Play
+from qililab.qprogram.operations.set_gain import SetGain
+from qililab.qprogram.operations.set_offset import SetOffset
+from qililab.yaml import yaml
+
+
+@yaml.register_class
+class LookupTable(Operation):
+    """Operation applying, on every iteration of the loops it is nested in, one of several precomputed ``Play``,
+    ``SetGain`` or ``SetOffset`` operations of a bus.
+
+    The entry applied is the one whose key equals the sum of the current values of the ``index`` variables. It is
+    created by :meth:`QProgram.with_crosstalk_qblox` to keep swept loops as hardware loops when the compensated values
+    change on every iteration.
+
+    Args:
+        bus (str): Bus of the operations.
+        index (list[Variable]): Variables whose sum selects the entry.
+        keys (list[int]): Key of each entry, in increasing order.
+        operations (list[Play | SetGain | SetOffset]): Entries of the table, all of the same type and on ``bus``.
+    """
+
+    def __init__(
+        self, bus: str, index: list[Variable], keys: list[int], operations: list[Play | SetGain | SetOffset]
+    ) -> None:
+        super().__init__()
+        self.bus: str = bus
+        self.index: list[Variable] = index
+        self.keys: list[int] = keys
+        self.operations: list[Play | SetGain | SetOffset] = operations
+
+    def get_variables(self) -> set[Variable]:
+        """Get a set of the variables used in operation, if any.
+
+        Returns:
+            set[Variable]: The set of variables used in operation.
+        """
+        return set(self.index)
@@ -14,7 +14,7 @@
 
 import math
 from collections import deque
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable
 
@@ -35,6 +35,7 @@ from qililab.qprogram.calibration import Calibration
 from qililab.qprogram.crosstalk_matrix import CrosstalkMatrix
 from qililab.qprogram.operations import (
     Acquire,
+    LookupTable,
     Measure,
     MeasureReset,
     Operation,
@@ -51,6 +52,13 @@ from qililab.qprogram.operations import (
     WaitTrigger,
 )
 from qililab.qprogram.qprogram import QProgram
+from qililab.qprogram.transforms import (
+    BusMappingTransform,
+    CalibrationTransform,
+    DistortionsTransform,
+    QProgramTransform,
+)
+from qililab.utils.execution_profiler import profile_phase
 from qililab.waveforms import Arbitrary, FlatTop, IQWaveform, Square, Waveform
 
 if TYPE_CHECKING:
@@ -118,8 +126,9 @@ class BusCompilationInfo:
 
         # Dictionaries to hold mappings useful during compilation.
         self.variable_to_register: dict[Variable, QPyProgram.Register] = {}
-        self.waveform_to_index: dict[str, int] = {}
-        self.weight_to_index: dict[str, int] = {}
+        # Waveform and weight digests mapped to their (index, length) in the Sequence.
+        self.waveform_to_index: dict[str, tuple[int, int]] = {}
+        self.weight_to_index: dict[str, tuple[int, int]] = {}
         self.acquisition_to_index: dict[str, int] = {}
 
         # Create and append the setup block to the Sequence's program
@@ -211,6 +220,12 @@ class BusCompilationInfo:
         # Flag used in _handle_acquire if acquisitions have more than 1 depth and the number of acquisitions exceeds MAX_ACQUISITION_INDEX
         self.exceeds_depth: bool = False
 
+        # Lookup tables, as their index register and the (first key, instruction) of their runs of equal entries. They
+        # are searched after the stop instruction, executing the instruction of the selected entry.
+        self.lookup_tables: list[tuple[QPyProgram.Register, list[tuple[int, QPyInstructions.Instruction]]]] = []
+        # Sum of the index variables of lookup tables indexed by more than one loop
+        self.lookup_index_register: QPyProgram.Register | None = None
+
 
 class QbloxCompiler:
     """A class for compiling QProgram to QBlox hardware."""
@@ -239,6 +254,7 @@ class QbloxCompiler:
             MeasureReset: self._handle_measure_reset,
             Acquire: self._handle_acquire,
             Play: self._handle_play,
+            LookupTable: self._handle_lookup_table,
             Block: self._handle_block,
         }
 
@@ -304,7 +320,10 @@ class QbloxCompiler:
                 self._buses[bus].qprogram_block_stack.append(block)
                 self._buses[bus].first_acquire_of_block = True
             for element in block.elements:
-                if isinstance(element, Play) and not delay_implemented:
+                if (
+                    isinstance(element, Play)
+                    or (isinstance(element, LookupTable) and isinstance(element.operations[0], Play))
+                ) and not delay_implemented:
                     for bus in self._buses:
                         if self._buses[bus].delay > 0:
                             self._handle_wait(element=Wait(bus=bus, duration=self._buses[bus].delay), delay=True)
@@ -342,26 +361,32 @@ class QbloxCompiler:
                 self._buses[bus].qprogram_block_stack.pop()
                 self._buses[bus].first_acquire_of_block = True
 
-        self._qprogram = qprogram
-        if bus_mapping is not None:
-            self._qprogram = self._qprogram.with_bus_mapping(bus_mapping=bus_mapping)
-        if calibration is not None:
-            self._qprogram = self._qprogram.with_calibration(calibration=calibration)
-            if calibration.crosstalk_matrix_ac is not None:
-                crosstalk = calibration.crosstalk_matrix_ac
-            elif crosstalk is None and calibration.crosstalk_matrix is not None:
-                logger.warning(
-                    "Using DC `crosstalk_matrix`.\nDefine `crosstalk_matrix_ac` to calibrate AC/fast-flux lines."
+        with profile_phase("compile.qblox.transforms"):
+            # Bus mapping, calibration and, when there is no crosstalk compensation in between, distortions are applied
+            # in a single copy-on-write traversal of the QProgram
+            transforms: list[QProgramTransform] = []
+            if bus_mapping is not None:
+                transforms.append(BusMappingTransform(bus_mapping))
+            if calibration is not None:
+                transforms.append(CalibrationTransform(calibration))
+                if calibration.crosstalk_matrix_ac is not None:
+                    crosstalk = calibration.crosstalk_matrix_ac
+                elif crosstalk is None and calibration.crosstalk_matrix is not None:
+                    logger.warning(
+                        "Using DC `crosstalk_matrix`.\nDefine `crosstalk_matrix_ac` to calibrate AC/fast-flux lines."
+                    )
+                    crosstalk = calibration.crosstalk_matrix
+            if crosstalk is None and bus_distortions is not None:
+                transforms.append(DistortionsTransform(bus_distortions))
+            self._qprogram = qprogram.with_transforms(*transforms) if transforms else qprogram
+            if self._qprogram.has_calibrated_waveforms_or_weights():
+                raise RuntimeError(
+                    "Cannot compile to hardware-native instructions because QProgram contains named operations that are not mapped. Provide a calibration instance containing all necessary mappings."
                 )
-                crosstalk = calibration.crosstalk_matrix
-        if self._qprogram.has_calibrated_waveforms_or_weights():
-            raise RuntimeError(
-                "Cannot compile to hardware-native instructions because QProgram contains named operations that are not mapped. Provide a calibration instance containing all necessary mappings."
-            )
-        if crosstalk is not None:
-            self._qprogram = self._qprogram.with_crosstalk_qblox(crosstalk=crosstalk)
-        if bus_distortions is not None:
-            self._qprogram = self._qprogram.with_distortions(bus_distortions=bus_distortions)
+            if crosstalk is not None:
+                self._qprogram = self._qprogram.with_crosstalk_qblox(crosstalk=crosstalk)
+                if bus_distortions is not None:
+                    self._qprogram = self._qprogram.with_distortions(bus_distortions=bus_distortions)
 
         self._qblox_buses = qblox_buses if qblox_buses else []
 
@@ -394,27 +419,28 @@ class QbloxCompiler:
             self._buses[bus].qpy_sequence._program.blocks[0].add(QPyInstructions.UpdParam(4))
             self._buses[bus].static_duration += 4
 
-        # Recursive traversal to convert QProgram blocks to Sequence
-        self.traverse_qprogram_acquire(self._qprogram._body)
-
-        # Handle the cases where the number of acquisitions exceeds MAX_ACQUISITION_INDEX whilst having more than one depth.
-        for bus, block_data in self._acquisition_metadata.items():
-            total = sum(count for count, _ in block_data.values())
-            depths = {depth for _, depth in block_data.values()}
-            if len(block_data) > 1 and total > MAX_ACQUISITION_INDEX + 1:
-                if len(depths) > 1:
-                    raise NotImplementedError(
-                        f"Bus '{bus}' has {total} acquisitions at inconsistent nesting depths "
-                        f"{sorted(depths)}. For more than {MAX_ACQUISITION_INDEX + 1} acquisitions, they must be at the same nesting depth."
-                    )
-                if not all(count == 1 for count, _ in block_data.values()):
-                    raise NotImplementedError(
-                        f"Bus '{bus}' has {total} acquisitions across {len(block_data)} blocks, "
-                        f"but only 1 acquisition per block is supported when total acquisitions exceed {MAX_ACQUISITION_INDEX + 1}."
-                    )
-                self._buses[bus].exceeds_depth = True
+        with profile_phase("compile.qblox.q1asm"):
+            # Recursive traversal to convert QProgram blocks to Sequence
+            self.traverse_qprogram_acquire(self._qprogram._body)
+
+            # Handle the cases where the number of acquisitions exceeds MAX_ACQUISITION_INDEX whilst having more than one depth.
+            for bus, block_data in self._acquisition_metadata.items():
+                total = sum(count for count, _ in block_data.values())
+                depths = {depth for _, depth in block_data.values()}
+                if len(block_data) > 1 and total > MAX_ACQUISITION_INDEX + 1:
+                    if len(depths) > 1:
+                        raise NotImplementedError(
+                            f"Bus '{bus}' has {total} acquisitions at inconsistent nesting depths "
+                            f"{sorted(depths)}. For more than {MAX_ACQUISITION_INDEX + 1} acquisitions, they must be at the same nesting depth."
+                        )
+                    if not all(count == 1 for count, _ in block_data.values()):
+                        raise NotImplementedError(
+                            f"Bus '{bus}' has {total} acquisitions across {len(block_data)} blocks, "
+                            f"but only 1 acquisition per block is supported when total acquisitions exceed {MAX_ACQUISITION_INDEX + 1}."
+                        )
+                    self._buses[bus].exceeds_depth = True
 
-        traverse(self._qprogram._body)
+            traverse(self._qprogram._body)
 
         # Post-processing: Set all markers OFF, add stop instructions and compile
         for bus in self._buses:
@@ -448,6 +474,9 @@ class QbloxCompiler:
                             component=QPyInstructions.Jmp(f"continue_after_long_wait_{idx}")
                         )
 
+            for table, (index_register, runs) in enumerate(self._buses[bus].lookup_tables):
+                self._add_lookup_search(bus, table, index_register, runs)
+
             # Check if variable waits are used to add the conditional labels after the stop in the q1asm
             if self._buses[bus].dynamic_sync_counter > 0:
                 for idx in range(self._buses[bus].dynamic_sync_counter):
@@ -562,24 +591,18 @@ class QbloxCompiler:
             _hash = QbloxCompiler._hash_waveform(waveform) if waveform else f"zeros {default_length}"
 
             if _hash in self._buses[bus].waveform_to_index:
-                index = self._buses[bus].waveform_to_index[_hash]
-                length = next(
-                    len(waveform.data)
-                    for waveform in self._buses[bus].qpy_sequence._waveforms._waveforms
-                    if waveform.index == index
-                )
-                return index, length
+                return self._buses[bus].waveform_to_index[_hash]
 
             envelope = waveform.envelope() if waveform else np.zeros(default_length)
             index = self._buses[bus].qpy_sequence._waveforms.add(envelope)
-            self._buses[bus].waveform_to_index[_hash] = index
+            self._buses[bus].waveform_to_index[_hash] = (index, len(envelope))
             return index, len(envelope)
 
         index_I, length_I = handle_waveform(waveform_I, 0)
         if waveform_Q is None and bus in self._single_channel:
             index_Q, _ = handle_waveform(waveform_I, 0)
         else:
-            index_Q, _ = handle_waveform(waveform_Q, len(waveform_I.envelope()))
+            index_Q, _ = handle_waveform(waveform_Q, length_I)
         return index_I, index_Q, length_I
 
     def _append_to_weights_of_bus(self, bus: str, weights: IQWaveform) -> tuple[int, int, int]:
@@ -587,18 +610,12 @@ class QbloxCompiler:
             _hash = QbloxCompiler._hash_waveform(waveform)
 
             if _hash in self._buses[bus].weight_to_index:
-                index = self._buses[bus].weight_to_index[_hash]
-                length = next(
-                    len(weight.data)
-                    for weight in self._buses[bus].qpy_sequence._weights._weights
-                    if weight.index == index
-                )
-                return index, length
+                return self._buses[bus].weight_to_index[_hash]
 
             envelope = waveform.envelope()
             length = len(envelope)
             index = self._buses[bus].qpy_sequence._weights.add(envelope)
-            self._buses[bus].weight_to_index[_hash] = index
+            self._buses[bus].weight_to_index[_hash] = (index, length)
             return index, length
 
         index_I, length_I = handle_weight(weights.get_I())
@@ -619,6 +636,8 @@ class QbloxCompiler:
                 QbloxCompiler._get_qpysequence_conversion_instructions(operation) if operation is not None else None
             )
             if isinstance(operation, Wait) and isinstance(loop, ForLoop):
+                # Blocks can be shared with the QProgram being compiled, so the clamped bounds go to a copy.
+                loop = copy(loop)
                 if loop.start < INST_MIN_WAIT:
                     logger.warning(
                         f"Wait duration {loop.start} ns is below the Q1ASM minimum (4 ns), clamping to 4 ns."
@@ -666,6 +685,8 @@ class QbloxCompiler:
             QbloxCompiler._get_qpysequence_conversion_instructions(operation) if operation is not None else None
         )
         if isinstance(operation, Wait):
+            # Blocks can be shared with the QProgram being compiled, so the clamped bounds go to a copy.
+            element = copy(element)
             if element.start < INST_MIN_WAIT:
                 logger.warning(f"Wait duration {element.start} ns is below the Q1ASM minimum (4 ns), clamping to 4 ns.")
                 element.start = 4
@@ -1126,12 +1147,12 @@ class QbloxCompiler:
             self._time_loop_counter += 1
 
         else:
-            element.duration = QbloxCompiler._clamp_duration(element.duration, label="wait")
+            duration = QbloxCompiler._clamp_duration(element.duration, label="wait")
             if not delay:
-                self._buses[element.bus].static_duration += element.duration
-                self._buses[element.bus].duration_since_sync += element.duration
+                self._buses[element.bus].static_duration += duration
+                self._buses[element.bus].duration_since_sync += duration
             # loop over wait instructions if static duration is longer than allowed qblox max wait time of 2**16 -4
-            self._handle_add_waits(bus=element.bus, duration=element.duration)
+            self._handle_add_waits(bus=element.bus, duration=duration)
 
         self._buses[element.bus].marked_for_sync = True
 
@@ -1190,13 +1211,13 @@ class QbloxCompiler:
         if isinstance(element.duration, Variable):
             raise ValueError("Wait trigger duration cannot be a Variable, it must be an int.")
 
-        element.duration = QbloxCompiler._clamp_duration(element.duration, label="wait_trigger")
+        duration = QbloxCompiler._clamp_duration(element.duration, label="wait_trigger")
 
         if not self._ext_trigger:
             raise AttributeError("External trigger has not been set as True inside runcard's instrument controllers.")
 
         # loop over wait instructions if static duration is longer than allowed qblox max wait time of 2**16 -4
-        self._handle_add_trigger_waits(bus=element.bus, duration=element.duration, port=element.port)
+        self._handle_add_trigger_waits(bus=element.bus, duration=duration, port=element.port)
 
     def _handle_add_trigger_waits(self, bus: str, duration: int, port: int | None) -> None:
         """Emit wait-trigger instructions for the given bus, handling durations longer than
@@ -1837,8 +1858,9 @@ class QbloxCompiler:
             )
             square_duration = duration - smooth_duration_I * 2
 
-            inital_envelope_I = Arbitrary(samples=smooth_waveform_I.envelope()[:smooth_duration_I])
-            end_envelope_I = Arbitrary(samples=smooth_waveform_I.envelope()[-smooth_duration_I:])
+            envelope_I = smooth_waveform_I.envelope()
+            inital_envelope_I = Arbitrary(samples=envelope_I[:smooth_duration_I])
+            end_envelope_I = Arbitrary(samples=envelope_I[-smooth_duration_I:])
             inital_envelope_Q = None
             end_envelope_Q = None
 
@@ -1848,8 +1870,9 @@ class QbloxCompiler:
                     and smooth_duration_I != INST_MIN_WAIT
                 ):
                     raise ValueError("smooth_duration + buffer of both I and Q must be the same.")
-                inital_envelope_Q = Arbitrary(samples=smooth_waveform_Q.envelope()[:smooth_duration_I])
-                end_envelope_Q = Arbitrary(samples=smooth_waveform_Q.envelope()[-smooth_duration_I:])
+                envelope_Q = smooth_waveform_Q.envelope()
+                inital_envelope_Q = Arbitrary(samples=envelope_Q[:smooth_duration_I])
+                end_envelope_Q = Arbitrary(samples=envelope_Q[-smooth_duration_I:])
 
             index_I, index_Q, _ = self._append_to_waveforms_of_bus(
                 bus=element.bus, waveform_I=inital_envelope_I, waveform_Q=inital_envelope_Q
@@ -1904,6 +1927,119 @@ class QbloxCompiler:
         self._buses[element.bus].marked_for_sync = True
         self._buses[element.bus].upd_param_instruction_pending = False
 
+    def _handle_lookup_table(self, element: LookupTable) -> None:
+        if element.bus not in self._qblox_buses:
+            return
+
+        first = element.operations[0]
+        # Every entry as the values that tell it apart and the instruction executing it
+        entries: list[tuple[tuple, QPyInstructions.Instruction]] = []
+        if isinstance(first, Play):
+            for operation in element.operations:
+                waveform_I, waveform_Q = operation.get_waveforms()  # type: ignore[union-attr]
+                index_I, index_Q, duration = self._append_to_waveforms_of_bus(
+                    bus=element.bus, waveform_I=waveform_I, waveform_Q=waveform_Q
+                )
+                if first.wait_time is not None:
+                    duration = QbloxCompiler._clamp_duration(first.wait_time, label="play")
+                entries.append(
+                    (
+                        (index_I, index_Q, duration),
+                        QPyInstructions.Play(wave_0=index_I, wave_1=index_Q, duration=duration),
+                    )
+                )
+        elif isinstance(first, SetGain):
+            for operation in element.operations:
+                gain = operation.gain  # type: ignore[union-attr]
+                value = int(gain * QPyInstructions.SetNormalisedGain.scale_factor)
+                entries.append(((value,), QPyInstructions.SetNormalisedGain(gain_i=gain, gain_q=gain)))
+        else:
+            if first.offset_path1 is None:  # type: ignore[union-attr]
+                logger.warning(
+                    "Qblox requires an offset for the two paths, the offset of the second path has been set to the same as the first path."
+                )
+            for operation in element.operations:
+                offset_0 = operation.offset_path0  # type: ignore[union-attr]
+                offset_1 = offset_0 if operation.offset_path1 is None else operation.offset_path1  # type: ignore[union-attr]
+                values = tuple(
+                    int(offset * QPyInstructions.SetNormalisedOffs.scale_factor) for offset in (offset_0, offset_1)
+                )
+                entries.append((values, QPyInstructions.SetNormalisedOffs(offset_i=offset_0, offset_q=offset_1)))
+
+        self._select_lookup_entry(element, entries)
+        if isinstance(first, Play):
+            self._buses[element.bus].static_duration += duration
+            self._buses[element.bus].duration_since_sync += duration
+            self._buses[element.bus].marked_for_sync = True
+            self._buses[element.bus].upd_param_instruction_pending = False
+        else:
+            self._buses[element.bus].upd_param_instruction_pending = True
+
+    def _select_lookup_entry(
+        self, element: LookupTable, entries: list[tuple[tuple, QPyInstructions.Instruction]]
+    ) -> None:
+        """Emit the Q1ASM instructions that execute the entry of a lookup table selected by its index.
+
+        Consecutive keys with equal values are merged, so a table whose entries are all equal is executed inline.
+        Otherwise the index is summed into a register and a jump goes to a binary search over the first key of every
+        run, added after the stop instruction, that executes the instruction of the run and jumps back.
+        """
+        bus = self._buses[element.bus]
+        runs: list[tuple[int, QPyInstructions.Instruction]] = []
+        previous_values = None
+        for key, (values, instruction) in zip(element.keys, entries):
+            if values != previous_values:
+                runs.append((key, instruction))
+                previous_values = values
+        if len(runs) == 1:
+            bus.qpy_block_stack[-1].add(component=runs[0][1])
+            return
+
+        index_registers = [bus.variable_to_register[variable] for variable in element.index]
+        index_register = index_registers[0]
+        if len(index_registers) > 1:
+            if bus.lookup_index_register is None:
+                bus.lookup_index_register = QPyProgram.Register()
+            index_register = bus.lookup_index_register
+            bus.qpy_block_stack[-1].add(
+                component=QPyInstructions.Add(a=index_registers[0], b=index_registers[1], destination=index_register)
+            )
+            for register in index_registers[2:]:
+                bus.qpy_block_stack[-1].add(
+                    component=QPyInstructions.Add(a=index_register, b=register, destination=index_register)
+                )
+
+        table = len(bus.lookup_tables)
+        bus.lookup_tables.append((index_register, runs))
+        bus.qpy_block_stack[-1].add(component=QPyInstructions.Jmp(f"lookup_{table}"))
+        bus.qpy_block_stack[-1].add(QPyProgram.Block(name=f"after_lookup_{table}"))
+
+    def _add_lookup_search(
+        self,
+        bus: str,
+        table: int,
+        index_register: QPyProgram.Register,
+        runs: list[tuple[int, QPyInstructions.Instruction]],
+    ) -> None:
+        """Add, after the stop instruction, the binary search executing the run of a lookup table."""
+
+        def search(block: QPyProgram.Block, start: int, stop: int) -> None:
+            if stop - start == 1:
+                block.add(component=runs[start][1])
+                block.add(component=QPyInstructions.Jmp(f"after_lookup_{table}"))
+                return
+            # Keys below the first key of the middle run fall through to the first half
+            middle = (start + stop) // 2
+            block.add(component=QPyInstructions.Jge(index_register, runs[middle][0], f"lookup_{table}_{middle}"))
+            search(block, start, middle)
+            upper_block = QPyProgram.Block(name=f"lookup_{table}_{middle}")
+            self._buses[bus].qpy_block_stack[0].add(upper_block)
+            search(upper_block, middle, stop)
+
+        block = QPyProgram.Block(name=f"lookup_{table}")
+        self._buses[bus].qpy_block_stack[0].add(block)
+        search(block, 0, len(runs))
+
     def _get_or_create_weight_register(self, bus: str, weight_index: int, block_index: int) -> QPyProgram.Register:
         """Create or Retrieve a register for the weight index of the acquisition
             If it is the first weight index of this program with this value, then a new register is created and stored in the dictionary weight_index_to_register.
@@ -1979,6 +2115,7 @@ class QbloxCompiler:
             SetGain: QPyInstructions.SetNormalisedGain,
             SetOffset: QPyInstructions.SetNormalisedOffs,
             Wait: None,
+            LookupTable: None,
         }
         if type(operation) not in instruction_map:
             raise ValueError(f"{type(operation).__name__} does not support variable sweep in a loop.")
@@ -2001,10 +2138,7 @@ class QbloxCompiler:
 
     @staticmethod
     def _hash_waveform(waveform: Waveform) -> str:
-        hashes = {
-            key: (value.__dict__ if isinstance(value, Waveform) else value) for key, value in waveform.__dict__.items()
-        }
-        return f"{waveform.__class__.__name__} {hashes}"
+        return waveform.digest()
 
     @staticmethod
     def calculate_square_waveform_optimization_values(duration: int) -> tuple[int, int, int]:
@@ -14,6 +14,7 @@
 
 import math
 from collections import deque
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
@@ -39,6 +40,7 @@ from qililab.qprogram.operations import (
     WaitTrigger,
 )
 from qililab.qprogram.qprogram import QProgram
+from qililab.qprogram.transforms import BusMappingTransform, CalibrationTransform, QProgramTransform
 from qililab.typings.enums import Parameter
 from qililab.waveforms import Arbitrary
 
@@ -46,18 +48,58 @@ if TYPE_CHECKING:
     from qililab.platform.components.bus import Bus
 
 
+@dataclass
+class QdacAction:
+    """Class representing a call to a QDAC-II channel planned by QdacCompiler.
+
+    Voltage list uploads carry the digest of the list, so that the instrument can skip transmitting a list that is
+    already loaded on the channel.
+    """
+
+    instrument: QDevilQDac2
+    method: str
+    channel_id: int
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    digest: str | None = None
+
+    def apply(self):
+        """Performs the call on the instrument."""
+        kwargs = self.kwargs if self.digest is None else {**self.kwargs, "digest": self.digest}
+        getattr(self.instrument, self.method)(channel_id=self.channel_id, **kwargs)
+
+
 class QdacCompilationOutput:
     """Class representing the output information generated by QdacCompiler.
 
+    Compiling does not communicate with the instruments: the uploads and trigger settings of the QProgram are planned
+    as ``actions``, which :meth:`apply` performs right before the execution.
+
     Attributes:
-        sequences (Sequence): A dictionary with the buses participating in the QProgram as keys and the corresponding Sequence as values.
-        acquisitions (Acquisitions): A dictionary with the buses participating in the acquisitions as keys and the corresponding Acquisitions as values.
+        qprogram (QProgram): The compiled QProgram, after applying the transforms.
+        qdacs (list[QDevilQDac2]): The qdac instruments participating in the QProgram, in the order they must be started.
+        trigger_position (str | None): Whether the qdacs are started before ("back") or after ("front") the AWGs.
+        actions (list[QdacAction]): The calls to the qdac channels, in the order they must be performed.
     """
 
-    def __init__(self, qprogram: QProgram, qdacs: list[QDevilQDac2], trigger_position: str | None):
+    def __init__(
+        self,
+        qprogram: QProgram,
+        qdacs: list[QDevilQDac2],
+        trigger_position: str | None,
+        actions: list[QdacAction] | None = None,
+    ):
         self.qprogram = qprogram
         self.qdacs = qdacs
         self.trigger_position = trigger_position
+        self.actions = actions or []
+
+    def apply(self):
+        """Uploads the voltage lists and sets the triggers of the compiled QProgram in the qdac instruments.
+
+        Voltage lists that are already loaded on their channel with the same content are not transmitted again.
+        """
+        for action in self.actions:
+            action.apply()
 
 
 class QdacBusCompilationInfo:
@@ -113,6 +155,10 @@ class QdacCompiler:
 
         self._element_popped: dict | None = None
 
+        self._actions: list[QdacAction] = []
+        # (instrument, channel) pairs with a planned DC list
+        self._planned_dc_lists: set[tuple[QDevilQDac2, int]] = set()
+
     def compile(
         self,
         qprogram: QProgram,
@@ -156,18 +202,23 @@ class QdacCompiler:
 
         self._qprogram = qprogram
         self._qdacs = qdacs
+        self._actions = []
+        self._planned_dc_lists = set()
         self._out_instrument = out_instrument
         self._qdac_buses = qdac_buses
         self._qdac_buses_by_alias = {bus.alias: bus for bus in self._qdac_buses}
         self._qdac_buses_alias = [bus.alias for bus in self._qdac_buses]
         # Hardware bias voltages, used as a fallback if no flux is given
         qdac_buses_offset = dict(zip(self._qdac_buses_alias, qdac_offsets))
+        transforms: list[QProgramTransform] = []
         if bus_mapping is not None:
-            self._qprogram = self._qprogram.with_bus_mapping(bus_mapping=bus_mapping)
+            transforms.append(BusMappingTransform(bus_mapping))
         if calibration is not None:
-            self._qprogram = self._qprogram.with_calibration(calibration=calibration)
+            transforms.append(CalibrationTransform(calibration))
             if calibration.crosstalk_matrix and crosstalk is None:
                 crosstalk = calibration.crosstalk_matrix
+        if transforms:
+            self._qprogram = self._qprogram.with_transforms(*transforms)
         if crosstalk is not None:
             self._qprogram = self._qprogram.with_crosstalk_qdac(
                 crosstalk=crosstalk, target_fluxes=target_fluxes, qdac_buses_offset=qdac_buses_offset
@@ -185,7 +236,7 @@ class QdacCompiler:
             self._handle_simultaneous_qdacs()
 
         return QdacCompilationOutput(
-            qprogram=self._qprogram, qdacs=self._qdacs, trigger_position=self._trigger_position
+            qprogram=self._qprogram, qdacs=self._qdacs, trigger_position=self._trigger_position, actions=self._actions
         )
 
     def _populate_qdac_buses(self):
@@ -253,8 +304,12 @@ class QdacCompiler:
                 for instrument in self._qdac_buses_by_alias[element.bus].instruments
                 if isinstance(instrument, QDevilQDac2)
             )
-            instrument.set_parameter(
-                parameter=Parameter.VOLTAGE, value=element.offset_path0, channel_id=self._channels[element.bus]
+            self._add_action(
+                instrument,
+                "set_parameter",
+                self._channels[element.bus],
+                parameter=Parameter.VOLTAGE,
+                value=element.offset_path0,
             )
             self._buses[element.bus].dc_set = True
 
@@ -287,7 +342,7 @@ class QdacCompiler:
                     (
                         trigger_bus
                         for trigger_bus in trigger_buses
-                        if f"{instrument.device.name}_{self._channels[trigger_bus]}" in instrument._cache_dc
+                        if self._has_dc_list(instrument, self._channels[trigger_bus])
                     ),
                     None,
                 )
@@ -316,30 +371,38 @@ class QdacCompiler:
                     trigger = self._hash_trigger(element, output)
 
                     if element.position == "end":
-                        instrument.set_end_marker_external_trigger(
-                            channel_id=self._channels[trigger_bus],
+                        self._add_action(
+                            instrument,
+                            "set_end_marker_external_trigger",
+                            self._channels[trigger_bus],
                             out_port=output,
                             trigger=trigger,
                             width_s=element.duration,
                         )
                     elif element.position == "start":
-                        instrument.set_start_marker_external_trigger(
-                            channel_id=self._channels[trigger_bus],
+                        self._add_action(
+                            instrument,
+                            "set_start_marker_external_trigger",
+                            self._channels[trigger_bus],
                             out_port=output,
                             trigger=trigger,
                             width_s=element.duration,
                         )
                     elif element.position == "step":
-                        instrument.set_start_marker_external_trigger(
-                            channel_id=self._channels[trigger_bus],
+                        self._add_action(
+                            instrument,
+                            "set_start_marker_external_trigger",
+                            self._channels[trigger_bus],
                             out_port=output,
                             trigger=trigger,
                             width_s=element.duration,
                             step=True,
                         )
                     elif element.position == "end_step":
-                        instrument.set_end_marker_external_trigger(
-                            channel_id=self._channels[trigger_bus],
+                        self._add_action(
+                            instrument,
+                            "set_end_marker_external_trigger",
+                            self._channels[trigger_bus],
                             out_port=output,
                             trigger=trigger,
                             width_s=element.duration,
@@ -349,19 +412,18 @@ class QdacCompiler:
                     self._trigger_position = "front"
             else:
                 trigger = self._hash_trigger(element, None)
+                channel_id = self._channels[trigger_bus]
                 if element.position == "end":
-                    instrument.set_end_marker_internal_trigger(channel_id=self._channels[trigger_bus], trigger=trigger)
+                    self._add_action(instrument, "set_end_marker_internal_trigger", channel_id, trigger=trigger)
                 elif element.position == "start":
-                    instrument.set_start_marker_internal_trigger(
-                        channel_id=self._channels[trigger_bus], trigger=trigger
-                    )
+                    self._add_action(instrument, "set_start_marker_internal_trigger", channel_id, trigger=trigger)
                 elif element.position == "step":
-                    instrument.set_start_marker_internal_trigger(
-                        channel_id=self._channels[trigger_bus], trigger=trigger, step=True
+                    self._add_action(
+                        instrument, "set_start_marker_internal_trigger", channel_id, trigger=trigger, step=True
                     )
                 elif element.position == "end_step":
-                    instrument.set_end_marker_internal_trigger(
-                        channel_id=self._channels[trigger_bus], trigger=trigger, step=True
+                    self._add_action(
+                        instrument, "set_end_marker_internal_trigger", channel_id, trigger=trigger, step=True
                     )
 
     def _handle_wait_trigger(self, element: WaitTrigger):
@@ -372,12 +434,16 @@ class QdacCompiler:
                 if isinstance(instrument, QDevilQDac2)
             )
             if element.port:
-                instrument.set_in_external_trigger(channel_id=self._channels[element.bus], in_port=element.port)
+                self._add_action(
+                    instrument, "set_in_external_trigger", self._channels[element.bus], in_port=element.port
+                )
                 if not self._trigger_position:
                     self._trigger_position = "back"
             else:
-                instrument.set_in_internal_trigger(
-                    channel_id=self._channels[element.bus],
+                self._add_action(
+                    instrument,
+                    "set_in_internal_trigger",
+                    self._channels[element.bus],
                     trigger=next(trigger for _, trigger in self._trigger_hashes.items()),
                 )
 
@@ -393,40 +459,61 @@ class QdacCompiler:
             if waveform_variables:
                 logger.error("Variables in waveforms are not supported in Qdac.")
                 return
-            if not element.dwell:
-                element.dwell = self._dc_dwell
-            if not element.delay:
-                element.delay = self._dc_delay
-            if not element.stepped:
-                element.stepped = self._dc_stepped
-            if not element.repetitions:
-                element.repetitions = self._loop_repetitions[element.bus]
+            # The operation can be shared with the QProgram being compiled, so defaults are not written back to it.
+            dwell = element.dwell or self._dc_dwell
+            delay = element.delay or self._dc_delay
+            stepped = element.stepped or self._dc_stepped
+            repetitions = element.repetitions or self._loop_repetitions[element.bus]
             if self._infinite_loop:
-                element.repetitions = -1
+                repetitions = -1
 
             # For QDAC execution with crosstalk all these parameters must be the same for any Play.
             self._play_params = {
                 "waveform": waveform.envelope(),
-                "dwell": element.dwell,
-                "delay": element.delay,
-                "stepped": element.stepped,
-                "repetitions": element.repetitions,
+                "dwell": dwell,
+                "delay": delay,
+                "stepped": stepped,
+                "repetitions": repetitions,
             }
 
-            instrument.upload_voltage_list(
-                waveform=waveform,
-                channel_id=self._channels[element.bus],
-                dwell_us=element.dwell,
-                sync_delay_s=element.delay,
-                repetitions=element.repetitions,
-                stepped=element.stepped,
+            channel_id = self._channels[element.bus]
+            self._actions.append(
+                QdacAction(
+                    instrument=instrument,
+                    method="upload_voltage_list",
+                    channel_id=channel_id,
+                    kwargs={
+                        "waveform": waveform,
+                        "dwell_us": dwell,
+                        "sync_delay_s": delay,
+                        "repetitions": repetitions,
+                        "stepped": stepped,
+                    },
+                    digest=QDevilQDac2.voltage_list_digest(
+                        waveform,
+                        dwell_us=dwell,
+                        sync_delay_s=delay,
+                        repetitions=repetitions,
+                        stepped=stepped,
+                    ),
+                )
             )
+            self._planned_dc_lists.add((instrument, channel_id))
 
             self._loop_repetitions[element.bus] = 1
 
     def _handle_block(self, element: Block):
         pass
 
+    def _add_action(self, instrument: QDevilQDac2, method: str, channel_id: int, **kwargs):
+        self._actions.append(QdacAction(instrument=instrument, method=method, channel_id=channel_id, kwargs=kwargs))
+
+    def _has_dc_list(self, instrument: QDevilQDac2, channel_id: int) -> bool:
+        """Whether the channel will have a DC list when the plan is applied, either planned or already uploaded."""
+        return (instrument, channel_id) in self._planned_dc_lists or (
+            f"{instrument.device.name}_{channel_id}" in instrument._cache_dc
+        )
+
     def _handle_unknown(self, element: Any):
         if type(element) in [SetFrequency, SetPhase, ResetPhase, SetGain, SetMarkers, Wait, Measure, Acquire]:
             if element.bus in self._qdac_buses_alias:
@@ -450,8 +537,10 @@ class QdacCompiler:
             ),
             None,
         )
-        self._out_instrument.set_out_external_trigger(
-            channel_id=self._channels[out_bus],
+        self._add_action(
+            self._out_instrument,
+            "set_out_external_trigger",
+            self._channels[out_bus],
             out_port=self._out_instrument.out_trigger,
             trigger="qdac_external_trigger",
         )
@@ -460,9 +549,12 @@ class QdacCompiler:
             if in_instrument is not self._out_instrument:
                 bus_list = [bus.alias for bus in self._qdac_buses if in_instrument in bus.instruments]
                 for bus in bus_list:
-                    if f"{in_instrument.device.name}_{self._channels[bus]}" in in_instrument._cache_dc:
-                        in_instrument.set_in_external_trigger(
-                            channel_id=self._channels[bus], in_port=in_instrument.in_trigger
+                    if self._has_dc_list(in_instrument, self._channels[bus]):
+                        self._add_action(
+                            in_instrument,
+                            "set_in_external_trigger",
+                            self._channels[bus],
+                            in_port=in_instrument.in_trigger,
                         )
         self._qdacs = [qdac for qdac in self._qdacs if qdac != self._out_instrument] + [self._out_instrument]
 
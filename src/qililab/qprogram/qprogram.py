@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from collections.abc import Sequence
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import TYPE_CHECKING, overload
 
 import numpy as np
@@ -46,7 +46,15 @@ from qililab.qprogram.operations import (
     WaitTrigger,
 )
 from qililab.qprogram.structured_program import StructuredProgram, VariableInfo, _to_scalar
-from qililab.qprogram.utils_crosstalk import CrosstalkElements, NonLinearFlagState
+from qililab.qprogram.transforms import (
+    BusMappingTransform,
+    CalibrationTransform,
+    DistortionsTransform,
+    QProgramTransform,
+    WeightDurationTransform,
+    apply_transforms,
+)
+from qililab.qprogram.utils_crosstalk import CrosstalkElements, NonLinearFlagState, NonLinearLoopFolder
 from qililab.waveforms import Arbitrary, FlatTop, IQPair, IQWaveform, Square, Waveform
 from qililab.yaml import yaml
 
@@ -208,6 +216,25 @@ class QProgram(StructuredProgram):
 
         return traverse(self.body)
 
+    def with_transforms(self, *transforms: QProgramTransform, copy_blocks: bool = False) -> "QProgram":
+        """Returns a copy of the QProgram with the given transformations applied, in order, in a single traversal.
+
+        Unlike a deep copy, the returned QProgram shares with this one every block and operation that no transformation
+        rewrites, together with their waveforms: only the blocks containing rewritten operations are copied. Chaining
+        several ``with_*`` methods copies the program once per method, while passing their transformations here
+        copies it once.
+
+        Args:
+            *transforms (QProgramTransform): Transformations to apply, such as :class:`BusMappingTransform`,
+                :class:`CalibrationTransform` or :class:`DistortionsTransform`.
+            copy_blocks (bool, optional): Whether to copy every block, so that the blocks of the returned QProgram can
+                be modified in place without affecting this one. Defaults to False.
+
+        Returns:
+            QProgram: A new instance of QProgram with the transformations applied.
+        """
+        return apply_transforms(self, *transforms, copy_blocks=copy_blocks)
+
     def with_bus_mapping(self, bus_mapping: dict[str, str]) -> "QProgram":
         """Returns a copy of the QProgram with bus mappings applied.
 
@@ -217,66 +244,7 @@ class QProgram(StructuredProgram):
         Returns:
             QProgram: A new instance of QProgram with updated bus names.
         """
-
-        def traverse(block: Block):
-            for index, element in enumerate(block.elements):
-                if isinstance(element, Block):
-                    traverse(element)
-                elif isinstance(element, (MeasureReset, MeasureResetCalibrated)):
-                    bus = getattr(element, "bus")
-                    control_bus = getattr(element, "control_bus")
-                    if isinstance(bus, str) and bus in bus_mapping:
-                        setattr(block.elements[index], "bus", bus_mapping[bus])
-                    if isinstance(control_bus, str) and control_bus in bus_mapping:
-                        setattr(block.elements[index], "control_bus", bus_mapping[control_bus])
-                    new_latch_enabled = []
-                    for bus in copied_qprogram.qblox.latch_enabled:
-                        if bus in bus_mapping:
-                            new_latch_enabled.append(bus_mapping[bus])
-                        else:
-                            new_latch_enabled.append(bus)
-                    copied_qprogram.qblox.latch_enabled = new_latch_enabled
-
-                    new_trigger_network_required = {}
-                    for bus, value in copied_qprogram.qblox.trigger_network_required.items():
-                        if bus in bus_mapping:
-                            new_trigger_network_required[bus_mapping[bus]] = value
-                        else:
-                            new_trigger_network_required[bus] = value
-                    copied_qprogram.qblox.trigger_network_required = new_trigger_network_required
-                elif hasattr(element, "bus"):
-                    bus = getattr(element, "bus")
-                    if isinstance(bus, str) and bus in bus_mapping:
-                        setattr(block.elements[index], "bus", bus_mapping[bus])
-                elif hasattr(element, "buses"):
-                    buses = getattr(element, "buses")
-                    if isinstance(buses, list):
-                        setattr(
-                            block.elements[index],
-                            "buses",
-                            [bus_mapping[bus] if bus in bus_mapping else bus for bus in buses],
-                        )
-
-        # Copy qprogram so the original remain unaffected
-        copied_qprogram = deepcopy(self)
-
-        # Recursively traverse qprogram applying the bus mapping
-        traverse(copied_qprogram.body)
-
-        # Apply the mapping to buses property
-        for bus in list(copied_qprogram.buses):
-            if bus in bus_mapping:
-                copied_qprogram.buses.remove(bus)
-                copied_qprogram.buses.add(bus_mapping[bus])
-
-        # Apply the mapping to weight_duration keys, merging entries when multiple source buses map onto
-        # the same target bus (e.g. multiplexed readout) instead of one overwriting the other
-        remapped_weight_duration: dict[str, list[int | str]] = {}
-        for bus, durations in copied_qprogram.qblox._weight_duration.items():
-            remapped_weight_duration.setdefault(bus_mapping.get(bus, bus), []).extend(durations)
-        copied_qprogram.qblox._weight_duration = remapped_weight_duration
-
-        return copied_qprogram
+        return self.with_transforms(BusMappingTransform(bus_mapping))
 
     def with_calibration(self, calibration: Calibration):
         """Apply calibration to the operations within the QProgram.
@@ -291,105 +259,7 @@ class QProgram(StructuredProgram):
         Returns:
             QProgram: A new instance of QProgram with calibrated operations.
         """
-        buses_to_add: set[str] = set()
-        latch_to_add: list[str] = []
-        trigger_network_to_add: dict[str, int] = {}
-
-        def traverse(block: Block):
-            for index, element in enumerate(block.elements):
-                if isinstance(element, Block):
-                    traverse(element)
-                elif isinstance(element, PlayWithCalibratedWaveform) and calibration.has_waveform(
-                    bus=element.bus, name=element.waveform
-                ):
-                    waveform = calibration.get_waveform(bus=element.bus, name=element.waveform)
-                    play_operation = Play(bus=element.bus, waveform=waveform, wait_time=element.wait_time)
-                    block.elements[index] = play_operation
-                elif isinstance(element, AcquireWithCalibratedWeights) and calibration.has_weights(
-                    bus=element.bus, name=element.weights
-                ):
-                    weights = calibration.get_weights(bus=element.bus, name=element.weights)
-                    acquire_operation = Acquire(bus=element.bus, weights=weights, save_adc=element.save_adc)
-                    block.elements[index] = acquire_operation
-                elif isinstance(element, MeasureWithCalibratedWaveform) and calibration.has_waveform(
-                    bus=element.bus, name=element.waveform
-                ):
-                    waveform = calibration.get_waveform(bus=element.bus, name=element.waveform)
-                    measure_operation = Measure(
-                        bus=element.bus,
-                        waveform=waveform,
-                        weights=element.weights,
-                        demodulation=element.demodulation,
-                        save_adc=element.save_adc,
-                    )
-                    block.elements[index] = measure_operation
-                elif isinstance(element, MeasureWithCalibratedWeights) and calibration.has_weights(
-                    bus=element.bus, name=element.weights
-                ):
-                    weights = calibration.get_weights(bus=element.bus, name=element.weights)
-                    measure_operation = Measure(
-                        bus=element.bus,
-                        waveform=element.waveform,
-                        weights=weights,
-                        demodulation=element.demodulation,
-                        save_adc=element.save_adc,
-                    )
-                    block.elements[index] = measure_operation
-                elif (
-                    isinstance(element, MeasureWithCalibratedWaveformWeights)
-                    and calibration.has_waveform(bus=element.bus, name=element.waveform)
-                    and calibration.has_weights(bus=element.bus, name=element.weights)
-                ):
-                    waveform = calibration.get_waveform(bus=element.bus, name=element.waveform)
-                    weights = calibration.get_weights(bus=element.bus, name=element.weights)
-                    measure_operation = Measure(
-                        bus=element.bus,
-                        waveform=waveform,
-                        weights=weights,
-                        demodulation=element.demodulation,
-                        save_adc=element.save_adc,
-                    )
-                    block.elements[index] = measure_operation
-                elif (
-                    isinstance(element, MeasureResetCalibrated)
-                    and calibration.has_waveform(bus=element.bus, name=element.waveform)
-                    and calibration.has_weights(bus=element.bus, name=element.weights)
-                    and calibration.has_waveform(bus=element.control_bus, name=element.reset_pulse)
-                ):
-                    waveform = calibration.get_waveform(bus=element.bus, name=element.waveform)
-                    weights = calibration.get_weights(bus=element.bus, name=element.weights)
-                    reset_pulse = calibration.get_waveform(bus=element.control_bus, name=element.reset_pulse)
-                    measure_reset_operation = MeasureReset(
-                        bus=element.bus,
-                        waveform=waveform,
-                        weights=weights,
-                        control_bus=element.control_bus,
-                        reset_pulse=reset_pulse,
-                        trigger_address=element.trigger_address,
-                        save_adc=element.save_adc,
-                    )
-                    block.elements[index] = measure_reset_operation
-                    buses_to_add.add(element.control_bus)
-                    latch_to_add.append(element.control_bus)
-                    trigger_network_to_add[element.bus] = element.trigger_address
-
-                if hasattr(element, "bus"):
-                    bus = getattr(element, "bus")
-                    buses_to_add.add(bus)
-
-        copied_qprogram = deepcopy(self)
-        traverse(copied_qprogram.body)
-
-        if buses_to_add:
-            copied_qprogram._buses.update(buses_to_add)
-
-        if latch_to_add:
-            copied_qprogram.qblox.latch_enabled.extend(latch_to_add)
-
-        if trigger_network_to_add:
-            copied_qprogram.qblox.trigger_network_required.update(trigger_network_to_add)
-
-        return copied_qprogram
+        return self.with_transforms(CalibrationTransform(calibration))
 
     def with_resolved_weight_duration(
         self, calibration: Calibration | None, bus_mapping: dict[str, str] | None = None
@@ -410,35 +280,24 @@ class QProgram(StructuredProgram):
         Returns:
             QProgram: A new instance of QProgram with ``qblox.weight_duration`` resolved.
         """
-        copied_qprogram = deepcopy(self)
-        resolved: dict[str, list[int | str]] = {}
-        for bus, entries in copied_qprogram.qblox.weight_duration.items():
-            mapped_bus = bus_mapping.get(bus, bus) if bus_mapping else bus
-            resolved_entries: list[int | str] = []
-            for entry in entries:
-                if isinstance(entry, int):
-                    resolved_entries.append(entry)
-                else:
-                    if calibration is None:
-                        raise ValueError(
-                            f"Calibrated weight {entry!r} requires a calibration object, but none was provided."
-                        )
-                    if not calibration.has_weights(mapped_bus, entry):
-                        raise ValueError(f"Calibrated weight {entry!r} not found in calibration.")
-                    resolved_entries.append(calibration.get_weights(mapped_bus, entry).get_duration())
-            resolved[bus] = resolved_entries
-        copied_qprogram.qblox._weight_duration = resolved
-        return copied_qprogram
+        return self.with_transforms(WeightDurationTransform(calibration, bus_mapping))
 
-    def with_crosstalk_qblox(self, crosstalk: CrosstalkMatrix):
+    def with_crosstalk_qblox(self, crosstalk: CrosstalkMatrix, lookup_tables: bool = True):
         """Apply crosstalk compensation to the qprogram flux buses.
 
         This method traverses the elements of the QProgram, replacing any
         Play or Offset instances by the compensated envelope or offset for
         all flux buses.
 
+        With a :class:`NonLinearCrosstalkMatrix` the compensation of every loop coordinate is computed beforehand. The
+        swept loops are kept as hardware loops, with the compensated offsets, gains and waveforms that change between
+        iterations selected from a :class:`LookupTable` indexed by the loop. A loop is unrolled instead when its tables
+        don't fit in a sequencer or take more instructions than the unrolled iterations.
+
         Args:
             crosstalk (CrosstalkMatrix): Crosstalk matrix class.
+            lookup_tables (bool, optional): Whether to fold the loops unrolled by the non-linear compensation back into
+                hardware loops with lookup tables. Defaults to True.
 
         Returns:
             QProgram: A new instance of QProgram with calibrated crosstalk.
@@ -959,6 +818,7 @@ class QProgram(StructuredProgram):
                         shape = next(iter(offsets[state.offsets_index].values())).shape
                         offsets_index = state.offsets_index
                         plays_index = state.plays_index
+                        iterations: list[list[Block | Operation]] = []
                         for key in range(shape[-len(loop_index) - 1]):
                             loop_coord = (key, *loop_index[::-1])
                             corrected_loop, state = handle_non_linear(
@@ -970,7 +830,13 @@ class QProgram(StructuredProgram):
                                 loop_coord=loop_coord,
                                 state=NonLinearFlagState(offsets_index=offsets_index, plays_index=plays_index),
                             )
-                            corrected_elements.extend(corrected_loop)
+                            iterations.append(corrected_loop)
+                        folded_loop = folder.fold(element, iterations) if folder is not None else None  # type: ignore[arg-type]
+                        if folded_loop is not None:
+                            corrected_elements.append(folded_loop)
+                        else:
+                            for corrected_loop in iterations:
+                                corrected_elements.extend(corrected_loop)
                         loop_coord = loop_coord[:-1]
                         if not loop_coord:
                             loop_coord = (0,)
@@ -984,7 +850,7 @@ class QProgram(StructuredProgram):
                             loop_coord=loop_coord,
                             state=NonLinearFlagState(offsets_index=state.offsets_index, plays_index=state.plays_index),
                         )
-                        element_copy = deepcopy(element)
+                        element_copy = copy(element)
                         element_copy.elements = corrected_loop
                         corrected_elements.append(element_copy)
                     state.after_block()
@@ -996,11 +862,13 @@ class QProgram(StructuredProgram):
                 corrected_elements.append(Sync())
             return corrected_elements, state
 
-        copied_qprogram = deepcopy(self)
+        # The compensation modifies the blocks in place, but never the operations, which can be shared
+        copied_qprogram = self.with_transforms(copy_blocks=True)
+        folder = NonLinearLoopFolder(copied_qprogram._variables, copied_qprogram.buses) if lookup_tables else None
         traverse(copied_qprogram.body, copied_qprogram._variables)
         if isinstance(non_lin_flux_vector, NonLinearFluxVector):
             corrected_elements, _ = handle_non_linear(
-                deepcopy(copied_qprogram.body.elements),
+                copied_qprogram.body.elements,
                 non_lin_flux_vector,
                 non_lin_offsets,
                 non_lin_play_waveforms,
@@ -1104,7 +972,7 @@ class QProgram(StructuredProgram):
                         block.elements.insert(element_list[0], play)
                         copied_qprogram.buses.add(bus)
 
-        copied_qprogram = deepcopy(self)
+        copied_qprogram = self.with_transforms(copy_blocks=True)
         traverse(copied_qprogram.body)
         return copied_qprogram
 
@@ -1136,43 +1004,7 @@ class QProgram(StructuredProgram):
             NotImplementedError: If a ``MeasureReset`` operation uses, as its ``control_bus``, a bus
                 that has distortions configured.
         """
-
-        def traverse(block: Block):
-            for index, element in enumerate(block.elements):
-                if isinstance(element, Block):
-                    traverse(element)
-                elif isinstance(element, (Play, Measure, MeasureReset)):
-                    if isinstance(element, MeasureReset) and element.control_bus in bus_distortions:
-                        raise NotImplementedError(
-                            "Applying pulse distortions to the control bus of a `MeasureReset` (active "
-                            f"reset) operation is not supported, but bus '{element.control_bus}' has "
-                            "distortions configured."
-                        )
-                    if element.bus in bus_distortions:
-                        waveform = element.waveform
-                        for distortion in bus_distortions[element.bus]:
-                            if isinstance(waveform, IQWaveform):
-                                distorted_waveform_I = Arbitrary(distortion.apply(waveform.get_I().envelope()))
-                                distorted_waveform_Q = Arbitrary(distortion.apply(waveform.get_Q().envelope()))
-                                distorted_waveform: IQPair | Arbitrary = IQPair(
-                                    I=distorted_waveform_I, Q=distorted_waveform_Q
-                                )
-                            elif isinstance(waveform, Waveform):
-                                distorted_waveform = Arbitrary(distortion.apply(waveform.envelope()))
-                            else:
-                                raise NotImplementedError(
-                                    f"Cannot apply distortions to waveform of type {type(waveform)}."
-                                )
-                            waveform = distorted_waveform
-                        block.elements[index].waveform = waveform  # type: ignore [union-attr]
-
-        # Copy qprogram so the original remain unaffected
-        copied_qprogram = deepcopy(self)
-
-        # Recursively traverse qprogram applying the distortions to all waveforms
-        traverse(copied_qprogram.body)
-
-        return copied_qprogram
+        return self.with_transforms(DistortionsTransform(bus_distortions))
 
     @overload
     def play(self, bus: str, waveform: Waveform | IQWaveform) -> None:
@@ -1860,6 +1692,7 @@ class QProgram(StructuredProgram):
         averages_displayed: bool = False,
         acquisition_showing: bool = True,
         calibration: Calibration | None = None,
+        max_points: int | None = None,
     ):
         """Draw the QProgram using QBlox Compiler
 
@@ -1868,6 +1701,8 @@ class QProgram(StructuredProgram):
                 For example, if the timeout is 100 ns but there is a play operation of 150 ns, the plot will display the data until 150 ns. Defaults to None.
             averages_displayed (bool): False means that all loops on the sequencer starting with avg will only loop once, and True shows all iterations. Defaults to False.
             acquisition_showing (bool): Allows visualing the acquisition period on the plot. Defaults to True.
+            max_points (int, optional): Maximum number of points of each trace of the plot. Longer traces are downsampled keeping the minimum
+                and maximum of each interval, which keeps long programs responsive to display. Defaults to None, which plots every ns.
 
         Returns:
             plotly object: plotly.graph_objs._figure.Figure
@@ -1884,5 +1719,6 @@ class QProgram(StructuredProgram):
             time_window=time_window,
             averages_displayed=averages_displayed,
             acquisition_showing=acquisition_showing,
+            max_points=max_points,
         )
         return plotly_figure
@@ -0,0 +1,348 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Copy-on-write transformations of the operations of a QProgram."""
+
+from __future__ import annotations
+
+from collections import deque
+from copy import copy
+from typing import TYPE_CHECKING
+
+from qililab.qprogram.blocks import Block
+from qililab.qprogram.operations import (
+    Acquire,
+    AcquireWithCalibratedWeights,
+    LookupTable,
+    Measure,
+    MeasureReset,
+    MeasureResetCalibrated,
+    MeasureWithCalibratedWaveform,
+    MeasureWithCalibratedWaveformWeights,
+    MeasureWithCalibratedWeights,
+    Operation,
+    Play,
+    PlayWithCalibratedWaveform,
+)
+from qililab.waveforms import Arbitrary, IQPair, IQWaveform, Waveform
+
+if TYPE_CHECKING:
+    from qililab.pulse_distortion.pulse_distortion import PulseDistortion
+    from qililab.qprogram.calibration import Calibration
+    from qililab.qprogram.qprogram import QProgram
+
+
+class QProgramTransform:
+    """Base class of the transformations applied by :meth:`QProgram.with_transforms`.
+
+    A transformation rewrites the operations of a QProgram one at a time with :meth:`rewrite`, and then updates the
+    attributes of the transformed QProgram with :meth:`finalize`. Operations and blocks are shared between the original
+    and the transformed QProgram, so :meth:`rewrite` must never modify the operation it receives: it returns either the
+    same operation, if it is left unchanged, or a new one.
+    """
+
+    def rewrite(self, operation: Operation) -> Operation:
+        """Returns the operation that replaces ``operation`` in the transformed QProgram.
+
+        Args:
+            operation (Operation): Operation of the QProgram, already rewritten by the previous transformations.
+
+        Returns:
+            Operation: ``operation`` itself if it is left unchanged, or a new operation otherwise.
+        """
+        return operation
+
+    def finalize(self, qprogram: QProgram) -> None:
+        """Updates the attributes of the transformed QProgram, after all its operations have been rewritten.
+
+        Args:
+            qprogram (QProgram): The transformed QProgram, whose attributes are already copies of the original ones.
+        """
+
+
+class BusMappingTransform(QProgramTransform):
+    """Renames the buses of a QProgram, see :meth:`QProgram.with_bus_mapping`.
+
+    Args:
+        bus_mapping (dict[str, str]): A dictionary mapping old bus names to new bus names.
+    """
+
+    def __init__(self, bus_mapping: dict[str, str]):
+        self.bus_mapping = bus_mapping
+        self._has_measure_reset = False
+
+    def rewrite(self, operation: Operation) -> Operation:
+        mapped = operation
+        if isinstance(operation, (MeasureReset, MeasureResetCalibrated)):
+            self._has_measure_reset = True
+            mapped = self._map_attribute(mapped, "control_bus")
+        if isinstance(operation, LookupTable) and operation.bus in self.bus_mapping:
+            mapped = self._map_attribute(mapped, "bus")
+            mapped.operations = [self.rewrite(entry) for entry in operation.operations]  # type: ignore[attr-defined]
+            return mapped
+        if hasattr(operation, "bus"):
+            return self._map_attribute(mapped, "bus")
+        buses = getattr(operation, "buses", None)
+        if isinstance(buses, list) and any(bus in self.bus_mapping for bus in buses):
+            mapped = copy(operation)
+            setattr(mapped, "buses", [self.bus_mapping.get(bus, bus) for bus in buses])
+        return mapped
+
+    def _map_attribute(self, operation: Operation, attribute: str) -> Operation:
+        bus = getattr(operation, attribute)
+        if not isinstance(bus, str) or bus not in self.bus_mapping:
+            return operation
+        mapped = copy(operation)
+        setattr(mapped, attribute, self.bus_mapping[bus])
+        return mapped
+
+    def finalize(self, qprogram: QProgram) -> None:
+        if self._has_measure_reset:
+            qprogram.qblox.latch_enabled = [self.bus_mapping.get(bus, bus) for bus in qprogram.qblox.latch_enabled]
+            qprogram.qblox.trigger_network_required = {
+                self.bus_mapping.get(bus, bus): value for bus, value in qprogram.qblox.trigger_network_required.items()
+            }
+
+        qprogram._buses = {self.bus_mapping.get(bus, bus) for bus in qprogram._buses}
+
+        # Merge weight_duration entries when multiple source buses map onto the same target bus (e.g. multiplexed
+        # readout) instead of one overwriting the other
+        remapped_weight_duration: dict[str, list[int | str]] = {}
+        for bus, durations in qprogram.qblox._weight_duration.items():
+            remapped_weight_duration.setdefault(self.bus_mapping.get(bus, bus), []).extend(durations)
+        qprogram.qblox._weight_duration = remapped_weight_duration
+
+
+class CalibrationTransform(QProgramTransform):
+    """Replaces the named operations of a QProgram with their calibrated waveforms and weights, see
+    :meth:`QProgram.with_calibration`.
+
+    Args:
+        calibration (Calibration): The calibration data to apply to the operations.
+    """
+
+    def __init__(self, calibration: Calibration):
+        self.calibration = calibration
+        self._buses_to_add: set[str] = set()
+        self._latch_to_add: list[str] = []
+        self._trigger_network_to_add: dict[str, int] = {}
+
+    def rewrite(self, operation: Operation) -> Operation:
+        calibration = self.calibration
+        if hasattr(operation, "bus"):
+            self._buses_to_add.add(getattr(operation, "bus"))
+
+        if isinstance(operation, PlayWithCalibratedWaveform) and calibration.has_waveform(
+            bus=operation.bus, name=operation.waveform
+        ):
+            waveform = calibration.get_waveform(bus=operation.bus, name=operation.waveform)
+            return Play(bus=operation.bus, waveform=waveform, wait_time=operation.wait_time)
+        if isinstance(operation, AcquireWithCalibratedWeights) and calibration.has_weights(
+            bus=operation.bus, name=operation.weights
+        ):
+            weights = calibration.get_weights(bus=operation.bus, name=operation.weights)
+            return Acquire(bus=operation.bus, weights=weights, save_adc=operation.save_adc)
+        if isinstance(operation, MeasureWithCalibratedWaveform) and calibration.has_waveform(
+            bus=operation.bus, name=operation.waveform
+        ):
+            waveform = calibration.get_waveform(bus=operation.bus, name=operation.waveform)
+            return Measure(
+                bus=operation.bus,
+                waveform=waveform,
+                weights=operation.weights,
+                demodulation=operation.demodulation,
+                save_adc=operation.save_adc,
+            )
+        if isinstance(operation, MeasureWithCalibratedWeights) and calibration.has_weights(
+            bus=operation.bus, name=operation.weights
+        ):
+            weights = calibration.get_weights(bus=operation.bus, name=operation.weights)
+            return Measure(
+                bus=operation.bus,
+                waveform=operation.waveform,
+                weights=weights,
+                demodulation=operation.demodulation,
+                save_adc=operation.save_adc,
+            )
+        if (
+            isinstance(operation, MeasureWithCalibratedWaveformWeights)
+            and calibration.has_waveform(bus=operation.bus, name=operation.waveform)
+            and calibration.has_weights(bus=operation.bus, name=operation.weights)
+        ):
+            waveform = calibration.get_waveform(bus=operation.bus, name=operation.waveform)
+            weights = calibration.get_weights(bus=operation.bus, name=operation.weights)
+            return Measure(
+                bus=operation.bus,
+                waveform=waveform,
+                weights=weights,
+                demodulation=operation.demodulation,
+                save_adc=operation.save_adc,
+            )
+        if (
+            isinstance(operation, MeasureResetCalibrated)
+            and calibration.has_waveform(bus=operation.bus, name=operation.waveform)
+            and calibration.has_weights(bus=operation.bus, name=operation.weights)
+            and calibration.has_waveform(bus=operation.control_bus, name=operation.reset_pulse)
+        ):
+            self._buses_to_add.add(operation.control_bus)
+            self._latch_to_add.append(operation.control_bus)
+            self._trigger_network_to_add[operation.bus] = operation.trigger_address
+            return MeasureReset(
+                bus=operation.bus,
+                waveform=calibration.get_waveform(bus=operation.bus, name=operation.waveform),
+                weights=calibration.get_weights(bus=operation.bus, name=operation.weights),
+                control_bus=operation.control_bus,
+                reset_pulse=calibration.get_waveform(bus=operation.control_bus, name=operation.reset_pulse),
+                trigger_address=operation.trigger_address,
+                save_adc=operation.save_adc,
+            )
+        return operation
+
+    def finalize(self, qprogram: QProgram) -> None:
+        qprogram._buses.update(self._buses_to_add)
+        qprogram.qblox.latch_enabled.extend(self._latch_to_add)
+        qprogram.qblox.trigger_network_required.update(self._trigger_network_to_add)
+
+
+class DistortionsTransform(QProgramTransform):
+    """Bakes pulse distortions into the waveforms played by a QProgram, see :meth:`QProgram.with_distortions`.
+
+    Args:
+        bus_distortions (dict[str, list[PulseDistortion]]): A dictionary mapping each bus alias to the list of
+            distortions to apply, in order, to the waveforms played on that bus.
+    """
+
+    def __init__(self, bus_distortions: dict[str, list[PulseDistortion]]):
+        self.bus_distortions = bus_distortions
+
+    def rewrite(self, operation: Operation) -> Operation:
+        if isinstance(operation, LookupTable):
+            entries = [self.rewrite(entry) for entry in operation.operations]
+            if all(entry is original for entry, original in zip(entries, operation.operations)):
+                return operation
+            table = copy(operation)
+            table.operations = entries  # type: ignore[assignment]
+            return table
+        if not isinstance(operation, (Play, Measure, MeasureReset)):
+            return operation
+        if isinstance(operation, MeasureReset) and operation.control_bus in self.bus_distortions:
+            raise NotImplementedError(
+                "Applying pulse distortions to the control bus of a `MeasureReset` (active "
+                f"reset) operation is not supported, but bus '{operation.control_bus}' has "
+                "distortions configured."
+            )
+        if operation.bus not in self.bus_distortions:
+            return operation
+
+        waveform = operation.waveform
+        for distortion in self.bus_distortions[operation.bus]:
+            if isinstance(waveform, IQWaveform):
+                distorted_waveform_I = Arbitrary(distortion.apply(waveform.get_I().envelope()))
+                distorted_waveform_Q = Arbitrary(distortion.apply(waveform.get_Q().envelope()))
+                distorted_waveform: IQPair | Arbitrary = IQPair(I=distorted_waveform_I, Q=distorted_waveform_Q)
+            elif isinstance(waveform, Waveform):
+                distorted_waveform = Arbitrary(distortion.apply(waveform.envelope()))
+            else:
+                raise NotImplementedError(f"Cannot apply distortions to waveform of type {type(waveform)}.")
+            waveform = distorted_waveform
+        distorted = copy(operation)
+        distorted.waveform = waveform  # type: ignore [assignment]
+        return distorted
+
+
+class WeightDurationTransform(QProgramTransform):
+    """Resolves the calibrated weight names of ``qblox.weight_duration`` to integer durations, see
+    :meth:`QProgram.with_resolved_weight_duration`.
+
+    Args:
+        calibration (Calibration | None): Calibration instance used to resolve calibrated weight names.
+        bus_mapping (dict[str, str] | None): Optional bus mapping; calibration lookups use the mapped bus alias.
+    """
+
+    def __init__(self, calibration: Calibration | None, bus_mapping: dict[str, str] | None = None):
+        self.calibration = calibration
+        self.bus_mapping = bus_mapping
+
+    def finalize(self, qprogram: QProgram) -> None:
+        resolved: dict[str, list[int | str]] = {}
+        for bus, entries in qprogram.qblox.weight_duration.items():
+            mapped_bus = self.bus_mapping.get(bus, bus) if self.bus_mapping else bus
+            resolved_entries: list[int | str] = []
+            for entry in entries:
+                if isinstance(entry, int):
+                    resolved_entries.append(entry)
+                else:
+                    if self.calibration is None:
+                        raise ValueError(
+                            f"Calibrated weight {entry!r} requires a calibration object, but none was provided."
+                        )
+                    if not self.calibration.has_weights(mapped_bus, entry):
+                        raise ValueError(f"Calibrated weight {entry!r} not found in calibration.")
+                    resolved_entries.append(self.calibration.get_weights(mapped_bus, entry).get_duration())
+            resolved[bus] = resolved_entries
+        qprogram.qblox._weight_duration = resolved
+
+
+def apply_transforms(qprogram: QProgram, *transforms: QProgramTransform, copy_blocks: bool = False) -> QProgram:
+    """Returns a copy of ``qprogram`` with ``transforms`` applied, in order, in a single traversal of its operations.
+
+    Only the blocks containing a rewritten operation, and the body, are copied: every other block and operation, with
+    its waveforms, is shared with ``qprogram``.
+
+    Args:
+        qprogram (QProgram): QProgram to transform. It is left unchanged.
+        *transforms (QProgramTransform): Transformations to apply.
+        copy_blocks (bool, optional): Whether to copy every block, even those without rewritten operations, so that the
+            blocks of the returned QProgram can be modified in place. Defaults to False.
+
+    Returns:
+        QProgram: The transformed QProgram.
+    """
+
+    def transform_block(block: Block, is_body: bool = False) -> Block:
+        elements: list[Block | Operation] = []
+        changed = copy_blocks or is_body
+        for element in block.elements:
+            if isinstance(element, Block):
+                transformed: Block | Operation = transform_block(element)
+            else:
+                transformed = element
+                for transform in transforms:
+                    transformed = transform.rewrite(transformed)
+            changed = changed or transformed is not element
+            elements.append(transformed)
+        if not changed:
+            return block
+        copied_block = copy(block)
+        copied_block.elements = elements
+        return copied_block
+
+    transformed_qprogram = copy(qprogram)
+    transformed_qprogram._body = transform_block(qprogram._body, is_body=True)
+    transformed_qprogram._block_stack = deque([transformed_qprogram._body])
+    transformed_qprogram._variables = dict(qprogram._variables)
+    transformed_qprogram._buses = set(qprogram._buses)
+
+    qblox = copy(qprogram.qblox)
+    qblox.qprogram = transformed_qprogram
+    qblox.latch_enabled = list(qprogram.qblox.latch_enabled)
+    qblox.trigger_network_required = dict(qprogram.qblox.trigger_network_required)
+    qblox._weight_duration = {bus: list(durations) for bus, durations in qprogram.qblox._weight_duration.items()}
+    transformed_qprogram.qblox = qblox
+    transformed_qprogram.quantum_machines = qprogram._QuantumMachinesInterface(transformed_qprogram)
+    transformed_qprogram.qdac = qprogram._QdacInterface(transformed_qprogram)
+
+    for transform in transforms:
+        transform.finalize(transformed_qprogram)
+    return transformed_qprogram
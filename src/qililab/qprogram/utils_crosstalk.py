@@ -11,9 +11,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections.abc import Sequence
+from copy import copy
+from numbers import Real
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from qililab.core.variables import Domain, IntVariable, Variable
+from qililab.qprogram.blocks import Block, ForLoop, Parallel
 from qililab.qprogram.crosstalk_matrix import CrosstalkMatrix
 from qililab.qprogram.flux_vector import FluxVector
-from qililab.qprogram.operations import Play, SetGain, SetOffset
+from qililab.qprogram.operations import LookupTable, Operation, Play, SetGain, SetOffset, Sync
+from qililab.qprogram.structured_program import VariableInfo
+from qililab.waveforms import IQWaveform, Waveform
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+# Q1ASM instructions that the lookup tables of a bus can take, half of the 16384 a Qblox sequencer can hold so that the
+# rest of the program still fits.
+MAX_LOOKUP_TABLE_INSTRUCTIONS = 8192
 
 
 class CrosstalkElements:
@@ -147,3 +165,238 @@ class NonLinearFlagState:
         self.block_defined = True
         # Reset last_appended_offset after every loop
         self.last_appended_offset = -1
+
+
+class NonLinearLoopFolder:
+    """Folds the iterations of a swept loop, unrolled by the non-linear crosstalk compensation, back into one hardware
+    loop.
+
+    The iterations are compared element by element. Elements equal in all of them are kept once, and the ``Play``,
+    ``SetGain`` and ``SetOffset`` operations that change between iterations are replaced by a :class:`LookupTable`
+    indexed by a new integer variable swept together with the loop. Nested loops folded before are merged into the
+    same tables, which are then indexed by the sum of the variables of all the folded loops.
+
+    Args:
+        variables (dict[Variable, VariableInfo]): Variables of the QProgram, where the index variables are declared.
+        buses (set[str]): Buses of the QProgram, all of which run the instructions of the hardware loops.
+    """
+
+    def __init__(self, variables: dict[Variable, VariableInfo], buses: set[str]):
+        self.variables = variables
+        self.buses = buses
+        self._index_variables: dict[UUID, IntVariable] = {}
+
+    def fold(self, loop: ForLoop | Parallel, iterations: list[list[Block | Operation]]) -> ForLoop | Parallel | None:
+        """Returns the hardware loop executing the unrolled ``iterations`` of ``loop``.
+
+        Args:
+            loop (ForLoop | Parallel): Swept loop that has been unrolled.
+            iterations (list[list[Block | Operation]]): Elements of every iteration of the loop.
+
+        Returns:
+            ForLoop | Parallel | None: The folded loop, or None if the iterations can't be folded, if the lookup tables
+                don't fit in a sequencer or if the unrolled iterations take less instructions.
+        """
+        if len(iterations) < 2:
+            return None
+        # Keys of the tables of nested loops go from 0 to stride - 1, so every iteration of this loop adds a stride
+        stride = max((key for table in self._lookup_tables(iterations) for key in table.keys), default=0) + 1
+        keys = [iteration * stride for iteration in range(len(iterations))]
+        index = self._index_variable(loop)
+
+        elements = self._fold_elements(iterations, index, keys)
+        if elements is None:
+            return None
+
+        index_loop = ForLoop(variable=index, start=0, stop=keys[-1], step=stride)
+        swept_loops = loop.loops if isinstance(loop, Parallel) else [loop]
+        used_variables = self._variables_of(elements)
+        referenced_loops = [swept for swept in swept_loops if swept.variable in used_variables]
+        folded: ForLoop | Parallel = Parallel(loops=[*referenced_loops, index_loop]) if referenced_loops else index_loop
+        folded.elements = elements
+
+        table_instructions: dict[str, int] = {}
+        for table in self._lookup_tables([elements]):
+            table_instructions[table.bus] = table_instructions.get(table.bus, 0) + 3 * self.count_runs(table)
+        if any(instructions > MAX_LOOKUP_TABLE_INSTRUCTIONS for instructions in table_instructions.values()):
+            return None
+        # The sync that ends every unrolled iteration has to be added after the loop too
+        instructions = self._instructions([folded, Sync()] if elements and isinstance(elements[-1], Sync) else [folded])
+        if instructions >= sum(self._instructions(iteration) for iteration in iterations):
+            return None
+        return folded
+
+    @staticmethod
+    def count_runs(table: LookupTable) -> int:
+        """Returns the number of runs of consecutive equal entries of a lookup table.
+
+        Args:
+            table (LookupTable): Lookup table.
+
+        Returns:
+            int: Number of runs.
+        """
+        return 1 + sum(
+            not NonLinearLoopFolder._same_operation(previous, operation)
+            for previous, operation in zip(table.operations, table.operations[1:])
+        )
+
+    def _index_variable(self, loop: ForLoop | Parallel) -> IntVariable:
+        if loop.uuid not in self._index_variables:
+            swept = loop.loops[0] if isinstance(loop, Parallel) else loop
+            index = IntVariable(f"{swept.variable.label}_index", Domain.Scalar)
+            self.variables[index] = VariableInfo()
+            self._index_variables[loop.uuid] = index
+        return self._index_variables[loop.uuid]
+
+    def _fold_elements(
+        self, iterations: Sequence[list[Block | Operation]], index: Variable, keys: list[int]
+    ) -> list[Block | Operation] | None:
+        if any(len(elements) != len(iterations[0]) for elements in iterations):
+            return None
+        folded: list[Block | Operation] = []
+        for column in zip(*iterations):
+            element = self._fold_column(list(column), index, keys)
+            if element is None:
+                return None
+            folded.append(element)
+        return folded
+
+    def _fold_column(
+        self, column: list[Block | Operation], index: Variable, keys: list[int]
+    ) -> Block | Operation | None:
+        first = column[0]
+        if isinstance(first, Block):
+            if any(
+                not isinstance(element, Block) or self._signature(element) != self._signature(first)
+                for element in column
+            ):
+                return None
+            elements = self._fold_elements([element.elements for element in column], index, keys)  # type: ignore[union-attr]
+            if elements is None:
+                return None
+            block = copy(first)
+            block.elements = elements
+            return block
+        if any(isinstance(element, Block) for element in column):
+            return None
+        if all(self._same_operation(first, element) for element in column[1:]):  # type: ignore[arg-type]
+            return first
+
+        nested = next((element for element in column if isinstance(element, LookupTable)), None)
+        if nested is None:
+            table = LookupTable(bus=getattr(first, "bus", ""), index=[index], keys=keys, operations=column)  # type: ignore[arg-type]
+        else:
+            operations: list[Play | SetGain | SetOffset] = []
+            for element in column:
+                if not isinstance(element, LookupTable):
+                    operations.extend([element] * len(nested.keys))  # type: ignore[list-item]
+                elif element.index == nested.index and element.keys == nested.keys:
+                    operations.extend(element.operations)
+                else:
+                    return None
+            table = LookupTable(
+                bus=nested.bus,
+                index=[index, *nested.index],
+                keys=[key + nested_key for key in keys for nested_key in nested.keys],
+                operations=operations,
+            )
+        return table if self._is_lookup_table(table) else None
+
+    @staticmethod
+    def _is_lookup_table(table: LookupTable) -> bool:
+        first = table.operations[0]
+        if not isinstance(first, (Play, SetGain, SetOffset)):
+            return False
+        if any(type(operation) is not type(first) or operation.bus != table.bus for operation in table.operations):
+            return False
+        if isinstance(first, SetGain):
+            return all(isinstance(operation.gain, Real) for operation in table.operations)  # type: ignore[union-attr]
+        if isinstance(first, SetOffset):
+            return all(
+                isinstance(operation.offset_path0, Real)  # type: ignore[union-attr]
+                and (operation.offset_path1 is None) == (first.offset_path1 is None)  # type: ignore[union-attr]
+                and (operation.offset_path1 is None or isinstance(operation.offset_path1, Real))  # type: ignore[union-attr]
+                for operation in table.operations
+            )
+        attributes = ("wait_time", "dwell", "delay", "repetitions", "stepped")
+        duration = first.get_waveforms()[0].get_duration()
+        return all(
+            not operation.get_waveform_variables()  # type: ignore[union-attr]
+            and all(getattr(operation, name) == getattr(first, name) for name in attributes)
+            and all(
+                waveform is None or waveform.get_duration() == duration
+                for waveform in operation.get_waveforms()  # type: ignore[union-attr]
+            )
+            for operation in table.operations
+        )
+
+    @staticmethod
+    def _same_operation(operation: Operation, other: Operation) -> bool:
+        if operation is other:
+            return True
+        if type(operation) is not type(other) or vars(operation).keys() != vars(other).keys():
+            return False
+        for name, value in vars(operation).items():
+            other_value = getattr(other, name)
+            if name == "_uuid":
+                continue
+            if isinstance(value, IQWaveform) and isinstance(other_value, IQWaveform):
+                equal = (
+                    value.get_I().digest() == other_value.get_I().digest()
+                    and value.get_Q().digest() == other_value.get_Q().digest()
+                )
+            elif isinstance(value, Waveform) and isinstance(other_value, Waveform):
+                equal = value.digest() == other_value.digest()
+            elif isinstance(value, np.ndarray) or isinstance(other_value, np.ndarray):
+                equal = np.array_equal(value, other_value)
+            else:
+                equal = type(value) is type(other_value) and value == other_value
+            if not equal:
+                return False
+        return True
+
+    @staticmethod
+    def _signature(block: Block) -> tuple:
+        if isinstance(block, Parallel):
+            return (Parallel, *(NonLinearLoopFolder._signature(loop) for loop in block.loops))
+        if isinstance(block, ForLoop):
+            return (ForLoop, block.variable, block.start, block.stop, block.step)
+        # Any other block is a copy of the same block of the QProgram in every iteration
+        return (type(block), block.uuid)
+
+    @staticmethod
+    def _lookup_tables(iterations: Sequence[list[Block | Operation]]):
+        for elements in iterations:
+            for element in elements:
+                if isinstance(element, Block):
+                    yield from NonLinearLoopFolder._lookup_tables([element.elements])
+                elif isinstance(element, LookupTable):
+                    yield element
+
+    @staticmethod
+    def _variables_of(elements: list[Block | Operation]) -> set[Variable]:
+        variables: set[Variable] = set()
+        for element in elements:
+            if isinstance(element, Block):
+                variables |= NonLinearLoopFolder._variables_of(element.elements)
+            else:
+                variables |= element.get_variables()
+        return variables
+
+    def _instructions(self, elements: list[Block | Operation]) -> int:
+        """Estimates the Q1ASM instructions the elements compile to, added over all the buses."""
+        instructions = 0
+        for element in elements:
+            if isinstance(element, LookupTable):
+                # Index sum and jump inline, and a binary search ending in the operation and a jump back per run
+                instructions += len(element.index) + 3 * self.count_runs(element)
+            elif isinstance(element, Block):
+                # Every bus initialises the iteration and loop registers, and updates them at the end of the loop
+                loops = len(element.loops) if isinstance(element, Parallel) else int(isinstance(element, ForLoop))
+                instructions += (2 + 2 * loops) * len(self.buses) + self._instructions(element.elements)
+            elif isinstance(element, Sync):
+                instructions += len(element.buses) if element.buses is not None else len(self.buses)
+            else:
+                instructions += 1
+        return instructions
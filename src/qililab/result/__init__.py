@@ -23,6 +23,7 @@ Classes
     :toctree: api
 
     experiment_results.ExperimentResults
+    experiment_results.ExperimentResultsView
     Result
     MeasurementResult
     QbloxMeasurementResult
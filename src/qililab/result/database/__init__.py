@@ -41,11 +41,12 @@ Functions
 
 from .database_autocal import AutocalMeasurement, CalibrationRun
 from .database_manager import DatabaseManager, get_db_manager, load_by_id
-from .database_measurements import Cooldown, Measurement, Sample, SequenceRun
+from .database_measurements import Blob, Cooldown, Measurement, Sample, SequenceRun
 from .database_qaas import QaaS_Experiment
 
 __all__ = [
     "AutocalMeasurement",
+    "Blob",
     "CalibrationRun",
     "Cooldown",
     "DatabaseManager",
@@ -13,20 +13,36 @@
 # limitations under the License.
 
 import datetime
+import hashlib
+import json
 import os
+import time
 import warnings
+from collections.abc import Sequence
 from configparser import ConfigParser
+from threading import Lock
 from typing import TYPE_CHECKING, Any, overload
 
 import h5py
 import numpy as np
 from pandas import read_sql
-from sqlalchemy import create_engine, exists
+from sqlalchemy import create_engine, exists, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from qililab.qililab_settings import get_settings
 from qililab.result.database.database_autocal import AutocalMeasurement, CalibrationRun
-from qililab.result.database.database_measurements import Cooldown, Measurement, Sample, SequenceRun
+from qililab.result.database.database_measurements import (
+    BLOB_REFERENCE_KEY,
+    Blob,
+    Cooldown,
+    Measurement,
+    Sample,
+    SequenceRun,
+)
 from qililab.result.database.database_qaas import QaaS_Experiment
+from qililab.result.database.database_write_queue import DatabaseWrite, DatabaseWriteQueue
 from qililab.utils.serialization import serialize
 
 if TYPE_CHECKING:
@@ -35,9 +51,53 @@ if TYPE_CHECKING:
     from qililab.qprogram.experiment import Experiment
     from qililab.qprogram.qprogram import QProgram
 
+SUMMARY_COLUMNS = (
+    Measurement.measurement_id,
+    Measurement.sequence_id,
+    Measurement.experiment_name,
+    Measurement.optional_identifier,
+    Measurement.start_time,
+    Measurement.end_time,
+    Measurement.run_length,
+    Measurement.experiment_completed,
+    Measurement.cooldown,
+    Measurement.sample_name,
+    Measurement.result_path,
+    Measurement.target,
+)
+"""Index columns of :class:`Measurement` returned by :meth:`DatabaseManager.tail_summary` and :meth:`DatabaseManager.head_summary`."""
+
+# Engines created by `get_engine`, one per database URL, so that their connection pools are shared
+_engines: dict[str, Engine] = {}
+_engines_lock = Lock()
+
+
+class _BlobInsert:
+    """Operation of a database write inserting a deduplicated blob, unless a blob with the same digest is stored."""
+
+    def __init__(self, digest: str, content: Any):
+        self.digest = digest
+        self._statement = insert(Blob).values(digest=digest, content=content).on_conflict_do_nothing()
+
+    def __call__(self, running_session: Session) -> None:
+        running_session.execute(self._statement)
+
 
 class DatabaseManager:
-    """Database manager for measurements results and metadata"""
+    """Database manager for measurements results and metadata
+
+    With the ``database_asynchronous_writes`` setting, new measurements are committed in batches by a background thread
+    instead of blocking until each one is committed. Their ``measurement_id`` is only set once committed: call
+    :meth:`flush` to wait for them. Reads flush the queued writes first.
+
+    With the ``database_deduplicate_blobs`` setting, platforms and calibrations are stored once per distinct content in
+    the ``blobs`` table, and measurements only store a reference to them. :meth:`get_platform` and
+    :meth:`get_calibration` resolve the references, and :meth:`resolve_blob` resolves them for loaded measurements.
+
+    Managers of the same database share the connection pool of its engine, see :func:`get_engine`. Dashboards polling
+    the latest measurements should use :meth:`tail_summary` and :meth:`head_summary`, which only read the index columns
+    and reuse their results for ``database_summary_cache_ttl`` seconds.
+    """
 
     calibration_measurement: AutocalMeasurement
 
@@ -72,6 +132,86 @@ class DatabaseManager:
             self.base_path_share = config["base_path_shared"]
             self.folder_path = config["data_write_folder"]
 
+        settings = get_settings()
+        self._write_queue: DatabaseWriteQueue | None = (
+            DatabaseWriteQueue(self.session, settings.database_write_batch_size, on_commit=self._record_blobs)
+            if settings.database_asynchronous_writes
+            else None
+        )
+        self._deduplicate_blobs = settings.database_deduplicate_blobs
+        self._blobs_table_created = False
+        # Digests of the blobs whose insert has been committed by this manager
+        self._stored_blobs: set[str] = set()
+        self._summary_cache_ttl = settings.database_summary_cache_ttl
+        # Results of the summary queries, with the time they were read, by query arguments
+        self._summary_cache: dict[tuple, tuple[float, Any]] = {}
+
+    def flush(self):
+        """Waits until all the measurements queued by asynchronous writes have been committed.
+
+        Raises:
+            Exception: The first error raised while committing them, if any.
+        """
+        if self._write_queue is not None:
+            self._write_queue.flush()
+
+    def close(self):
+        """Commits the queued measurements and stops the background thread of asynchronous writes."""
+        if self._write_queue is not None:
+            self._write_queue.close()
+            self._write_queue = None
+
+    def resolve_blob(self, value: Any) -> Any:
+        """Returns the document referenced by a deduplicated column value, or the value itself if it is not a reference.
+
+        Args:
+            value (Any): Value of a platform or calibration column.
+        """
+        if not (isinstance(value, dict) and value.keys() == {BLOB_REFERENCE_KEY}):
+            return value
+        self.flush()
+        with self.session() as running_session:
+            blob = running_session.get(Blob, value[BLOB_REFERENCE_KEY])
+            if blob is None:
+                raise KeyError(f"Blob '{value[BLOB_REFERENCE_KEY]}' does not exist.")
+            return blob.content
+
+    def _deduplicate(self, content: Any, write: list) -> Any:
+        """Returns the reference to store in place of ``content``, adding the insert of its blob to ``write``."""
+        if not self._deduplicate_blobs or content is None:
+            return content
+        if not self._blobs_table_created:
+            Blob.__table__.create(bind=self.engine, checkfirst=True)
+            self._blobs_table_created = True
+
+        digest = hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        # Until an insert of the blob is committed, every write referencing it inserts it too, so that a failed commit
+        # does not leave references to a blob that was never stored.
+        if digest not in self._stored_blobs:
+            write.append(_BlobInsert(digest, content))
+        return {BLOB_REFERENCE_KEY: digest}
+
+    def _record_blobs(self, writes: Sequence[DatabaseWrite]) -> None:
+        """Records the blobs inserted by ``writes`` as stored, once their transaction has been committed."""
+        for write in writes:
+            self._stored_blobs.update(operation.digest for operation in write if isinstance(operation, _BlobInsert))
+
+    def _write(self, write: DatabaseWrite):
+        """Commits the operations of ``write`` together, or queues them when writes are asynchronous."""
+        self._summary_cache.clear()
+        if self._write_queue is not None:
+            self._write_queue.put(write)
+            return
+        with self.session() as running_session:
+            for operation in write:
+                operation(running_session)
+            try:
+                running_session.commit()
+            except Exception as e:
+                running_session.rollback()
+                raise e
+        self._record_blobs([write])
+
     def set_sample_and_cooldown(self, sample: str, cooldown: str | None = None):
         """Set sample and cooldown of the database
 
@@ -235,6 +375,7 @@ class DatabaseManager:
         Args:
             id (int | list[int]): measurement_id value given by the database.
         """
+        self.flush()
         with self.session() as running_session:
             if not isinstance(id, list):
                 measurement_id = [id]
@@ -273,6 +414,7 @@ class DatabaseManager:
         Returns:
             list[Measurement] | None: returns the list of measurements or None if no sequence could be found.
         """
+        self.flush()
         with self.session() as running_session:
             measurement_by_id_list = (
                 running_session.query(Measurement)
@@ -293,6 +435,7 @@ class DatabaseManager:
         Args:
             id (int): measurement_id value given by the database.
         """
+        self.flush()
         with self.session() as running_session:
             measurement_by_id = (
                 running_session.query(AutocalMeasurement).where(AutocalMeasurement.measurement_id == id).one_or_none()
@@ -338,6 +481,7 @@ class DatabaseManager:
             light_read (bool, optional): If True, load only a subset of the columns. Replace heavy columns Platform and Qprogram by True or False. Defaults to False.
             since_id (int | None, optional): If provided, only load measurements with measurement_id greater than since_id. Defaults to None.
         """
+        self.flush()
         with self.engine.connect() as con:
             query = self.session().query(Measurement)
 
@@ -403,6 +547,7 @@ class DatabaseManager:
             light_read (bool, optional): If True, load only a subset of the columns. Replace heavy columns Platform and Qprogram by True or False. Defaults to False.
             before_id (int | None, optional): If provided, only load measurements with measurement_id lower than since_id. Defaults to None.
         """
+        self.flush()
         with self.engine.connect() as con:
             query = self.session().query(Measurement)
 
@@ -449,6 +594,99 @@ class DatabaseManager:
                 return read_sql(query.statement, con=con)
             return query.all()
 
+    def tail_summary(
+        self,
+        exp_name: str | None = None,
+        current_sample: bool = True,
+        order_limit: int | None = 5,
+        pandas_output: bool = False,
+        since_id: int | None = None,
+    ):
+        """Returns the index columns of the last measurements of the database, newest first.
+
+        Unlike :meth:`tail`, only the columns in :data:`SUMMARY_COLUMNS` are read, and identical queries made within
+        ``database_summary_cache_ttl`` seconds return the same results without querying the database again.
+
+        Args:
+            exp_name (str | None, optional): Experiment name. Defaults to None.
+            current_sample (bool, optional): Conditional to define if the sample is currently on use. Defaults to True.
+            order_limit (int | None, optional): Limit of the order by query. Defaults to 5.
+            pandas_output (bool, optional): If True, return a DataFrame instead of a list of rows. Defaults to False.
+            since_id (int | None, optional): If provided, only load measurements with measurement_id greater than since_id. Defaults to None.
+        """
+        return self._summary(exp_name, current_sample, order_limit, pandas_output, since_id=since_id, newest_first=True)
+
+    def head_summary(
+        self,
+        exp_name: str | None = None,
+        current_sample: bool = True,
+        order_limit: int | None = 5,
+        pandas_output: bool = False,
+        before_id: int | None = None,
+    ):
+        """Returns the index columns of the first measurements of the database, oldest first.
+
+        Unlike :meth:`head`, only the columns in :data:`SUMMARY_COLUMNS` are read, and identical queries made within
+        ``database_summary_cache_ttl`` seconds return the same results without querying the database again.
+
+        Args:
+            exp_name (str | None, optional): Experiment name. Defaults to None.
+            current_sample (bool, optional): Conditional to define if the sample is currently on use. Defaults to True.
+            order_limit (int | None, optional): Limit of the order by query. Defaults to 5.
+            pandas_output (bool, optional): If True, return a DataFrame instead of a list of rows. Defaults to False.
+            before_id (int | None, optional): If provided, only load measurements with measurement_id lower than before_id. Defaults to None.
+        """
+        return self._summary(exp_name, current_sample, order_limit, pandas_output, before_id=before_id)
+
+    def _summary(
+        self,
+        exp_name: str | None,
+        current_sample: bool,
+        order_limit: int | None,
+        pandas_output: bool,
+        since_id: int | None = None,
+        before_id: int | None = None,
+        newest_first: bool = False,
+    ):
+        """Runs the summary query of :meth:`tail_summary` and :meth:`head_summary`, through the summary cache."""
+        self.flush()
+        sample_name = self.current_sample if current_sample else None
+        key = (exp_name, sample_name, order_limit, pandas_output, since_id, before_id, newest_first)
+        now = time.monotonic()
+        cached = self._summary_cache.get(key)
+        if cached is not None and now - cached[0] < self._summary_cache_ttl:
+            return cached[1].copy()
+
+        # The statement only varies in its parameters between calls, so SQLAlchemy reuses its compiled form
+        statement = select(*SUMMARY_COLUMNS)
+        if sample_name:
+            statement = statement.where(Measurement.sample_name == sample_name)
+        if since_id:
+            statement = statement.where(Measurement.measurement_id > since_id)
+        if before_id:
+            statement = statement.where(Measurement.measurement_id < before_id)
+        if exp_name is not None:
+            statement = statement.where(Measurement.experiment_name == exp_name)
+        statement = statement.order_by(
+            Measurement.measurement_id.desc() if newest_first else Measurement.measurement_id
+        )
+        if order_limit is not None:
+            statement = statement.limit(order_limit)
+
+        with self.engine.connect() as con:
+            result = read_sql(statement, con=con) if pandas_output else list(con.execute(statement).all())
+
+        if self._summary_cache_ttl > 0:
+            # Drop the expired results, so that polling with a moving since_id does not grow the cache
+            self._summary_cache = {
+                cached_key: entry
+                for cached_key, entry in self._summary_cache.items()
+                if now - entry[0] < self._summary_cache_ttl
+            }
+            self._summary_cache[key] = (now, result)
+            return result.copy()
+        return result
+
     def get_qprogram(self, measurement_id: int) -> str:
         """Get QProgram of a measurement by its measurement_id.
         To be used when you have light loaded measurements
@@ -456,6 +694,7 @@ class DatabaseManager:
         Args:
             measurement_id (int): measurement_id value given by the database.
         """
+        self.flush()
         with self.session() as running_session:
             return (
                 running_session.query(Measurement.qprogram)
@@ -470,12 +709,14 @@ class DatabaseManager:
         Args:
             measurement_id (int): measurement_id value given by the database.
         """
+        self.flush()
         with self.session() as running_session:
-            return (
+            calibration = (
                 running_session.query(Measurement.calibration)
                 .filter(Measurement.measurement_id == measurement_id)
                 .scalar()
             )
+        return self.resolve_blob(calibration)
 
     def get_platform(self, measurement_id: int) -> dict:
         """Get Platform of a measurement by its measurement_id.
@@ -484,12 +725,14 @@ class DatabaseManager:
         Args:
             measurement_id (int): measurement_id value given by the database.
         """
+        self.flush()
         with self.session() as running_session:
-            return (
+            platform = (
                 running_session.query(Measurement.platform)
                 .filter(Measurement.measurement_id == measurement_id)
                 .scalar()
             )
+        return self.resolve_blob(platform)
 
     def get_debug(self, measurement_id: int) -> str:
         """Get Debug of a measurement by its measurement_id.
@@ -498,6 +741,7 @@ class DatabaseManager:
         Args:
             measurement_id (int): measurement_id value given by the database.
         """
+        self.flush()
         with self.session() as running_session:
             return (
                 running_session.query(Measurement.debug_file)
@@ -512,6 +756,7 @@ class DatabaseManager:
         Args:
             measurement_id (int): measurement_id value given by the database.
         """
+        self.flush()
         with self.session() as running_session:
             return (
                 running_session.query(Measurement.dc_offsets)
@@ -559,6 +804,7 @@ class DatabaseManager:
             os.makedirs(base_path)
             warnings.warn(f"Data folder did not exist. Created one at {base_path}")
 
+        write: list = []
         self.calibration_measurement = AutocalMeasurement(
             experiment_name=experiment_name,
             calibration_id=calibration_id,
@@ -567,20 +813,16 @@ class DatabaseManager:
             fitting_path=base_path,
             experiment_completed=False,
             start_time=start_time,
-            platform_before=platform,
+            platform_before=self._deduplicate(platform, write),
             qprogram=qprogram,
-            calibration=serialize(calibration),
+            calibration=self._deduplicate(serialize(calibration), write),
             parameters=serialize(parameters),
             data_shape=data_shape,
         )
-        with self.session() as running_session:
-            running_session.add(self.calibration_measurement)
-            try:
-                running_session.commit()
-                return self.calibration_measurement
-            except Exception as e:
-                running_session.rollback()
-                raise e
+        measurement = self.calibration_measurement
+        write.append(lambda running_session: running_session.add(measurement))
+        self._write(write)
+        return self.calibration_measurement
 
     def update_platform(self, platform: "Platform"):
         """Update calibration platform after fitting
@@ -588,6 +830,7 @@ class DatabaseManager:
         Args:
             platform (Platform): New platform to be set at platform_before column from `AutocalMeasurement`.
         """
+        self.flush()
         self.calibration_measurement.update_platform(self.session, platform)
 
     def add_experiment(
@@ -697,6 +940,7 @@ class DatabaseManager:
             os.makedirs(folder)
             warnings.warn(f"Data folder did not exist. Created one at {folder}")
 
+        write: list = []
         measurement = Measurement(
             experiment_name=experiment_name,
             sample_name=sample_name,
@@ -708,10 +952,10 @@ class DatabaseManager:
             optional_identifier=optional_identifier,
             end_time=end_time,
             run_length=run_length,
-            platform=platform,
+            platform=self._deduplicate(platform, write),
             experiment=experiment,
             qprogram=qprogram,
-            calibration=calibration,
+            calibration=self._deduplicate(calibration, write),
             debug_file=debug_file,
             parameters=parameters,
             data_shape=data_shape,
@@ -720,14 +964,9 @@ class DatabaseManager:
             secondary_source=secondary_source,
             bus_mapping=bus_mapping,
         )
-        with self.session() as running_session:
-            running_session.add(measurement)
-            try:
-                running_session.commit()
-                return measurement
-            except Exception as e:
-                running_session.rollback()
-                raise e
+        write.append(lambda running_session: running_session.add(measurement))
+        self._write(write)
+        return measurement
 
     def add_results(
         self,
@@ -789,6 +1028,7 @@ class DatabaseManager:
         _file.create_dataset("results", data=results)
         _file.__exit__()
 
+        write: list = []
         measurement = Measurement(
             experiment_name=experiment_name,
             sample_name=sample_name,
@@ -798,21 +1038,16 @@ class DatabaseManager:
             cooldown=cooldown,
             optional_identifier=optional_identifier,
             end_time=datetime.datetime.now(),
-            platform=platform,
+            platform=self._deduplicate(platform, write),
             experiment=experiment,
             qprogram=qprogram,
-            calibration=calibration,
+            calibration=self._deduplicate(calibration, write),
             parameters=parameters,
             data_shape=results.shape,
         )
-        with self.session() as running_session:
-            running_session.add(measurement)
-            try:
-                running_session.commit()
-                return measurement
-            except Exception as e:
-                running_session.rollback()
-                raise e
+        write.append(lambda running_session: running_session.add(measurement))
+        self._write(write)
+        return measurement
 
 
 def _load_config(filename, section):
@@ -836,9 +1071,13 @@ def get_db_manager(path: str = "~/database.ini", database_name: str = "postgresq
     return DatabaseManager(filename, database_name)
 
 
-def get_engine(user: str, passwd: str, host: str, port: str, database: str):
+def get_engine(user: str, passwd: str, host: str, port: str, database: str) -> Engine:
     """Returns SQLalchemy engine based on user information
 
+    Engines are created once per database and reused by later calls, so that all the managers of a database share
+    its connection pool, sized by the ``database_pool_*`` settings. Pooled connections are checked before being used,
+    so that connections dropped by the server are replaced transparently.
+
     Args:
         user (str): SQLalchemy user
         passwd (str): Personal password
@@ -847,7 +1086,17 @@ def get_engine(user: str, passwd: str, host: str, port: str, database: str):
         database (str): Database name
     """
     url = f"postgresql://{user}:{passwd}@{host}:{port}/{database}"
-    return create_engine(url)
+    with _engines_lock:
+        if url not in _engines:
+            settings = get_settings()
+            _engines[url] = create_engine(
+                url,
+                pool_size=settings.database_pool_size,
+                max_overflow=settings.database_pool_max_overflow,
+                pool_recycle=settings.database_pool_recycle,
+                pool_pre_ping=True,
+            )
+        return _engines[url]
 
 
 def load_by_id(id: int | list[int], path: str = "~/database.ini") -> list[Measurement] | Measurement | None:
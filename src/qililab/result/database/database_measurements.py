@@ -42,6 +42,9 @@ if TYPE_CHECKING:
 
 base = declarative_base()
 
+BLOB_REFERENCE_KEY = "$blob"
+"""Key of the JSON objects stored in place of a deduplicated document, holding the digest of its :class:`Blob`."""
+
 
 class Cooldown(base):  # type: ignore
     """Creates and manipulates CoolDown metadata database"""
@@ -62,6 +65,26 @@ class Cooldown(base):  # type: ignore
         return f"{self.cooldown} {self.date} {self.fridge} {self.active}"
 
 
+class Blob(base):  # type: ignore
+    """Content-addressed JSON documents, such as platforms and calibrations, shared by many measurements.
+
+    Measurements store ``{"$blob": digest}`` in place of the document, so that a document used by many measurements is
+    only stored once.
+    """
+
+    __tablename__ = "blobs"
+
+    digest: Column = Column("digest", String(64), primary_key=True)
+    content: Column = Column("content", JSONB, nullable=False)
+
+    def __init__(self, digest, content):
+        self.digest = digest
+        self.content = content
+
+    def __repr__(self):
+        return f"{self.digest}"
+
+
 class Sample(base):  # type: ignore
     """Creates and manipulates Sample metadata database"""
 
@@ -218,10 +241,26 @@ class Measurement(base):  # type: ignore
             data, dims = results.get()
         return data, dims
 
-    def read_experiment_xarray(self):
-        """Rewads current experiment in Xarray format."""
+    def read_experiment_xarray(self, lazy: bool = False):
+        """Rewads current experiment in Xarray format.
 
-        with ExperimentResults(self.result_path) as results:
+        Args:
+            lazy (bool, optional): Whether to return a lazily loaded DataArray, which only reads from the results file
+                the values that are indexed or computed on. The file then stays open until the DataArray is closed,
+                with ``close()`` or by using it as a context manager. Defaults to False.
+        """
+        if lazy:
+            results = ExperimentResults(str(self.result_path))
+            results.__enter__()
+            try:
+                data_array = results.view().as_complex().to_xarray()
+            except Exception:
+                results.__exit__()
+                raise
+            data_array.set_close(results.__exit__)
+            return data_array
+
+        with ExperimentResults(str(self.result_path)) as results:
             data, dims = results.get()
 
         d = {}
@@ -0,0 +1,120 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Background thread writing metadata to the database in batches."""
+
+from collections.abc import Callable, Sequence
+from queue import Empty, Queue
+from threading import Thread
+
+from sqlalchemy.orm import Session, sessionmaker
+
+DatabaseWrite = Sequence[Callable[[Session], None]]
+"""Operations on a session that have to be committed together, e.g. adding a row and the blobs it references."""
+
+
+class DatabaseWriteQueue:
+    """Queue of database writes committed by a background thread, so that they do not block the acquisition.
+
+    The thread takes all the writes queued at once, up to ``batch_size``, and commits them in a single transaction, so
+    that SQLAlchemy sends their inserts in bulk. Writes are committed in the order they were queued.
+
+    Errors raised by the thread are re-raised by the next call to :meth:`flush` or :meth:`close`. When a batch fails,
+    none of its writes are committed.
+
+    Args:
+        session (sessionmaker[Session]): Factory of the sessions used to commit the writes.
+        batch_size (int, optional): Maximum number of writes committed in a single transaction. Defaults to 100.
+        on_commit (Callable[[Sequence[DatabaseWrite]], None], optional): Called by the thread with the writes of each
+            batch once they have been committed. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        session: sessionmaker[Session],
+        batch_size: int = 100,
+        on_commit: Callable[[Sequence[DatabaseWrite]], None] | None = None,
+    ):
+        self.session = session
+        self.batch_size = batch_size
+        self.on_commit = on_commit
+        self._queue: Queue[DatabaseWrite | None] = Queue()
+        self._error: Exception | None = None
+        self._thread = Thread(target=self._run, name="qililab-database-writes", daemon=True)
+        self._thread.start()
+
+    def put(self, write: DatabaseWrite) -> None:
+        """Queues a write.
+
+        Args:
+            write (DatabaseWrite): Operations to run on the session, committed in the same transaction.
+
+        Raises:
+            RuntimeError: If the queue has been closed.
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("The database write queue has been closed.")
+        self._queue.put(write)
+
+    def flush(self) -> None:
+        """Waits until all the queued writes have been committed.
+
+        Raises:
+            Exception: The first error raised while committing the writes since the last flush.
+        """
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self) -> None:
+        """Commits the queued writes and stops the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            try:
+                self._commit([write for write in batch if write is not None])
+            except Exception as error:  # noqa: BLE001
+                if self._error is None:
+                    self._error = error
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def _commit(self, writes: list[DatabaseWrite]) -> None:
+        if not writes:
+            return
+        with self.session() as running_session:
+            try:
+                for write in writes:
+                    for operation in write:
+                        operation(running_session)
+                running_session.commit()
+            except Exception as e:
+                running_session.rollback()
+                raise e
+        if self.on_commit is not None:
+            self.on_commit(writes)
@@ -15,6 +15,8 @@
 import os
 import warnings
 from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Any
 
 import numpy as np
 import plotly.graph_objects as go
@@ -30,28 +32,52 @@ class DimensionInfo:
     values: list[np.ndarray]
 
 
+def decibels(s21: np.ndarray) -> np.ndarray:
+    """Convert result values from s21 into dB, with NaN for the values not acquired yet."""
+    s21 = np.asarray(s21)  # a single written cell gives a scalar, which does not support masked assignment
+    s21[s21 == 0j] = np.nan
+    return 20 * np.log10(np.abs(s21))
+
+
 class ExperimentLivePlot:
-    """Provides methods to access the experiment results stored in an HDF5 file."""
+    """Live plots the S21 parameter of the results of an experiment while they are acquired.
+
+    The S21 values in dB of every measurement are kept in a plot buffer in memory. Each write of results only converts
+    and copies the cells written into it, so its cost does not depend on the size of the experiment. Updating the figure
+    and exporting it to PNG are the expensive parts: with a positive ``refresh_interval`` they run in a background thread,
+    at most once every ``refresh_interval`` seconds and only if something was written, so that live plotting does not
+    slow down the acquisition.
+    """
 
     LIVE_PLOT_NAME = "live_plot.png"
 
-    def __init__(self, path: str, slurm_execution: bool = True, port_number: int | None = None):
+    def __init__(
+        self, path: str, slurm_execution: bool = True, port_number: int | None = None, refresh_interval: float = 0.0
+    ):
         """Initializes the ExperimentResults instance.
 
         Args:
             path (str): The file path to the HDF5 results file.
             slurm_execution (bool): Flag that defines if the liveplot will be held through Dash or a notebook cell. Defaults to True.
             port_number (int|None): Optional parameter for when slurm_execution is True. It defines the port number of the Dash server. Defaults to None.
+            refresh_interval (float): Minimum time in seconds between two refreshes of the figure, which then run in a background thread. 0 refreshes the figure on every call to :meth:`live_plot`. Defaults to 0.
         """
         self.path = path
         self._slurm_execution = slurm_execution
         self._port_number = port_number
+        self.refresh_interval = refresh_interval
 
         self.live_plot_dict: dict[tuple[str, str], int] = {}
 
         self._live_plot_fig: go.Figure | go.FigureWidget
         self._dash_app: Dash
 
+        self._plot_buffers: dict[tuple[str, str], np.ndarray] = {}
+        self._dirty: set[tuple[str, str]] = set()
+        self._lock = Lock()
+        self._stop_refreshing = Event()
+        self._refresh_thread: Thread | None = None
+
     def live_plot_figures(self, dims_dict: dict[tuple[str, str], list]):
         """Generates the figures for live plotting the S21 parameter from the experiment results.
 
@@ -135,35 +161,94 @@ class ExperimentLivePlot:
             warnings.filterwarnings("ignore")
             display(self._live_plot_fig)
 
-    def live_plot(self, data: np.ndarray, qprogram_name: str, measurement_name: str):
+    def live_plot(
+        self,
+        data: np.ndarray,
+        qprogram_name: str,
+        measurement_name: str,
+        indices: tuple | None = None,
+        value: Any = None,
+    ):
         """Live plots the S21 parameter from the experiment results.
 
-        Args:
-            qprogram (int | str, optional): The index or name of the quantum program. Defaults to 0.
-            measurement (int | str, optional): The index or name of the measurement. Defaults to 0.
+        When ``indices`` is given, only the cells written at ``data[indices]`` are updated in the plot buffer, taking
+        their values from ``value`` when it holds all of them, or reading just those cells back from ``data`` otherwise.
+        Without ``indices``, the whole ``data`` is read.
 
-        Raises:
-            NotImplementedError: If the data has more than 2 dimensions.
+        Args:
+            data (np.ndarray): The results dataset of the measurement, with the I/Q values in the last dimension.
+            qprogram_name (str): The name of the quantum program.
+            measurement_name (str): The name of the measurement.
+            indices (tuple, optional): The indices of ``data`` just written. Defaults to None.
+            value (Any, optional): The value just written at ``data[indices]``. Defaults to None.
         """
-
-        def decibels(s21: np.ndarray):
-            """Convert result values from s21 into dB"""
-            s21[s21 == 0j] = np.nan
-            return 20 * np.log10(np.abs(s21))
-
+        key = (qprogram_name, measurement_name)
         n_dimensions = len(data.shape) - 1
-        qprogram_num = self.live_plot_dict[qprogram_name, measurement_name]
 
-        # Calculate S21
-        s21 = data[..., 0] + 1j * data[..., 1]
-        s21 = decibels(s21)
+        if indices is None:
+            region: tuple = (...,)
+            cells = np.asarray(data)
+        else:
+            region = tuple(indices[:n_dimensions])
+            cells = self._written_cells(data, tuple(indices), value)
 
-        if n_dimensions == 1:
-            self._live_plot_fig.data[qprogram_num].y = s21.T
-        elif n_dimensions == 2:
-            self._live_plot_fig.data[qprogram_num].z = s21.T
+        # Calculate S21
+        s21 = decibels(cells[..., 0] + 1j * cells[..., 1])
+
+        with self._lock:
+            if key not in self._plot_buffers:
+                self._plot_buffers[key] = np.full(data.shape[:-1], np.nan)
+            self._plot_buffers[key][region] = s21
+            self._dirty.add(key)
+
+        if indices is None or self.refresh_interval <= 0:
+            self.refresh()
+        elif self._refresh_thread is None:
+            self._stop_refreshing.clear()
+            self._refresh_thread = Thread(target=self._refresh_periodically, name="qililab-live-plot", daemon=True)
+            self._refresh_thread.start()
+
+    @staticmethod
+    def _written_cells(data: np.ndarray, indices: tuple, value: Any) -> np.ndarray:
+        """Returns the I/Q values of the cells written at ``data[indices]``, with the I/Q values in the last dimension."""
+        if (
+            value is not None
+            and len(indices) < len(data.shape)
+            and all(isinstance(index, (int, np.integer)) for index in indices)
+        ):
+            return np.broadcast_to(np.asarray(value), data.shape[len(indices) :])
+        # The write selected single I/Q components or used slices: read back only the cells it touched
+        return np.asarray(data[tuple(indices[: len(data.shape) - 1])])
+
+    def refresh(self):
+        """Updates the figure with the plot buffers written since the last refresh and exports it to PNG."""
+        with self._lock:
+            updates = {key: self._plot_buffers[key].copy() for key in self._dirty}
+            self._dirty.clear()
+
+        for key, s21 in updates.items():
+            qprogram_num = self.live_plot_dict[key]
+            if s21.ndim == 1:
+                self._live_plot_fig.data[qprogram_num].y = s21.T
+            elif s21.ndim == 2:
+                self._live_plot_fig.data[qprogram_num].z = s21.T
 
         folder = os.path.dirname(self.path)
         path = os.path.join(folder, ExperimentLivePlot.LIVE_PLOT_NAME)
 
         self._live_plot_fig.write_image(path)
+
+    def _refresh_periodically(self):
+        """Refreshes the figure every ``refresh_interval`` seconds, if it changed, until :meth:`close` is called."""
+        while not self._stop_refreshing.wait(self.refresh_interval):
+            if self._dirty:
+                self.refresh()
+
+    def close(self):
+        """Stops the background refreshes and refreshes the figure one last time with the pending writes."""
+        if self._refresh_thread is not None:
+            self._stop_refreshing.set()
+            self._refresh_thread.join()
+            self._refresh_thread = None
+        if self._dirty:
+            self.refresh()
@@ -12,14 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # mypy: disable-error-code="attr-defined"
+import json
 import os
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
 import h5py
 import matplotlib.pyplot as plt
 import numpy as np
+from xarray import DataArray, Dataset, Variable
+from xarray.backends import BackendArray
+from xarray.core import indexing
 
 
 @dataclass
@@ -30,6 +35,115 @@ class DimensionInfo:
     values: list[np.ndarray]
 
 
+class ExperimentResultsView:
+    """Lazy view of a results dataset of an :class:`ExperimentResults` file.
+
+    Nothing is read from the file until the view is indexed: numpy-style basic indexing (integers, slices and
+    ``...``) is translated to an HDF5 hyperslab selection, so looking at a line cut of a large sweep only reads that
+    line. Views are only valid while the :class:`ExperimentResults` they come from is open.
+
+    A complex view, see :meth:`as_complex`, hides the last (I/Q) dimension of the dataset and converts only the values
+    read to complex numbers ``I + 1j * Q``.
+
+    Args:
+        dataset (h5py.Dataset): The results dataset.
+        complex_values (bool, optional): Whether to combine the I/Q values of the last dimension into complex numbers.
+            Defaults to False.
+    """
+
+    def __init__(self, dataset: h5py.Dataset, complex_values: bool = False):
+        self.dataset = dataset
+        self.complex_values = complex_values
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the view."""
+        return self.dataset.shape[:-1] if self.complex_values else self.dataset.shape
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the view."""
+        return len(self.shape)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the values read from the view."""
+        return np.result_type(self.dataset.dtype, np.complex64) if self.complex_values else self.dataset.dtype
+
+    @cached_property
+    def dims(self) -> list[DimensionInfo]:
+        """Labels and loop values of each dimension of the view, as returned by :meth:`ExperimentResults.get`."""
+        dims = [
+            DimensionInfo(labels=dim.label.split(","), values=[values[()] for values in dim.values()])
+            for dim in self.dataset.dims
+        ]
+        return dims[:-1] if self.complex_values else dims
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        """Reads the values selected by ``key`` from the file."""
+        if not self.complex_values:
+            return self.dataset[key]
+        key = key if isinstance(key, tuple) else (key,)
+        # Keep the whole I/Q dimension, which is the last one of the dataset
+        key += (slice(None),) if any(index is Ellipsis for index in key) else (...,)
+        iq = self.dataset[key]
+        return iq[..., 0] + 1j * iq[..., 1]
+
+    def as_complex(self) -> "ExperimentResultsView":
+        """Returns a view of the same dataset with the I/Q values combined into complex numbers."""
+        return ExperimentResultsView(self.dataset, complex_values=True)
+
+    def memmap(self) -> np.ndarray:
+        """Maps the dataset into memory, without reading it.
+
+        Only possible for datasets stored contiguously and uncompressed, see ``ResultsStorageLayout``. For a complex view,
+        the I/Q values are reinterpreted as complex numbers without copying them.
+
+        Returns:
+            np.ndarray: A read-only memory-mapped array.
+
+        Raises:
+            ValueError: If the dataset is chunked, compressed or has not been written yet.
+        """
+        offset = self.dataset.id.get_offset()
+        if self.dataset.chunks is not None or offset is None:
+            raise ValueError(
+                "Only datasets stored contiguously and already written can be memory-mapped. Use slicing instead."
+            )
+        array = np.memmap(
+            self.dataset.file.filename, mode="r", dtype=self.dataset.dtype, shape=self.dataset.shape, offset=offset
+        )
+        return array.view(self.dtype)[..., 0] if self.complex_values else array
+
+    def to_xarray(self) -> DataArray:
+        """Returns the view as a lazily loaded ``xarray.DataArray``, with the loop values as coordinates.
+
+        Values are only read from the file when the array is indexed, computed on, or loaded with ``.load()``.
+        """
+        labels = [dim.labels[0] for dim in self.dims]
+        coords = {dim.labels[0]: dim.values[0] for dim in self.dims if dim.values}
+        variable = Variable(labels, indexing.LazilyIndexedArray(_LazyResultsArray(self)))
+        return Dataset({ExperimentResults.RESULTS_PATH: variable}, coords=coords)[ExperimentResults.RESULTS_PATH]
+
+
+class _LazyResultsArray(BackendArray):
+    """Adapter reading the values of an :class:`ExperimentResultsView` when xarray indexes them."""
+
+    def __init__(self, view: ExperimentResultsView):
+        self.view = view
+        self.shape = view.shape
+        self.dtype = np.dtype(view.dtype)
+
+    def __getitem__(self, key: indexing.ExplicitIndexer) -> np.ndarray:
+        return indexing.explicit_indexing_adapter(key, self.shape, indexing.IndexingSupport.BASIC, self._getitem)
+
+    def _getitem(self, key: tuple) -> np.ndarray:
+        return np.asarray(self.view[key])
+
+
 class ExperimentResults:
     """Provides methods to access the experiment results stored in an HDF5 file."""
 
@@ -41,17 +155,21 @@ class ExperimentResults:
     PLATFORM_PATH = "platform"
     EXECUTED_AT_PATH = "executed_at"
     EXECUTION_TIME_PATH = "execution_time"
+    PROFILE_PATH = "profile"
 
     S21_PLOT_NAME = "S21.png"
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, chunk_cache_bytes: int = 64 * 1024 * 1024):
         """Initializes the ExperimentResults instance.
 
         Args:
             path (str): The file path to the HDF5 results file.
-            slurm_execution (bool): Flag that defines if the liveplot will be held through Dash or a notebook cell. Defaults to True.
+            chunk_cache_bytes (int): Size in bytes of the cache of recently read chunks of each results dataset, so that
+                reading nearby slices of chunked datasets does not read and decompress the same chunks again.
+                Defaults to 64 MiB.
         """
         self.path = path
+        self.chunk_cache_bytes = chunk_cache_bytes
         # To hold links to the data of the results for in-memory access
         self.data: dict[tuple[str, str], Any] = {}
         # To hold links to dimensions of the results for in-memory access
@@ -64,7 +182,9 @@ class ExperimentResults:
         Returns:
             ExperimentResults: The ExperimentResults instance.
         """
-        self._file = h5py.File(self.path, mode="r", libver="latest")
+        self._file = h5py.File(
+            self.path, mode="r", libver="latest", rdcc_nbytes=self.chunk_cache_bytes, rdcc_nslots=10007
+        )
 
         # Prepare access to each results dataset and its dimensions
         for qprogram_name in self._file[ExperimentResults.QPROGRAMS_PATH]:
@@ -108,6 +228,31 @@ class ExperimentResults:
 
         return data, dims
 
+    def view(self, qprogram: int | str = 0, measurement: int | str = 0) -> ExperimentResultsView:
+        """Returns a lazy view of the results of a quantum program and measurement, that only reads what is sliced.
+
+        Unlike :meth:`get`, nothing is read from the file until the view is indexed:
+
+        .. code-block:: python
+
+            with ExperimentResults(path) as results:
+                view = results.view(qprogram=0, measurement=0)
+                line_cut = view.as_complex()[10, :]  # reads a single line of the sweep
+                data_array = view.as_complex().to_xarray()  # lazily loaded xarray.DataArray
+
+        Args:
+            qprogram (int | str, optional): The index or name of the quantum program. Defaults to 0.
+            measurement (int | str, optional): The index or name of the measurement. Defaults to 0.
+
+        Returns:
+            ExperimentResultsView: The view of the results dataset.
+        """
+        if isinstance(qprogram, int):
+            qprogram = f"QProgram_{qprogram}"
+        if isinstance(measurement, int):
+            measurement = f"Measurement_{measurement}"
+        return ExperimentResultsView(self.data[qprogram, measurement])
+
     def __getitem__(self, key: tuple):
         """Get an item from the results dataset.
 
@@ -178,6 +323,18 @@ class ExperimentResults:
         """
         return float(self._file[ExperimentResults.EXECUTION_TIME_PATH][()].decode("utf-8"))
 
+    @property
+    def profile(self) -> dict[str, Any] | None:
+        """Gets the execution profile recorded when the ``experiment_profiling_enabled`` setting is enabled.
+
+        Returns:
+            dict[str, Any] | None: The profile, as returned by ``ExecutionProfile.to_dict()``, or None if the
+                experiment was not profiled.
+        """
+        if ExperimentResults.PROFILE_PATH not in self._file:
+            return None
+        return json.loads(self._file[ExperimentResults.PROFILE_PATH][()].decode("utf-8"))
+
     # pylint: disable=too-many-statements
     def plot_S21(self, qprogram: int | str = 0, measurement: int | str = 0, save_plot: bool = True):
         """Plots the S21 parameter from the experiment results.
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # mypy: disable-error-code="attr-defined"
+import json
 from datetime import datetime
+from threading import Event, Lock, Thread
 from typing import Any, TypedDict
 
 import h5py
@@ -22,6 +24,7 @@ from qililab.qililab_settings import get_settings
 from qililab.result.database import DatabaseManager
 from qililab.result.experiment_live_plot import ExperimentLivePlot
 from qililab.result.experiment_results import ExperimentResults
+from qililab.result.results_storage import ChunkedWriteBuffer, ResultsStorageLayout
 
 
 class VariableMetadata(TypedDict):
@@ -106,6 +109,12 @@ class ExperimentResultsWriter(ExperimentResults):
     Allows for real-time saving of results from an experiment using the provided metadata information.
 
     Inherits from `ExperimentResults` to support both read and write operations.
+
+    The results datasets are stored following a :class:`.ResultsStorageLayout`: when chunked, the values written are
+    buffered in memory and written one chunk at a time, and a background thread writes the buffered values to the file
+    every ``flush_interval`` seconds, so that a crash loses at most the values of the last interval. Live plotting takes
+    the values from each write, and only reads back, through the buffer, the cells of writes that do not cover both the
+    I and Q values.
     """
 
     def __init__(
@@ -114,12 +123,15 @@ class ExperimentResultsWriter(ExperimentResults):
         metadata: ExperimentMetadata,
         db_metadata: ExperimentDataBaseMetadata | None,
         db_manager: DatabaseManager | None,
+        layout: ResultsStorageLayout | None = None,
     ):
         """Initializes the ExperimentResultsWriter instance.
 
         Args:
             path (str): The file path to save the HDF5 results file.
             metadata (ExperimentMetadata): The metadata describing the experiment structure.
+            layout (ResultsStorageLayout, optional): Storage layout of the results datasets. Defaults to the layout
+                configured by the ``experiment_results_*`` settings.
             live_plot (bool): Flag that abilitates live plotting. Defaults to True.
             slurm_execution (bool): Flag that defines if the liveplot will be held through Dash or a notebook cell. Defaults to True.
             port_number (int|None): Optional parameter for when slurm_execution is True. It defines the port number of the Dash server. Defaults to None.
@@ -132,6 +144,12 @@ class ExperimentResultsWriter(ExperimentResults):
         self._live_plot_true = get_settings().experiment_live_plot_enabled
         self._slurm_execution = get_settings().experiment_live_plot_on_slurm
         self._port_number = get_settings().experiment_live_plot_port
+        self._live_plot_refresh_interval = get_settings().experiment_live_plot_refresh_interval
+        self._layout = layout if layout is not None else ResultsStorageLayout.from_settings()
+        self._buffers: dict[tuple[str, str], ChunkedWriteBuffer] = {}
+        self._buffers_lock = Lock()
+        self._stop_flushing = Event()
+        self._flush_thread: Thread | None = None
 
     # pylint: disable=too-many-locals
     def _create_results_file(self):
@@ -192,7 +210,11 @@ class ExperimentResultsWriter(ExperimentResults):
                         loop.make_scale(label)
 
                     # Create the results dataset
-                    results_ds = mgroup.create_dataset(ExperimentResults.RESULTS_PATH, shape=measurement_data["shape"])
+                    results_ds = mgroup.create_dataset(
+                        ExperimentResults.RESULTS_PATH,
+                        shape=measurement_data["shape"],
+                        **self._layout.dataset_options(measurement_data["shape"]),
+                    )
 
                     # Attach dimension scales (loops) to the results dataset
                     for idx, dim_variables in enumerate(qprogram_data["dims"]):
@@ -213,7 +235,9 @@ class ExperimentResultsWriter(ExperimentResults):
 
             # Generate live plot figures
             if self._live_plot_true:
-                self.results_liveplot = ExperimentLivePlot(self.path, self._slurm_execution, self._port_number)
+                self.results_liveplot = ExperimentLivePlot(
+                    self.path, self._slurm_execution, self._port_number, self._live_plot_refresh_interval
+                )
                 self.results_liveplot.live_plot_figures(dims_dict)
 
     def _create_resuts_access(self):
@@ -224,6 +248,10 @@ class ExperimentResultsWriter(ExperimentResults):
                     self.data[qprogram_name, measurement_name] = self._file[
                         f"qprograms/{qprogram_name}/measurements/{measurement_name}/results"
                     ]
+                    if self._layout.is_chunked:
+                        self._buffers[qprogram_name, measurement_name] = ChunkedWriteBuffer(
+                            self.data[qprogram_name, measurement_name]
+                        )
 
     def __enter__(self):
         """Opens the HDF5 file and creates the structure for streaming.
@@ -249,11 +277,24 @@ class ExperimentResultsWriter(ExperimentResults):
 
         self._append_mode = True
 
+        if self._buffers and self._layout.flush_interval > 0:
+            self._stop_flushing.clear()
+            self._flush_thread = Thread(target=self._flush_periodically, name="qililab-results-flush", daemon=True)
+            self._flush_thread.start()
+
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Exit the context manager and close the HDF5 file and end experiment if there is a database."""
+        if self._flush_thread is not None:
+            self._stop_flushing.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        if self._live_plot_true and hasattr(self, "results_liveplot"):
+            self.results_liveplot.close()
         if self._file is not None:
+            self.flush()
+            self._buffers.clear()
             self._file.close()
         if self._db_metadata:
             self.measurement = self.measurement.end_experiment(self._db_manager.session, traceback)
@@ -270,9 +311,38 @@ class ExperimentResultsWriter(ExperimentResults):
             qprogram_name = f"QProgram_{qprogram_name}"
         if isinstance(measurement_name, int):
             measurement_name = f"Measurement_{measurement_name}"
-        self.data[qprogram_name, measurement_name][tuple(indices)] = value
+        buffer = self._buffers.get((qprogram_name, measurement_name))
+        if buffer is not None:
+            with self._buffers_lock:
+                buffer[tuple(indices)] = value
+        else:
+            self.data[qprogram_name, measurement_name][tuple(indices)] = value
         if self._live_plot_true:
-            self.results_liveplot.live_plot(self.data[qprogram_name, measurement_name], qprogram_name, measurement_name)
+            self.results_liveplot.live_plot(
+                buffer if buffer is not None else self.data[qprogram_name, measurement_name],
+                qprogram_name,
+                measurement_name,
+                indices=tuple(indices),
+                value=value,
+            )
+
+    def __getitem__(self, key: tuple):
+        """Gets an item from the results datasets, after writing the buffered values to them."""
+        self.flush()
+        return super().__getitem__(key)
+
+    def flush(self) -> None:
+        """Writes the buffered values to the results datasets and flushes the HDF5 file to disk."""
+        with self._buffers_lock:
+            for buffer in self._buffers.values():
+                buffer.flush()
+        if self._file is not None:
+            self._file.flush()
+
+    def _flush_periodically(self) -> None:
+        """Calls :meth:`flush` every ``flush_interval`` seconds until the writer is closed."""
+        while not self._stop_flushing.wait(self._layout.flush_interval):
+            self.flush()
 
     @ExperimentResults.platform.setter
     def platform(self, platform: str):
@@ -321,3 +391,15 @@ class ExperimentResultsWriter(ExperimentResults):
         if path in self._file:
             del self._file[path]
         self._file[path] = str(time)
+
+    @ExperimentResults.profile.setter
+    def profile(self, profile: dict[str, Any]):
+        """Sets the execution profile of the experiment.
+
+        Args:
+            profile (dict[str, Any]): The profile, as returned by ``ExecutionProfile.to_dict()``.
+        """
+        path = ExperimentResults.PROFILE_PATH
+        if path in self._file:
+            del self._file[path]
+        self._file[path] = json.dumps(profile)
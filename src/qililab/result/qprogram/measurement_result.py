@@ -39,12 +39,25 @@ class MeasurementResult(ABC):
                               reshaping or validation.
     """
 
+    __slots__ = ("bus", "shape")
+
     name: ResultName
 
     def __init__(self, bus: str, shape: tuple | None = None):
         self.bus: str = bus
         self.shape = shape
 
+    def __getstate__(self) -> dict:
+        """Returns the attributes of the result, stored either in slots or in its ``__dict__``, for serialization."""
+        state = {slot: getattr(self, slot) for slot in ("bus", "shape") if hasattr(self, slot)}
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restores the attributes returned by :meth:`__getstate__`."""
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+
     @property
     @abstractmethod
     def array(self) -> np.ndarray:
@@ -27,9 +27,12 @@ class QbloxMeasurementResult(MeasurementResult):
     single measurement obtained from the `Cluster.get_acquisitions` method.
 
     This class stores the acquisition results from a single measurement
-    obtained via the `Cluster.get_acquisitions` method. It parses and
-    reshapes the raw data provided by the Qblox hardware into standardized
-    numpy arrays for further processing.
+    obtained via the `Cluster.get_acquisitions` method. The lists of the raw
+    data provided by the Qblox hardware are converted once, on creation, into
+    contiguous read-only numpy buffers. The `array` and `threshold` properties
+    are views of these buffers reshaped into `shape`, computed on first access
+    and cached, and `deinterleave` separates intertwined acquisitions into
+    strided views without copying them.
 
     Args:
         name : ResultName
@@ -42,36 +45,151 @@ class QbloxMeasurementResult(MeasurementResult):
             Identifier for the acquisition bus.
     """
 
+    __slots__ = ("_array", "_threshold", "avg_cnt", "integration", "scope", "thresholded")
+
     name = ResultName.QBLOX_QPROGRAM_MEASUREMENT
 
     def __init__(self, bus: str, raw_measurement_data: dict, shape: tuple | None = None):
-        super().__init__(bus=bus)
-        self.raw_measurement_data = raw_measurement_data
-        self.shape = shape
+        super().__init__(bus=bus, shape=shape)
+        bins = raw_measurement_data.get("bins", {})
+        integration = bins.get("integration", {})
+        scope = raw_measurement_data.get("scope", {})
+        self._set_buffers(
+            integration=np.array([integration.get("path0", []), integration.get("path1", [])], dtype=float),
+            thresholded=np.array(bins.get("threshold", []), dtype=float),
+            avg_cnt=np.array(bins.get("avg_cnt", []), dtype=float),
+            scope=np.array(
+                [scope.get("path0", {}).get("data", []), scope.get("path1", {}).get("data", [])], dtype=float
+            ),
+        )
+
+    @classmethod
+    def from_buffers(
+        cls,
+        bus: str,
+        integration: np.ndarray,
+        thresholded: np.ndarray,
+        avg_cnt: np.ndarray,
+        scope: np.ndarray,
+        shape: tuple | None = None,
+    ) -> "QbloxMeasurementResult":
+        """Creates a result from numpy buffers, without copying them.
+
+        Args:
+            bus (str): Identifier for the acquisition bus.
+            integration (np.ndarray): Integrated I/Q values of the bins, with shape ``(2, bins)``.
+            thresholded (np.ndarray): Thresholded values of the bins, with shape ``(bins,)``.
+            avg_cnt (np.ndarray): Number of averages of the bins, with shape ``(bins,)``.
+            scope (np.ndarray): I/Q values of the scope acquisition, with shape ``(2, samples)``.
+            shape (tuple | None, optional): Expected shape to reshape the bins into. Defaults to None.
+
+        Returns:
+            QbloxMeasurementResult: The result viewing the buffers.
+        """
+        result = cls.__new__(cls)
+        MeasurementResult.__init__(result, bus=bus, shape=shape)
+        result._set_buffers(integration=integration, thresholded=thresholded, avg_cnt=avg_cnt, scope=scope)
+        return result
+
+    def _set_buffers(self, integration: np.ndarray, thresholded: np.ndarray, avg_cnt: np.ndarray, scope: np.ndarray):
+        for buffer in (integration, thresholded, avg_cnt, scope):
+            buffer.flags.writeable = False
+        self.integration = integration
+        self.thresholded = thresholded
+        self.avg_cnt = avg_cnt
+        self.scope = scope
+        self._array: np.ndarray | None = None
+        self._threshold: np.ndarray | None = None
+
+    def deinterleave(self, intertwined: int) -> list["QbloxMeasurementResult"]:
+        """Separates the acquisitions intertwined in the bins and scope of this result.
+
+        When ``intertwined`` acquisitions are performed at the same nested level, the bins are looped over while the
+        acquisition index remains constant, so acquisition ``i`` holds every ``intertwined``-th value starting at ``i``.
+
+        Args:
+            intertwined (int): Number of intertwined acquisitions.
+
+        Returns:
+            list[QbloxMeasurementResult]: One result per acquisition, viewing the buffers of this result. This same
+            result, inside a single-element list, if ``intertwined`` is 1.
+        """
+        if intertwined <= 1:
+            return [self]
+        return [
+            QbloxMeasurementResult.from_buffers(
+                bus=self.bus,
+                integration=self.integration[:, index::intertwined],
+                thresholded=self.thresholded[index::intertwined],
+                avg_cnt=self.avg_cnt[index::intertwined],
+                scope=self.scope[:, index::intertwined],
+                shape=self.shape,
+            )
+            for index in range(intertwined)
+        ]
+
+    @property
+    def raw_measurement_data(self) -> dict:
+        """Raw dictionary of measurement data, in the format returned by `Cluster.get_acquisitions`.
+
+        The dictionary is rebuilt from the numpy buffers on every access, so prefer `array`, `threshold` and the
+        buffers themselves.
+        """
+        return {
+            "scope": {"path0": {"data": self.scope[0].tolist()}, "path1": {"data": self.scope[1].tolist()}},
+            "bins": {
+                "integration": {"path0": self.integration[0].tolist(), "path1": self.integration[1].tolist()},
+                "threshold": self.thresholded.tolist(),
+                "avg_cnt": self.avg_cnt.tolist(),
+            },
+        }
 
     @property
     def array(self) -> np.ndarray:
         """Get I/Q data as an np.ndarray
 
+        The array is a read-only view of the integration buffer, cached after the first access.
+
         Returns:
             np.ndarray: The I/Q data
         """
-        path0 = self.raw_measurement_data["bins"]["integration"]["path0"]
-        path1 = self.raw_measurement_data["bins"]["integration"]["path1"]
-
-        array = np.array([path0, path1])
-        if self.shape:
-            array = array.reshape((2, *self.shape))
-        return array
+        if self._array is None:
+            self._array = self.integration.reshape((2, *self.shape)) if self.shape else self.integration
+        return self._array
 
     @property
     def threshold(self) -> np.ndarray:
         """Get the thresholded data as an np.ndarray.
 
+        The array is a read-only view of the threshold buffer, cached after the first access.
+
         Returns:
             np.ndarray: The thresholded data.
         """
-        array = np.array(self.raw_measurement_data["bins"]["threshold"])
-        if self.shape:
-            array = array.reshape((1, *self.shape))
-        return array
+        if self._threshold is None:
+            self._threshold = self.thresholded.reshape((1, *self.shape)) if self.shape else self.thresholded
+        return self._threshold
+
+    def __getstate__(self) -> dict:
+        """Returns the buffers of the result, without the cached arrays, for serialization."""
+        return {
+            "bus": self.bus,
+            "shape": self.shape,
+            "integration": self.integration,
+            "thresholded": self.thresholded,
+            "avg_cnt": self.avg_cnt,
+            "scope": self.scope,
+        }
+
+    def __setstate__(self, state: dict):
+        """Restores the state returned by :meth:`__getstate__`, or the raw measurement data of older serializations."""
+        if "raw_measurement_data" in state:
+            self.__init__(state["bus"], state["raw_measurement_data"], state.get("shape"))  # type: ignore[misc]
+            return
+        MeasurementResult.__init__(self, bus=state["bus"], shape=state.get("shape"))
+        self._set_buffers(
+            integration=np.array(state["integration"], dtype=float),
+            thresholded=np.array(state["thresholded"], dtype=float),
+            avg_cnt=np.array(state["avg_cnt"], dtype=float),
+            scope=np.array(state["scope"], dtype=float),
+        )
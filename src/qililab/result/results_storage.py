@@ -0,0 +1,209 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage layout and write buffering of the results datasets of an experiment."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from qililab.qililab_settings import get_settings
+
+if TYPE_CHECKING:
+    import h5py
+
+
+@dataclass
+class ResultsStorageLayout:
+    """Policy deciding how the results datasets of an experiment are stored in the HDF5 file.
+
+    Datasets are split into chunks of about ``chunk_bytes`` bytes that span the innermost loops of the sweep, so that
+    the values written by consecutive executions land in the same chunk. Chunking allows lossless compression and lets
+    :class:`ChunkedWriteBuffer` write whole chunks at once instead of one small hyperslab per loop point.
+
+    Args:
+        chunk_bytes (int, optional): Target size of a chunk in bytes. 0 stores the datasets contiguously, without
+            compression nor write buffering. Defaults to 1 MiB.
+        compression (Literal["gzip", "lzf"] | None, optional): Lossless compression filter. Defaults to None.
+        compression_level (int, optional): Compression level of the ``"gzip"`` filter, from 0 to 9. Defaults to 4.
+        shuffle (bool, optional): Whether to apply the byte shuffle filter before compressing, which usually improves
+            the compression ratio of floating point data. Defaults to True.
+        flush_interval (float, optional): Maximum time in seconds that written values stay in memory before being
+            written to the file. 0 only writes them when their chunk is complete and when the file is closed.
+            Defaults to 5.0.
+    """
+
+    chunk_bytes: int = 1024 * 1024
+    compression: Literal["gzip", "lzf"] | None = None
+    compression_level: int = 4
+    shuffle: bool = True
+    flush_interval: float = 5.0
+
+    @classmethod
+    def from_settings(cls) -> ResultsStorageLayout:
+        """Returns the layout configured by the ``experiment_results_*`` settings of :func:`.get_settings`."""
+        settings = get_settings()
+        return cls(
+            chunk_bytes=settings.experiment_results_chunk_bytes,
+            compression=settings.experiment_results_compression,
+            compression_level=settings.experiment_results_compression_level,
+            flush_interval=settings.experiment_results_flush_interval,
+        )
+
+    @property
+    def is_chunked(self) -> bool:
+        """Whether the datasets are chunked and their writes buffered."""
+        return self.chunk_bytes > 0
+
+    def chunk_shape(self, shape: tuple[int, ...], itemsize: int) -> tuple[int, ...] | None:
+        """Returns the chunk shape of a dataset, aligned with its innermost dimensions.
+
+        Dimensions are filled from the innermost one outwards while the chunk stays within ``chunk_bytes``: the
+        innermost dimensions are taken whole and the first one that does not fit is split.
+
+        Args:
+            shape (tuple[int, ...]): Shape of the dataset.
+            itemsize (int): Size in bytes of an element of the dataset.
+
+        Returns:
+            tuple[int, ...] | None: The chunk shape, or None if the dataset is not chunked.
+        """
+        if not self.is_chunked or not shape or 0 in shape:
+            return None
+        chunk = [1] * len(shape)
+        size = itemsize
+        for dimension in reversed(range(len(shape))):
+            chunk[dimension] = min(shape[dimension], max(1, self.chunk_bytes // size))
+            size *= chunk[dimension]
+            if chunk[dimension] < shape[dimension]:
+                break
+        return tuple(chunk)
+
+    def dataset_options(self, shape: tuple[int, ...], dtype: Any = "f4") -> dict[str, Any]:
+        """Returns the keyword arguments of ``h5py.Group.create_dataset`` implementing this layout.
+
+        Args:
+            shape (tuple[int, ...]): Shape of the dataset.
+            dtype (Any, optional): Data type of the dataset. Defaults to ``"f4"``, the default of h5py.
+
+        Returns:
+            dict[str, Any]: The ``chunks``, ``compression``, ``compression_opts`` and ``shuffle`` options.
+        """
+        chunks = self.chunk_shape(shape, np.dtype(dtype).itemsize)
+        if chunks is None:
+            return {}
+        options: dict[str, Any] = {"chunks": chunks}
+        if self.compression is not None:
+            options["compression"] = self.compression
+            if self.compression == "gzip":
+                options["compression_opts"] = self.compression_level
+            options["shuffle"] = self.shuffle
+        return options
+
+
+class ChunkedWriteBuffer:
+    """In-memory write-back buffer of a chunked results dataset.
+
+    Writes index the leading dimensions of the dataset with integers and give the values of all the remaining
+    dimensions, as the results of one execution of a QProgram do. They are collected in memory, one block per chunk of
+    the leading dimensions, and each block is written to the dataset with a single call once all its positions have been
+    written. :meth:`flush` writes the incomplete blocks too, keeping them in memory until they are complete.
+
+    Any other kind of write (slices, fancy indexing...) goes straight to the dataset. Reading the buffer reads the
+    dataset, after writing to it the blocks held in memory.
+
+    Args:
+        dataset (h5py.Dataset): The chunked dataset to write to.
+    """
+
+    def __init__(self, dataset: h5py.Dataset):
+        self.dataset = dataset
+        self._chunks: tuple[int, ...] = dataset.chunks or dataset.shape
+        self._leading: int | None = None
+        self._blocks: dict[tuple[int, ...], tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        """Number of blocks held in memory."""
+        return len(self._blocks)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the dataset."""
+        return self.dataset.shape
+
+    def __getitem__(self, indices: tuple) -> np.ndarray:
+        """Reads the dataset at ``indices``, after writing the blocks held in memory to it."""
+        self.flush()
+        return self.dataset[indices]
+
+    def __setitem__(self, indices: tuple, value: Any) -> None:
+        leading = len(indices)
+        shape = self.dataset.shape
+        if (
+            leading > self.dataset.ndim
+            or (self._leading is not None and leading != self._leading)
+            or not all(
+                isinstance(index, (int, np.integer)) and 0 <= index < size for index, size in zip(indices, shape)
+            )
+        ):
+            self.flush(keep=False)
+            self.dataset[indices] = value
+            return
+        self._leading = leading
+
+        position = tuple(int(index) for index in indices)
+        block_index = tuple(index // chunk for index, chunk in zip(position, self._chunks))
+        if block_index not in self._blocks:
+            selection = self._block_selection(block_index)
+            # Start from the stored values, so that flushing an incomplete block never overwrites earlier writes
+            self._blocks[block_index] = (
+                np.asarray(self.dataset[selection]),
+                np.zeros(tuple(bound.stop - bound.start for bound in selection), dtype=bool),
+            )
+        values, written = self._blocks[block_index]
+        offset = tuple(index - block * chunk for index, block, chunk in zip(position, block_index, self._chunks))
+        values[offset] = value
+        written[offset] = True
+        if written.all():
+            self._write_block(block_index)
+            del self._blocks[block_index]
+
+    def _block_selection(self, block_index: tuple[int, ...]) -> tuple[slice, ...]:
+        """Returns the slices of the leading dimensions covered by a block."""
+        return tuple(
+            slice(block * chunk, min((block + 1) * chunk, size))
+            for block, chunk, size in zip(block_index, self._chunks, self.dataset.shape)
+        )
+
+    def _write_block(self, block_index: tuple[int, ...]) -> None:
+        values, _ = self._blocks[block_index]
+        self.dataset[self._block_selection(block_index)] = values
+
+    def flush(self, keep: bool = True) -> None:
+        """Writes the blocks held in memory to the dataset.
+
+        Positions of a block that have not been written yet keep the value they had in the dataset.
+
+        Args:
+            keep (bool, optional): Whether to keep the incomplete blocks in memory, so that they are written again
+                once complete. Defaults to True.
+        """
+        for block_index in list(self._blocks):
+            self._write_block(block_index)
+        if not keep:
+            self._blocks.clear()
+            self._leading = None
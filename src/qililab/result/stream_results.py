@@ -13,6 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 import h5py
@@ -20,6 +21,7 @@ import numpy as np
 
 from qililab.instruments.qblox.qblox_module import QbloxModule
 from qililab.instruments.qdevil.qdevil_qdac2 import QDevilQDac2
+from qililab.result.results_storage import ChunkedWriteBuffer, ResultsStorageLayout
 from qililab.typings.enums import Parameter
 from qililab.utils.serialization import serialize
 
@@ -37,6 +39,12 @@ class StreamArray:
     This ensures that in the event of a runtime failure, you can still access results up to the point of failure
     from a resulting file.
 
+    By default every assignment is written to the file and flushed to disk. In buffered mode the results dataset is
+    chunked, assignments are coalesced in memory into whole chunks, and the file is only flushed every
+    ``flush_interval`` seconds or every ``flush_bytes`` bytes assigned, whichever comes first. The file is opened in
+    SWMR mode, so readers see the results up to the last flush. For sweeps too big to hold twice in memory,
+    ``keep_results=False`` drops the in-memory copy of the results, and reading from the ``StreamArray`` reads the file.
+
     Args:
         shape (list | tuple): Shape of the results array.
         loops (dict[str, np.ndarray] | dict[str, dict[str, Any]]): dictionary of loops with the name of the loop and the array.
@@ -45,6 +53,10 @@ class StreamArray:
         db_manager (DatabaseManager): database manager loaded from the database after setting the db parameters.
         qprogram (QProgram | None, optional): Qprogram of the experiment, if there is no Qprogram related to the results it is not mandatory. Defaults to None.
         optional_identifier (str | None, optional): String containing a description or any relevant information about the experiment. Defaults to None.
+        buffered (bool, optional): Whether to coalesce the assignments in memory and flush them periodically, instead of writing and flushing every assignment. Defaults to False.
+        flush_interval (float, optional): In buffered mode, maximum time in seconds between two flushes of the file. Defaults to 1.0.
+        flush_bytes (int, optional): In buffered mode, maximum number of bytes assigned between two flushes of the file. Defaults to 16 MiB.
+        keep_results (bool, optional): Whether to keep a copy of all the results in memory, in ``results``. Defaults to True.
     """
 
     path: str
@@ -66,6 +78,10 @@ class StreamArray:
         autocalibration: bool = False,
         qubit_idx: int | str | list[str] | None = None,
         secondary_idx: int | str | list[str] | None = None,
+        buffered: bool = False,
+        flush_interval: float = 1.0,
+        flush_bytes: int = 16 * 1024 * 1024,
+        keep_results: bool = True,
     ):
         self.results: np.ndarray
         self.shape = [shape] if isinstance(shape, int) else shape
@@ -80,7 +96,14 @@ class StreamArray:
         self.autocalibration = autocalibration
         self.qubit_idx = qubit_idx
         self.second_idx = secondary_idx
+        self.buffered = buffered
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.keep_results = keep_results
         self._first_value = True
+        self._buffer: ChunkedWriteBuffer | None = None
+        self._pending_bytes = 0
+        self._last_flush = 0.0
 
     def __enter__(self):
         """The execution while the with StreamArray is created.
@@ -123,7 +146,6 @@ class StreamArray:
 
             # Save loops
             self._file = h5py.File(name=self.path, mode="w", libver="latest")
-            self._file.swmr_mode = True
 
             g = self._file.create_group(name="loops", track_order=True)
             for loop_name, array in self.loops.items():
@@ -135,16 +157,22 @@ class StreamArray:
                 else:
                     g.create_dataset(name=loop_name, data=array)
 
-            # Create results dataset only once
-            if len(self.shape) == len(self.loops.keys()):
-                self.results = np.zeros(shape=self.shape, dtype=np.complex128)
-                if self._file:
-                    self._dataset = self._file.create_dataset("results", data=self.results, dtype=np.complex128)
-            else:
-                self.results = np.zeros(shape=self.shape)
-                if self._file:
-                    self._dataset = self._file.create_dataset("results", data=self.results)
+            # Create results dataset only once, filled with zeros by HDF5 instead of from a zero-filled copy
+            shape = tuple(self.shape)
+            dtype = np.complex128 if len(self.shape) == len(self.loops.keys()) else np.float64
+            if self.keep_results:
+                self.results = np.zeros(shape=shape, dtype=dtype)
+            layout = ResultsStorageLayout() if self.buffered else ResultsStorageLayout(chunk_bytes=0)
+            self._dataset = self._file.create_dataset(
+                "results", shape=shape, dtype=dtype, **layout.dataset_options(shape, dtype)
+            )
+            self._buffer = ChunkedWriteBuffer(self._dataset) if self.buffered else None
+
+            # SWMR mode does not allow creating new objects, so it is only enabled once the file structure is complete
+            self._file.swmr_mode = True
             self._file.flush()
+            self._pending_bytes = 0
+            self._last_flush = perf_counter()
 
             return self
         except Exception as e:
@@ -160,16 +188,36 @@ class StreamArray:
             value (float | np.complexfloating): value to save.
         """
         if self._file is not None and self._dataset is not None:
-            self._dataset[key] = value
+            if self._buffer is not None:
+                self._buffer[key if isinstance(key, tuple) else (key,)] = value
+                self._pending_bytes += np.asarray(value).nbytes
+                if self._pending_bytes >= self.flush_bytes or perf_counter() - self._last_flush >= self.flush_interval:
+                    self.flush()
+            else:
+                self._dataset[key] = value
+                self._file.flush()
+        if self.keep_results:
+            self.results[key] = value
+
+    def flush(self):
+        """Writes the assignments buffered in memory to the results dataset and flushes the file to disk."""
+        if self._buffer is not None:
+            self._buffer.flush(keep=False)
+        if self._file is not None:
             self._file.flush()
-        self.results[key] = value
+        self._pending_bytes = 0
+        self._last_flush = perf_counter()
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Exits the context manager."""
         if self._file is not None:
+            self.flush()
             self._file.__exit__()
             self._file = None
+            self._buffer = None
 
+        # With asynchronous database writes, the measurement has to be committed before it can be ended
+        self.db_manager.flush()
         self.measurement = self.measurement.end_experiment(self.db_manager.session, traceback)
 
     def add_fitting(self, path: str, parameters: dict[str, Any] | None = None):
@@ -196,23 +244,27 @@ class StreamArray:
         Args:
             index (int): item's index.
         """
-        return self.results[index]
+        if self.keep_results:
+            return self.results[index]
+        return self._read_results(index)
 
     def __len__(self):
         """Gets length of results."""
-        return len(self.results)
+        if self.keep_results:
+            return len(self.results)
+        return self.shape[0]
 
     def __iter__(self):
         """Gets iterator of results."""
-        return iter(self.results)
+        return iter(self.results if self.keep_results else self._read_results())
 
     def __str__(self):
         """Gets string representation of results."""
-        return str(self.results)
+        return str(self.results if self.keep_results else self._read_results())
 
     def __repr__(self):
         """Gets string representation of results."""
-        return repr(self.results)
+        return repr(self.results if self.keep_results else self._read_results())
 
     def __contains__(self, item: dict[str, Any]):
         """Returns if an item is contained in results.
@@ -223,7 +275,15 @@ class StreamArray:
         Returns:
             bool: True if an item is contained in results.
         """
-        return item in self.results
+        return item in (self.results if self.keep_results else self._read_results())
+
+    def _read_results(self, index: Any = ()) -> np.ndarray:
+        """Reads results from the file, for when they are not kept in memory."""
+        if self._file is not None:
+            self.flush()
+            return self._dataset[index]
+        with h5py.File(name=self.path, mode="r") as file:
+            return file["results"][index]
 
     def _get_debug(self):
         if any(
@@ -18,12 +18,16 @@ from .asdict_factory import dict_factory
 from .bus_sorter import argsort_buses, sort_buses
 from .coordinate_decomposition import coordinate_decompose
 from .dictionaries import merge_dictionaries
+from .execution_profiler import ExecutionProfile, ExecutionProfiler
 from .factory import Factory
+from .fingerprint import fingerprint
 from .nested_dict_iterator import nested_dict_to_pandas_dataframe
 from .sentinels import Sentinel, Unset
 from .singleton import Singleton, SingletonABC
 
 __all__ = [
+    "ExecutionProfile",
+    "ExecutionProfiler",
     "Factory",
     "Sentinel",
     "Singleton",
@@ -32,6 +36,7 @@ __all__ = [
     "argsort_buses",
     "coordinate_decompose",
     "dict_factory",
+    "fingerprint",
     "merge_dictionaries",
     "nested_dict_to_pandas_dataframe",
     "sort_buses",
@@ -0,0 +1,247 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Instrumentation recording where the time of compiling and executing QPrograms goes."""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ContextManager
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass
+class PhaseStatistics:
+    """Wall time spent in a phase of the compilation or execution.
+
+    Phases running concurrently in several threads (e.g. uploads to different clusters) add up their times, so the
+    total of a phase can be larger than the wall time of the execution.
+    """
+
+    count: int = 0
+    """Number of times the phase was entered."""
+    total: float = 0.0
+    """Total time spent in the phase, in seconds."""
+    min: float = float("inf")
+    """Shortest time spent in the phase, in seconds."""
+    max: float = 0.0
+    """Longest time spent in the phase, in seconds."""
+
+    @property
+    def mean(self) -> float:
+        """Mean time spent in the phase, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Records one run of the phase.
+
+        Args:
+            elapsed (float): Time spent in the phase, in seconds.
+        """
+        self.count += 1
+        self.total += elapsed
+        self.min = min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+
+
+@dataclass
+class BusStatistics:
+    """Data moved to and from the sequencer of a bus, and size of the programs run on it."""
+
+    uploads: int = 0
+    """Number of sequences sent to the sequencer."""
+    skipped_uploads: int = 0
+    """Number of uploads skipped because the sequencer already held the same sequence."""
+    bytes_uploaded: int = 0
+    """Size of the serialized sequences sent to the sequencer."""
+    bytes_downloaded: int = 0
+    """Size of the acquisition data fetched from the sequencer, counting 8 bytes per value."""
+    waveform_samples: int = 0
+    """Samples of waveform and weight memory used by the last sequence."""
+    instructions: int = 0
+    """Number of Q1ASM instructions of the last sequence."""
+
+
+@dataclass
+class ExecutionProfile:
+    """Structured record of an :class:`ExecutionProfiler`, see :meth:`ExecutionProfiler.profile`."""
+
+    phases: dict[str, PhaseStatistics] = field(default_factory=dict)
+    """Wall time statistics of each phase, by phase name."""
+    buses: dict[str, BusStatistics] = field(default_factory=dict)
+    """Data transfer and program size statistics, by bus alias."""
+    counters: dict[str, int] = field(default_factory=dict)
+    """Event counters, such as compilation cache hits, by name."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the profile as a dictionary of plain Python types.
+
+        Returns:
+            dict[str, Any]: Dictionary with the ``phases``, ``buses`` and ``counters`` of the profile.
+        """
+        return {
+            "phases": {
+                name: asdict(statistics) | {"min": statistics.min if statistics.count else 0.0, "mean": statistics.mean}
+                for name, statistics in self.phases.items()
+            },
+            "buses": {alias: asdict(statistics) for alias, statistics in self.buses.items()},
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self) -> str:
+        """Returns the profile serialized as a JSON string, see :meth:`to_dict`."""
+        return json.dumps(self.to_dict())
+
+    def __str__(self) -> str:
+        lines = [f"{'phase':<40}{'count':>8}{'total [s]':>12}{'mean [s]':>12}{'max [s]':>12}"]
+        lines.extend(
+            f"{name:<40}{statistics.count:>8}{statistics.total:>12.6f}{statistics.mean:>12.6f}{statistics.max:>12.6f}"
+            for name, statistics in self.phases.items()
+        )
+        if self.buses:
+            lines.append("")
+            lines.append(f"{'bus':<40}{'uploads':>8}{'sent [B]':>12}{'fetched [B]':>12}{'samples':>10}{'instr.':>8}")
+            lines.extend(
+                f"{alias:<40}{statistics.uploads:>8}{statistics.bytes_uploaded:>12}{statistics.bytes_downloaded:>12}"
+                f"{statistics.waveform_samples:>10}{statistics.instructions:>8}"
+                for alias, statistics in self.buses.items()
+            )
+        if self.counters:
+            lines.append("")
+            lines.extend(f"{name:<40}{value:>8}" for name, value in self.counters.items())
+        return "\n".join(lines)
+
+
+class ExecutionProfiler:
+    """Records the wall time of the phases of compiling and executing QPrograms, and per-bus transfer statistics.
+
+    A profiler only records while it is active, see :meth:`activate` or :meth:`.Platform.profile`. The compilers,
+    instruments and platform report to the active profiler through :func:`profile_phase` and
+    :func:`get_active_profiler`, which cost a single check when no profiler is active. The active profiler is stored in
+    a context variable, so profilers activated by different threads do not interfere with each other. Recording is
+    thread-safe, and the Qblox execution threads and the background compilation of pipelined experiments run in a copy
+    of the context of the thread that started them (see :func:`contextvars.copy_context`), so their phases are recorded
+    too.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._phases: dict[str, PhaseStatistics] = {}
+        self._buses: dict[str, BusStatistics] = {}
+        self._counters: dict[str, int] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Context manager measuring the wall time of the code it wraps as a run of phase ``name``.
+
+        Args:
+            name (str): Name of the phase, e.g. ``"execute.upload"``.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            with self._lock:
+                self._phases.setdefault(name, PhaseStatistics()).add(elapsed)
+
+    def count(self, name: str, increment: int = 1) -> None:
+        """Increments the counter ``name``.
+
+        Args:
+            name (str): Name of the counter, e.g. ``"compilation_cache.hits"``.
+            increment (int, optional): Amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + increment
+
+    def record_bus(self, bus: str, **statistics: int) -> None:
+        """Updates the statistics of a bus.
+
+        ``uploads``, ``skipped_uploads``, ``bytes_uploaded`` and ``bytes_downloaded`` are accumulated, while
+        ``waveform_samples`` and ``instructions`` describe the last sequence and are overwritten.
+
+        Args:
+            bus (str): Alias of the bus.
+            **statistics (int): Values of the :class:`BusStatistics` fields to update.
+        """
+        with self._lock:
+            bus_statistics = self._buses.setdefault(bus, BusStatistics())
+            for name, value in statistics.items():
+                if name in {"waveform_samples", "instructions"}:
+                    setattr(bus_statistics, name, value)
+                else:
+                    setattr(bus_statistics, name, getattr(bus_statistics, name) + value)
+
+    def profile(self) -> ExecutionProfile:
+        """Returns a copy of everything recorded so far.
+
+        Returns:
+            ExecutionProfile: The recorded phases, bus statistics and counters.
+        """
+        with self._lock:
+            return ExecutionProfile(
+                phases={name: PhaseStatistics(**asdict(statistics)) for name, statistics in self._phases.items()},
+                buses={alias: BusStatistics(**asdict(statistics)) for alias, statistics in self._buses.items()},
+                counters=dict(self._counters),
+            )
+
+    def reset(self) -> None:
+        """Forgets everything recorded so far."""
+        with self._lock:
+            self._phases.clear()
+            self._buses.clear()
+            self._counters.clear()
+
+    @contextmanager
+    def activate(self) -> Iterator[ExecutionProfiler]:
+        """Context manager making this profiler the active one while it is open.
+
+        Activations can be nested: on exit, the previously active profiler, if any, becomes active again.
+
+        Yields:
+            ExecutionProfiler: This profiler.
+        """
+        token = _active_profiler.set(self)
+        try:
+            yield self
+        finally:
+            _active_profiler.reset(token)
+
+
+_active_profiler: ContextVar[ExecutionProfiler | None] = ContextVar("qililab_active_profiler", default=None)
+
+
+def get_active_profiler() -> ExecutionProfiler | None:
+    """Returns the active :class:`ExecutionProfiler`, or None if nothing is being profiled."""
+    return _active_profiler.get()
+
+
+def profile_phase(name: str) -> ContextManager[None]:
+    """Context manager recording the wall time of the code it wraps as phase ``name`` of the active profiler.
+
+    It does nothing when no profiler is active.
+
+    Args:
+        name (str): Name of the phase.
+    """
+    profiler = _active_profiler.get()
+    return profiler.phase(name) if profiler is not None else nullcontext()
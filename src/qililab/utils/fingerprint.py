@@ -0,0 +1,136 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Structural fingerprints of arbitrary Python objects, used as content-addressed cache keys."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import deque
+from enum import Enum
+from typing import Any
+
+import numpy as np
+
+from qililab.core.variables import Variable, VariableExpression
+
+# Attributes that identify an object instance but carry no structural information.
+_IGNORED_ATTRIBUTES = frozenset({"_uuid"})
+
+
+class _FingerprintEncoder:
+    """Walks an object graph and feeds a canonical byte encoding of it into a hash.
+
+    Variables are renamed to their order of first appearance, so two objects built independently with the same
+    structure (e.g. two identical ``QProgram`` instances, whose variables and blocks have different uuids) produce the
+    same fingerprint.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._variables: dict[Variable, int] = {}
+        self._seen: dict[int, int] = {}
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _child(self) -> _FingerprintEncoder:
+        child = _FingerprintEncoder()
+        child._variables = dict(self._variables)
+        return child
+
+    def encode_and_digest(self, obj: Any) -> str:
+        self.encode(obj)
+        return self.hexdigest()
+
+    def _write(self, tag: str, payload: bytes | str = b"") -> None:
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self._hash.update(f"{tag}:{len(payload)}:".encode())
+        self._hash.update(payload)
+
+    def encode(self, obj: Any) -> None:
+        """Encodes ``obj`` recursively into the hash."""
+        if obj is None or isinstance(obj, (bool, str, bytes)):
+            self._write(type(obj).__name__, obj if isinstance(obj, (str, bytes)) else repr(obj))
+        elif isinstance(obj, Variable) and not isinstance(obj, VariableExpression):
+            index = self._variables.setdefault(obj, len(self._variables))
+            self._write("variable", f"{index}|{obj.label}|{obj.domain.name}")
+        elif isinstance(obj, Enum):
+            self._write("enum", f"{type(obj).__qualname__}.{obj.name}")
+        elif isinstance(obj, (int, float, complex)):
+            self._write(type(obj).__name__, repr(obj))
+        elif isinstance(obj, np.ndarray):
+            array = np.ascontiguousarray(obj)
+            self._write("ndarray", f"{array.dtype.str}|{array.shape}")
+            self._write("data", array.tobytes() if array.dtype != object else repr(array.tolist()))
+        elif isinstance(obj, np.generic):
+            self._write("npscalar", f"{obj.dtype.str}|{obj.tobytes().hex()}")
+        elif isinstance(obj, (list, tuple, deque)):
+            self._write(type(obj).__name__, str(len(obj)))
+            for item in obj:
+                self.encode(item)
+        elif isinstance(obj, dict):
+            self._write("dict", str(len(obj)))
+            for key, value in obj.items():
+                self.encode(key)
+                self.encode(value)
+        elif isinstance(obj, (set, frozenset)):
+            # Sets have no stable iteration order, so every element is fingerprinted on its own and sorted.
+            digests = sorted(self._child().encode_and_digest(item) for item in obj)
+            self._write("set", "|".join(digests))
+        else:
+            self._encode_object(obj)
+
+    def _encode_object(self, obj: Any) -> None:
+        key = id(obj)
+        if key in self._seen:
+            # Back-reference to an object already encoded (shared subtree or cycle).
+            self._write("ref", str(self._seen[key]))
+            return
+        self._seen[key] = len(self._seen)
+        self._write("object", f"{type(obj).__module__}.{type(obj).__qualname__}")
+        if hasattr(obj, "__fingerprint__"):
+            self.encode(obj.__fingerprint__())
+            return
+        state = getattr(obj, "__dict__", None)
+        if state is None and hasattr(obj, "__slots__"):
+            state = {slot: getattr(obj, slot) for slot in obj.__slots__ if hasattr(obj, slot)}
+        if state is None:
+            self._write("repr", repr(obj))
+            return
+        for name in sorted(state):
+            if name in _IGNORED_ATTRIBUTES:
+                continue
+            self._write("attr", name)
+            self.encode(state[name])
+
+
+def fingerprint(*objects: Any) -> str:
+    """Computes a structural fingerprint of the given objects.
+
+    The fingerprint depends only on the content of the objects (attribute names and values, array bytes, the
+    relative identity of QProgram variables...), not on their memory addresses or uuids. Objects can customise what
+    gets fingerprinted by defining a ``__fingerprint__()`` method returning the data to hash instead of their
+    ``__dict__``.
+
+    Args:
+        *objects: Objects to fingerprint together.
+
+    Returns:
+        str: Hexadecimal digest identifying the structure of ``objects``.
+    """
+    encoder = _FingerprintEncoder()
+    encoder.encode(objects)
+    return encoder.hexdigest()
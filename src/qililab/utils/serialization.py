@@ -12,14 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from io import StringIO
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any, TypeVar, overload
+from typing import Any, Literal, TypeVar, overload
 
+import dill
+
+from qililab import __version__
+from qililab.config import logger
+from qililab.qililab_settings import get_settings
 from qililab.yaml import yaml
 
 T = TypeVar("T")
 
+BINARY_EXTENSION = ".qlbin"
+"""Extension of the files that :func:`serialize_to` writes in the binary format by default."""
+
+_BINARY_MAGIC = b"\x89QLBIN\r\n"
+_BINARY_VERSION = 1
+# Sections are aligned so that the arrays loaded from them are aligned too
+_BINARY_ALIGNMENT = 64
+_HEADER_LENGTH = struct.Struct("<Q")
+
 
 class SerializationError(Exception):
     """Custom exception for serialization errors."""
@@ -49,18 +70,29 @@ def serialize(obj: Any) -> str:
         raise SerializationError(f"Failed to serialize object {e}") from e
 
 
-def serialize_to(obj: Any, file: str) -> None:
-    """Serialize an object to a YAML file.
+def serialize_to(obj: Any, file: str, format: Literal["yaml", "binary"] | None = None) -> None:
+    """Serialize an object to a YAML or binary file.
+
+    The binary format pickles the object, storing its numpy arrays as separate aligned sections of the file, together
+    with a hash of its content, see :func:`content_hash`. It is much faster to load than YAML, and
+    :func:`deserialize_from` maps the arrays lazily from the file, so large waveforms are only read when used.
 
     Args:
         obj (Any): The object to serialize.
-        file (str): The file path where the YAML data will be written.
+        file (str): The file path where the data will be written.
+        format (Literal["yaml", "binary"], optional): Format of the file. Defaults to binary if ``file`` ends with
+            :data:`BINARY_EXTENSION`, and to YAML otherwise.
 
     Raises:
         SerializationError: If serialization to file fails.
     """
+    if format is None:
+        format = "binary" if str(file).endswith(BINARY_EXTENSION) else "yaml"
     try:
-        yaml.dump(obj, Path(file))
+        if format == "binary":
+            _dump_binary(obj, file)
+        else:
+            yaml.dump(obj, Path(file))
     except Exception as e:
         raise SerializationError(f"Failed to serialize object {e} to file {file}") from e
 
@@ -105,10 +137,14 @@ def deserialize_from(file: str, cls: type[T]) -> T: ...
 
 
 def deserialize_from(file: str, cls: type[T] | None = None) -> Any | T:
-    """Deserialize a YAML file to an object.
+    """Deserialize a YAML or binary file to an object.
+
+    The format of the file is detected from its content. With the ``serialization_cache_dir`` setting, YAML files are
+    also saved in the binary format in that directory, named after the hash of their content, and later loads of an
+    unchanged file read the binary copy instead of parsing the YAML again.
 
     Args:
-        file (str): The file path of the YAML file to deserialize.
+        file (str): The file path of the YAML or binary file to deserialize.
         cls (type[T], optional): The class type to cast the deserialized object to. Defaults to None.
 
     Raises:
@@ -117,10 +153,142 @@ def deserialize_from(file: str, cls: type[T] | None = None) -> Any | T:
     Returns:
         Any | T: The deserialized object, optionally cast to the specified class type.
     """
+    binary = False
     try:
-        result = yaml.load(Path(file))
+        binary = _is_binary(file)
+        result = _load_binary(file) if binary else _load_yaml(file)
     except Exception as e:
+        if binary:
+            raise DeserializationError(f"Failed to deserialize binary file {file}: {e}") from e
         raise DeserializationError(f"Failed to deserialize YAML string {e} from file {file}") from e
     if cls is not None and not isinstance(result, cls):
         raise DeserializationError(f"Deserialized object is not of type {cls.__name__}")
     return result
+
+
+def content_hash(file: str | Path) -> str:
+    """Returns the SHA-256 hash of the content of a YAML or binary serialized file.
+
+    The hash of binary files is stored in their header when they are written, so it is returned without reading the
+    rest of the file. The hash of YAML files is computed from their bytes.
+
+    Args:
+        file (str | Path): The file path of the YAML or binary file.
+
+    Returns:
+        str: The hexadecimal SHA-256 hash.
+    """
+    if _is_binary(file):
+        with open(file, "rb") as stream:
+            return _read_binary_header(stream)["hash"]
+    digest = hashlib.sha256()
+    with open(file, "rb") as stream:
+        for block in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _is_binary(file: str | Path) -> bool:
+    with open(file, "rb") as stream:
+        return stream.read(len(_BINARY_MAGIC)) == _BINARY_MAGIC
+
+
+def _align(position: int) -> int:
+    return -(-position // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+
+
+def _dump_binary(obj: Any, file: str | Path) -> None:
+    """Writes ``obj`` to ``file`` in the binary format.
+
+    The file holds the magic bytes, the length of a JSON header, the header and the sections it lists: the pickle of
+    the object, followed by the out-of-band buffers of its numpy arrays. It is written to a temporary file that then
+    replaces ``file``, so that processes mapping the previous file keep reading consistent data.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    try:
+        payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Objects holding lambdas or local functions need dill, as in their YAML representation
+        buffers = []
+        with BytesIO() as stream:
+            dill.Pickler(stream, protocol=5, buffer_callback=buffers.append).dump(obj)
+            payload = stream.getvalue()
+
+    sections = [memoryview(payload), *(buffer.raw() for buffer in buffers)]
+    digest = hashlib.sha256()
+    layout = []
+    position = 0
+    for section in sections:
+        digest.update(section)
+        position = _align(position)
+        layout.append([position, section.nbytes])
+        position += section.nbytes
+    header = json.dumps({"version": _BINARY_VERSION, "hash": digest.hexdigest(), "sections": layout}).encode()
+    data_offset = _align(len(_BINARY_MAGIC) + _HEADER_LENGTH.size + len(header))
+
+    directory = os.path.dirname(os.path.abspath(file))
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=".qililab-", delete=False) as stream:
+        try:
+            stream.write(_BINARY_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+            for (offset, _), section in zip(layout, sections):
+                stream.seek(data_offset + offset)
+                stream.write(section)
+            stream.close()
+            # Temporary files are only accessible by their owner: give the file the permissions of a new file instead
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(stream.name, 0o666 & ~umask)
+            os.replace(stream.name, file)
+        except BaseException:
+            stream.close()
+            os.remove(stream.name)
+            raise
+
+
+def _read_binary_header(stream) -> dict[str, Any]:
+    """Reads the header of a binary file, adding the offset of its first section as ``data_offset``."""
+    if stream.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+        raise ValueError("Not a qililab binary file.")
+    (length,) = _HEADER_LENGTH.unpack(stream.read(_HEADER_LENGTH.size))
+    header = json.loads(stream.read(length))
+    if header["version"] > _BINARY_VERSION:
+        raise ValueError(f"Unsupported version {header['version']} of the qililab binary format.")
+    header["data_offset"] = _align(len(_BINARY_MAGIC) + _HEADER_LENGTH.size + length)
+    return header
+
+
+def _load_binary(file: str | Path) -> Any:
+    """Loads an object written by :func:`_dump_binary`.
+
+    The file is memory mapped copy-on-write: the numpy arrays of the object are views of the mapping, so their data is
+    only read from disk when accessed, and modifying them never modifies the file.
+    """
+    with open(file, "rb") as stream:
+        header = _read_binary_header(stream)
+        data = memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_COPY))
+    start = header["data_offset"]
+    payload, *buffers = (data[start + offset : start + offset + size] for offset, size in header["sections"])
+    return pickle.loads(payload, buffers=buffers)  # noqa: S301
+
+
+def _load_yaml(file: str | Path) -> Any:
+    """Loads a YAML file, through the binary cache of the ``serialization_cache_dir`` setting if configured."""
+    cache_dir = get_settings().serialization_cache_dir
+    if cache_dir is None:
+        return yaml.load(Path(file))
+
+    # The pickled objects depend on the classes of qililab, so each version has its own cache entries
+    cached = Path(cache_dir) / f"{content_hash(file)}-{__version__}{BINARY_EXTENSION}"
+    if cached.is_file():
+        try:
+            return _load_binary(cached)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Ignoring the invalid cached copy {cached} of {file}: {e}")
+
+    result = yaml.load(Path(file))
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        _dump_binary(result, cached)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Could not cache {file} in binary format: {e}")
+    return result
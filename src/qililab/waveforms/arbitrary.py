@@ -83,3 +83,11 @@ class Arbitrary(Waveform):
             normalized = np.full_like(downsampled, self.samples.min())
 
         return normalized
+
+    def get_duration(self) -> int:
+        """Get the duration of the waveform.
+
+        Returns:
+            int: The duration of the waveform in ns.
+        """
+        return len(self.samples)
@@ -18,6 +18,7 @@ import numpy as np
 
 from qililab.yaml import yaml
 
+from .envelope_cache import cached_envelope
 from .waveform import Waveform
 
 
@@ -61,6 +62,7 @@ class Chained(Waveform):
         super().__init__()
         self.waveforms = waveforms
 
+    @cached_envelope
     def envelope(self, resolution: int = 1) -> np.ndarray:
         """Retrieve the envelope of the chained waveform.
 
@@ -0,0 +1,118 @@
+# Copyright 2025 Qilimanjaro Quantum Tech
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache of waveform envelopes shared by all the waveforms."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Concatenate, ParamSpec, TypeVar, cast
+
+import numpy as np
+
+from qililab.qililab_settings import get_settings
+
+if TYPE_CHECKING:
+    from .waveform import Waveform
+
+W = TypeVar("W", bound="Waveform")
+P = ParamSpec("P")
+
+
+class EnvelopeCache:
+    """Least-recently-used cache of envelopes, bounded by the total size in bytes of the stored arrays."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, str, float], np.ndarray] = OrderedDict()
+        self._lock = Lock()
+        self.nbytes: int = 0
+        """Total size in bytes of the cached envelopes."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str, float]) -> np.ndarray | None:
+        """Returns the envelope stored under ``key``, or None if there is none.
+
+        Args:
+            key (tuple[str, str, float]): Envelope method, waveform digest and resolution.
+
+        Returns:
+            np.ndarray | None: The cached envelope, or None on a miss.
+        """
+        with self._lock:
+            envelope = self._entries.get(key)
+            if envelope is not None:
+                self._entries.move_to_end(key)
+            return envelope
+
+    def put(self, key: tuple[str, str, float], envelope: np.ndarray, max_bytes: int) -> None:
+        """Stores ``envelope`` under ``key``, evicting the least recently used envelopes above ``max_bytes``.
+
+        Args:
+            key (tuple[str, str, float]): Envelope method, waveform digest and resolution.
+            envelope (np.ndarray): Envelope to store.
+            max_bytes (int): Maximum total size in bytes of the cached envelopes.
+        """
+        if envelope.nbytes > max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key).nbytes
+            self._entries[key] = envelope
+            self.nbytes += envelope.nbytes
+            while self.nbytes > max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Removes all the cached envelopes."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+envelope_cache = EnvelopeCache()
+"""Envelope cache shared by all the waveforms, bounded by the ``waveform_envelope_cache_bytes`` setting."""
+
+
+def cached_envelope(
+    envelope: Callable[Concatenate[W, P], np.ndarray],
+) -> Callable[Concatenate[W, P], np.ndarray]:
+    """Decorator caching the result of a waveform's ``envelope(resolution=1)`` method in :data:`envelope_cache`.
+
+    Envelopes are keyed by the digest of the waveform, so waveforms with equal parameters share their envelope, and
+    changing a parameter of a waveform makes it compute its envelope again.
+
+    Cached envelopes are shared, so they are returned as read-only arrays: modifying them in place raises
+    ``ValueError: assignment destination is read-only``. Copy them before modifying them.
+    """
+
+    @wraps(envelope)
+    def wrapper(self: W, /, *args: P.args, **kwargs: P.kwargs) -> np.ndarray:
+        max_bytes = get_settings().waveform_envelope_cache_bytes
+        if max_bytes == 0:
+            return envelope(self, *args, **kwargs)
+        resolution = cast("float", kwargs.get("resolution", args[0] if args else 1))
+        key = (envelope.__qualname__, self.digest(), resolution)
+        cached = envelope_cache.get(key)
+        if cached is None:
+            cached = np.asarray(envelope(self, *args, **kwargs))
+            cached.flags.writeable = False
+            envelope_cache.put(key, cached, max_bytes)
+        return cached
+
+    return wrapper
@@ -20,6 +20,7 @@ from scipy.special import erf
 from qililab.core.variables import Domain, requires_domain
 from qililab.yaml import yaml
 
+from .envelope_cache import cached_envelope
 from .waveform import Waveform
 
 
@@ -43,6 +44,7 @@ class FlatTop(Waveform):
         self.smooth_duration = smooth_duration
         self.buffer = buffer
 
+    @cached_envelope
     def envelope(self, resolution: int = 1) -> np.ndarray:
         """Smoothed square pulse with error function on the edges rise envelope.
 
@@ -19,6 +19,7 @@ import numpy as np
 from qililab.core.variables import Domain, requires_domain
 from qililab.yaml import yaml
 
+from .envelope_cache import cached_envelope
 from .waveform import Waveform
 
 
@@ -78,6 +79,7 @@ class Gaussian(Waveform):
         self.duration = duration
         self.num_sigmas = num_sigmas
 
+    @cached_envelope
     def envelope(self, resolution: int = 1) -> np.ndarray:
         """Gaussian envelope centered with respect to the pulse.
 
@@ -19,6 +19,7 @@ import numpy as np
 from qililab.core.variables import Domain, requires_domain
 from qililab.yaml import yaml
 
+from .envelope_cache import cached_envelope
 from .gaussian import Gaussian
 
 
@@ -41,6 +42,7 @@ class GaussianDragCorrection(Gaussian):
         super().__init__(amplitude=amplitude, duration=duration, num_sigmas=num_sigmas)
         self.drag_coefficient = drag_coefficient
 
+    @cached_envelope
     def envelope(self, resolution: int = 1) -> np.ndarray:
         """Returns the envelope corresponding to the drag correction.
 
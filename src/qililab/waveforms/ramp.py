@@ -19,6 +19,7 @@ import numpy as np
 from qililab.core.variables import Domain, requires_domain
 from qililab.yaml import yaml
 
+from .envelope_cache import cached_envelope
 from .waveform import Waveform
 
 
@@ -54,6 +55,7 @@ class Ramp(Waveform):
         self.to_amplitude = to_amplitude
         self.duration = duration
 
+    @cached_envelope
     def envelope(self, resolution: int = 1) -> np.ndarray:
         """Constant amplitude envelope.
 
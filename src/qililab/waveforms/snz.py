@@ -20,6 +20,7 @@ from qililab.config import logger
 from qililab.core.variables import Domain, requires_domain
 from qililab.yaml import yaml
 
+from .envelope_cache import cached_envelope
 from .waveform import Waveform
 
 
@@ -43,6 +44,7 @@ class SuddenNetZero(Waveform):
         self.b = b
         self.t_phi = t_phi
 
+    @cached_envelope
     def envelope(self, resolution: float = 1.0) -> np.ndarray:
         """SuddenNetZero envelope.
 
@@ -19,6 +19,7 @@ import numpy as np
 from qililab.core.variables import Domain, requires_domain
 from qililab.yaml import yaml
 
+from .envelope_cache import cached_envelope
 from .waveform import Waveform
 
 
@@ -53,6 +54,7 @@ class Square(Waveform):
         self.amplitude = amplitude
         self.duration = duration
 
+    @cached_envelope
     def envelope(self, resolution: int = 1) -> np.ndarray:
         """Constant amplitude envelope.
 
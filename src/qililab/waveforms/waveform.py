@@ -14,10 +14,22 @@
 
 """Waveform protocol class."""
 
+import hashlib
+import weakref
 from abc import ABC, abstractmethod
+from typing import Any, Protocol
 
 import numpy as np
 
+_SCALAR_TYPES = (bool, int, float, complex, str, bytes, type(None), np.generic)
+_digests: "weakref.WeakKeyDictionary[Waveform, str]" = weakref.WeakKeyDictionary()
+
+
+class _Hasher(Protocol):
+    """Hash object of :mod:`hashlib` that waveform digests are fed into."""
+
+    def update(self, data: bytes, /) -> None: ...
+
 
 class Waveform(ABC):
     """Waveforms describes the pulses envelope's shapes. ``Waveform`` is their abstract base class.
@@ -26,6 +38,10 @@ class Waveform(ABC):
 
     The `envelope` method will create the corresponding array of each shape.
 
+    Every waveform also has a :meth:`digest` identifying its envelope, computed from its parameters (and from the
+    bytes of its samples for arrays), which is used to deduplicate waveforms without comparing their envelopes, and to
+    share the envelopes of equal waveforms through the cache of :mod:`qililab.waveforms.envelope_cache`.
+
     Derived: :class:`Arbitrary`,  :class:`Square`, :class:`Gaussian` and :class:`GaussianDragCorrection`.
     """
 
@@ -33,6 +49,9 @@ class Waveform(ABC):
     def envelope(self, resolution: int = 1) -> np.ndarray:
         """Returns the pulse height for each time step.
 
+        Envelopes of analytic waveforms are cached and shared between equal waveforms, so the returned array may be
+        read-only: copy it before modifying it in place.
+
         Returns:
             np.ndarray: Height of the envelope for each time step.
         """
@@ -44,3 +63,63 @@ class Waveform(ABC):
             int: The duration of the waveform in ns.
         """
         return len(self.envelope())
+
+    def digest(self) -> str:
+        """Returns a digest identifying the envelope of the waveform.
+
+        Two waveforms of the same class with equal parameters have the same digest. The digest is computed from the
+        parameters of the waveform, hashing the raw bytes of array parameters (like the samples of :class:`Arbitrary`)
+        and the digest of nested waveforms, so it is cheap to compute and never depends on how arrays are printed.
+        Subclasses can override :meth:`_digest_parameters` to choose which parameters identify them.
+
+        Returns:
+            str: Hexadecimal digest of the waveform.
+        """
+        if (digest := _digests.get(self)) is not None:
+            return digest
+        parameters = self._digest_parameters()
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{type(self).__module__}.{type(self).__qualname__}".encode())
+        for name, value in sorted(parameters.items()):
+            hasher.update(f"|{name}=".encode())
+            _update_digest(hasher, value)
+        digest = hasher.hexdigest()
+        # Arrays, lists and nested waveforms can be modified in place without going through `__setattr__`, so only
+        # digests of waveforms with scalar parameters are remembered.
+        if all(isinstance(value, _SCALAR_TYPES) for value in parameters.values()):
+            _digests[self] = digest
+        return digest
+
+    def _digest_parameters(self) -> dict[str, Any]:
+        """Returns the parameters that identify the envelope of the waveform. Defaults to all its attributes.
+
+        Returns:
+            dict[str, Any]: Parameters of the waveform, by name.
+        """
+        return vars(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _digests.pop(self, None)
+        super().__setattr__(name, value)
+
+    def __fingerprint__(self) -> str:
+        """Fingerprints the waveform by its digest, see :func:`qililab.utils.fingerprint`."""
+        return self.digest()
+
+
+def _update_digest(hasher: _Hasher, value: Any) -> None:
+    """Feeds a canonical encoding of a waveform parameter into ``hasher``."""
+    if isinstance(value, Waveform):
+        hasher.update(f"waveform:{value.digest()}".encode())
+    elif isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        hasher.update(f"ndarray:{array.dtype.str}:{array.shape}:".encode())
+        hasher.update(array.tobytes() if array.dtype != object else repr(array.tolist()).encode())
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}:{len(value)}:".encode())
+        for item in value:
+            _update_digest(hasher, item)
+    elif isinstance(value, np.generic):
+        hasher.update(f"{type(value).__name__}:{value.item()!r}".encode())
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r}".encode())
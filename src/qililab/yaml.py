@@ -13,6 +13,7 @@
 # limitations under the License.
 import base64
 import types
+import zlib
 from collections import deque
 from uuid import UUID
 
@@ -20,20 +21,48 @@ import numpy as np
 from dill import dumps, loads
 from ruamel.yaml import YAML
 
+from qililab.qililab_settings import get_settings
+
 
 def ndarray_representer(representer, data):
-    """Representer for ndarray"""
-    value = {"dtype": str(data.dtype), "shape": data.shape, "data": data.ravel().tolist()}
+    """Representer for ndarray
+
+    Arrays with at least ``yaml_ndarray_binary_min_size`` elements store their raw little-endian bytes in base64,
+    compressed with zlib if ``yaml_ndarray_compression_level`` is positive. Smaller arrays, and arrays of Python
+    objects or structured types, store their elements as a list.
+    """
+    settings = get_settings()
+    if data.dtype.kind in "OV" or data.size < settings.yaml_ndarray_binary_min_size:
+        value = {"dtype": str(data.dtype), "shape": data.shape, "data": data.ravel().tolist()}
+        return representer.represent_mapping("!ndarray", value)
+
+    array = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("<"))
+    raw = array.tobytes()
+    value = {"dtype": array.dtype.str, "shape": data.shape, "encoding": "base64"}
+    if settings.yaml_ndarray_compression_level > 0:
+        raw = zlib.compress(raw, settings.yaml_ndarray_compression_level)
+        value["compression"] = "zlib"
+    value["data"] = base64.b64encode(raw).decode("ascii")
     return representer.represent_mapping("!ndarray", value)
 
 
 def ndarray_constructor(constructor, node):
-    """Constructor for ndarray"""
+    """Constructor for ndarray, from both the binary and the list representations."""
     mapping = constructor.construct_mapping(node, deep=True)
     dtype = np.dtype(mapping["dtype"])
     shape = tuple(mapping["shape"])
     data = mapping["data"]
-    return np.array(data, dtype=dtype).reshape(shape)
+    if mapping.get("encoding") != "base64":
+        return np.array(data, dtype=dtype).reshape(shape)
+
+    raw = base64.b64decode(data)
+    compression = mapping.get("compression")
+    if compression == "zlib":
+        raw = zlib.decompress(raw)
+    elif compression is not None:
+        raise ValueError(f"Unknown compression '{compression}' of a serialized ndarray.")
+    # A bytearray keeps the loaded array writable without copying it again
+    return np.frombuffer(bytearray(raw), dtype=dtype).reshape(shape)
 
 
 def deque_representer(representer, data):
@@ -5,6 +5,7 @@ import pytest
 
 from qililab.instrument_controllers.qblox.qblox_cluster_controller import QbloxClusterController
 from qililab.instruments.qblox import QbloxQCM
+from qililab.instruments.qblox.qblox_emulator import EmulatedCluster
 from qililab.platform import Platform
 from qililab.data_management import build_platform
 
@@ -14,6 +15,11 @@ def fixture_platform():
     return build_platform(runcard="tests/instrument_controllers/qblox/qblox_runcard.yaml")
 
 
+@pytest.fixture(name="platform_emulator")
+def fixture_platform_emulator():
+    return build_platform(runcard="tests/instrument_controllers/qblox/qblox_runcard_emulator.yaml")
+
+
 @pytest.fixture(name="platform_ext_trigger")
 def fixture_platform_ext_trigger():
     return build_platform(runcard="tests/instrument_controllers/qblox/qblox_runcard_ext_trigger.yaml")
@@ -99,3 +105,45 @@ class TestQbloxClusterController:
         )
         with pytest.raises(ValueError):
             controller_instance._check_supported_modules()
+
+    def test_initialize_emulated_device(self, platform_emulator: Platform):
+        """Test the controller builds an emulated cluster with the modules of the runcard."""
+        controller_instance = platform_emulator.instrument_controllers.get_instrument_controller(
+            alias="cluster_controller"
+        )
+        assert controller_instance.emulated
+
+        controller_instance._initialize_device()
+
+        assert isinstance(controller_instance.device, EmulatedCluster)
+        assert controller_instance.device.modules[0].module_type() == "QCM"
+        assert controller_instance.device.modules[1].module_type() == "QRM"
+        assert not controller_instance.device.modules[2].present
+        assert controller_instance.device.model.seed == 1234
+
+    def test_connect_and_initial_setup_on_emulated_device(self, platform_emulator: Platform):
+        """Test the modules are set up on the emulated cluster without any hardware."""
+        controller_instance = platform_emulator.instrument_controllers.get_instrument_controller(
+            alias="cluster_controller"
+        )
+
+        controller_instance.connect()
+        controller_instance.initial_setup()
+        for module in controller_instance.modules:
+            module.initial_setup()
+
+        qcm, qrm = controller_instance.modules
+        assert qcm.device is controller_instance.device.modules[0]
+        assert qrm.device is controller_instance.device.modules[1]
+        assert controller_instance.device.reference_source() == "internal"
+        assert qrm.device.sequencers[0].nco_freq() == 100000000.0
+
+    def test_to_dict_includes_emulator(self, platform: Platform, platform_emulator: Platform):
+        """Test the emulator settings are only serialized when they are set."""
+        controller_instance = platform.instrument_controllers.get_instrument_controller(alias="cluster_controller")
+        emulated_instance = platform_emulator.instrument_controllers.get_instrument_controller(
+            alias="cluster_controller"
+        )
+
+        assert "emulator" not in controller_instance.to_dict()
+        assert emulated_instance.to_dict()["emulator"] == {"noise": 0.0, "seed": 1234}
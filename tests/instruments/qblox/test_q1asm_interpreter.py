@@ -0,0 +1,206 @@
+"""Tests for the Q1ASM parser and interpreter."""
+
+import math
+
+import pytest
+
+from qililab.instruments.qblox.q1asm_interpreter import Q1ASMInterpreter, Q1ASMProgram
+
+
+def run(source: str, **kwargs):
+    return Q1ASMInterpreter(Q1ASMProgram.parse(source), **kwargs).run()
+
+
+class TestQ1ASMProgram:
+    """Unit tests of the Q1ASM parser."""
+
+    def test_parse_resolves_labels_registers_and_immediates(self):
+        program = Q1ASMProgram.parse(
+            """
+            setup:
+                wait_sync 4  # comment
+            main: move 10, R0
+            loop_0:
+                play 0, 1, 100
+                loop R0, @loop_0
+                stop
+            """
+        )
+
+        assert program.labels == {"setup": 0, "main": 1, "loop_0": 2}
+        assert program.instructions[1] == ("move", (10, ~0))
+        assert program.instructions[3] == ("loop", (~0, 2))
+
+    def test_parse_is_cached(self):
+        source = "wait 4\nstop"
+        assert Q1ASMProgram.parse(source) is Q1ASMProgram.parse(source)
+
+    @pytest.mark.parametrize(
+        "source, message",
+        [
+            ("jump @main", "unknown Q1ASM instruction"),
+            ("wait 4, 4", "takes 1 operands"),
+            ("jmp @nowhere", "unknown label"),
+            ("move 1, R64", "does not exist"),
+            ("add R0, 1, 2", "must be a register"),
+        ],
+    )
+    def test_parse_errors(self, source: str, message: str):
+        with pytest.raises(ValueError, match=message):
+            Q1ASMProgram.parse(source)
+
+    def test_has_conditionals(self):
+        assert Q1ASMProgram.parse("set_cond 1, 1, 0, 4\nstop").has_conditionals
+        assert not Q1ASMProgram.parse("stop").has_conditionals
+
+
+class TestQ1ASMInterpreter:
+    """Unit tests of the Q1ASM interpreter."""
+
+    def test_nested_loops_and_timing(self):
+        trace = run(
+            """
+                move 3, R0
+            outer:
+                move 2, R1
+            inner:
+                play 0, 1, 20
+                loop R1, @inner
+                wait 100
+                loop R0, @outer
+                stop
+            """
+        )
+
+        assert trace.completed
+        assert len(trace.plays) == 6
+        assert trace.play_times == [0, 20, 140, 160, 280, 300]
+        assert trace.duration == 3 * 140
+
+    def test_arithmetic_wraps_to_32_bits(self):
+        interpreter = Q1ASMInterpreter(
+            Q1ASMProgram.parse("move 0, R0\nsub R0, 1, R1\nadd R1, 2, R2\nnot R0, R3\nasl R2, 4, R4\nstop")
+        )
+        interpreter.run()
+
+        assert interpreter.registers[1] == 0xFFFFFFFF
+        assert interpreter.registers[2] == 1
+        assert interpreter.registers[3] == 0xFFFFFFFF
+        assert interpreter.registers[4] == 16
+
+    def test_jumps(self):
+        trace = run(
+            """
+                move 5, R0
+                jge R0, 5, @greater
+                play 0, 0, 4
+            greater:
+                jlt R0, 5, @end
+                play 1, 1, 4
+            end:
+                stop
+            """
+        )
+
+        assert trace.plays == [(1, 1, 1.0, 1.0)]
+
+    def test_parameters_are_applied_at_the_next_real_time_instruction(self):
+        trace = run(
+            """
+                set_awg_gain 16384, -16384
+                set_awg_offs 32767, 0
+                wait 8
+                set_freq 400000000
+                set_ph 250000000
+                play 0, 1, 4
+                set_mrk 3
+                upd_param 4
+                stop
+            """
+        )
+
+        assert trace.plays == [(0, 1, pytest.approx(16384 / 32767), pytest.approx(-16384 / 32767))]
+        assert trace.play_times == [8]
+        assert trace.offset_times == [8]
+        assert trace.offsets == [(1.0, 0.0)]
+        assert trace.nco == [(8, 1e8, pytest.approx(math.pi / 2), False)]
+        assert trace.markers == [(12, 3)]
+
+    def test_gain_from_registers_uses_twos_complement(self):
+        trace = run("move 0, R0\nsub R0, 3276, R0\nset_awg_gain R0, R0\nplay 0, 1, 4\nstop")
+
+        assert trace.plays[0][2] == pytest.approx(-0.1, abs=1e-4)
+
+    def test_acquisitions(self):
+        trace = run(
+            """
+                move 0, R0
+                move 3, R1
+            loop:
+                acquire 0, R0, 100
+                acquire_weighed 1, R0, 2, 3, 200
+                add R0, 1, R0
+                loop R1, @loop
+                stop
+            """
+        )
+
+        assert trace.acquisitions[:2] == [(0, 0, 0, 100, None), (100, 1, 0, 200, (2, 3))]
+        assert [acquisition[2] for acquisition in trace.acquisitions] == [0, 0, 1, 1, 2, 2]
+
+    @pytest.mark.parametrize("arrivals, played", [([], False), ([500], True), ([5000], False)])
+    def test_conditional_on_latched_triggers(self, arrivals: list[int], played: bool):
+        trace = run(
+            """
+                set_latch_en 1, 4
+                latch_rst 4
+                wait 2400
+                set_cond 1, 1, 0, 100
+                play 0, 1, 100
+                set_cond 0, 0, 0, 4
+                upd_param 4
+                stop
+            """,
+            triggers={1: arrivals},
+        )
+
+        assert bool(trace.plays) is played
+        assert trace.duration == 2512
+
+    def test_conditional_operators(self):
+        source = "set_latch_en 1, 4\nwait 100\nset_cond 1, 3, {operator}, 4\nplay 0, 1, 4\nstop"
+        triggers = {1: [50]}
+
+        assert [bool(run(source.format(operator=operator), triggers=triggers).plays) for operator in range(6)] == [
+            True,  # OR
+            False,  # NOR
+            False,  # AND
+            True,  # NAND
+            True,  # XOR
+            False,  # XNOR
+        ]
+
+    def test_wait_trigger_waits_for_the_next_trigger(self):
+        trace = run("wait_trigger 2, 4\nplay 0, 1, 4\nstop", triggers={2: [1000]})
+
+        assert trace.play_times == [1004]
+
+    def test_empty_program_stops_immediately(self):
+        trace = run("")
+
+        assert trace.completed
+        assert trace.duration == 0
+
+    def test_program_without_stop_raises(self):
+        with pytest.raises(ValueError, match="without reaching a stop"):
+            run("wait 4")
+
+    def test_illegal_raises(self):
+        with pytest.raises(ValueError, match="illegal"):
+            run("illegal")
+
+    def test_infinite_loop_is_interrupted(self):
+        trace = run("main:\nplay 0, 1, 4\njmp @main", max_instructions=100)
+
+        assert not trace.completed
+        assert len(trace.plays) == 50
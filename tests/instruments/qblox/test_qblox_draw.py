@@ -137,6 +137,17 @@ def fixture_qp_plat_draw_qrm() -> QProgram:
     return qp
 
 
+@pytest.fixture(name="qp_long_waits")
+def fixture_qp_long_waits() -> QProgram:
+    qp = QProgram()
+    frequency = qp.variable(label="drive", domain=Domain.Frequency)
+    with qp.for_loop(frequency, 10e6, 100e6, 10e6):
+        qp.set_frequency(bus="drive", frequency=frequency)
+        qp.play(bus="drive", waveform=Square(amplitude=1, duration=100))
+        qp.wait("drive", 50_000)
+    return qp
+
+
 @pytest.fixture(name="platform")
 def fixture_platform():
     return build_platform(runcard=Galadriel.runcard)
@@ -619,3 +630,39 @@ class TestQBloxDraw:
         out = qblox_draw._interrupt_acquire(param)
         assert len(out["acquiring_status"]) == len(out["intermediate_frequency"])
         assert out["acquiring_status"] == [1, 1]
+
+    def test_long_waits(self, qp_long_waits: QProgram):
+        """Test long waits are drawn as zeros without changing the waveforms played around them."""
+        results = QbloxCompiler().compile(qp_long_waits)
+        pio.renderers.default = "json"
+        _, data_draw = QbloxDraw().draw(sequencer=results, runcard_data=None)
+
+        waveform = data_draw["drive"][0]
+        assert len(waveform) == 10 * 50_100
+        for iteration in range(10):
+            start = iteration * 50_100
+            np.testing.assert_allclose(waveform[start], 0.70710678, rtol=1e-6)
+            np.testing.assert_array_equal(waveform[start + 100 : start + 50_100], 0.0)
+        # the frequency of each iteration is applied from its play on
+        np.testing.assert_allclose(
+            waveform[50_100:50_104], 0.70710678 * np.cos(2 * np.pi * 0.02 * np.arange(4)), rtol=1e-6, atol=1e-12
+        )
+
+    def test_draw_downsamples_the_figure(self, qp_long_waits: QProgram):
+        """Test the traces of the figure are downsampled to max_points, keeping the extremes of the waveforms."""
+        results = QbloxCompiler().compile(qp_long_waits)
+        pio.renderers.default = "json"
+        figure, data_draw = QbloxDraw().draw(sequencer=results, runcard_data=None, max_points=1000)
+
+        waveform = data_draw["drive"][0]
+        assert len(waveform) == 10 * 50_100
+        assert len(figure.data[0].y) <= 1000
+        assert np.all(np.diff(figure.data[0].x) >= 0)
+        np.testing.assert_array_equal(figure.data[0].y, waveform[figure.data[0].x])
+        assert max(figure.data[0].y) == waveform.max()
+        assert min(figure.data[0].y) == waveform.min()
+
+        figure, _ = QbloxDraw().draw(sequencer=results, runcard_data=None)
+
+        assert len(figure.data[0].y) == len(waveform)
+        assert figure.data[0].x is None
@@ -0,0 +1,256 @@
+"""Tests for the emulated Qblox cluster."""
+
+import numpy as np
+import pytest
+
+from qililab.instruments.qblox.qblox_emulator import (
+    SCOPE_SAMPLES,
+    EmulatedCluster,
+    QbloxEmulatorModel,
+)
+
+READOUT_PROGRAM = """
+    setup:
+        wait_sync 4
+        upd_param 4
+    main:
+        move 0, R0
+        move 0, R1
+        move 100, R2
+    avg:
+        move 0, R0
+        move 0, R1
+        move 3, R3
+    loop:
+        set_awg_gain R1, R1
+        play 0, 1, 4
+        acquire_weighed 0, R0, 0, 1, 1000
+        add R0, 1, R0
+        add R1, 16383, R1
+        loop R3, @loop
+        loop R2, @avg
+        stop
+"""
+
+DRIVE_PROGRAM = """
+    setup:
+        set_latch_en 1, 4
+        wait_sync 4
+        upd_param 4
+    main:
+        latch_rst 4
+        wait 1400
+        set_cond 1, 1, 0, 100
+        play 0, 1, 100
+        set_cond 0, 0, 0, 4
+        upd_param 4
+        stop
+"""
+
+
+def readout_sequence(program: str = READOUT_PROGRAM, num_bins: int = 3) -> dict:
+    return {
+        "program": program,
+        "waveforms": {
+            "I": {"data": [1.0] * 1000, "index": 0},
+            "Q": {"data": [0.0] * 1000, "index": 1},
+        },
+        "weights": {
+            "I": {"data": [1.0] * 1000, "index": 0},
+            "Q": {"data": [1.0] * 1000, "index": 1},
+        },
+        "acquisitions": {"acquisition": {"num_bins": num_bins, "index": 0}},
+    }
+
+
+def drive_sequence() -> dict:
+    return {
+        "program": DRIVE_PROGRAM,
+        "waveforms": {"I": {"data": [0.5] * 100, "index": 0}, "Q": {"data": [0.0] * 100, "index": 1}},
+        "weights": {},
+        "acquisitions": {},
+    }
+
+
+@pytest.fixture(name="cluster")
+def fixture_cluster() -> EmulatedCluster:
+    return EmulatedCluster(name="cluster", modules={1: "QCM", 2: "QRM"}, model=QbloxEmulatorModel(seed=0))
+
+
+def run(*modules_and_sequencers):
+    for module, sequencer in modules_and_sequencers:
+        module.arm_sequencer(sequencer=sequencer)
+    for module, sequencer in modules_and_sequencers:
+        module.start_sequencer(sequencer=sequencer)
+
+
+class TestEmulatedCluster:
+    """Unit tests of the emulated cluster."""
+
+    def test_modules(self, cluster: EmulatedCluster):
+        assert len(cluster.modules) == 20
+        qcm, qrm, empty = cluster.modules[0], cluster.modules[1], cluster.modules[2]
+        assert qcm.is_qcm_type and not qcm.is_qrm_type
+        assert qrm.is_qrm_type and not qrm.is_rf_type
+        assert qrm.module_type() == "QRM"
+        assert not empty.present
+        assert len(qrm.sequencers) == 6
+
+    def test_parameters(self, cluster: EmulatedCluster):
+        sequencer = cluster.modules[1].sequencers[0]
+        assert sequencer.gain_awg_path0() == 1.0
+        assert sequencer.connect_out0() is None
+
+        sequencer.nco_freq(1e8)
+        cluster.modules[1].set("out0_offset", 0.1)
+        cluster.reference_source("external")
+
+        assert sequencer.nco_freq() == 1e8
+        assert cluster.modules[1].out0_offset() == 0.1
+        assert cluster.reference_source() == "external"
+
+        cluster.reset()
+
+        assert sequencer.nco_freq() == 0.0
+        assert cluster.reference_source() == "internal"
+
+    def test_acquisitions_integrate_the_looped_back_outputs(self, cluster: EmulatedCluster):
+        qrm = cluster.modules[1]
+        qrm.sequencers[0].sequence(readout_sequence())
+        run((qrm, 0))
+
+        assert qrm.get_acquisition_status(sequencer=0, timeout=1)
+        bins = qrm.get_acquisitions(sequencer=0)["acquisition"]["acquisition"]["bins"]
+
+        # The gain doubles the signal of each bin, integrated over the 996 samples of the pulse left after the play
+        expected = np.array([0.0, 16383, 32766]) / 32767 * 996
+        np.testing.assert_allclose(bins["integration"]["path0"], expected)
+        np.testing.assert_allclose(bins["integration"]["path1"], 0.0)
+        np.testing.assert_array_equal(bins["avg_cnt"], [100, 100, 100])
+
+    def test_acquisitions_are_accumulated_until_deleted(self, cluster: EmulatedCluster):
+        qrm = cluster.modules[1]
+        qrm.sequencers[0].sequence(readout_sequence())
+        run((qrm, 0))
+        run((qrm, 0))
+
+        bins = qrm.get_acquisitions(sequencer=0)["acquisition"]["acquisition"]["bins"]
+        np.testing.assert_array_equal(bins["avg_cnt"], [200, 200, 200])
+
+        qrm.delete_acquisition_data(sequencer=0, all=True)
+
+        bins = qrm.get_acquisitions(sequencer=0)["acquisition"]["acquisition"]["bins"]
+        np.testing.assert_array_equal(bins["avg_cnt"], [0, 0, 0])
+        assert np.isnan(bins["integration"]["path0"]).all()
+
+    def test_bins_out_of_range_raise(self, cluster: EmulatedCluster):
+        qrm = cluster.modules[1]
+        qrm.sequencers[0].sequence(readout_sequence(num_bins=2))
+        run((qrm, 0))
+
+        with pytest.raises(ValueError, match="bin 2"):
+            qrm.get_acquisitions(sequencer=0)
+
+    def test_noise_and_thresholding(self):
+        model = QbloxEmulatorModel(
+            noise=0.01, loopback=0.0, excited_state_probability=0.3, excited_state_response=[0.5, 0.0], seed=1
+        )
+        cluster = EmulatedCluster(name="cluster", modules={1: "QRM"}, model=model)
+        qrm = cluster.modules[0]
+        qrm.sequencers[0].sequence(readout_sequence())
+        qrm.sequencers[0].thresholded_acq_threshold(0.25 * 1000)
+        run((qrm, 0))
+
+        bins = qrm.get_acquisitions(sequencer=0)["acquisition"]["acquisition"]["bins"]
+
+        np.testing.assert_allclose(bins["threshold"], 0.3, atol=0.15)
+        np.testing.assert_allclose(bins["integration"]["path0"], bins["threshold"] * 500, atol=5)
+
+    def test_seed_makes_runs_reproducible(self):
+        def acquire():
+            model = QbloxEmulatorModel(noise=0.1, excited_state_probability=0.5, seed=7)
+            cluster = EmulatedCluster(name="cluster", modules={1: "QRM"}, model=model)
+            cluster.modules[0].sequencers[0].sequence(readout_sequence())
+            run((cluster.modules[0], 0))
+            return cluster.modules[0].get_acquisitions(sequencer=0)["acquisition"]["acquisition"]["bins"]
+
+        np.testing.assert_array_equal(acquire()["integration"]["path0"], acquire()["integration"]["path0"])
+
+    @pytest.mark.parametrize("excited, played", [(0.0, False), (1.0, True)])
+    def test_conditional_playback_on_thresholded_triggers(self, excited: float, played: bool):
+        model = QbloxEmulatorModel(loopback=0.0, excited_state_probability=excited, excited_state_response=[0.5, 0.0])
+        cluster = EmulatedCluster(name="cluster", modules={1: "QCM", 2: "QRM"}, model=model)
+        qcm, qrm = cluster.modules[0], cluster.modules[1]
+        program = "play 0, 1, 4\nacquire_weighed 0, 0, 0, 1, 1000\nstop"
+        qrm.sequencers[0].sequence(readout_sequence(program=program, num_bins=1))
+        qrm.sequencers[0].thresholded_acq_threshold(0.25 * 1000)
+        qrm.sequencers[0].thresholded_acq_trigger_address(1)
+        qrm.sequencers[0].thresholded_acq_trigger_en(True)
+        qcm.sequencers[0].sequence(drive_sequence())
+
+        # The drive sequencer is started first, but it is run after the readout that sends its trigger
+        run((qcm, 0), (qrm, 0))
+
+        assert bool(qcm.sequencers[0].trace.plays) is played
+        assert cluster.trigger_monitor_count(address=1) == int(played)
+        cluster.reset_trigger_monitor_count(address=1)
+        assert cluster.trigger_monitor_count(address=1) == 0
+
+    def test_render_applies_gains_offsets_and_modulation(self, cluster: EmulatedCluster):
+        qcm = cluster.modules[0]
+        sequencer = qcm.sequencers[0]
+        sequencer.sequence(
+            {
+                "program": "set_awg_offs 16384, 0\nset_awg_gain 16384, 16384\nplay 0, 1, 100\nset_awg_offs 0, 0\n"
+                "upd_param 100\nstop",
+                "waveforms": {"I": {"data": [1.0] * 50, "index": 0}, "Q": {"data": [0.0] * 50, "index": 1}},
+            }
+        )
+        sequencer.gain_awg_path0(0.5)
+        run((qcm, 0))
+
+        output = sequencer.render()
+
+        assert output.shape == (2, 200)
+        np.testing.assert_allclose(output[0, :50], 0.5 * (16384 / 32767 + 16384 / 32767))
+        np.testing.assert_allclose(output[0, 50:100], 0.5 * 16384 / 32767)
+        np.testing.assert_allclose(output[0, 100:], 0.0)
+
+        sequencer.mod_en_awg(True)
+        sequencer.nco_freq(250e6)
+        sequencer.sequence(sequencer.sequence())
+        run((qcm, 0))
+
+        modulated = sequencer.render(0, 4)
+        amplitude = 0.5 * 2 * 16384 / 32767
+        np.testing.assert_allclose(modulated[0], amplitude * np.array([1.0, 0.0, -1.0, 0.0]), atol=1e-12)
+        np.testing.assert_allclose(modulated[1], amplitude * np.array([0.0, 1.0, 0.0, -1.0]), atol=1e-12)
+
+    def test_render_before_running_raises(self, cluster: EmulatedCluster):
+        with pytest.raises(ValueError, match="has not been run"):
+            cluster.modules[0].sequencers[0].render()
+
+    def test_scope(self, cluster: EmulatedCluster):
+        qrm = cluster.modules[1]
+        qrm.sequencers[0].sequence(readout_sequence(program="play 0, 1, 4\nacquire 0, 0, 1000\nstop", num_bins=1))
+        qrm.scope_acq_avg_mode_en_path0(True)
+        run((qrm, 0))
+
+        qrm.store_scope_acquisition(sequencer=0, name="acquisition")
+        scope = qrm.get_acquisitions(sequencer=0)["acquisition"]["acquisition"]["scope"]
+
+        assert len(scope["path0"]["data"]) == SCOPE_SAMPLES
+        assert scope["path0"]["avg_cnt"] == 1
+        # The scope starts with the acquisition, 4 ns after the pulse
+        np.testing.assert_allclose(scope["path0"]["data"][:996], 1.0)
+        np.testing.assert_allclose(scope["path0"]["data"][996:], 0.0)
+        np.testing.assert_allclose(scope["path1"]["data"], 0.0)
+
+    def test_scope_of_unselected_sequencer_is_empty(self, cluster: EmulatedCluster):
+        qrm = cluster.modules[1]
+        qrm.sequencers[1].sequence(readout_sequence())
+        run((qrm, 1))
+
+        qrm.store_scope_acquisition(sequencer=1, name="acquisition")
+
+        assert len(qrm.get_acquisitions(sequencer=1)["acquisition"]["acquisition"]["scope"]["path0"]["data"]) == 0
@@ -379,6 +379,43 @@ class TestQbloxQCM:
 
         qcm.device.sequencers[0].sequence.assert_called_once_with(sequence.to_dict())
 
+    def test_upload_qpysequence_skips_unchanged_sequence(self, qcm: QbloxQCM):
+        """Test that uploading the same sequence twice only sends it to the device once."""
+        sequence = Sequence(program=Program(), waveforms=Waveforms(), acquisitions=Acquisitions(), weights=Weights())
+        identical_sequence = Sequence(
+            program=Program(), waveforms=Waveforms(), acquisitions=Acquisitions(), weights=Weights()
+        )
+
+        assert qcm.upload_qpysequence(qpysequence=sequence, channel_id=0) is True
+        assert qcm.upload_qpysequence(qpysequence=sequence, channel_id=0) is False
+        assert qcm.upload_qpysequence(qpysequence=identical_sequence, channel_id=0) is False
+
+        qcm.device.sequencers[0].sequence.assert_called_once_with(sequence.to_dict())
+        assert qcm.sequences[0] is identical_sequence
+        assert qcm.is_sequence_resident(sequencer_id=0)
+
+    def test_upload_qpysequence_uploads_changed_sequence(self, qcm: QbloxQCM):
+        """Test that a sequence with a different waveform is uploaded again."""
+        sequence = Sequence(program=Program(), waveforms=Waveforms(), acquisitions=Acquisitions(), weights=Weights())
+        waveforms = Waveforms()
+        waveforms.add(array=[0.0, 0.5, 1.0], index=0)
+        changed_sequence = Sequence(program=Program(), waveforms=waveforms, acquisitions=Acquisitions(), weights=Weights())
+
+        qcm.upload_qpysequence(qpysequence=sequence, channel_id=0)
+        assert qcm.upload_qpysequence(qpysequence=changed_sequence, channel_id=0) is True
+
+        assert qcm.device.sequencers[0].sequence.call_count == 2
+
+    def test_upload_qpysequence_after_clear_cache(self, qcm: QbloxQCM):
+        """Test that clearing the cache forces the next upload."""
+        sequence = Sequence(program=Program(), waveforms=Waveforms(), acquisitions=Acquisitions(), weights=Weights())
+        qcm.upload_qpysequence(qpysequence=sequence, channel_id=0)
+        qcm.clear_cache()
+
+        assert not qcm.is_sequence_resident(sequencer_id=0)
+        assert qcm.upload_qpysequence(qpysequence=sequence, channel_id=0) is True
+        assert qcm.device.sequencers[0].sequence.call_count == 2
+
     def test_clear_cache(self, qcm: QbloxQCM):
         """Test clearing the cache of the QCM module."""
         qcm.cache = {0: MagicMock()}  # type: ignore[misc]
@@ -354,10 +354,11 @@ class TestQbloxQRM:
 
         qrm.acquire_qprogram_results(acquisitions=qp_acqusitions, channel_id=0)
 
-        assert qrm.device.get_acquisition_status.call_count == 2
-        assert qrm.device.store_scope_acquisition.call_count == 1
-        assert qrm.device.get_acquisitions.call_count == 2
-        assert qrm.device.delete_acquisition_data.call_count == 2
+        # waiting, fetching and deleting happen once per sequencer, not once per acquisition
+        qrm.device.get_acquisition_status.assert_called_once()
+        qrm.device.store_scope_acquisition.assert_called_once_with(sequencer=0, name="acquisition_1")
+        qrm.device.get_acquisitions.assert_called_once_with(sequencer=0)
+        qrm.device.delete_acquisition_data.assert_called_once_with(sequencer=0, all=True)
         # after uploading the empty sequence
         assert qrm.device.sequencers[0].sequence.call_count == 2
 
@@ -424,6 +425,58 @@ class TestQbloxQRM:
             "With the buggy code the wipe happened inside the loop, once per acquisition."
         )
 
+    def test_acquire_qprogram_results_never_requests_unsaved_scope(self, qrm: QbloxQRM):
+        """The scope is not stored on the device for acquisitions with `save_adc=False`, so only their bins are sent."""
+        sequence = Sequence(program=Program(), waveforms=Waveforms(), acquisitions=Acquisitions(), weights=Weights())
+        qp_acquisitions = {
+            "acquisition_0": AcquisitionData(bus="readout", save_adc=False, shape=(-1,), intertwined=1),
+            "acquisition_1": AcquisitionData(bus="readout", save_adc=False, shape=(-1,), intertwined=1),
+        }
+        bins = {"integration": {"path0": [1.0], "path1": [2.0]}, "threshold": [0], "avg_cnt": [1]}
+        # Acquisitions whose scope was never stored are sent by the device with empty scope data
+        scope = {"path0": {"data": []}, "path1": {"data": []}}
+        qrm.device.get_acquisitions.return_value = {
+            name: {"acquisition": {"scope": scope, "bins": bins}} for name in qp_acquisitions
+        }
+
+        qrm.upload_qpysequence(qpysequence=sequence, channel_id=0)
+        results = qrm.acquire_qprogram_results(acquisitions=qp_acquisitions, channel_id=0)
+
+        qrm.device.store_scope_acquisition.assert_not_called()
+        qrm.device.get_acquisitions.assert_called_once_with(sequencer=0)
+        assert [result.raw_measurement_data["bins"]["integration"]["path0"] for result in results] == [[1.0], [1.0]]
+        assert all(result.scope.size == 0 for result in results)
+
+    def test_acquire_qprogram_results_invalidates_wiped_sequence(self, qrm: QbloxQRM):
+        """After the sequencer is wiped, uploading the same sequence again must send it to the device."""
+        sequence = Sequence(program=Program(), waveforms=Waveforms(), acquisitions=Acquisitions(), weights=Weights())
+        qrm.upload_qpysequence(qpysequence=sequence, channel_id=0)
+        qrm.acquire_qprogram_results(acquisitions={}, channel_id=0)
+
+        assert not qrm.is_sequence_resident(sequencer_id=0)
+        assert qrm.upload_qpysequence(qpysequence=sequence, channel_id=0) is True
+        assert qrm.device.sequencers[0].sequence.call_count == 3
+
+    def test_acquire_qprogram_results_keeps_sequence_resident(self, qrm: QbloxQRM, override_settings):
+        """With `qblox_keep_sequences_resident`, the sequence is not wiped and is not uploaded again."""
+        acquisitions = Acquisitions()
+        acquisitions.add(name="acquisition_0")
+        sequence = Sequence(program=Program(), waveforms=Waveforms(), acquisitions=acquisitions, weights=Weights())
+        qp_acquisitions = {
+            "acquisition_0": AcquisitionData(bus="readout_q0", save_adc=False, shape=(-1,), intertwined=1),
+        }
+
+        with override_settings(qblox_keep_sequences_resident=True):
+            for _ in range(3):
+                qrm.upload_qpysequence(qpysequence=sequence, channel_id=0)
+                qrm.run(channel_id=0)
+                qrm.acquire_qprogram_results(acquisitions=qp_acquisitions, channel_id=0)
+
+        qrm.device.sequencers[0].sequence.assert_called_once_with(sequence.to_dict())
+        assert qrm.device.arm_sequencer.call_count == 3
+        assert qrm.device.start_sequencer.call_count == 3
+        assert qrm.is_sequence_resident(sequencer_id=0)
+
     def test_acquire_qprogram_results_with_no_acquisitions_does_not_raise(self, qrm: QbloxQRM):
         # QHC-1455 regression: empty acquisitions dict on a played-but-not-acquired bus must not raise UnboundLocalError.
         results = qrm.acquire_qprogram_results(acquisitions={}, channel_id=0)
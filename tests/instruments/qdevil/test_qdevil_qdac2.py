@@ -2,12 +2,13 @@ import re
 from itertools import product
 from unittest.mock import MagicMock, call, patch
 
+import numpy as np
 import pytest
 
 from qililab.instruments.instrument import ParameterNotFound
 from qililab.instruments.qdevil.qdevil_qdac2 import QDevilQDac2
 from qililab.typings.enums import Parameter
-from qililab.waveforms import Square
+from qililab.waveforms import Arbitrary, Square
 
 
 def _stateful_qdac_device() -> MagicMock:
@@ -262,16 +263,43 @@ class TestQDevilQDac2:
     def test_upload_awg_waveform(self, qdac: QDevilQDac2, waveform: Square):
         """Test upload_waveform method"""
         channel_id = 4
-        qdac.upload_awg_waveform(waveform, channel_id)
         trace = qdac.device.allocate_trace.return_value
+        trace.name = "4"
+        qdac.upload_awg_waveform(waveform, channel_id)
         qdac.device.allocate_trace.assert_called_once_with(channel_id, len(waveform.envelope()))
-        # the waveform data was actually pushed to the trace
-        trace.waveform.assert_called_once_with(list(waveform.envelope()))
+        # the waveform data was actually pushed to the trace, as a binary block of 4 float32 (16 bytes)
+        qdac.device.visa_handle.write_raw.assert_called_once_with(
+            b'TRAC:DATA "4",#216' + np.asarray(waveform.envelope(), dtype="<f4").tobytes() + b"\n"
+        )
+        trace.waveform.assert_not_called()
         # the trace was wrapped in an AWG generator and cached
         channel = qdac.device.channel.return_value
         channel.arbitrary_wave.assert_called_once_with(trace.name)
         assert qdac._cache_awg == {channel_id: channel.arbitrary_wave.return_value}
 
+    def test_upload_awg_waveform_ascii(self, qdac: QDevilQDac2, waveform: Square):
+        """Test that the trace can still be sent as ASCII through the driver"""
+        progress = MagicMock()
+        qdac.upload_awg_waveform(waveform, channel_id=4, binary=False, progress=progress)
+
+        qdac.device.allocate_trace.return_value.waveform.assert_called_once_with(list(waveform.envelope()))
+        qdac.device.visa_handle.write_raw.assert_not_called()
+        progress.assert_called_once_with(4, 4)
+
+    def test_upload_awg_waveform_binary_chunks(self, qdac: QDevilQDac2):
+        """Test that the binary block is streamed in chunks, reporting the progress after each one"""
+        waveform = Arbitrary(np.linspace(-0.5, 0.5, 10))
+        trace = qdac.device.allocate_trace.return_value
+        trace.name = "2"
+        progress = MagicMock()
+
+        qdac.upload_awg_waveform(waveform, channel_id=2, chunk_size=4, progress=progress)
+
+        chunks = [args.args[0] for args in qdac.device.visa_handle.write_raw.call_args_list]
+        data = np.asarray(waveform.envelope(), dtype="<f4").tobytes()
+        assert chunks == [b'TRAC:DATA "2",#240' + data[:16], data[16:32], data[32:] + b"\n"]
+        assert progress.call_args_list == [call(4, 10), call(8, 10), call(10, 10)]
+
     def test_upload_awg_waveform_fails_overwrite_cache(self, qdac: QDevilQDac2, waveform: Square):
         """Test that upload waveform raises an error when trying to allocate a waveform to an already allocated channel id"""
         channel_id = 2
@@ -328,8 +356,67 @@ class TestQDevilQDac2:
         qdac.device.channel(channel_id).dc_list.assert_called_once()
         waveform = Square(0.1, 3)
         qdac.upload_voltage_list(waveform, channel_id)
-        qdac.device.remove_traces.assert_called_once()
-        qdac.device.channel(channel_id).dc_list.assert_called()
+        # only the list of the channel is replaced, the traces of the instrument are left alone
+        qdac.device.channel(channel_id).dc_abort.assert_called_once()
+        qdac.device.remove_traces.assert_not_called()
+        assert qdac.device.channel(channel_id).dc_list.call_count == 2
+
+    def test_upload_voltage_list_skips_resident_lists(self, qdac: QDevilQDac2, waveform: Square):
+        """Uploading a list already loaded on the channel only arms it again, without transmitting it."""
+        channel_id = 4
+        channel = qdac.device.channel(channel_id)
+        qdac.upload_voltage_list(waveform, channel_id)
+        dc_list = qdac._cache_dc[f"{qdac.device.name}_{channel_id}"]
+        qdac.start()
+
+        qdac.upload_voltage_list(Square(0.1, 4), channel_id)
+
+        channel.dc_list.assert_called_once()
+        assert qdac._cache_dc == {f"{qdac.device.name}_{channel_id}": dc_list}
+
+        # a list with different parameters is transmitted
+        qdac.upload_voltage_list(waveform, channel_id, repetitions=2)
+        assert channel.dc_list.call_count == 2
+
+    def test_upload_voltage_list_with_digest(self, qdac: QDevilQDac2, waveform: Square):
+        """The digest given by the caller identifies the list."""
+        channel_id = 4
+        digest = QDevilQDac2.voltage_list_digest(waveform, dwell_us=2)
+        qdac.upload_voltage_list(waveform, channel_id, digest=digest)
+        qdac.upload_voltage_list(Square(0.5, 8), channel_id, digest=digest)
+
+        qdac.device.channel(channel_id).dc_list.assert_called_once()
+        assert digest != QDevilQDac2.voltage_list_digest(waveform, dwell_us=4)
+
+    @pytest.mark.parametrize("method", ["set_voltage", "turn_on", "turn_off", "initial_setup", "reset"])
+    def test_fixed_voltage_forgets_resident_lists(self, qdac: QDevilQDac2, waveform: Square, method: str):
+        """Setting a fixed voltage takes the channel out of list mode, so its list must be transmitted again."""
+        channel_id = 4
+        qdac.upload_voltage_list(waveform, channel_id)
+        qdac.start()
+
+        if method == "set_voltage":
+            qdac.set_parameter(parameter=Parameter.VOLTAGE, value=0.1, channel_id=channel_id)
+        else:
+            getattr(qdac, method)()
+        qdac.upload_voltage_list(waveform, channel_id)
+
+        assert qdac.device.channel(channel_id).dc_list.call_count == 2
+
+    def test_upload_voltage_list_chunks(self, qdac: QDevilQDac2):
+        """Test that long voltage lists are streamed in chunks appended to the list"""
+        waveform = Arbitrary(np.arange(10) / 10)
+        progress = MagicMock()
+
+        qdac.upload_voltage_list(waveform, channel_id=4, chunk_size=4, progress=progress)
+
+        channel = qdac.device.channel(4)
+        assert channel.dc_list.call_args.kwargs["voltages"] == [0.0, 0.1, 0.2, 0.3]
+        assert channel.dc_list.return_value.append.call_args_list == [
+            call([0.4, 0.5, 0.6, 0.7]),
+            call([0.8, 0.9]),
+        ]
+        assert progress.call_args_list == [call(4, 10), call(8, 10), call(10, 10)]
 
     def test_upload_voltage_list_raises_channel_error(self, qdac: QDevilQDac2, waveform: Square):
         """Test upload_waveform method"""
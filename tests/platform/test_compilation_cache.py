@@ -0,0 +1,48 @@
+"""Tests for the CompilationCache class."""
+
+import pytest
+
+from qililab.platform.compilation_cache import CompilationCache
+
+
+class TestCompilationCache:
+    """Unit tests for the CompilationCache class."""
+
+    def test_get_and_put(self):
+        cache = CompilationCache(max_size=2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "max_size": 2}
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = CompilationCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_zero_size_disables_cache(self):
+        cache = CompilationCache(max_size=0)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_negative_size_raises_error(self):
+        with pytest.raises(ValueError, match="max_size must be non-negative"):
+            CompilationCache(max_size=-1)
+
+    def test_clear(self):
+        cache = CompilationCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        cache.clear()
+        assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "max_size": 64}
@@ -0,0 +1,85 @@
+"""Tests for the ParallelTaskRunner class."""
+
+import threading
+import time
+
+import pytest
+
+from qililab.platform.parallel_task_runner import ParallelTaskRunner
+from qililab.utils.execution_profiler import ExecutionProfiler, get_active_profiler
+
+
+class TestParallelTaskRunner:
+    """Unit tests for the ParallelTaskRunner class."""
+
+    def test_results_follow_task_order(self):
+        runner = ParallelTaskRunner(max_workers=4)
+        tasks = {f"bus_{i}": (i % 3, lambda i=i: (time.sleep(0.001 * (5 - i)), i)[1]) for i in range(5)}
+
+        results = runner.run(tasks)
+
+        assert list(results) == [f"bus_{i}" for i in range(5)]
+        assert list(results.values()) == list(range(5))
+        runner.shutdown()
+
+    def test_tasks_on_different_connections_run_concurrently(self):
+        runner = ParallelTaskRunner(max_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        # Each task waits for the other one, so this only finishes if both run at the same time.
+        results = runner.run({"a": ("cluster_0", barrier.wait), "b": ("cluster_1", barrier.wait)})
+
+        assert sorted(results.values()) == [0, 1]
+        runner.shutdown()
+
+    def test_tasks_on_the_same_connection_run_serially_in_order(self):
+        runner = ParallelTaskRunner(max_workers=4)
+        calls = []
+        tasks = {i: ("cluster", lambda i=i: calls.append((i, threading.get_ident()))) for i in range(4)}
+
+        runner.run(tasks)
+
+        assert [i for i, _ in calls] == [0, 1, 2, 3]
+        assert len({thread for _, thread in calls}) == 1
+
+    def test_first_failing_task_raises(self):
+        runner = ParallelTaskRunner(max_workers=4)
+        executed = []
+
+        def fail(message):
+            raise TimeoutError(message)
+
+        tasks = {
+            "a": ("cluster_0", lambda: executed.append("a")),
+            "b": ("cluster_1", lambda: fail("b")),
+            "c": ("cluster_1", lambda: executed.append("c")),
+            "d": ("cluster_2", lambda: fail("d")),
+        }
+
+        with pytest.raises(TimeoutError, match="b"):
+            runner.run(tasks)
+        # Tasks after a failure on the same connection are not run.
+        assert "c" not in executed
+        assert "a" in executed
+        runner.shutdown()
+
+    def test_tasks_see_the_active_profiler_of_the_caller(self):
+        runner = ParallelTaskRunner(max_workers=2)
+        profiler = ExecutionProfiler()
+
+        with profiler.activate():
+            results = runner.run({"a": ("cluster_0", get_active_profiler), "b": ("cluster_1", get_active_profiler)})
+
+        assert list(results.values()) == [profiler, profiler]
+        runner.shutdown()
+
+    def test_single_worker_runs_in_calling_thread(self):
+        runner = ParallelTaskRunner(max_workers=1)
+        results = runner.run({i: (i, threading.get_ident) for i in range(3)})
+
+        assert set(results.values()) == {threading.get_ident()}
+        assert runner._executor is None
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            ParallelTaskRunner(max_workers=0)
@@ -32,6 +32,7 @@ from tests.test_utils import build_platform
 
 from qililab import save_platform
 from qililab.constants import DEFAULT_PLATFORM_NAME
+from qililab.core.variables import Domain
 from qililab.extra.quantum_machines import QuantumMachinesCluster, QuantumMachinesMeasurementResult
 from qililab.instrument_controllers import InstrumentControllers
 from qililab.instrument_controllers.qblox import QbloxClusterController
@@ -41,13 +42,15 @@ from qililab.instruments.qblox import QbloxModule
 from qililab.instruments.qblox.qblox_qrm import QbloxQRM
 from qililab.instruments.qdevil import QDevilQDac2
 from qililab.platform import Bus, Buses, Platform, Session
-from qililab.qprogram import Calibration, Experiment, QProgram, QbloxCompilationOutput
+from qililab.platform.compilation_cache import CompilationCache
+from qililab.qprogram import Calibration, Experiment, QProgram, QbloxCompilationOutput, QbloxCompiler
 from qililab.qprogram.crosstalk_matrix import CrosstalkMatrix
 from qililab.result.database import get_db_manager
 from qililab.result.qprogram.qblox_measurement_result import QbloxMeasurementResult
 from qililab.settings import AnalogCompilationSettings, DigitalCompilationSettings, Runcard
 from qililab.settings.digital.gate_event import GateEvent
 from qililab.typings.enums import InstrumentName, Parameter
+from qililab.utils.fingerprint import fingerprint
 from qililab.waveforms import Chained, IQPair, Ramp, Square
 
 @pytest.fixture(name="platform")
@@ -298,6 +301,13 @@ def compare_platforms(obj1, obj2, path="root", depth=0, max_depth=10):
             differences.extend(diffs)
         return len(differences) == 0, differences
 
+    # Compilation caches hold runtime state only, so just their public state is compared
+    if isinstance(obj1, CompilationCache):
+        obj1, obj2 = obj1.stats(), obj2.stats()
+        if obj1 != obj2:
+            differences.append(f"{path}: {obj1!r} != {obj2!r}")
+        return obj1 == obj2, differences
+
     # Objects with __dict__ (dataclasses, custom classes, etc.)
     if hasattr(obj1, "__dict__"):
         attrs1 = set(vars(obj1).keys())
@@ -1528,6 +1538,234 @@ class TestMethods:
         assert captured["qdac"].crosstalk_matrix is dc_matrix
         assert captured["qdac"].crosstalk_matrix_ac is ac_matrix
 
+    def test_compile_qprogram_reuses_cached_output(self, platform: Platform):
+        """Compiling a structurally identical QProgram twice hits the compilation cache and skips the compiler."""
+
+        def build_qprogram() -> QProgram:
+            qprogram = QProgram()
+            amplitude = qprogram.variable(label="amplitude", domain=Domain.Voltage)
+            with qprogram.for_loop(variable=amplitude, start=0.0, stop=1.0, step=0.1):
+                qprogram.set_gain(bus="drive_line_q0_bus", gain=amplitude)
+                qprogram.play(bus="drive_line_q0_bus", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+            return qprogram
+
+        with patch("qililab.platform.platform.QbloxCompiler", wraps=QbloxCompiler) as qblox_compiler:
+            first = platform.compile_qprogram(qprogram=build_qprogram())
+            second = platform.compile_qprogram(qprogram=build_qprogram())
+
+        assert qblox_compiler.call_count == 1
+        assert second.qblox is first.qblox
+        assert platform.compilation_cache.stats() == {"hits": 1, "misses": 1, "size": 1, "max_size": 64}
+
+    def test_compile_qprogram_cache_misses_when_inputs_change(self, platform: Platform):
+        """Changing the QProgram, the bus mapping or a platform parameter read by the compiler invalidates the cache."""
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+
+        first = platform.compile_qprogram(qprogram=qprogram)
+        platform.buses.get(alias="drive_line_q0_bus").settings.delay += 8
+        second = platform.compile_qprogram(qprogram=qprogram)
+        qprogram.wait(bus="drive_line_q0_bus", duration=100)
+        third = platform.compile_qprogram(qprogram=qprogram)
+
+        assert first.qblox is not second.qblox
+        assert second.qblox is not third.qblox
+        assert platform.compilation_cache.misses == 3
+        assert platform.compilation_cache.hits == 0
+
+    def test_compile_qprogram_cache_disabled(self, platform: Platform, override_settings):
+        """A cache size of 0 compiles every time."""
+        with override_settings(compilation_cache_size=0):
+            platform = build_platform(runcard=Galadriel.runcard)
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+
+        first = platform.compile_qprogram(qprogram=qprogram)
+        second = platform.compile_qprogram(qprogram=qprogram)
+
+        assert first.qblox is not second.qblox
+        assert len(platform.compilation_cache) == 0
+
+    def test_disconnect_clears_compilation_cache(self, platform: Platform):
+        """Disconnecting from the instruments empties the compilation cache."""
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+        platform.compile_qprogram(qprogram=qprogram)
+        platform._connected_to_instruments = True
+        platform.instrument_controllers = MagicMock()
+
+        platform.disconnect()
+
+        assert len(platform.compilation_cache) == 0
+        assert platform.compilation_cache.misses == 0
+
+    def test_precompile_qprogram_warms_the_compilation_cache(self, platform: Platform):
+        """A precompiled QProgram is executed from the cache, without compiling it again."""
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+
+        assert platform.precompile_qprogram(qprogram=qprogram)
+        with patch("qililab.platform.platform.QbloxCompiler", wraps=QbloxCompiler) as qblox_compiler:
+            platform.compile_qprogram(qprogram=qprogram, calibration=platform.calibration)
+
+        qblox_compiler.assert_not_called()
+        assert platform.compilation_cache.hits == 1
+
+    def test_precompile_qprogram_skips_qdac_and_disabled_cache(self, platform_qblox_qdac: Platform):
+        """QPrograms using QDAC-II buses are not precompiled, and nothing is when the cache is disabled."""
+        qprogram = QProgram()
+        qprogram.set_offset(bus="qdac_bus_2", offset_path0=1)
+        qprogram.play(bus="drive", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+        qblox_qprogram = QProgram()
+        qblox_qprogram.play(bus="drive", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+
+        with patch.object(platform_qblox_qdac, "_compile_qblox") as compile_qblox:
+            assert not platform_qblox_qdac.precompile_qprogram(qprogram=qprogram)
+            platform_qblox_qdac.compilation_cache.max_size = 0
+            assert not platform_qblox_qdac.precompile_qprogram(qprogram=qblox_qprogram)
+
+        compile_qblox.assert_not_called()
+
+    def test_prepare_qprogram_precompilation_snapshots_the_settings(self, platform: Platform):
+        """The settings are read when the precompilation is prepared, so changing them before it runs has no effect."""
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+        bus = platform.buses.get(alias="drive_line_q0_bus")
+        bus.settings.delay = 0
+
+        precompilation = platform.prepare_qprogram_precompilation(qprogram=qprogram)
+        bus.settings.delay = 8
+        assert precompilation is not None
+        precompilation()
+
+        with patch("qililab.platform.platform.QbloxCompiler", wraps=QbloxCompiler) as qblox_compiler:
+            platform.compile_qprogram(qprogram=qprogram, calibration=platform.calibration)
+            bus.settings.delay = 0
+            platform.compile_qprogram(qprogram=qprogram, calibration=platform.calibration)
+
+        # Only the compilation with the new delay runs: the precompiled output is the one of the old delay.
+        assert qblox_compiler.call_count == 1
+        assert platform.compilation_cache.hits == 1
+
+    def test_prepare_qprogram_precompilation_leaves_the_compilation_to_the_callable(self, platform: Platform):
+        """Preparing only snapshots the settings: the QProgram, calibration and crosstalk are shared, not copied, and
+        both the fingerprint and the compiler only run when the returned callable is called."""
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+        platform.set_crosstalk(CrosstalkMatrix.from_array(["drive_line_q0_bus"], np.array([[1.0]])))
+
+        with (
+            patch("qililab.platform.platform.QbloxCompiler", wraps=QbloxCompiler) as qblox_compiler,
+            patch("qililab.platform.platform.deepcopy", wraps=copy.deepcopy) as mock_deepcopy,
+            patch("qililab.platform.platform.fingerprint", wraps=fingerprint) as mock_fingerprint,
+        ):
+            precompilation = platform.prepare_qprogram_precompilation(qprogram=qprogram)
+            assert precompilation is not None
+            qblox_compiler.assert_not_called()
+            mock_fingerprint.assert_not_called()
+
+            (compilation_inputs,) = precompilation.args
+            assert compilation_inputs["qprogram"] is qprogram
+            assert compilation_inputs["calibration"] is platform.calibration
+            assert compilation_inputs["crosstalk"] is platform.crosstalk
+            copied = [call.args[0] for call in mock_deepcopy.call_args_list]
+            assert not any(obj is platform.calibration or obj is platform.crosstalk for obj in copied)
+
+            precompilation()
+            mock_fingerprint.assert_called_once_with(compilation_inputs)
+            qblox_compiler.assert_called_once()
+
+    def test_execute_qprogram_finishes_each_phase_before_the_next(self, platform: Platform):
+        """Uploads, runs and acquisitions fan out per instrument connection, but every phase finishes on all buses
+        before the next one starts, and each bus gets its own results."""
+        readout_wf = IQPair(I=Square(amplitude=1.0, duration=120), Q=Square(amplitude=0.0, duration=120))
+        weights_wf = IQPair(I=Square(amplitude=1.0, duration=2000), Q=Square(amplitude=0.0, duration=2000))
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=readout_wf)
+        qprogram.play(bus="drive_line_q1_bus", waveform=readout_wf)
+        qprogram.play(bus="feedline_input_output_bus", waveform=readout_wf)
+        qprogram.qblox.acquire(bus="feedline_input_output_bus", weights=weights_wf)
+        qprogram.play(bus="feedline_input_output_bus_1", waveform=readout_wf)
+        qprogram.qblox.acquire(bus="feedline_input_output_bus_1", weights=weights_wf)
+
+        phases: list[str] = []
+
+        def acquire(self, **_):
+            phases.append("acquire")
+            return [self.alias]
+
+        with (
+            patch.object(Bus, "upload_qpysequence", autospec=True, side_effect=lambda *_, **__: phases.append("upload")),
+            patch.object(Bus, "run", autospec=True, side_effect=lambda *_: phases.append("run")),
+            patch.object(Bus, "acquire_qprogram_results", autospec=True, side_effect=acquire),
+            patch.object(QbloxModule, "sync_sequencer"),
+            patch.object(QbloxModule, "desync_sequencer"),
+        ):
+            results = platform.execute_qprogram(qprogram=qprogram)
+
+        assert phases == ["upload"] * 4 + ["run"] * 4 + ["acquire"] * 2
+        assert set(results.results) == {"feedline_input_output_bus", "feedline_input_output_bus_1"}
+        for bus_alias, bus_results in results.results.items():
+            assert bus_results == [bus_alias]
+
+    def test_qblox_connection_is_shared_by_modules_of_the_same_cluster(self, platform: Platform):
+        """Buses whose modules hang from the same cluster device share their connection."""
+        cluster = MagicMock()
+        first, second = platform.buses.get(alias="drive_line_q0_bus"), platform.buses.get(alias="drive_line_q1_bus")
+        first_module = next(instrument for instrument in first.instruments if isinstance(instrument, QbloxModule))
+        second_module = next(instrument for instrument in second.instruments if isinstance(instrument, QbloxModule))
+        first_module.device = MagicMock(root_instrument=cluster)
+        second_module.device = MagicMock(root_instrument=cluster)
+
+        assert Platform._qblox_connection(first) is cluster
+        assert Platform._qblox_connection(second) is cluster
+
+    def test_profile_records_phases_and_bus_statistics(self, platform: Platform, raw_measurement_data_intertwined: dict):
+        """Executing inside `platform.profile()` records the time of each phase and what was sent to each bus."""
+        readout_wf = IQPair(I=Square(amplitude=1.0, duration=120), Q=Square(amplitude=0.0, duration=120))
+        weights_wf = IQPair(I=Square(amplitude=1.0, duration=2000), Q=Square(amplitude=0.0, duration=2000))
+        qprogram = QProgram()
+        qprogram.play(bus="drive_line_q0_bus", waveform=readout_wf)
+        qprogram.play(bus="feedline_input_output_bus", waveform=readout_wf)
+        qprogram.qblox.acquire(bus="feedline_input_output_bus", weights=weights_wf)
+
+        def acquire(self, **_):
+            return [QbloxMeasurementResult(bus=self.alias, raw_measurement_data=raw_measurement_data_intertwined)]
+
+        with (
+            patch.object(Bus, "upload_qpysequence", autospec=True, return_value=True),
+            patch.object(Bus, "run", autospec=True),
+            patch.object(Bus, "acquire_qprogram_results", autospec=True, side_effect=acquire),
+            patch.object(QbloxModule, "sync_sequencer"),
+            patch.object(QbloxModule, "desync_sequencer"),
+        ):
+            platform.clear_compilation_cache()
+            with platform.profile() as profiler:
+                platform.execute_qprogram(qprogram=qprogram)
+                platform.execute_qprogram(qprogram=qprogram)
+            platform.execute_qprogram(qprogram=qprogram)
+
+        profile = profiler.profile()
+        assert profile.phases["compile"].count == 2
+        assert profile.phases["compile.qblox"].count == 1
+        assert profile.phases["compile.qblox.transforms"].count == 1
+        assert profile.phases["compile.qblox.q1asm"].count == 1
+        for phase in ("execute", "execute.upload", "execute.run", "execute.acquire", "execute.reset"):
+            assert profile.phases[phase].count == 2
+        assert profile.counters == {"compilation_cache.misses": 1, "compilation_cache.hits": 1}
+
+        readout = profile.buses["feedline_input_output_bus"]
+        assert readout.uploads == 2
+        assert readout.bytes_uploaded > 0
+        assert readout.instructions > 0
+        assert readout.waveform_samples > 0
+        assert readout.bytes_downloaded == 2 * 8 * 12
+        assert profile.buses["drive_line_q0_bus"].bytes_downloaded == 0
+
+        record = profile.to_dict()
+        assert record["buses"]["feedline_input_output_bus"]["uploads"] == 2
+        assert record["phases"]["execute"]["count"] == 2
+
     def test_execute_qprogram_single_baseband_channel(self, platform: Platform):
         """Test that the execute method compiles the qprogram, calls the buses to run and return the results."""
         drive_wf = Square(amplitude=1.0, duration=40)
@@ -1599,7 +1837,7 @@ class TestMethods:
         mock_bus.check_recurrent_timeout.return_value = 3
 
         platform_qblox_qdac.buses.get = MagicMock(return_value=mock_bus)
-        platform_qblox_qdac._qpy_sequence_cache = {}
+        platform_qblox_qdac.clear_compilation_cache()
         platform_qblox_qdac.trigger_runs = 0
 
         with pytest.raises(TimeoutError):
@@ -1617,7 +1855,7 @@ class TestMethods:
         mock_bus.check_recurrent_timeout.side_effect = [0, 3, 0, 3, 0, 3, 0, 3]
 
         platform_qblox_qdac.buses.get = MagicMock(return_value=mock_bus)
-        platform_qblox_qdac._qpy_sequence_cache = {}
+        platform_qblox_qdac.clear_compilation_cache()
         platform_qblox_qdac.trigger_runs = 0
 
         with pytest.raises(TimeoutError):
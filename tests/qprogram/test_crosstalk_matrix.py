@@ -1,7 +1,11 @@
+import re
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
 from qililab.qprogram.crosstalk_matrix import CrosstalkMatrix, NonLinearCrosstalkMatrix
+from qililab.utils.serialization import deserialize, serialize
 
 # Insertion orders that diverge from the canonical sort order once names are multi-digit
 # (alphabetical q0, q1, q10, q2 vs sorted q0, q1, q2, q10). Used by the bus-ordering regression tests.
@@ -294,6 +298,17 @@ bus3          0.0      0.0      0.2"""
             for bus in flux_dict:
                 assert float(bias[bus][i]) == pytest.approx(scalar_bias[bus], rel=1e-6)
 
+    def test_flux_to_bias_raises_for_arrays_of_different_shapes(self, crosstalk_matrix):
+        """flux_to_bias should reject array values that cannot be processed element-wise together."""
+        flux_dict = {"flux_0": np.zeros(3), "flux_1": np.zeros(4), "flux_2": 0.1}
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "Flux values must be scalars or arrays of the same shape, got shapes {'flux_0': (3,), 'flux_1': (4,)}."
+            ),
+        ):
+            crosstalk_matrix.flux_to_bias(flux_dict)
+
     #### bus-ordering regression: array and labels must stay consistent for any key insertion order ####
     @pytest.mark.parametrize("buses", _INSERTION_ORDERS)
     def test_inverse_is_a_true_inverse(self, buses):
@@ -309,6 +324,56 @@ bus3          0.0      0.0      0.2"""
         for bus in buses:
             assert bias[bus] == pytest.approx(expected[bus], rel=1e-6)
 
+    def test_inverse_is_cached_until_the_matrix_changes(self, crosstalk_matrix):
+        flux = {"flux_0": 0.1, "flux_1": 0.2, "flux_2": 0.05}
+        with patch("numpy.linalg.inv", wraps=np.linalg.inv) as mock_inv:
+            first = crosstalk_matrix.flux_to_bias(flux)
+            crosstalk_matrix.flux_to_bias(flux)
+            crosstalk_matrix.inverse()
+            crosstalk_matrix.set_offset({"flux_0": 0.1})
+            with_offset = crosstalk_matrix.flux_to_bias(flux)
+            assert mock_inv.call_count == 1
+
+            # Changes to rows in place, through __setitem__ or by reassigning the matrix are all detected
+            crosstalk_matrix["flux_2"]["flux_2"] = 1.0
+            crosstalk_matrix.flux_to_bias(flux)
+            crosstalk_matrix["flux_1"] = {"flux_0": 0.0}
+            crosstalk_matrix.to_array()
+            crosstalk_matrix.matrix = dict(crosstalk_matrix.matrix)
+            crosstalk_matrix.to_array()
+            assert mock_inv.call_count == 3
+            crosstalk_matrix.matrix = {**crosstalk_matrix.matrix, "flux_0": {"flux_0": 2.0}}
+            crosstalk_matrix.to_array()
+            assert mock_inv.call_count == 4
+
+        assert with_offset["flux_0"] != first["flux_0"]
+        assert crosstalk_matrix.to_array()[2, 2] == 1.0
+
+    def test_flux_to_bias_array(self, crosstalk_matrix):
+        """The batched conversion matches flux_to_bias point by point, in the order of `buses`."""
+        crosstalk_matrix.set_offset({"flux_1": 0.05})
+        rng = np.random.default_rng(0)
+        flux = rng.uniform(-0.5, 0.5, size=(20, 3))
+
+        bias = crosstalk_matrix.flux_to_bias_array(flux)
+
+        assert bias.shape == flux.shape
+        assert crosstalk_matrix.buses == ["flux_0", "flux_1", "flux_2"]
+        for point in range(20):
+            expected = crosstalk_matrix.flux_to_bias(dict(zip(crosstalk_matrix.buses, flux[point])))
+            assert np.allclose(bias[point], [expected[bus] for bus in crosstalk_matrix.buses])
+        assert np.allclose(crosstalk_matrix.flux_to_bias_array(flux[0]), bias[0])
+        with pytest.raises(ValueError, match="Expected flux values for 3 buses"):
+            crosstalk_matrix.flux_to_bias_array(np.zeros((4, 2)))
+
+    def test_cache_is_not_serialized(self, crosstalk_matrix):
+        crosstalk_matrix.to_array()
+
+        serialized = serialize(crosstalk_matrix)
+
+        assert "_dense_cache" not in serialized
+        assert np.allclose(deserialize(serialized, CrosstalkMatrix).to_array(), crosstalk_matrix.to_array())
+
 
 class TestNonLinearCrosstalkMatrix:
     def test_from_linear_preserves_matrix(self, non_linear_crosstalk_matrix, crosstalk_matrix):
@@ -1,4 +1,5 @@
 import datetime
+import inspect
 import os
 import tempfile
 from unittest.mock import MagicMock, Mock, call, create_autospec, patch
@@ -499,6 +500,129 @@ class TestExperimentExecutor:
                 data, _ = experiment_results.get(0, measurement_index)
                 assert data.shape == (11, 2)
 
+    def test_prepare_operations_is_lazy(self, platform, experiment):
+        """Operations are generated on demand, and their number is known without generating them."""
+        executor = ExperimentExecutor(platform=platform, experiment=experiment)
+        executor._prepare_metadata(executed_at=datetime.datetime.now())
+        progress = MagicMock()
+
+        operations = executor._prepare_operations(experiment.body, progress)
+
+        assert inspect.isgenerator(operations)
+        progress.add_task.assert_not_called()
+        assert sum(1 for _ in operations) == executor._count_operations(experiment.body) == 91
+
+    def test_execute_resume_from(self, platform, experiment, override_settings):
+        """Resuming from a flat index skips the previous operations and stores the results at the same indices."""
+        settings = {
+            "experiment_results_save_in_database": False,
+            "experiment_live_plot_enabled": False,
+            "experiment_live_plot_on_slurm": False,
+        }
+        with override_settings(**settings):
+            executor = ExperimentExecutor(platform=platform, experiment=experiment)
+            with patch.object(executor, "_store_results", wraps=executor._store_results) as store_results:
+                executor.execute()
+        all_calls = [method_call for method_call in platform.mock_calls if method_call[0] != "to_dict"]
+        all_stored_indices = [(c.args[1], c.args[2]) for c in store_results.call_args_list]
+
+        # Resume in the middle of the nested loops, right before the execution of their second iteration.
+        platform.reset_mock()
+        with override_settings(**settings):
+            resumed = ExperimentExecutor(platform=platform, experiment=experiment, resume_from=16)
+            with patch.object(resumed, "_store_results", wraps=resumed._store_results) as store_results:
+                resumed.execute()
+        resumed_calls = [method_call for method_call in platform.mock_calls if method_call[0] != "to_dict"]
+        stored_indices = [(c.args[1], c.args[2]) for c in store_results.call_args_list]
+
+        assert resumed.operation_index == executor.operation_index == 91
+        # The SetCrosstalk, SetParameter and GetParameter operations before the nested loops and in the first iteration
+        # of the outer loop are replayed in order, then the execution continues where it was left.
+        replayed_calls = [method_call for method_call in all_calls[:9] if method_call[0] != "execute_qprogram"]
+        assert replayed_calls[-1] == call.set_parameter(
+            alias="readout_bus", parameter=Parameter.VOLTAGE, value=0.0, channel_id=None, output_id=None
+        )
+        assert resumed_calls[: len(replayed_calls)] == replayed_calls
+        continued_calls = resumed_calls[len(replayed_calls) :]
+        assert continued_calls == all_calls[len(all_calls) - len(continued_calls) :]
+        assert stored_indices[0] == (1, (0, 1))
+        assert stored_indices == all_stored_indices[len(all_stored_indices) - len(stored_indices) :]
+
+    def test_execute_resume_from_sets_the_values_of_the_resumed_iteration(self, platform, experiment, override_settings):
+        """Resuming inside an inner loop sets the instruments to the values of the enclosing loops' resumed iteration."""
+        with override_settings(
+            experiment_results_save_in_database=False,
+            experiment_live_plot_enabled=False,
+            experiment_live_plot_on_slurm=False,
+        ):
+            # Resume right before the second frequency of the second bias of the nested loops.
+            resumed = ExperimentExecutor(platform=platform, experiment=experiment, resume_from=29)
+            with patch.object(resumed, "_store_results", wraps=resumed._store_results) as store_results:
+                resumed.execute()
+
+        calls_before_first_execution = platform.mock_calls[
+            : next(index for index, method_call in enumerate(platform.mock_calls) if method_call[0] == "execute_qprogram")
+        ]
+        assert calls_before_first_execution[-2:] == [
+            call.set_parameter(
+                alias="readout_bus", parameter=Parameter.VOLTAGE, value=0.5, channel_id=None, output_id=None
+            ),
+            call.set_parameter(
+                alias="readout_bus", parameter=Parameter.LO_FREQUENCY, value=3e9, channel_id=None, output_id=None
+            ),
+        ]
+        assert store_results.call_args_list[0].args[1:] == (1, (1, 1))
+
+    def test_execute_pipelined(self, platform, experiment, override_settings):
+        """The pipelined mode makes the same platform calls in the same order and stores the same results, while
+        precompiling every QProgram that does not depend on a GetParameter."""
+        settings = {
+            "experiment_results_save_in_database": False,
+            "experiment_live_plot_enabled": False,
+            "experiment_live_plot_on_slurm": False,
+        }
+        with override_settings(**settings):
+            results_path = ExperimentExecutor(platform=platform, experiment=experiment).execute()
+        sequential_calls = list(platform.mock_calls)
+        with ExperimentResults(results_path) as experiment_results:
+            sequential_data = [experiment_results.get(qprogram, 0)[0] for qprogram in range(5)]
+
+        platform.reset_mock()
+        with override_settings(experiment_pipelined_execution=True, **settings):
+            executor = ExperimentExecutor(platform=platform, experiment=experiment)
+            results_path = executor.execute()
+
+        pipelined_calls = [
+            method_call
+            for method_call in platform.mock_calls
+            if not method_call[0].startswith("prepare_qprogram_precompilation")
+        ]
+        assert pipelined_calls == sequential_calls
+        # The experiment executes 17 QPrograms. All but the first one, which depends on a GetParameter, are precompiled.
+        assert platform.execute_qprogram.call_count == 17
+        assert platform.prepare_qprogram_precompilation.call_count == 16
+        assert platform.prepare_qprogram_precompilation.return_value.call_count == 16
+        assert executor.pipeline_statistics["precompiled"] == 16
+        assert executor.pipeline_statistics["overlap"] >= 0.0
+        with ExperimentResults(results_path) as experiment_results:
+            for qprogram, data in enumerate(sequential_data):
+                assert np.array_equal(experiment_results.get(qprogram, 0)[0], data)
+
+    def test_execute_pipelined_ignores_precompilation_errors(self, platform, experiment, override_settings):
+        """A failing precompilation is ignored, since the execution compiles the QProgram again."""
+        platform.prepare_qprogram_precompilation = Mock(return_value=Mock(side_effect=RuntimeError("stale parameters")))
+        with override_settings(
+            experiment_results_save_in_database=False,
+            experiment_live_plot_enabled=False,
+            experiment_live_plot_on_slurm=False,
+            experiment_pipelined_execution=True,
+        ):
+            executor = ExperimentExecutor(platform=platform, experiment=experiment)
+            executor.execute()
+
+        assert platform.execute_qprogram.call_count == 17
+        assert executor.pipeline_statistics["precompiled"] == 0
+
     @patch("qililab.platform.platform.get_db_manager")
     @patch("qililab.result.experiment_results_writer.h5py.File")
     def test_execute_database_metadata_only(
@@ -5651,6 +5651,82 @@ class TestQBloxCompiler:
         assert is_q1asm_equal(sequences["flux1"], flux1_str)
         assert is_q1asm_equal(sequences["flux2"], flux2_str)
         
+    def test_non_linear_crosstalk_compensation_lookup_tables(self):
+        """The compensated offsets of a swept loop are selected with a binary search over its lookup tables."""
+        inverse_xtalk_array = np.linalg.inv([[1, 0.5], [0.5, 1]])
+        crosstalk = CrosstalkMatrix().from_array(["flux1", "flux2"], inverse_xtalk_array)
+        non_linear_crosstalk = NonLinearCrosstalkMatrix.from_linear(crosstalk)
+        non_linear_crosstalk.set_non_linear_params("flux2", "flux1", beta_c=0.8, amplitude=0.5)
+
+        square_wf = Square(amplitude=0.1, duration=50)
+        square_iq = IQPair(I=square_wf, Q=square_wf)
+        qp = QProgram()
+        offset_1 = qp.variable(label="offset_1", domain=Domain.Voltage)
+        offset_2 = qp.variable(label="offset_2", domain=Domain.Voltage)
+        with qp.for_loop(variable=offset_1, start=0, stop=0.1, step=0.05):
+            with qp.for_loop(variable=offset_2, start=0, stop=0.35, step=0.05):
+                qp.set_offset(bus="flux1", offset_path0=offset_1)
+                qp.set_offset(bus="flux2", offset_path0=offset_2)
+                qp.play(bus="drive", waveform=square_iq)
+                qp.sync(["drive", "readout"])
+                qp.measure(bus="readout", waveform=square_iq, weights=square_iq)
+
+        compiler = QbloxCompiler()
+        sequences, acquisitions = compiler.compile(qprogram=qp, crosstalk=non_linear_crosstalk)
+
+        for bus in ["flux1", "flux2"]:
+            lines = [line.split() for line in repr(sequences[bus]._program).splitlines() if line.strip()]
+            instructions = [tokens[0] for tokens in lines]
+            # The index of the table is the sum of the registers of both loops
+            lookup = instructions.index("jmp")
+            assert lines[lookup] == ["jmp", "@lookup_0"]
+            assert instructions[lookup - 1] == "add"
+            assert all(operand.startswith("R") for operand in "".join(lines[lookup - 1][1:]).split(","))
+            assert lines[lookup + 1] == ["after_lookup_0:"]
+            # 24 entries, searched in 23 comparisons, each executing its offset and jumping back
+            assert instructions.count("jge") == 23
+            assert instructions.count("set_awg_offs") == 24
+            assert instructions.count("jmp") == 1 + 24
+            assert instructions.index("stop") < instructions.index("lookup_0:")
+            assert "loop" in instructions
+
+        # The acquisitions keep the shape of the loops
+        assert acquisitions["readout"]["Acquisition 0"].shape == (3, 8)
+
+    def test_non_linear_crosstalk_compensation_lookup_tables_of_plays(self):
+        """The compensated envelopes of a swept gain are played from the leaves of the binary search."""
+        inverse_xtalk_array = np.linalg.inv([[1, 0.5], [0.5, 1]])
+        crosstalk = CrosstalkMatrix().from_array(["flux1", "flux2"], inverse_xtalk_array)
+        non_linear_crosstalk = NonLinearCrosstalkMatrix.from_linear(crosstalk)
+        non_linear_crosstalk.set_non_linear_params("flux2", "flux1", beta_c=0.8, amplitude=0.5)
+
+        gauss_wf = Gaussian(amplitude=0.5, duration=40, num_sigmas=4)
+        square_wf = Square(amplitude=0.1, duration=50)
+        square_iq = IQPair(I=square_wf, Q=square_wf)
+        qp = QProgram()
+        gain = qp.variable(label="gain", domain=Domain.Voltage)
+        with qp.for_loop(variable=gain, start=0, stop=0.9, step=0.1):
+            qp.set_gain(bus="flux1", gain=gain)
+            qp.play(bus="flux1", waveform=gauss_wf)
+            qp.play(bus="drive", waveform=square_iq)
+            qp.sync(["drive", "readout"])
+            qp.measure(bus="readout", waveform=square_iq, weights=square_iq)
+
+        compiler = QbloxCompiler()
+        sequences, _ = compiler.compile(qprogram=qp, crosstalk=non_linear_crosstalk)
+
+        program = repr(sequences["flux1"]._program)
+        lines = [line.split() for line in program.splitlines() if line.strip()]
+        instructions = [tokens[0] for tokens in lines]
+        stop = instructions.index("stop")
+        # The gain is 0 in the first iteration and 1 in the rest, so its table has two runs
+        assert ["jmp", "@lookup_0"] in lines[:stop]
+        assert ["jmp", "@lookup_1"] in lines[:stop]
+        assert "play" not in instructions[:stop]
+        assert instructions[stop:].count("set_awg_gain") == 2
+        # Every entry plays its own envelope
+        assert len({tokens[1] for tokens in lines[stop:] if tokens[0] == "play"}) == 10
+
     def test_crosstalk_compensation_gain_loop(self, crosstalk_qprogram_gain_loop: QProgram):
 
         inverse_xtalk_array = np.linalg.inv([[1, 0.5], [0.5, 1]])
@@ -6155,7 +6231,12 @@ class TestQBloxCompiler:
         qp.play(bus="flux2", waveform=square_wf_wrong)
         
         compiler = QbloxCompiler()
-        with pytest.raises(ValueError, match=re.escape("operands could not be broadcast together with shapes (50,) (500,) ")):
+        with pytest.raises(
+            ValueError,
+            match=re.escape(
+                "Flux values must be scalars or arrays of the same shape, got shapes {'flux1': (50,), 'flux2': (500,)}."
+            ),
+        ):
             compiler.compile(qprogram=qp, crosstalk=crosstalk)
 
         # Raise error for FlatTop pulses with different elements (duration, smooth_duration or buffer)
@@ -6243,6 +6324,26 @@ class TestQBloxCompiler:
         readout_waveform_i = sequences["readout"]._waveforms._waveforms[0]
         np.testing.assert_allclose(readout_waveform_i.data, readout_wf.get_I().envelope())
 
+    def test_arbitrary_waveforms_are_deduplicated_by_content(self):
+        """Arbitrary waveforms are uploaded once per distinct content, even when they only differ in samples that
+        numpy hides when printing long arrays."""
+        samples = np.zeros(5_000)
+        other_samples = samples.copy()
+        other_samples[2_500] = 0.5
+
+        qp = QProgram()
+        for waveform_samples in (samples, other_samples, samples.copy()):
+            qp.play(bus="drive", waveform=IQPair(I=Arbitrary(waveform_samples), Q=Arbitrary(np.zeros(5_000))))
+
+        compiler = QbloxCompiler()
+        sequences, _ = compiler.compile(qprogram=qp)
+
+        waveforms = sequences["drive"]._waveforms._waveforms
+        assert len(waveforms) == 2
+        np.testing.assert_array_equal(waveforms[0].data, samples)
+        np.testing.assert_array_equal(waveforms[1].data, other_samples)
+        assert set(compiler._buses["drive"].waveform_to_index.values()) == {(0, 5_000), (1, 5_000)}
+
     def test_bus_distortions_measure_reset_control_bus_raises_at_compile_time(self):
         """Test that distortions on a MeasureReset's control_bus raise NotImplementedError through the compiler."""
         distortion = ExponentialCorrection(tau_exponential=1.0, amp=0.5)
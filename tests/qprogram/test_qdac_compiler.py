@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import numpy as np
 import pytest
@@ -15,6 +15,7 @@ from qililab.qprogram.crosstalk_matrix import CrosstalkMatrix, NonLinearCrosstal
 from qililab.qprogram.operations import Play
 from qililab.qprogram.qdac_compiler import QdacCompilationOutput
 from qililab.core.variables import Domain
+from qililab.typings.enums import Parameter
 from qililab.waveforms import Square
 from qililab.waveforms.arbitrary import Arbitrary
 from qililab.waveforms.iq_pair import IQPair
@@ -189,6 +190,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -206,6 +208,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -223,6 +226,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -240,6 +244,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -257,6 +262,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -274,6 +280,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -292,6 +299,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -309,6 +317,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -318,6 +327,45 @@ class TestQdacCompiler:
         assert qdac_bus.upload_voltage_list.call_count == 16
         assert qdac_bus.set_end_marker_internal_trigger.call_count == 2
 
+    def test_compile_plans_actions_without_calling_the_instruments(self, qdac: QDevilQDac2, flux1: Bus, flux2: Bus):
+        """Compiling only plans the calls to the instruments, which are performed when applying the output."""
+        qdac_bus = flux1.instruments[0]
+
+        pulse_wf = Square(1.0, 100)
+        qp = QProgram()
+        qp.qdac.play(bus="flux1", waveform=pulse_wf, dwell=2)
+        qp.set_offset(bus="flux2", offset_path0=0.1)
+        qp.set_trigger(bus="flux1", duration=10e-6, outputs=1, position="start")
+
+        compiler = QdacCompiler()
+        output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+
+        qdac_bus.upload_voltage_list.assert_not_called()
+        qdac_bus.set_parameter.assert_not_called()
+        qdac_bus.set_start_marker_external_trigger.assert_not_called()
+        assert [(action.method, action.channel_id) for action in output.actions] == [
+            ("upload_voltage_list", 1),
+            ("set_parameter", 2),
+            ("set_start_marker_external_trigger", 1),
+        ]
+        upload = output.actions[0]
+        assert upload.instrument is qdac_bus
+        assert upload.digest == QDevilQDac2.voltage_list_digest(pulse_wf, dwell_us=2)
+        assert all(action.digest is None for action in output.actions[1:])
+
+        # compiling the same QProgram again gives the same digests
+        assert compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0]).actions[0].digest == upload.digest
+
+        output.apply()
+
+        qdac_bus.upload_voltage_list.assert_called_once_with(
+            waveform=pulse_wf, channel_id=1, dwell_us=2, sync_delay_s=0, repetitions=1, stepped=False, digest=upload.digest
+        )
+        qdac_bus.set_parameter.assert_called_once_with(parameter=Parameter.VOLTAGE, value=0.1, channel_id=2)
+        qdac_bus.set_start_marker_external_trigger.assert_called_once_with(
+            channel_id=1, out_port=1, trigger="trigger_flux1_1_start", width_s=10e-6
+        )
+
     def test_set_trigger_on_non_trigger_bus_with_existing_dc_list(self, qdac: QDevilQDac2, flux1: Bus, flux2: Bus):
         """Test set_trigger on a non-trigger bus when a DC list already exists on the trigger bus."""
         qdac_bus = flux1.instruments[0]
@@ -338,6 +386,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._trigger_position == "front"
@@ -357,17 +406,21 @@ class TestQdacCompiler:
         qdac._cache_dc = {}
 
         qp = QProgram()
-        qp.qdac.play(bus="flux_qdac1", waveform=pulse_wf, dwell=dwell_us)
+        # Only the non trigger_sync bus plays, so no DC list is planned on the trigger bus either
+        qp.qdac.play(bus="flux_qdac2", waveform=pulse_wf, dwell=dwell_us)
         # set_trigger on flux2, which is NOT a trigger_sync bus, and no DC list exists
         qp.set_trigger(bus="flux_qdac2", duration=10e-6, outputs=out_port, position="start")
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac, qdac_2], qdac_buses=[flux_qdac1, flux_qdac2], qdac_offsets=[0, 0], out_instrument=qdac)
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._trigger_position == "front"
-        # Once for the original play on flux1 + once for the synthetic constant waveform created by the fallback
-        assert qdac_bus.upload_voltage_list.call_count == 2
+        # The original play on flux2 + the synthetic constant waveform created by the fallback on flux1
+        assert qdac_2.upload_voltage_list.call_count == 1
+        assert qdac_bus.upload_voltage_list.call_count == 1
+        np.testing.assert_allclose(qdac_bus.upload_voltage_list.call_args.kwargs["waveform"].envelope(), 0.5)
         assert qdac_bus.set_start_marker_external_trigger.call_count == 1
 
     def test_set_trigger_on_non_trigger_bus_no_dc_list_no_play_raises_error(
@@ -407,6 +460,7 @@ class TestQdacCompiler:
             qdac_offsets=[0, 0],
             out_instrument=qdac,
         )
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -439,6 +493,7 @@ class TestQdacCompiler:
         output = compiler.compile(
             qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0], crosstalk=crosstalk
         )
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qdacs == [qdac]
@@ -466,6 +521,7 @@ class TestQdacCompiler:
         output = compiler.compile(
             qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0], crosstalk=crosstalk
         )
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qdacs == [qdac]
@@ -499,6 +555,7 @@ class TestQdacCompiler:
         output = compiler.compile(
             qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0], calibration=calibration
         )
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qdacs == [qdac]
@@ -556,6 +613,7 @@ class TestQdacCompiler:
         output = compiler.compile(
             qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0], crosstalk=crosstalk
         )
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qdacs == [qdac]
@@ -587,6 +645,7 @@ class TestQdacCompiler:
             crosstalk=nonlinear,
             target_fluxes={"flux1": 0.0, "flux2": 0.1},
         )
+        output.apply()
 
         plays = _collect_plays(output.qprogram.body)
         assert {"flux1", "flux2"} <= set(plays)
@@ -619,6 +678,7 @@ class TestQdacCompiler:
             qdac_offsets=qdac_offsets,
             crosstalk=crosstalk,
         )  # no target_fluxes -> fallback to voltage recovery
+        output.apply()
 
         plays = _collect_plays(output.qprogram.body)
         got2 = np.asarray(plays["flux2"].waveform.envelope(), dtype=float)
@@ -662,9 +722,10 @@ class TestQdacCompiler:
         qp.qdac.play(bus="flux1", waveform=pulse_wf, dwell=dwell_us)
 
         compiler = QdacCompiler()
-        compiler.compile(
+        output = compiler.compile(
             qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0], bus_mapping={"flux1": "flux1"}
         )
+        output.apply()
 
         assert qdac_bus.upload_voltage_list.call_count == 1
 
@@ -675,7 +736,8 @@ class TestQdacCompiler:
         qp.play(bus="flux1", waveform="Xpi")
 
         compiler = QdacCompiler()
-        compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], calibration=calibration, qdac_offsets=[0])
+        output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], calibration=calibration, qdac_offsets=[0])
+        output.apply()
 
         qdac_bus.upload_voltage_list.assert_called_with(
             waveform=calibration.get_waveform(bus="flux1", name="Xpi"),
@@ -684,6 +746,7 @@ class TestQdacCompiler:
             sync_delay_s=0,
             repetitions=1,
             stepped=False,
+            digest=ANY,
         )
 
     def test_play_incorrect_named_operation_raises_error(self, qdac: QDevilQDac2, flux1: Bus):
@@ -709,10 +772,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=1, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=1, stepped=False, digest=ANY
         )
 
         # 100 repetitions
@@ -721,10 +785,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=100, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=100, stepped=False, digest=ANY
         )
 
         # Infinite repetitions (repetitions = -1)
@@ -733,10 +798,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=-1, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=-1, stepped=False, digest=ANY
         )
 
     def test_play_and_set_trigger_no_position_raises_trigger(self, qdac: QDevilQDac2, flux1: Bus, flux2: Bus):
@@ -786,10 +852,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=6, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=6, stepped=False, digest=ANY
         )
 
         # For loop
@@ -800,6 +867,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         # For loop decimals
         qp = QProgram()
@@ -809,10 +877,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=11, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=11, stepped=False, digest=ANY
         )
 
         # Arbitrary loop
@@ -823,10 +892,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=4, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=4, stepped=False, digest=ANY
         )
 
         # Parallel loop
@@ -838,10 +908,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=3, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=3, stepped=False, digest=ANY
         )
 
         # Combining loops
@@ -858,10 +929,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=288, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=288, stepped=False, digest=ANY
         )
 
         # Infinite loop
@@ -871,10 +943,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=-1, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=-1, stepped=False, digest=ANY
         )
 
         # Infinite loop with other loops is still infinite
@@ -886,10 +959,11 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         qdac_bus.upload_voltage_list.assert_called_with(
-            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=-1, stepped=False
+            waveform=wf, channel_id=1, dwell_us=dwell, sync_delay_s=0, repetitions=-1, stepped=False, digest=ANY
         )
 
     def test_for_loops_with_no_iterations_raises_error(self, qdac: QDevilQDac2, flux1: Bus):
@@ -922,6 +996,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -940,6 +1015,7 @@ class TestQdacCompiler:
 
         compiler = QdacCompiler()
         output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1, flux2], qdac_offsets=[0, 0])
+        output.apply()
 
         assert isinstance(output, QdacCompilationOutput)
         assert compiler._qprogram == qp
@@ -963,7 +1039,8 @@ class TestQdacCompiler:
             qp.qdac.play(bus="flux1", waveform=pulse_wf, dwell=dwell_us)
 
         compiler = QdacCompiler()
-        compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output = compiler.compile(qprogram=qp, qdacs=[qdac], qdac_buses=[flux1], qdac_offsets=[0])
+        output.apply()
 
         assert qdac_bus.upload_voltage_list.call_count == 1
 
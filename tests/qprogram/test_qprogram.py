@@ -2,18 +2,21 @@ import math
 import os
 import re
 from itertools import product
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
 from qililab import Arbitrary, Domain, GaussianDragCorrection, Gaussian, IQPair, QProgram, Square, IQDrag
-from qililab.qprogram.blocks import Average
+from qililab.qprogram.blocks import Average, ForLoop
 from qililab.qprogram.calibration import Calibration
 from qililab.qprogram.crosstalk_matrix import CrosstalkMatrix, NonLinearCrosstalkMatrix
 from qililab.pulse_distortion import ExponentialCorrection
+from qililab.qprogram import BusMappingTransform, CalibrationTransform, DistortionsTransform
 from qililab.qprogram.operations import (
     Acquire,
     AcquireWithCalibratedWeights,
+    LookupTable,
     Measure,
     MeasureReset,
     MeasureResetCalibrated,
@@ -488,6 +491,84 @@ class TestQProgram(TestStructuredProgram):
 
         assert isinstance(new_qp.body.elements[0].elements[0], MeasureReset)
 
+    def test_with_transforms_shares_unchanged_blocks_and_operations(self):
+        """Only the blocks containing rewritten operations are copied; everything else is shared with the original."""
+        flux_wf = Square(amplitude=1.0, duration=100)
+        qp = QProgram()
+        with qp.average(1000):
+            qp.play(bus="drive", waveform="xgate")
+            qp.wait(bus="drive", duration=100)
+        with qp.average(1000):
+            qp.play(bus="flux", waveform=flux_wf)
+
+        calibration = Calibration()
+        calibration.add_waveform(bus="drive_q0_bus", name="xgate", waveform=Square(amplitude=0.5, duration=40))
+        new_qp = qp.with_transforms(
+            BusMappingTransform({"drive": "drive_q0_bus"}), CalibrationTransform(calibration)
+        )
+
+        calibrated_average, flux_average = new_qp.body.elements
+        assert new_qp.body is not qp.body
+        assert calibrated_average is not qp.body.elements[0]
+        assert isinstance(calibrated_average.elements[0], Play)
+        assert calibrated_average.elements[0].bus == "drive_q0_bus"
+        assert calibrated_average.elements[1].bus == "drive_q0_bus"
+        assert flux_average is qp.body.elements[1]
+        assert flux_average.elements[0].waveform is flux_wf
+        assert new_qp.buses == {"drive_q0_bus", "flux"}
+
+        # The original QProgram is left unchanged.
+        assert isinstance(qp.body.elements[0].elements[0], PlayWithCalibratedWaveform)
+        assert qp.body.elements[0].elements[1].bus == "drive"
+        assert qp.buses == {"drive", "flux"}
+
+    def test_with_transforms_in_one_traversal_matches_chained_methods(self):
+        distortion = ExponentialCorrection(tau_exponential=1.0, amp=0.5)
+        readout = IQPair(I=Square(1.0, 200), Q=Square(1.0, 200))
+        weights = IQPair(I=Square(1.0, 2000), Q=Square(1.0, 2000))
+        calibration = Calibration()
+        calibration.add_waveform(bus="flux_q0_bus", name="pulse", waveform=Square(amplitude=0.5, duration=40))
+        calibration.add_weights(bus="readout_q0_bus", name="weights", weights=weights)
+
+        qp = QProgram()
+        with qp.average(1000):
+            qp.play(bus="flux", waveform="pulse")
+            qp.sync()
+            qp.measure(bus="readout", waveform=readout, weights="weights")
+
+        bus_mapping = {"flux": "flux_q0_bus", "readout": "readout_q0_bus"}
+        chained_qp = (
+            qp.with_bus_mapping(bus_mapping)
+            .with_calibration(calibration)
+            .with_distortions({"flux_q0_bus": [distortion]})
+        )
+        fused_qp = qp.with_transforms(
+            BusMappingTransform(bus_mapping),
+            CalibrationTransform(calibration),
+            DistortionsTransform({"flux_q0_bus": [distortion]}),
+        )
+
+        assert fused_qp.buses == chained_qp.buses
+        for fused, chained in zip(fused_qp.body.elements[0].elements, chained_qp.body.elements[0].elements):
+            assert type(fused) is type(chained)
+            assert getattr(fused, "bus", None) == getattr(chained, "bus", None)
+        np.testing.assert_allclose(
+            fused_qp.body.elements[0].elements[0].waveform.envelope(),
+            chained_qp.body.elements[0].elements[0].waveform.envelope(),
+        )
+
+    def test_with_transforms_copy_blocks(self):
+        qp = QProgram()
+        with qp.average(1000):
+            qp.wait(bus="drive", duration=100)
+
+        new_qp = qp.with_transforms(copy_blocks=True)
+        new_qp.body.elements[0].elements.append(Wait(bus="drive", duration=50))
+
+        assert new_qp.body.elements[0] is not qp.body.elements[0]
+        assert new_qp.body.elements[0].elements[0] is qp.body.elements[0].elements[0]
+        assert len(qp.body.elements[0].elements) == 1
+
     def test_average_method(self):
         """Test acquire_loop method"""
         qp = QProgram()
@@ -812,7 +893,7 @@ class TestQProgram(TestStructuredProgram):
         qp.set_offset(bus="flux1", offset_path0=0)
         qp.set_offset(bus="flux2", offset_path0=0)
 
-        new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk)
+        new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk, lookup_tables=False)
         assert new_qp is not None
         # FIRST ITERATION
         assert isinstance(new_qp.body.elements[0], SetOffset)
@@ -875,7 +956,7 @@ class TestQProgram(TestStructuredProgram):
             qp.sync(["drive", "readout"])
             qp.measure(bus="readout", waveform=square_iq, weights=square_iq)
 
-        new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk)
+        new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk, lookup_tables=False)
         assert new_qp is not None
         # FIRST ITERATION FIRST LOOP
         assert isinstance(new_qp.body.elements[0], SetOffset)
@@ -1161,6 +1242,179 @@ class TestQProgram(TestStructuredProgram):
         # ... second iteration of the loop
         assert isinstance(new_qp.body.elements[26], Sync)
 
+    def test_with_crosstalk_non_linear_folds_loop_into_lookup_tables(self):
+        """Test with_crosstalk_qblox keeps a swept loop as a hardware loop selecting the compensated offsets from
+        lookup tables."""
+        inverse_xtalk_array = np.linalg.inv([[1, 0.5], [0.5, 1]])
+        crosstalk = CrosstalkMatrix().from_array(["flux1", "flux2"], inverse_xtalk_array)
+        non_linear_crosstalk = NonLinearCrosstalkMatrix.from_linear(crosstalk)
+        non_linear_crosstalk.set_non_linear_params("flux2", "flux1", beta_c=0.8, amplitude=0.5)
+
+        square_wf = Square(amplitude=0.1, duration=50)
+        square_iq = IQPair(I=square_wf, Q=square_wf)
+        qp = QProgram()
+        offset = qp.variable(label="offset", domain=Domain.Voltage)
+        with qp.for_loop(variable=offset, start=0, stop=0.9, step=0.1):
+            qp.set_offset(bus="flux1", offset_path0=offset)
+            qp.set_offset(bus="flux2", offset_path0=0.1)
+            qp.play(bus="drive", waveform=square_iq)
+            qp.sync(["drive", "readout"])
+            qp.measure(bus="readout", waveform=square_iq, weights=square_iq)
+        qp.set_offset(bus="flux1", offset_path0=0)
+        qp.set_offset(bus="flux2", offset_path0=0)
+
+        new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk)
+        unrolled_qp = qp.with_crosstalk_qblox(non_linear_crosstalk, lookup_tables=False)
+
+        loop = new_qp.body.elements[0]
+        assert isinstance(loop, ForLoop)
+        assert loop.variable.label == "offset_index"
+        assert loop.variable in new_qp.variables
+        assert (loop.start, loop.stop, loop.step) == (0, 9, 1)
+        flux1_table, flux2_table, play, sync, measure, last_sync = loop.elements
+        for table, bus, element in [(flux1_table, "flux1", 0), (flux2_table, "flux2", 1)]:
+            assert isinstance(table, LookupTable)
+            assert table.bus == bus
+            assert table.index == [loop.variable]
+            assert table.keys == list(range(10))
+            # Every entry is the offset of the same iteration of the unrolled loop
+            for iteration, operation in enumerate(table.operations):
+                assert isinstance(operation, SetOffset)
+                assert math.isclose(
+                    operation.offset_path0, unrolled_qp.body.elements[6 * iteration + element].offset_path0
+                )
+        assert math.isclose(flux1_table.operations[0].offset_path0, 0.05)
+        assert math.isclose(flux1_table.operations[-1].offset_path0, 0.7028822095929785)
+        assert isinstance(play, Play)
+        assert play.bus == "drive"
+        assert sync.buses == ["drive", "readout"]
+        assert isinstance(measure, Measure)
+        assert isinstance(last_sync, Sync)
+        # The offsets after the loop are kept
+        assert isinstance(new_qp.body.elements[1], SetOffset)
+        assert math.isclose(new_qp.body.elements[1].offset_path0, 0.0)
+        assert isinstance(new_qp.body.elements[2], SetOffset)
+        assert math.isclose(new_qp.body.elements[2].offset_path0, 0.0)
+
+        # Mapping the bus of a table maps the bus of its entries
+        mapped_table = new_qp.with_transforms(BusMappingTransform({"flux1": "flux_q0"})).body.elements[0].elements[0]
+        assert mapped_table.bus == "flux_q0"
+        assert all(operation.bus == "flux_q0" for operation in mapped_table.operations)
+        assert all(operation.bus == "flux1" for operation in flux1_table.operations)
+
+    def test_with_crosstalk_non_linear_folds_nested_loops(self):
+        """Test with_crosstalk_qblox merges the lookup tables of nested loops into tables indexed by both loops."""
+        inverse_xtalk_array = np.linalg.inv([[1, 0.5], [0.5, 1]])
+        crosstalk = CrosstalkMatrix().from_array(["flux1", "flux2"], inverse_xtalk_array)
+        non_linear_crosstalk = NonLinearCrosstalkMatrix.from_linear(crosstalk)
+        non_linear_crosstalk.set_non_linear_params("flux2", "flux1", beta_c=0.8, amplitude=0.5)
+
+        square_wf = Square(amplitude=0.1, duration=50)
+        square_iq = IQPair(I=square_wf, Q=square_wf)
+        qp = QProgram()
+        offset_1 = qp.variable(label="offset_1", domain=Domain.Voltage)
+        offset_2 = qp.variable(label="offset_2", domain=Domain.Voltage)
+        with qp.for_loop(variable=offset_1, start=0, stop=0.2, step=0.1):
+            with qp.for_loop(variable=offset_2, start=0, stop=0.7, step=0.1):
+                qp.set_offset(bus="flux1", offset_path0=offset_1)
+                qp.set_offset(bus="flux2", offset_path0=offset_2)
+                qp.play(bus="drive", waveform=square_iq)
+                qp.sync(["drive", "readout"])
+                qp.measure(bus="readout", waveform=square_iq, weights=square_iq)
+
+        new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk)
+        unrolled_qp = qp.with_crosstalk_qblox(non_linear_crosstalk, lookup_tables=False)
+
+        outer_loop = new_qp.body.elements[0]
+        assert isinstance(outer_loop, ForLoop)
+        assert (outer_loop.start, outer_loop.stop, outer_loop.step) == (0, 16, 8)
+        inner_loop = outer_loop.elements[0]
+        assert isinstance(inner_loop, ForLoop)
+        assert (inner_loop.start, inner_loop.stop, inner_loop.step) == (0, 7, 1)
+
+        flux1_table, flux2_table = inner_loop.elements[:2]
+        for table, element in [(flux1_table, 0), (flux2_table, 1)]:
+            assert isinstance(table, LookupTable)
+            assert table.index == [outer_loop.variable, inner_loop.variable]
+            assert table.keys == list(range(24))
+            for iteration, operation in enumerate(table.operations):
+                assert math.isclose(
+                    operation.offset_path0, unrolled_qp.body.elements[6 * iteration + element].offset_path0
+                )
+
+    def test_with_crosstalk_non_linear_folds_plays(self):
+        """Test with_crosstalk_qblox selects the compensated waveforms of a gain sweep from lookup tables, which
+        distortions are then applied to."""
+        inverse_xtalk_array = np.linalg.inv([[1, 0.5], [0.5, 1]])
+        crosstalk = CrosstalkMatrix().from_array(["flux1", "flux2"], inverse_xtalk_array)
+        non_linear_crosstalk = NonLinearCrosstalkMatrix.from_linear(crosstalk)
+        non_linear_crosstalk.set_non_linear_params("flux2", "flux1", beta_c=0.8, amplitude=0.5)
+
+        gauss_wf = Gaussian(amplitude=0.5, duration=40, num_sigmas=4)
+        square_wf = Square(amplitude=0.1, duration=50)
+        square_iq = IQPair(I=square_wf, Q=square_wf)
+        qp = QProgram()
+        gain = qp.variable(label="gain", domain=Domain.Voltage)
+        with qp.for_loop(variable=gain, start=0, stop=0.9, step=0.1):
+            qp.set_gain(bus="flux1", gain=gain)
+            qp.play(bus="flux1", waveform=gauss_wf)
+            qp.play(bus="drive", waveform=square_iq)
+            qp.sync(["drive", "readout"])
+            qp.measure(bus="readout", waveform=square_iq, weights=square_iq)
+
+        new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk)
+
+        loop = new_qp.body.elements[0]
+        assert isinstance(loop, ForLoop)
+        play_tables = [
+            element
+            for element in loop.elements
+            if isinstance(element, LookupTable) and isinstance(element.operations[0], Play)
+        ]
+        assert [table.bus for table in play_tables] == ["flux1", "flux2"]
+        # The first gain is 0, so only the other entries have a compensated envelope
+        assert all(isinstance(play.waveform, Arbitrary) for play in play_tables[0].operations[1:])
+
+        distortion = ExponentialCorrection(tau_exponential=1.0, amp=0.5)
+        distorted_qp = new_qp.with_distortions(bus_distortions={"flux1": [distortion]})
+
+        distorted_tables = [
+            element
+            for element in distorted_qp.body.elements[0].elements
+            if isinstance(element, LookupTable) and isinstance(element.operations[0], Play)
+        ]
+        for play, distorted_play in zip(play_tables[0].operations, distorted_tables[0].operations):
+            np.testing.assert_allclose(
+                distorted_play.waveform.envelope(), distortion.apply(play.waveform.envelope())
+            )
+        # The tables of other buses are shared
+        assert distorted_tables[1] is play_tables[1]
+
+    def test_with_crosstalk_non_linear_unrolls_loop_if_lookup_tables_do_not_fit(self):
+        """Test with_crosstalk_qblox unrolls a swept loop whose lookup tables exceed the sequencer memory."""
+        inverse_xtalk_array = np.linalg.inv([[1, 0.5], [0.5, 1]])
+        crosstalk = CrosstalkMatrix().from_array(["flux1", "flux2"], inverse_xtalk_array)
+        non_linear_crosstalk = NonLinearCrosstalkMatrix.from_linear(crosstalk)
+        non_linear_crosstalk.set_non_linear_params("flux2", "flux1", beta_c=0.8, amplitude=0.5)
+
+        square_wf = Square(amplitude=0.1, duration=50)
+        square_iq = IQPair(I=square_wf, Q=square_wf)
+        qp = QProgram()
+        offset = qp.variable(label="offset", domain=Domain.Voltage)
+        with qp.for_loop(variable=offset, start=0, stop=0.9, step=0.1):
+            qp.set_offset(bus="flux1", offset_path0=offset)
+            qp.play(bus="drive", waveform=square_iq)
+            qp.sync(["drive", "readout"])
+            qp.measure(bus="readout", waveform=square_iq, weights=square_iq)
+
+        assert isinstance(qp.with_crosstalk_qblox(non_linear_crosstalk).body.elements[0], ForLoop)
+
+        with patch("qililab.qprogram.utils_crosstalk.MAX_LOOKUP_TABLE_INSTRUCTIONS", 20):
+            new_qp = qp.with_crosstalk_qblox(non_linear_crosstalk)
+
+        assert not any(isinstance(element, (ForLoop, LookupTable)) for element in new_qp.body.elements)
+        assert len(new_qp.body.elements) == 10 * 6
+
     def test_set_markers(self):
         qp = QProgram()
         qp.qblox.set_markers(bus="drive", mask="0111")
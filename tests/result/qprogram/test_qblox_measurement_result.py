@@ -104,3 +104,46 @@ class TestsQbloxQProgramMeasurementResult:
         assert isinstance(thresholded_data, np.ndarray)
         assert np.all(thresholded_data == expected_thresholds)
         assert thresholded_data.shape == expected_thresholds.shape
+
+    def test_buffers_are_converted_once_and_cached(self, qblox_measurement_result_nested_loops: QbloxMeasurementResult):
+        """Test the raw data is converted to read-only numpy buffers, and the arrays are cached views of them."""
+        result = qblox_measurement_result_nested_loops
+
+        assert not hasattr(result, "__dict__")
+        assert result.integration.shape == (2, 6)
+        assert result.integration.flags.c_contiguous
+        assert result.array is result.array
+        assert result.threshold is result.threshold
+        assert np.shares_memory(result.array, result.integration)
+        assert np.shares_memory(result.threshold, result.thresholded)
+        with pytest.raises(ValueError, match="read-only"):
+            result.array[0, 0, 0] = 0
+
+    def test_deinterleave(self, raw_measurement_data_nested_loops: dict):
+        """Test intertwined acquisitions are separated into strided views of the buffers."""
+        result = QbloxMeasurementResult(bus="readout", raw_measurement_data=raw_measurement_data_nested_loops, shape=(3,))
+
+        first, second = result.deinterleave(2)
+
+        assert np.array_equal(first.array, [[1, 3, 5], [7, 9, 11]])
+        assert np.array_equal(second.array, [[2, 4, 6], [8, 10, 12]])
+        assert np.array_equal(second.threshold, [[0.2, 0.4, 0.6]])
+        assert np.shares_memory(first.array, result.integration)
+        assert first.bus == "readout"
+        assert result.deinterleave(1) == [result]
+
+    def test_serialization_keeps_buffers(self, qblox_measurement_result_nested_loops: QbloxMeasurementResult):
+        """Test serialization keeps the buffers and the shape of the result."""
+        deserialized = deserialize(serialize(qblox_measurement_result_nested_loops), QbloxMeasurementResult)
+
+        assert deserialized.bus == "readout"
+        assert deserialized.shape == (2, 3)
+        assert np.array_equal(deserialized.array, qblox_measurement_result_nested_loops.array)
+        assert np.array_equal(deserialized.threshold, qblox_measurement_result_nested_loops.threshold)
+
+    def test_setstate_from_raw_measurement_data(self, raw_measurement_data: dict):
+        """Test results serialized with their raw measurement data are restored."""
+        result = QbloxMeasurementResult.__new__(QbloxMeasurementResult)
+        result.__setstate__({"bus": "readout", "shape": None, "raw_measurement_data": raw_measurement_data})
+
+        assert np.array_equal(result.array, [[1, 2, 3], [4, 5, 6]])
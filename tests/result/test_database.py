@@ -16,13 +16,15 @@ from qililab.qprogram import Calibration
 from qililab.result import AutocalMeasurement
 from qililab.result.database import CalibrationRun, QaaS_Experiment
 from qililab.result.database.database_manager import (
+    SUMMARY_COLUMNS,
     DatabaseManager,
     _load_config,
     get_db_manager,
     get_engine,
     load_by_id,
 )
-from qililab.result.database.database_measurements import Measurement, SequenceRun
+from qililab.result.database.database_measurements import BLOB_REFERENCE_KEY, Blob, Measurement, SequenceRun
+from qililab.result.database.database_write_queue import DatabaseWriteQueue
 
 # Use non-interactive backend for testing
 mpl.use("Agg")
@@ -367,6 +369,29 @@ class TestMeasurement:
         data_mock.take.assert_any_call(indices=1, axis=1)
         mock_data_array.assert_called_once()
 
+    @patch("qililab.result.database.database_measurements.ExperimentResults")
+    def test_read_experiment_xarray_lazy_owns_results_file(self, mock_experiment_results, measurement):
+        mock_results = mock_experiment_results.return_value
+        data_array = mock_results.view.return_value.as_complex.return_value.to_xarray.return_value
+
+        result = measurement.read_experiment_xarray(lazy=True)
+
+        assert result is data_array
+        mock_experiment_results.assert_called_once_with(str(measurement.result_path))
+        mock_results.__enter__.assert_called_once()
+        mock_results.__exit__.assert_not_called()
+        data_array.set_close.assert_called_once_with(mock_results.__exit__)
+
+    @patch("qililab.result.database.database_measurements.ExperimentResults")
+    def test_read_experiment_xarray_lazy_closes_results_file_on_error(self, mock_experiment_results, measurement):
+        mock_results = mock_experiment_results.return_value
+        mock_results.view.side_effect = KeyError("QProgram_0")
+
+        with pytest.raises(KeyError, match="QProgram_0"):
+            measurement.read_experiment_xarray(lazy=True)
+
+        mock_results.__exit__.assert_called_once()
+
     @patch("qililab.result.database.database_measurements.load_results")
     def test_load_old_h5(self, mock_load_results, measurement):
         measurement.load_old_h5()
@@ -1311,8 +1336,9 @@ def test_get_db_manager(mock_db_manager):
     get_db_manager()
     mock_db_manager.assert_called_once_with(filename, "postgresql")
 
+@patch.dict("qililab.result.database.database_manager._engines", clear=True)
 @patch("qililab.result.database.database_manager.create_engine")
-def test_get_engine(mock_create_engine):
+def test_get_engine(mock_create_engine, override_settings):
     user = "user"
     passwd = "password"
     host = "localhost"
@@ -1320,8 +1346,265 @@ def test_get_engine(mock_create_engine):
     database = "mydb"
     expected_url = f"postgresql://{user}:{passwd}@{host}:{port}/{database}"
 
-    get_engine(user, passwd, host, port, database)
-    mock_create_engine.assert_called_once_with(expected_url)
+    with override_settings(database_pool_size=3, database_pool_max_overflow=2, database_pool_recycle=600):
+        engine = get_engine(user, passwd, host, port, database)
+    mock_create_engine.assert_called_once_with(
+        expected_url, pool_size=3, max_overflow=2, pool_recycle=600, pool_pre_ping=True
+    )
+
+    # The engine, and its connection pool, is reused for the same database
+    assert get_engine(user, passwd, host, port, database) is engine
+    mock_create_engine.assert_called_once()
+    get_engine(user, passwd, host, port, "otherdb")
+    assert mock_create_engine.call_count == 2
+
+
+class TestDatabaseWriteQueue:
+    """Tests for the DatabaseWriteQueue class."""
+
+    @staticmethod
+    def _sessionmaker():
+        sessions = []
+
+        def session():
+            running_session = MagicMock()
+            running_session.__enter__.return_value = running_session
+            sessions.append(running_session)
+            return running_session
+
+        return session, sessions
+
+    def test_writes_are_committed_in_order_and_batches(self):
+        session, sessions = self._sessionmaker()
+        written = []
+        queue = DatabaseWriteQueue(session, batch_size=100)
+
+        for index in range(50):
+            queue.put([lambda running_session, index=index: written.append(index)])
+        queue.flush()
+
+        assert written == list(range(50))
+        assert 1 <= len(sessions) <= 50
+        assert all(running_session.commit.call_count == 1 for running_session in sessions)
+        queue.close()
+
+    def test_batch_size_limits_the_writes_per_transaction(self):
+        session, sessions = self._sessionmaker()
+        queue = DatabaseWriteQueue(session, batch_size=1)
+
+        for _ in range(5):
+            queue.put([lambda running_session: None])
+        queue.close()
+
+        assert len(sessions) == 5
+
+    def test_errors_are_raised_on_flush(self):
+        session, sessions = self._sessionmaker()
+        queue = DatabaseWriteQueue(session)
+
+        def fail(_):
+            raise ValueError("DB error")
+
+        queue.put([fail])
+        with pytest.raises(ValueError, match="DB error"):
+            queue.flush()
+        sessions[0].rollback.assert_called_once()
+        sessions[0].commit.assert_not_called()
+
+        # The error is only raised once, and the queue keeps working
+        queue.put([lambda running_session: None])
+        queue.flush()
+        queue.close()
+
+    def test_on_commit_only_receives_committed_writes(self):
+        session, _ = self._sessionmaker()
+        committed = []
+        queue = DatabaseWriteQueue(session, batch_size=1, on_commit=committed.extend)
+
+        def fail(_):
+            raise ValueError("DB error")
+
+        failing, succeeding = [fail], [lambda running_session: None]
+        queue.put(failing)
+        queue.put(succeeding)
+        with pytest.raises(ValueError, match="DB error"):
+            queue.close()
+
+        assert committed == [succeeding]
+
+    def test_put_after_close_raises(self):
+        session, _ = self._sessionmaker()
+        queue = DatabaseWriteQueue(session)
+        queue.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            queue.put([lambda running_session: None])
+
+
+class TestDatabaseManagerWrites:
+    """Tests for asynchronous writes and blob deduplication of the DatabaseManager."""
+
+    @patch("qililab.result.database.database_manager.os.makedirs")
+    def test_asynchronous_add_measurement(self, mock_makedirs, db_manager: DatabaseManager):
+        db_manager.current_sample = "sampleA"
+        db_manager.current_cd = "cdX"
+        db_manager._write_queue = DatabaseWriteQueue(db_manager.session)
+
+        measurement = db_manager.add_measurement("exp1", experiment_completed=False)
+        db_manager.flush()
+
+        db_manager._mock_session.add.assert_called_once_with(measurement)
+        db_manager._mock_session.commit.assert_called_once()
+
+        db_manager.close()
+        assert db_manager._write_queue is None
+
+    @patch("qililab.result.database.database_manager.os.makedirs")
+    def test_blobs_are_deduplicated(self, mock_makedirs, db_manager: DatabaseManager):
+        db_manager.current_sample = "sampleA"
+        db_manager.current_cd = "cdX"
+        db_manager._deduplicate_blobs = True
+        platform = {"name": "galadriel", "buses": [{"alias": "drive_q0"}]}
+
+        with patch.object(Blob.__table__, "create") as mock_create:
+            first = db_manager.add_measurement("exp1", experiment_completed=False, platform=platform)
+            second = db_manager.add_measurement("exp2", experiment_completed=False, platform=dict(platform))
+
+        mock_create.assert_called_once()
+        assert first.platform == second.platform
+        assert set(first.platform) == {BLOB_REFERENCE_KEY}
+        assert first.calibration is None
+        # The blob is only inserted with the first measurement
+        assert db_manager._mock_session.execute.call_count == 1
+        assert db_manager._mock_session.add.call_count == 2
+
+    @patch("qililab.result.database.database_manager.os.makedirs")
+    def test_blob_is_inserted_again_after_a_failed_commit(self, mock_makedirs, db_manager: DatabaseManager):
+        db_manager.current_sample = "sampleA"
+        db_manager.current_cd = "cdX"
+        db_manager._deduplicate_blobs = True
+        db_manager._blobs_table_created = True
+        platform = {"name": "galadriel"}
+
+        db_manager._mock_session.commit.side_effect = Exception("Commit error")
+        with pytest.raises(Exception, match="Commit error"):
+            db_manager.add_measurement("exp1", experiment_completed=False, platform=platform)
+        db_manager._mock_session.rollback.assert_called_once()
+        assert db_manager._mock_session.execute.call_count == 1
+
+        db_manager._mock_session.commit.side_effect = None
+        db_manager.add_measurement("exp2", experiment_completed=False, platform=platform)
+        db_manager.add_measurement("exp3", experiment_completed=False, platform=platform)
+
+        # The blob is inserted again with the next measurement, and only skipped once that insert is committed
+        assert db_manager._mock_session.execute.call_count == 2
+
+    @patch("qililab.result.database.database_manager.os.makedirs")
+    def test_asynchronous_blob_is_inserted_again_after_a_failed_batch(self, mock_makedirs, db_manager: DatabaseManager):
+        db_manager.current_sample = "sampleA"
+        db_manager.current_cd = "cdX"
+        db_manager._deduplicate_blobs = True
+        db_manager._blobs_table_created = True
+        db_manager._write_queue = DatabaseWriteQueue(db_manager.session, on_commit=db_manager._record_blobs)
+        platform = {"name": "galadriel"}
+
+        db_manager._mock_session.commit.side_effect = Exception("Commit error")
+        db_manager.add_measurement("exp1", experiment_completed=False, platform=platform)
+        with pytest.raises(Exception, match="Commit error"):
+            db_manager.flush()
+
+        db_manager._mock_session.commit.side_effect = None
+        db_manager.add_measurement("exp2", experiment_completed=False, platform=platform)
+        db_manager.flush()
+        db_manager.add_measurement("exp3", experiment_completed=False, platform=platform)
+        db_manager.close()
+
+        assert db_manager._mock_session.execute.call_count == 2
+
+    def test_resolve_blob(self, db_manager: DatabaseManager):
+        db_manager._mock_session.get.return_value = Blob(digest="abc", content={"name": "galadriel"})
+
+        assert db_manager.resolve_blob({BLOB_REFERENCE_KEY: "abc"}) == {"name": "galadriel"}
+        db_manager._mock_session.get.assert_called_once_with(Blob, "abc")
+        assert db_manager.resolve_blob({"name": "galadriel"}) == {"name": "galadriel"}
+
+        db_manager._mock_session.get.return_value = None
+        with pytest.raises(KeyError, match="abc"):
+            db_manager.resolve_blob({BLOB_REFERENCE_KEY: "abc"})
+
+
+class TestDatabaseManagerSummaries:
+    """Tests for the summary queries of the DatabaseManager."""
+
+    @staticmethod
+    def _connection(db_manager: DatabaseManager) -> MagicMock:
+        connection = MagicMock()
+        connection.execute.return_value.all.return_value = [("row1",), ("row2",)]
+        db_manager.engine.connect.return_value.__enter__.return_value = connection
+        return connection
+
+    def test_tail_summary_only_selects_index_columns(self, db_manager: DatabaseManager):
+        db_manager.current_sample = "sampleA"
+        connection = self._connection(db_manager)
+
+        result = db_manager.tail_summary(exp_name="rabi", since_id=10, order_limit=3)
+
+        assert result == [("row1",), ("row2",)]
+        statement = connection.execute.call_args.args[0]
+        assert [column.name for column in statement.selected_columns] == [
+            column.name for column in SUMMARY_COLUMNS
+        ]
+        sql = str(statement)
+        assert "platform" not in sql
+        assert "ORDER BY measurements.measurement_id DESC" in sql
+        assert set(statement.compile().params.values()) == {"sampleA", 10, "rabi", 3}
+
+    def test_head_summary_orders_oldest_first(self, db_manager: DatabaseManager):
+        connection = self._connection(db_manager)
+
+        db_manager.head_summary(current_sample=False, before_id=5, order_limit=None)
+
+        statement = connection.execute.call_args.args[0]
+        sql = str(statement)
+        assert "measurements.measurement_id < " in sql
+        assert "DESC" not in sql
+        assert "LIMIT" not in sql
+
+    @patch("qililab.result.database.database_manager.read_sql")
+    def test_summary_pandas_output(self, mock_read_sql, db_manager: DatabaseManager):
+        connection = self._connection(db_manager)
+
+        result = db_manager.tail_summary(pandas_output=True)
+
+        assert mock_read_sql.call_args.kwargs["con"] is connection
+        assert result == mock_read_sql.return_value.copy.return_value
+
+    def test_summaries_are_cached_until_written(self, db_manager: DatabaseManager):
+        db_manager._summary_cache_ttl = 60.0
+        connection = self._connection(db_manager)
+
+        first = db_manager.tail_summary()
+        second = db_manager.tail_summary()
+        assert first == second
+        assert first is not second
+        assert connection.execute.call_count == 1
+
+        db_manager.tail_summary(order_limit=10)
+        assert connection.execute.call_count == 2
+
+        db_manager._write([])
+        db_manager.tail_summary()
+        assert connection.execute.call_count == 3
+
+    def test_summary_cache_disabled(self, db_manager: DatabaseManager):
+        db_manager._summary_cache_ttl = 0.0
+        connection = self._connection(db_manager)
+
+        db_manager.tail_summary()
+        db_manager.tail_summary()
+
+        assert connection.execute.call_count == 2
+        assert not db_manager._summary_cache
 
 
 @patch("qililab.result.database.database_manager.get_db_manager")
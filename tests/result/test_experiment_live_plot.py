@@ -256,6 +256,69 @@ class TestExperimentLivePlot:
         mock_write.assert_called_once()
 
 
+    def test_live_plot_updates_only_written_cells(self):
+        """Test that live_plot with indices updates the plot buffer from the written value without reading the data"""
+        live_plot = ExperimentLivePlot("test_incremental.h5", slurm_execution=False)
+
+        fig_mock = MagicMock()
+        heatmap = MagicMock()
+        fig_mock.data = [heatmap]
+        live_plot._live_plot_fig = fig_mock
+        live_plot.live_plot_dict = {("QProgram_0", "Measurement_0"): 0}
+        data = MagicMock()
+        data.shape = (3, 4, 2)
+
+        live_plot.live_plot(data, "QProgram_0", "Measurement_0", indices=(1,), value=np.full((4, 2), 10.0))
+
+        data.__getitem__.assert_not_called()
+        z = heatmap.z.T
+        assert z.shape == (3, 4)
+        assert np.allclose(z[1], 20 * np.log10(np.abs(10 + 10j)))
+        assert np.all(np.isnan(z[[0, 2]]))
+        fig_mock.write_image.assert_called_once()
+
+    def test_live_plot_reads_back_partial_writes(self):
+        """Test that writes of single I/Q components read back only the cell they touched"""
+        live_plot = ExperimentLivePlot("test_partial.h5", slurm_execution=False)
+
+        fig_mock = MagicMock()
+        scatter = MagicMock()
+        fig_mock.data = [scatter]
+        live_plot._live_plot_fig = fig_mock
+        live_plot.live_plot_dict = {("QProgram_0", "Measurement_0"): 0}
+        data = np.zeros((3, 2))
+        data[2] = [1.0, 0.0]
+
+        live_plot.live_plot(data, "QProgram_0", "Measurement_0", indices=(2, 0), value=1.0)
+
+        assert np.isclose(scatter.y[2], 0.0)
+        assert np.all(np.isnan(scatter.y[:2]))
+
+    def test_live_plot_refreshes_are_throttled(self):
+        """Test that with a refresh interval the figure is refreshed in the background and once more on close"""
+        live_plot = ExperimentLivePlot("test_throttled.h5", slurm_execution=False, refresh_interval=60)
+
+        fig_mock = MagicMock()
+        scatter = MagicMock()
+        fig_mock.data = [scatter]
+        live_plot._live_plot_fig = fig_mock
+        live_plot.live_plot_dict = {("QProgram_0", "Measurement_0"): 0}
+        data = np.zeros((3, 2))
+
+        for index in range(3):
+            live_plot.live_plot(data, "QProgram_0", "Measurement_0", indices=(index,), value=np.array([1.0, 1.0]))
+
+        fig_mock.write_image.assert_not_called()
+        assert live_plot._refresh_thread.is_alive()
+
+        refresh_thread = live_plot._refresh_thread
+        live_plot.close()
+
+        assert not refresh_thread.is_alive()
+        fig_mock.write_image.assert_called_once()
+        assert np.allclose(scatter.y, 20 * np.log10(np.sqrt(2)))
+
+
 class TestExperimentResultsWriterLivePlot:
     """Test ExperimentResultsWriter class"""
 
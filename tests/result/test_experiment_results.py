@@ -1,5 +1,6 @@
 # pylint: disable=protected-access
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from types import MethodType
@@ -10,8 +11,10 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 
-from qililab.result.experiment_results import DimensionInfo, ExperimentResults
+from qililab.result.experiment_live_plot import ExperimentLivePlot
+from qililab.result.experiment_results import DimensionInfo, ExperimentResults, ExperimentResultsView
 from qililab.result.experiment_results_writer import ExperimentMetadata, ExperimentResultsWriter
+from qililab.result.results_storage import ResultsStorageLayout
 
 # Use non-interactive backend for testing
 mpl.use("Agg")
@@ -509,6 +512,95 @@ class TestExperimentResults:
         plt.close(plt.gcf())
 
 
+@pytest.fixture(name="written_results")
+def fixture_written_results(metadata, override_settings):
+    """Create a results file with known values, stored contiguously"""
+    path = "written_results.hdf5"
+    with override_settings(experiment_live_plot_enabled=False, experiment_live_plot_on_slurm=False):
+        with ExperimentResultsWriter(
+            path=path,
+            metadata=metadata,
+            db_metadata=None,
+            db_manager=None,
+            layout=ResultsStorageLayout(chunk_bytes=0),
+        ) as writer:
+            for x in range(3):
+                for y in range(4):
+                    writer["QProgram_0", "Measurement_0", x, y] = np.array([x, y])
+    yield path
+    Path(path).unlink()
+
+
+class TestExperimentResultsView:
+    """Test ExperimentResultsView class"""
+
+    def test_slicing_reads_hyperslabs(self, written_results):
+        """Test that slicing a view returns the same values as slicing the full data"""
+        with ExperimentResults(written_results) as results:
+            data, dims = results.get(qprogram=0, measurement=0)
+            view = results.view(qprogram=0, measurement=0)
+
+            assert view.shape == (3, 4, 2)
+            assert len(view) == 3
+            assert np.array_equal(view[1], data[1])
+            assert np.array_equal(view[:, 2, 0], data[:, 2, 0])
+            assert np.array_equal(view[..., 1], data[..., 1])
+            assert [dim.labels for dim in view.dims] == [dim.labels for dim in dims]
+
+    def test_complex_view(self, written_results):
+        """Test that a complex view hides the I/Q dimension and converts only what is read"""
+        with ExperimentResults(written_results) as results:
+            data, _ = results.get()
+            view = results.view().as_complex()
+
+            assert view.shape == (3, 4)
+            assert view.dtype == np.complex64
+            assert [dim.labels for dim in view.dims] == [["x"], ["y"]]
+            assert view[2, 3] == 2 + 3j
+            assert np.array_equal(view[1], data[1, :, 0] + 1j * data[1, :, 1])
+            assert np.array_equal(view[..., 1], data[:, 1, 0] + 1j * data[:, 1, 1])
+
+    def test_memmap(self, written_results):
+        """Test that contiguous datasets can be memory-mapped"""
+        with ExperimentResults(written_results) as results:
+            data, _ = results.get()
+            assert np.array_equal(results.view().memmap(), data)
+            assert np.array_equal(results.view().as_complex().memmap(), data[..., 0] + 1j * data[..., 1])
+
+    def test_memmap_raises_for_chunked_datasets(self, metadata, override_settings):
+        """Test that chunked datasets cannot be memory-mapped"""
+        path = "chunked_results.hdf5"
+        with override_settings(experiment_live_plot_enabled=False, experiment_live_plot_on_slurm=False):
+            with ExperimentResultsWriter(
+                path=path, metadata=metadata, db_metadata=None, db_manager=None, layout=ResultsStorageLayout()
+            ):
+                ...
+
+        with ExperimentResults(path) as results, pytest.raises(ValueError, match="memory-mapped"):
+            results.view().memmap()
+        Path(path).unlink()
+
+    def test_to_xarray_is_lazy(self, written_results):
+        """Test that the xarray DataArray only reads the values that are indexed"""
+        with ExperimentResults(written_results) as results:
+            view = results.view().as_complex()
+            reads = []
+            getitem = ExperimentResultsView.__getitem__
+
+            def counting_getitem(self, key):
+                reads.append(key)
+                return getitem(self, key)
+
+            with patch.object(ExperimentResultsView, "__getitem__", counting_getitem):
+                data_array = view.to_xarray()
+                assert not reads
+
+                assert data_array.dims == ("x", "y")
+                assert np.array_equal(data_array.coords["y"], [10, 20, 30, 40])
+                assert data_array.isel(x=2, y=1).values == 2 + 1j
+                assert len(reads) == 1
+
+
 class TestExperimentResultsWriter:
     """Test ExperimentResultsWriter class"""
 
@@ -578,6 +670,15 @@ class TestExperimentResultsWriter:
                 exp_writer.execution_time = 4.56
                 assert exp_writer.execution_time == 4.56
 
+                # test profile property, which is optional
+                assert exp_writer.profile is None
+                exp_writer.profile = {"phases": {"compile": {"count": 1}}, "buses": {}, "counters": {}}
+                assert exp_writer.profile == {"phases": {"compile": {"count": 1}}, "buses": {}, "counters": {}}
+
+                # write again to assert that HDF5 old partition is deleted correctly
+                exp_writer.profile = {"phases": {}, "buses": {}, "counters": {"compilation_cache.hits": 2}}
+                assert exp_writer.profile == {"phases": {}, "buses": {}, "counters": {"compilation_cache.hits": 2}}
+
     @patch("qililab.result.experiment_live_plot.ExperimentLivePlot.live_plot")
     @patch("qililab.result.experiment_live_plot.ExperimentLivePlot.live_plot_figures")
     def test_setitem_calls_live_plot(self, mock_figures, mock_live_plot, metadata, override_settings):
@@ -600,3 +701,132 @@ class TestExperimentResultsWriter:
         path_obj = Path(path)
         if path_obj.exists():
             path_obj.unlink()
+
+    @patch("qililab.result.experiment_live_plot.ExperimentLivePlot.live_plot")
+    @patch("qililab.result.experiment_live_plot.ExperimentLivePlot.live_plot_figures")
+    def test_live_plot_with_buffered_writes(self, mock_figures, mock_live_plot, metadata, override_settings):
+        """Test that writes are buffered while live plotting, and that the live plot gets the written values"""
+        path = "test_live_plot_buffered_writer.h5"
+        layout = ResultsStorageLayout(chunk_bytes=4 * 4 * 2 * 4 * 2, flush_interval=0)
+
+        with override_settings(experiment_live_plot_enabled=True, experiment_live_plot_on_slurm=False):
+            with ExperimentResultsWriter(
+                path=path, metadata=metadata, db_metadata=None, db_manager=None, layout=layout
+            ) as writer:
+                dataset = writer.data["QProgram_0", "Measurement_1"]
+                buffer = writer._buffers["QProgram_0", "Measurement_1"]
+
+                value = np.ones((4, 4, 2))
+                writer["QProgram_0", "Measurement_1", 0] = value
+                assert len(buffer) == 1
+                assert np.all(dataset[0] == 0)
+                data, qprogram_name, measurement_name = mock_live_plot.call_args.args
+                assert data is buffer
+                assert (qprogram_name, measurement_name) == ("QProgram_0", "Measurement_1")
+                assert mock_live_plot.call_args.kwargs == {"indices": (0,), "value": value}
+
+                # The cells of partial writes are read back through the buffer, including the values held in memory
+                writer["QProgram_0", "Measurement_1", 0, 1, 2, 0] = 5.0
+                data, _, _ = mock_live_plot.call_args.args
+                cells = ExperimentLivePlot._written_cells(data, (0, 1, 2, 0), 5.0)
+                assert np.all(cells == [5.0, 1.0])
+
+        with ExperimentResults(path) as results:
+            data, _ = results.get(qprogram="QProgram_0", measurement="Measurement_1")
+            assert np.all(data[0, 1, 2] == [5.0, 1.0])
+
+        Path(path).unlink()
+
+    def test_dataset_layout(self, metadata, override_settings):
+        """Test that the results datasets are chunked along the innermost loops and compressed"""
+        path = "test_layout_writer.h5"
+        layout = ResultsStorageLayout(chunk_bytes=4 * 4 * 2 * 4, compression="gzip", compression_level=6)
+
+        with override_settings(experiment_live_plot_enabled=False, experiment_live_plot_on_slurm=False):
+            with ExperimentResultsWriter(
+                path=path, metadata=metadata, db_metadata=None, db_manager=None, layout=layout
+            ) as writer:
+                dataset = writer.data["QProgram_0", "Measurement_1"]
+                assert dataset.chunks == (1, 4, 4, 2)
+                assert dataset.compression == "gzip"
+                assert dataset.compression_opts == 6
+                assert dataset.shuffle
+
+                assert writer.data["QProgram_0", "Measurement_0"].chunks == (3, 4, 2)
+
+        Path(path).unlink()
+
+    def test_contiguous_layout_is_not_buffered(self, metadata, override_settings):
+        """Test that a layout without chunks stores the results contiguously and writes them directly"""
+        path = "test_contiguous_writer.h5"
+
+        with override_settings(experiment_live_plot_enabled=False, experiment_live_plot_on_slurm=False):
+            with ExperimentResultsWriter(
+                path=path, metadata=metadata, db_metadata=None, db_manager=None, layout=ResultsStorageLayout(chunk_bytes=0)
+            ) as writer:
+                assert writer.data["QProgram_0", "Measurement_0"].chunks is None
+                assert not writer._buffers
+
+        Path(path).unlink()
+
+    def test_buffered_writes_reach_the_file(self, metadata, override_settings):
+        """Test that buffered results are written to the file on reads, flushes and on exit"""
+        path = "test_buffered_writer.h5"
+        layout = ResultsStorageLayout(chunk_bytes=4 * 4 * 2 * 4 * 2, flush_interval=0)
+
+        with override_settings(experiment_live_plot_enabled=False, experiment_live_plot_on_slurm=False):
+            with ExperimentResultsWriter(
+                path=path, metadata=metadata, db_metadata=None, db_manager=None, layout=layout
+            ) as writer:
+                dataset = writer.data["QProgram_0", "Measurement_1"]
+                buffer = writer._buffers["QProgram_0", "Measurement_1"]
+
+                # The first position of a chunk of two outer positions stays in memory
+                writer["QProgram_0", "Measurement_1", 0] = np.ones((4, 4, 2))
+                assert len(buffer) == 1
+                assert np.all(dataset[0] == 0)
+
+                # Reading flushes the incomplete chunk but keeps it in memory
+                assert np.all(writer["QProgram_0", "Measurement_1", 0] == 1)
+                assert len(buffer) == 1
+
+                # Completing the chunk writes it
+                writer["QProgram_0", "Measurement_1", 1] = np.full((4, 4, 2), 2.0)
+                assert len(buffer) == 0
+                assert np.all(dataset[1] == 2)
+
+                # The last chunk is incomplete until the file is closed
+                writer["QProgram_0", "Measurement_1", 2] = np.full((4, 4, 2), 3.0)
+                writer["QProgram_0", "Measurement_0", 1, 2] = np.array([4.0, 5.0])
+
+        with ExperimentResults(path) as results:
+            data, _ = results.get(qprogram="QProgram_0", measurement="Measurement_1")
+            assert np.all(data[0] == 1)
+            assert np.all(data[1] == 2)
+            assert np.all(data[2] == 3)
+            data, _ = results.get(qprogram="QProgram_0", measurement="Measurement_0")
+            assert np.all(data[1, 2] == [4.0, 5.0])
+
+        Path(path).unlink()
+
+    def test_background_flush(self, metadata, override_settings):
+        """Test that buffered results are written to the file periodically"""
+        path = "test_background_flush_writer.h5"
+        layout = ResultsStorageLayout(chunk_bytes=4 * 4 * 2 * 4 * 3, flush_interval=0.01)
+
+        with override_settings(experiment_live_plot_enabled=False, experiment_live_plot_on_slurm=False):
+            with ExperimentResultsWriter(
+                path=path, metadata=metadata, db_metadata=None, db_manager=None, layout=layout
+            ) as writer:
+                assert writer._flush_thread.is_alive()
+                dataset = writer.data["QProgram_0", "Measurement_1"]
+                writer["QProgram_0", "Measurement_1", 0] = np.ones((4, 4, 2))
+                for _ in range(100):
+                    if np.all(dataset[0] == 1):
+                        break
+                    time.sleep(0.01)
+                assert np.all(dataset[0] == 1)
+                flush_thread = writer._flush_thread
+
+        assert not flush_thread.is_alive()
+        Path(path).unlink()
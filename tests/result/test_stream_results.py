@@ -3,6 +3,7 @@
 import copy
 from unittest.mock import MagicMock, patch
 
+import h5py
 import numpy as np
 import pytest
 from tests.data import Galadriel, SauronQuantumMachines
@@ -614,6 +615,81 @@ class TestStreamArray:
             stream_array.add_fitting(path="/test/fit.h5")
 
 
+    def test_buffered_stream_array(self, tmp_path):
+        """Tests that buffered mode coalesces the assignments and writes them to a chunked dataset."""
+        db_manager = MagicMock()
+        db_manager.add_measurement.return_value.result_path = str(tmp_path / "buffered.h5")
+        stream_array = StreamArray(
+            shape=(4, 3),
+            loops={"amplitude": np.linspace(0, 1, 4)},
+            experiment_name="buffered",
+            db_manager=db_manager,
+            buffered=True,
+            flush_interval=3600,
+            flush_bytes=1024,
+        )
+
+        with stream_array:
+            assert stream_array._dataset.chunks is not None
+            for index in range(3):
+                stream_array[index] = np.full(3, index + 1)
+            # Nothing is written while the chunk is incomplete and below the interval and byte budget
+            assert np.all(stream_array._dataset[()] == 0)
+            assert len(stream_array._buffer) == 1
+            stream_array.flush()
+            assert len(stream_array._buffer) == 0
+            assert np.all(stream_array._dataset[2] == 3)
+            stream_array[3] = np.full(3, 4)
+
+        expected = np.repeat(np.arange(1, 5), 3).reshape(4, 3)
+
+        with h5py.File(stream_array.path, mode="r") as file:
+            assert np.array_equal(file["results"][()], expected)
+        assert np.array_equal(stream_array.results, expected)
+
+    def test_buffered_stream_array_flushes_on_byte_budget(self, tmp_path):
+        """Tests that buffered mode flushes the file once the assigned bytes exceed the byte budget."""
+        db_manager = MagicMock()
+        db_manager.add_measurement.return_value.result_path = str(tmp_path / "budget.h5")
+        stream_array = StreamArray(
+            shape=(4, 3),
+            loops={"amplitude": np.linspace(0, 1, 4)},
+            experiment_name="budget",
+            db_manager=db_manager,
+            buffered=True,
+            flush_interval=3600,
+            flush_bytes=2 * 3 * 8,
+        )
+
+        with stream_array:
+            stream_array[0] = np.ones(3)
+            assert np.all(stream_array._dataset[0] == 0)
+            stream_array[1] = np.ones(3)
+            assert np.all(stream_array._dataset[:2] == 1)
+
+    def test_stream_array_without_results_in_memory(self, tmp_path):
+        """Tests that without keeping the results in memory they are read from the file."""
+        db_manager = MagicMock()
+        db_manager.add_measurement.return_value.result_path = str(tmp_path / "no_results.h5")
+        stream_array = StreamArray(
+            shape=(3, 2),
+            loops={"amplitude": np.linspace(0, 1, 3)},
+            experiment_name="no_results",
+            db_manager=db_manager,
+            buffered=True,
+            keep_results=False,
+        )
+
+        with stream_array:
+            stream_array[0] = np.array([1.0, 2.0])
+            assert not hasattr(stream_array, "results")
+            assert np.array_equal(stream_array[0], [1.0, 2.0])
+
+        assert len(stream_array) == 3
+        assert np.array_equal(stream_array[0], [1.0, 2.0])
+        assert [0.0, 0.0] in stream_array
+
+
 class TestRawStreamArray:
     """Test `StreamArray` functionalities."""
 
@@ -85,3 +85,45 @@ def test_uuid_serialization():
     # Verify that the original and loaded UUIDs are equal
     assert original_uuid == loaded_uuid
     assert isinstance(loaded_uuid, UUID)
+
+
+def test_large_ndarray_is_serialized_as_binary():
+    """Test large arrays are serialized as compressed binary data, keeping their dtype and shape."""
+    original_array = (np.arange(200) * (1 + 0.5j)).reshape(10, 20)
+
+    stream = io.StringIO()
+    yaml.dump(original_array, stream)
+    yaml_str = stream.getvalue()
+
+    assert "encoding: base64" in yaml_str
+    assert "compression: zlib" in yaml_str
+    loaded_array = yaml.load(yaml_str)
+    assert loaded_array.dtype == original_array.dtype
+    np.testing.assert_array_equal(original_array, loaded_array)
+    # Loaded arrays can be modified
+    loaded_array[0, 0] = 1
+
+
+def test_ndarray_binary_serialization_settings(override_settings):
+    """Test the binary representation follows the size threshold and the compression level."""
+    original_array = np.arange(10, dtype=">i4")
+
+    stream = io.StringIO()
+    yaml.dump(original_array, stream)
+    assert "encoding" not in stream.getvalue()
+
+    with override_settings(yaml_ndarray_binary_min_size=0, yaml_ndarray_compression_level=0):
+        stream = io.StringIO()
+        yaml.dump(original_array, stream)
+    yaml_str = stream.getvalue()
+
+    assert "encoding: base64" in yaml_str
+    assert "compression" not in yaml_str
+    np.testing.assert_array_equal(original_array, yaml.load(yaml_str))
+
+
+def test_ndarray_list_representation_is_loaded():
+    """Test arrays serialized as lists of their elements are still loaded."""
+    yaml_str = "!ndarray\ndtype: float64\nshape: !!python/tuple [2, 2]\ndata: [1.0, 2.0, 3.0, 4.0]\n"
+
+    np.testing.assert_array_equal(yaml.load(yaml_str), [[1.0, 2.0], [3.0, 4.0]])
@@ -0,0 +1,148 @@
+"""Tests for the ExecutionProfiler class."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Barrier, Thread
+
+import pytest
+
+from qililab.utils.execution_profiler import ExecutionProfiler, get_active_profiler, profile_phase
+
+
+class TestExecutionProfiler:
+    """Unit tests for the ExecutionProfiler class."""
+
+    def test_phase_records_count_and_times(self):
+        profiler = ExecutionProfiler()
+        for _ in range(3):
+            with profiler.phase("compile"):
+                pass
+
+        statistics = profiler.profile().phases["compile"]
+        assert statistics.count == 3
+        assert 0.0 <= statistics.min <= statistics.mean <= statistics.max
+        assert statistics.total == pytest.approx(statistics.mean * 3)
+
+    def test_phase_is_recorded_when_it_raises(self):
+        profiler = ExecutionProfiler()
+        with pytest.raises(TimeoutError), profiler.phase("execute.acquire"):
+            raise TimeoutError
+
+        assert profiler.profile().phases["execute.acquire"].count == 1
+
+    def test_record_bus_accumulates_transfers_and_keeps_last_sequence_size(self):
+        profiler = ExecutionProfiler()
+        profiler.record_bus("readout", uploads=1, bytes_uploaded=100, waveform_samples=40, instructions=10)
+        profiler.record_bus("readout", uploads=1, bytes_uploaded=50, waveform_samples=20, instructions=5)
+        profiler.record_bus("readout", bytes_downloaded=64)
+
+        statistics = profiler.profile().buses["readout"]
+        assert statistics.uploads == 2
+        assert statistics.bytes_uploaded == 150
+        assert statistics.bytes_downloaded == 64
+        assert statistics.waveform_samples == 20
+        assert statistics.instructions == 5
+
+    def test_profile_is_a_snapshot(self):
+        profiler = ExecutionProfiler()
+        profiler.count("compilation_cache.hits")
+        profile = profiler.profile()
+        profiler.count("compilation_cache.hits")
+
+        assert profile.counters == {"compilation_cache.hits": 1}
+        assert profiler.profile().counters == {"compilation_cache.hits": 2}
+
+    def test_reset(self):
+        profiler = ExecutionProfiler()
+        with profiler.phase("compile"):
+            profiler.count("compilation_cache.misses")
+            profiler.record_bus("drive", uploads=1)
+        profiler.reset()
+
+        profile = profiler.profile()
+        assert not profile.phases
+        assert not profile.buses
+        assert not profile.counters
+
+    def test_profile_phase_only_records_while_active(self):
+        profiler = ExecutionProfiler()
+        with profile_phase("compile"):
+            pass
+        assert get_active_profiler() is None
+
+        with profiler.activate() as active:
+            assert get_active_profiler() is profiler is active
+            with profile_phase("compile"):
+                pass
+        assert get_active_profiler() is None
+
+        assert profiler.profile().phases["compile"].count == 1
+
+    def test_nested_activation_restores_previous_profiler(self):
+        outer, inner = ExecutionProfiler(), ExecutionProfiler()
+        with outer.activate():
+            with inner.activate():
+                assert get_active_profiler() is inner
+            assert get_active_profiler() is outer
+
+    def test_phases_from_several_threads_are_added_up(self):
+        profiler = ExecutionProfiler()
+
+        def upload(_):
+            with profile_phase("qblox.sequence_upload"):
+                pass
+
+        with profiler.activate(), ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(copy_context().run, upload, index) for index in range(20)]
+            for future in futures:
+                future.result()
+
+        assert profiler.profile().phases["qblox.sequence_upload"].count == 20
+
+    def test_profilers_activated_in_different_threads_do_not_interfere(self):
+        profilers = [ExecutionProfiler(), ExecutionProfiler()]
+        barrier = Barrier(2)
+
+        def run(profiler, phase):
+            with profiler.activate():
+                barrier.wait()
+                with profile_phase(phase):
+                    pass
+                barrier.wait()
+
+        threads = [Thread(target=run, args=(profiler, f"phase_{index}")) for index, profiler in enumerate(profilers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert list(profilers[0].profile().phases) == ["phase_0"]
+        assert list(profilers[1].profile().phases) == ["phase_1"]
+        assert get_active_profiler() is None
+
+    def test_to_dict_and_json(self):
+        profiler = ExecutionProfiler()
+        with profiler.phase("compile"):
+            pass
+        profiler.record_bus("readout", uploads=1, instructions=12)
+        profiler.count("compilation_cache.misses")
+
+        record = profiler.profile().to_dict()
+        assert record["phases"]["compile"]["count"] == 1
+        assert set(record["phases"]["compile"]) == {"count", "total", "min", "max", "mean"}
+        assert record["buses"]["readout"]["instructions"] == 12
+        assert record["counters"] == {"compilation_cache.misses": 1}
+        assert json.loads(profiler.profile().to_json()) == record
+
+    def test_str_lists_phases_buses_and_counters(self):
+        profiler = ExecutionProfiler()
+        with profiler.phase("execute.upload"):
+            pass
+        profiler.record_bus("readout", uploads=1)
+        profiler.count("compilation_cache.hits")
+
+        text = str(profiler.profile())
+        assert "execute.upload" in text
+        assert "readout" in text
+        assert "compilation_cache.hits" in text
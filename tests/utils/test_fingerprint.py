@@ -0,0 +1,90 @@
+"""Tests for the fingerprint utility."""
+
+import numpy as np
+
+from qililab.core.variables import Domain
+from qililab.qprogram import Calibration, QProgram
+from qililab.utils.fingerprint import fingerprint
+from qililab.waveforms import Arbitrary, IQPair, Square
+
+
+def build_qprogram(amplitude: float = 1.0) -> QProgram:
+    qprogram = QProgram()
+    frequency = qprogram.variable(label="frequency", domain=Domain.Frequency)
+    with qprogram.for_loop(variable=frequency, start=10e6, stop=100e6, step=10e6):
+        qprogram.set_frequency(bus="drive", frequency=frequency)
+        qprogram.play(bus="drive", waveform=IQPair(I=Square(amplitude, 40), Q=Square(0.0, 40)))
+    return qprogram
+
+
+class TestFingerprint:
+    """Unit tests for the fingerprint function."""
+
+    def test_structurally_identical_qprograms_share_fingerprint(self):
+        assert fingerprint(build_qprogram()) == fingerprint(build_qprogram())
+
+    def test_different_qprograms_have_different_fingerprints(self):
+        assert fingerprint(build_qprogram(amplitude=1.0)) != fingerprint(build_qprogram(amplitude=0.5))
+
+    def test_fingerprint_changes_when_qprogram_is_mutated(self):
+        qprogram = build_qprogram()
+        before = fingerprint(qprogram)
+        qprogram.wait(bus="drive", duration=100)
+        assert fingerprint(qprogram) != before
+
+    def test_variables_are_compared_by_position_not_identity(self):
+        qprogram = QProgram()
+        first = qprogram.variable(label="x", domain=Domain.Voltage)
+        _ = qprogram.variable(label="x", domain=Domain.Voltage)
+        with qprogram.for_loop(variable=first, start=0.0, stop=1.0, step=0.5):
+            qprogram.set_offset(bus="flux", offset_path0=first)
+
+        swapped = QProgram()
+        _ = swapped.variable(label="x", domain=Domain.Voltage)
+        second_swapped = swapped.variable(label="x", domain=Domain.Voltage)
+        with swapped.for_loop(variable=second_swapped, start=0.0, stop=1.0, step=0.5):
+            swapped.set_offset(bus="flux", offset_path0=second_swapped)
+
+        assert fingerprint(qprogram) != fingerprint(swapped)
+
+    def test_arrays_are_fingerprinted_by_content(self):
+        samples = np.linspace(0, 1, 100)
+        assert fingerprint(Arbitrary(samples)) == fingerprint(Arbitrary(samples.copy()))
+        assert fingerprint(Arbitrary(samples)) != fingerprint(Arbitrary(samples.astype(np.float32)))
+        assert fingerprint(Arbitrary(samples)) != fingerprint(Arbitrary(samples[::-1]))
+
+    def test_containers(self):
+        assert fingerprint({"a": 1, "b": [1.0, 2.0]}) == fingerprint({"a": 1, "b": [1.0, 2.0]})
+        assert fingerprint({"a": 1}) != fingerprint({"a": 1.0})
+        assert fingerprint([1, 2]) != fingerprint((1, 2))
+        assert fingerprint({"x", "y", "z"}) == fingerprint({"z", "y", "x"})
+        assert fingerprint(None) != fingerprint("None")
+
+    def test_calibration(self):
+        calibration = Calibration()
+        calibration.add_waveform(bus="drive", name="Xpi", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+        other = Calibration()
+        other.add_waveform(bus="drive", name="Xpi", waveform=IQPair(I=Square(1.0, 40), Q=Square(0.0, 40)))
+        assert fingerprint(calibration) == fingerprint(other)
+
+        other.add_waveform(bus="drive", name="Xpi", waveform=IQPair(I=Square(0.5, 40), Q=Square(0.0, 40)))
+        assert fingerprint(calibration) != fingerprint(other)
+
+    def test_self_referencing_objects(self):
+        class Node:
+            def __init__(self):
+                self.child = self
+
+        assert fingerprint(Node()) == fingerprint(Node())
+
+    def test_fingerprint_hook(self):
+        class Hooked:
+            def __init__(self, value, noise):
+                self.value = value
+                self.noise = noise
+
+            def __fingerprint__(self):
+                return self.value
+
+        assert fingerprint(Hooked(1, "a")) == fingerprint(Hooked(1, "b"))
+        assert fingerprint(Hooked(1, "a")) != fingerprint(Hooked(2, "a"))
@@ -1,18 +1,25 @@
 import os
+import stat
+import sys
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from qililab.qprogram.qblox_compiler import QbloxCompiler
-from qililab.qprogram import Experiment
+from qililab.qprogram import Calibration, Experiment
+from qililab.utils import serialization
 from qililab.utils.serialization import (
+    BINARY_EXTENSION,
     DeserializationError,
     SerializationError,
+    content_hash,
     deserialize,
     deserialize_from,
     serialize,
     serialize_to,
 )
-from qililab.waveforms import Gaussian
+from qililab.waveforms import Arbitrary, Gaussian, IQPair, Square
 from qililab.typings.enums import Parameter
 
 
@@ -60,3 +67,111 @@ class TestSerialization:
         assert "!SetParameter" in serialized
 
         deserialize(serialized, Experiment)
+
+
+@pytest.fixture(name="calibration")
+def fixture_calibration() -> Calibration:
+    calibration = Calibration()
+    samples = np.linspace(0, 1, 10_000)
+    calibration.add_waveform(bus="drive_q0", name="Xpi", waveform=IQPair(I=Arbitrary(samples), Q=Arbitrary(-samples)))
+    calibration.add_weights(bus="readout_q0", name="weights", weights=IQPair(I=Square(1.0, 200), Q=Square(0.0, 200)))
+    calibration.parameters = {"frequency": 6e9}
+    return calibration
+
+
+class TestBinarySerialization:
+    def test_binary_round_trip(self, calibration: Calibration, tmp_path):
+        file = str(tmp_path / f"calibration{BINARY_EXTENSION}")
+        serialize_to(calibration, file)
+
+        with open(file, "rb") as stream:
+            assert not stream.read().startswith(b"!Calibration")
+
+        loaded = deserialize_from(file, Calibration)
+        samples = loaded.waveforms["drive_q0"]["Xpi"].I.samples
+        assert isinstance(samples, np.ndarray)
+        np.testing.assert_array_equal(samples, calibration.waveforms["drive_q0"]["Xpi"].I.samples)
+        assert loaded.weights["readout_q0"]["weights"].I.amplitude == 1.0
+        assert loaded.parameters == {"frequency": 6e9}
+        # Arrays are mapped copy-on-write: they can be modified without modifying the file
+        samples[0] = 10.0
+        np.testing.assert_array_equal(deserialize_from(file, Calibration).waveforms["drive_q0"]["Xpi"].I.samples[0], 0.0)
+
+    @pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX file permissions")
+    def test_binary_files_have_the_permissions_of_new_files(self, calibration: Calibration, tmp_path):
+        file = tmp_path / f"calibration{BINARY_EXTENSION}"
+        umask = os.umask(0o022)
+        try:
+            serialize_to(calibration, str(file))
+        finally:
+            os.umask(umask)
+
+        assert stat.S_IMODE(os.stat(file).st_mode) == 0o644
+
+    def test_format_is_explicit_or_detected(self, calibration: Calibration, tmp_path):
+        binary_file, yaml_file = str(tmp_path / "calibration.dat"), str(tmp_path / "calibration.yml")
+        serialize_to(calibration, binary_file, format="binary")
+        serialize_to(calibration, yaml_file)
+
+        with open(yaml_file, encoding="utf-8") as stream:
+            assert stream.read().startswith("!Calibration")
+        for file in (binary_file, yaml_file):
+            assert isinstance(deserialize_from(file), Calibration)
+        with pytest.raises(DeserializationError):
+            deserialize_from(binary_file, Gaussian)
+
+    def test_deserialization_errors_name_the_format_of_the_file(self, calibration: Calibration, tmp_path):
+        binary_file = str(tmp_path / f"calibration{BINARY_EXTENSION}")
+        serialize_to(calibration, binary_file)
+        with open(binary_file, "r+b") as stream:
+            stream.truncate(len(serialization._BINARY_MAGIC) + 4)
+        yaml_file = tmp_path / "calibration.yml"
+        yaml_file.write_text("!Calibration\nunknown: [", encoding="utf-8")
+
+        with pytest.raises(DeserializationError, match="Failed to deserialize binary file"):
+            deserialize_from(binary_file)
+        with pytest.raises(DeserializationError, match="Failed to deserialize YAML string"):
+            deserialize_from(str(yaml_file))
+
+    def test_content_hash(self, calibration: Calibration, tmp_path):
+        first, second = str(tmp_path / f"first{BINARY_EXTENSION}"), str(tmp_path / f"second{BINARY_EXTENSION}")
+        serialize_to(calibration, first)
+        serialize_to(calibration, second)
+        assert content_hash(first) == content_hash(second)
+
+        calibration.parameters["frequency"] = 5e9
+        serialize_to(calibration, second)
+        assert content_hash(first) != content_hash(second)
+
+        yaml_file = str(tmp_path / "calibration.yml")
+        serialize_to(calibration, yaml_file)
+        assert len(content_hash(yaml_file)) == 64
+
+    def test_yaml_files_are_cached_in_binary_format(self, calibration: Calibration, tmp_path, override_settings):
+        yaml_file = str(tmp_path / "calibration.yml")
+        serialize_to(calibration, yaml_file)
+        cache_dir = tmp_path / "cache"
+
+        with override_settings(serialization_cache_dir=str(cache_dir)):
+            with (
+                patch.object(serialization, "_dump_binary", wraps=serialization._dump_binary) as mock_dump,
+                patch.object(serialization, "_load_binary", wraps=serialization._load_binary) as mock_load,
+            ):
+                first = deserialize_from(yaml_file, Calibration)
+                mock_dump.assert_called_once()
+                mock_load.assert_not_called()
+
+                second = deserialize_from(yaml_file, Calibration)
+                # The second load reads the cached binary copy instead of parsing the YAML file again
+                mock_dump.assert_called_once()
+                mock_load.assert_called_once_with(mock_dump.call_args.args[1])
+
+            assert len(list(cache_dir.glob(f"{content_hash(yaml_file)}-*{BINARY_EXTENSION}"))) == 1
+            np.testing.assert_array_equal(
+                first.waveforms["drive_q0"]["Xpi"].I.samples, second.waveforms["drive_q0"]["Xpi"].I.samples
+            )
+
+            # Changing the file invalidates its cached copy
+            calibration.parameters["frequency"] = 5e9
+            serialize_to(calibration, yaml_file)
+            assert deserialize_from(yaml_file, Calibration).parameters == {"frequency": 5e9}
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from qililab.utils import fingerprint
+from qililab.waveforms import Arbitrary, Chained, Gaussian, GaussianDragCorrection, Ramp, Square
+from qililab.waveforms.envelope_cache import EnvelopeCache, envelope_cache
+
+
+class TestWaveformDigest:
+    def test_equal_parameters_have_equal_digest(self):
+        assert Square(amplitude=1.0, duration=40).digest() == Square(amplitude=1.0, duration=40).digest()
+        assert Arbitrary(samples=np.linspace(0, 1, 100)).digest() == Arbitrary(samples=np.linspace(0, 1, 100)).digest()
+
+    def test_different_parameters_or_class_have_different_digest(self):
+        assert Square(amplitude=1.0, duration=40).digest() != Square(amplitude=1.0, duration=41).digest()
+        assert (
+            Gaussian(amplitude=1.0, duration=40, num_sigmas=4).digest()
+            != Gaussian(amplitude=1.0, duration=40, num_sigmas=5).digest()
+        )
+        assert Ramp(from_amplitude=0.0, to_amplitude=1.0, duration=40).digest() != Square(1.0, 40).digest()
+
+    def test_arbitrary_digest_uses_all_samples(self):
+        """Long arrays are summarized with '...' when printed, so samples hidden by it must still change the digest."""
+        samples = np.zeros(10_000)
+        other_samples = samples.copy()
+        other_samples[5_000] = 1.0
+
+        assert "..." in str(samples)
+        assert Arbitrary(samples=samples).digest() != Arbitrary(samples=other_samples).digest()
+        assert Arbitrary(samples=samples).digest() != Arbitrary(samples=samples.astype(np.float32)).digest()
+
+    def test_nested_waveforms_digest(self):
+        chained = Chained(waveforms=[Ramp(0.0, 1.0, 20), Square(1.0, 40)])
+
+        assert chained.digest() == Chained(waveforms=[Ramp(0.0, 1.0, 20), Square(1.0, 40)]).digest()
+        assert chained.digest() != Chained(waveforms=[Square(1.0, 40), Ramp(0.0, 1.0, 20)]).digest()
+
+    def test_fingerprint_uses_digest(self):
+        assert fingerprint(Arbitrary(samples=np.ones(100))) == fingerprint(Arbitrary(samples=np.ones(100)))
+        assert fingerprint(Arbitrary(samples=np.ones(100))) != fingerprint(Arbitrary(samples=np.zeros(100)))
+
+    def test_digest_is_recomputed_when_a_parameter_changes(self):
+        square = Square(amplitude=1.0, duration=40)
+        digest = square.digest()
+        square.duration = 41
+
+        assert square.digest() != digest
+        assert square.digest() == Square(amplitude=1.0, duration=41).digest()
+
+    def test_digest_of_mutable_parameters_is_not_remembered(self):
+        samples = np.zeros(100)
+        arbitrary = Arbitrary(samples=samples)
+        digest = arbitrary.digest()
+        samples[50] = 1.0
+
+        assert arbitrary.digest() != digest
+
+
+@pytest.fixture(name="empty_envelope_cache")
+def fixture_empty_envelope_cache():
+    """Empties the shared envelope cache before and after the test."""
+    envelope_cache.clear()
+    yield envelope_cache
+    envelope_cache.clear()
+
+
+@pytest.mark.usefixtures("empty_envelope_cache")
+class TestEnvelopeCache:
+    def test_equal_waveforms_share_their_envelope(self):
+        envelope = Gaussian(amplitude=1.0, duration=40, num_sigmas=4).envelope()
+
+        assert Gaussian(amplitude=1.0, duration=40, num_sigmas=4).envelope() is envelope
+        assert not envelope.flags.writeable
+        assert len(envelope_cache) == 1
+
+    def test_resolution_and_parameters_are_part_of_the_key(self):
+        square = Square(amplitude=1.0, duration=40)
+        envelope = square.envelope()
+
+        assert len(square.envelope(resolution=2)) == 20
+        square.amplitude = 0.5
+        assert np.allclose(square.envelope(), 0.5 * envelope)
+        assert len(envelope_cache) == 3
+
+    def test_subclass_envelopes_do_not_collide(self):
+        gaussian = Gaussian(amplitude=1.0, duration=40, num_sigmas=4)
+        drag = GaussianDragCorrection(amplitude=1.0, duration=40, num_sigmas=4, drag_coefficient=0.5)
+
+        assert not np.allclose(drag.envelope(), gaussian.envelope())
+        assert len(envelope_cache) == 3
+
+    def test_arbitrary_envelopes_are_not_cached(self):
+        samples = np.linspace(0, 1, 100)
+
+        assert Arbitrary(samples=samples).envelope() is samples
+        assert Arbitrary(samples=samples).get_duration() == 100
+        assert len(envelope_cache) == 0
+
+    def test_cache_is_bounded_by_size_in_bytes(self):
+        cache = EnvelopeCache()
+        cache.put(("envelope", "a", 1), np.zeros(10), max_bytes=200)
+        cache.put(("envelope", "b", 1), np.zeros(10), max_bytes=200)
+        assert cache.get(("envelope", "a", 1)) is not None
+
+        cache.put(("envelope", "c", 1), np.zeros(10), max_bytes=200)
+        cache.put(("envelope", "d", 1), np.zeros(100), max_bytes=200)
+
+        assert cache.get(("envelope", "b", 1)) is None
+        assert cache.get(("envelope", "d", 1)) is None
+        assert len(cache) == 2
+        assert cache.nbytes == 160
+
+    def test_cache_can_be_disabled(self, override_settings):
+        with override_settings(waveform_envelope_cache_bytes=0):
+            envelope = Square(amplitude=1.0, duration=40).envelope()
+
+            assert Square(amplitude=1.0, duration=40).envelope() is not envelope
+            assert envelope.flags.writeable
+        assert len(envelope_cache) == 0